@@ -34,7 +34,7 @@ import os
 import re
 import sys
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 from xml.etree import ElementTree
 
@@ -46,6 +46,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from collectors.base import BaseCollector
 from discovery_engine.mcp_server import CollectorResult, CollectorStatus
 from storage.signal_store import SignalStore
+from utils.xml_stream import ATOM_ENTRY, ATOM_NS, aiter_elements
 from verification.verification_gate_v2 import Signal, VerificationStatus
 
 logger = logging.getLogger(__name__)
@@ -53,6 +54,12 @@ logger = logging.getLogger(__name__)
 # ArXiv API endpoint
 ARXIV_API = "http://export.arxiv.org/api/query"
 
+# Namespaces in ArXiv API responses
+ATOM_NAMESPACES = {
+    "atom": ATOM_NS,
+    "arxiv": "http://arxiv.org/schemas/atom",
+}
+
 # Thesis-relevant ArXiv categories
 THESIS_CATEGORIES = {
     # AI Infrastructure
@@ -179,6 +186,9 @@ class ArxivCollector(BaseCollector):
         result = await collector.run(dry_run=True)
     """
 
+    # Fetch only papers submitted after the last saved run
+    INCREMENTAL = True
+
     def __init__(
         self,
         categories: Optional[List[str]] = None,
@@ -243,6 +253,11 @@ class ArxivCollector(BaseCollector):
         if self.keywords:
             search_query = f"({category_query}) AND ({keyword_query})"
 
+        cutoff_date = self._fetch_cutoff(self.lookback_days)
+        if self._watermark:
+            # Let the API drop papers already seen instead of paging past them
+            search_query += f" AND submittedDate:[{cutoff_date:%Y%m%d%H%M} TO 999912312359]"
+
         params = {
             "search_query": search_query,
             "start": 0,
@@ -252,112 +267,121 @@ class ArxivCollector(BaseCollector):
         }
 
         try:
-            # Use _fetch_with_retry for automatic retry and rate limiting
+            # Stream the response and parse entries as they arrive; each
+            # attempt starts over, so a retry never duplicates papers
             async def fetch_arxiv():
-                async with httpx.AsyncClient(timeout=60.0) as client:
-                    response = await client.get(ARXIV_API, params=params)
+                fetched: List[ArxivPaper] = []
+                published: List[datetime] = []  # Dates the feed actually gave
+                async with self.http_client.stream("GET", ARXIV_API, params=params) as response:
                     response.raise_for_status()
-                    return response.content
+                    async for entry in aiter_elements(response.aiter_bytes(), ATOM_ENTRY):
+                        paper = self._parse_entry(entry, cutoff_date)
+                        if paper:
+                            fetched.append(paper)
+                            if entry.findtext("atom:published", namespaces=ATOM_NAMESPACES):
+                                published.append(paper.published_at)
+                return fetched, published
 
             # Acquire rate limit before request
             await self.rate_limiter.acquire()
-            xml_content = await self._fetch_with_retry(fetch_arxiv)
-
-            # Parse XML response
-            root = ElementTree.fromstring(xml_content)
-
-            # Define namespaces
-            ns = {
-                "atom": "http://www.w3.org/2005/Atom",
-                "arxiv": "http://arxiv.org/schemas/atom",
-            }
-
-            cutoff_date = datetime.now(timezone.utc) - timedelta(days=self.lookback_days)
-
-            for entry in root.findall("atom:entry", ns):
-                # Parse arxiv ID
-                id_elem = entry.find("atom:id", ns)
-                if id_elem is None or id_elem.text is None:
-                    continue
-
-                arxiv_id = id_elem.text.split("/abs/")[-1]
-
-                # Parse dates
-                published_elem = entry.find("atom:published", ns)
-                updated_elem = entry.find("atom:updated", ns)
+            papers, published = await self._fetch_with_retry(fetch_arxiv)
 
-                try:
-                    published_at = datetime.fromisoformat(
-                        published_elem.text.replace("Z", "+00:00")
-                    ) if published_elem is not None and published_elem.text else datetime.now(timezone.utc)
-
-                    updated_at = datetime.fromisoformat(
-                        updated_elem.text.replace("Z", "+00:00")
-                    ) if updated_elem is not None and updated_elem.text else published_at
-                except ValueError:
-                    published_at = datetime.now(timezone.utc)
-                    updated_at = published_at
-
-                # Skip old papers
-                if published_at < cutoff_date:
-                    continue
-
-                # Parse title and abstract
-                title_elem = entry.find("atom:title", ns)
-                title = (title_elem.text or "").strip().replace("\n", " ") if title_elem is not None else ""
-
-                summary_elem = entry.find("atom:summary", ns)
-                abstract = (summary_elem.text or "").strip().replace("\n", " ") if summary_elem is not None else ""
-
-                # Parse authors
-                authors = []
-                affiliations = []
-                for author_elem in entry.findall("atom:author", ns):
-                    name_elem = author_elem.find("atom:name", ns)
-                    if name_elem is not None and name_elem.text:
-                        authors.append(name_elem.text)
-
-                    affil_elem = author_elem.find("arxiv:affiliation", ns)
-                    if affil_elem is not None and affil_elem.text:
-                        affiliations.append(affil_elem.text)
-
-                # Parse categories
-                categories = []
-                for cat_elem in entry.findall("atom:category", ns):
-                    term = cat_elem.get("term")
-                    if term:
-                        categories.append(term)
-
-                # Get PDF link
-                pdf_url = ""
-                for link_elem in entry.findall("atom:link", ns):
-                    if link_elem.get("title") == "pdf":
-                        pdf_url = link_elem.get("href", "")
-                        break
-
-                paper = ArxivPaper(
-                    arxiv_id=arxiv_id,
-                    title=title,
-                    abstract=abstract,
-                    authors=authors,
-                    categories=categories,
-                    published_at=published_at,
-                    updated_at=updated_at,
-                    pdf_url=pdf_url,
-                    affiliations=affiliations,
-                )
-                papers.append(paper)
+            # Only a complete feed may move the watermark: entries arrive
+            # newest first, so a partial one would skip everything older
+            for published_at in published:
+                self._observe_item_time(published_at)
 
         except httpx.HTTPError as e:
-            logger.error(f"ArXiv HTTP error: {e}")
+            error_msg = f"ArXiv HTTP error: {e}"
+            logger.error(error_msg)
+            self._errors.append(error_msg)
         except ElementTree.ParseError as e:
-            logger.error(f"ArXiv XML parse error: {e}")
+            error_msg = f"ArXiv XML parse error: {e}"
+            logger.error(error_msg)
+            self._errors.append(error_msg)
         except Exception as e:
             logger.exception(f"ArXiv fetch error: {e}")
+            self._errors.append(f"ArXiv fetch error: {e}")
 
         logger.info(f"Fetched {len(papers)} ArXiv papers")
         return papers
 
+    def _parse_entry(self, entry: ElementTree.Element, cutoff_date: datetime) -> Optional[ArxivPaper]:
+        """Build a paper from an Atom <entry>, or None if unusable or older than cutoff_date."""
+        ns = ATOM_NAMESPACES
+
+        # Parse arxiv ID
+        id_elem = entry.find("atom:id", ns)
+        if id_elem is None or id_elem.text is None:
+            return None
+
+        arxiv_id = id_elem.text.split("/abs/")[-1]
+
+        # Parse dates
+        published_elem = entry.find("atom:published", ns)
+        updated_elem = entry.find("atom:updated", ns)
+
+        try:
+            published_at = datetime.fromisoformat(
+                published_elem.text.replace("Z", "+00:00")
+            ) if published_elem is not None and published_elem.text else datetime.now(timezone.utc)
+
+            updated_at = datetime.fromisoformat(
+                updated_elem.text.replace("Z", "+00:00")
+            ) if updated_elem is not None and updated_elem.text else published_at
+        except ValueError:
+            published_at = datetime.now(timezone.utc)
+            updated_at = published_at
+
+        # Skip old papers
+        if published_at < cutoff_date:
+            return None
+
+        # Parse title and abstract
+        title_elem = entry.find("atom:title", ns)
+        title = (title_elem.text or "").strip().replace("\n", " ") if title_elem is not None else ""
+
+        summary_elem = entry.find("atom:summary", ns)
+        abstract = (summary_elem.text or "").strip().replace("\n", " ") if summary_elem is not None else ""
+
+        # Parse authors
+        authors = []
+        affiliations = []
+        for author_elem in entry.findall("atom:author", ns):
+            name_elem = author_elem.find("atom:name", ns)
+            if name_elem is not None and name_elem.text:
+                authors.append(name_elem.text)
+
+            affil_elem = author_elem.find("arxiv:affiliation", ns)
+            if affil_elem is not None and affil_elem.text:
+                affiliations.append(affil_elem.text)
+
+        # Parse categories
+        categories = []
+        for cat_elem in entry.findall("atom:category", ns):
+            term = cat_elem.get("term")
+            if term:
+                categories.append(term)
+
+        # Get PDF link
+        pdf_url = ""
+        for link_elem in entry.findall("atom:link", ns):
+            if link_elem.get("title") == "pdf":
+                pdf_url = link_elem.get("href", "")
+                break
+
+        return ArxivPaper(
+            arxiv_id=arxiv_id,
+            title=title,
+            abstract=abstract,
+            authors=authors,
+            categories=categories,
+            published_at=published_at,
+            updated_at=updated_at,
+            pdf_url=pdf_url,
+            affiliations=affiliations,
+        )
+
 
 # =============================================================================
 # CLI
@@ -11,25 +11,34 @@ Provides common functionality for all collectors:
 - Per-API rate limiting
 
 All collectors should inherit from BaseCollector and implement:
-- _collect_signals(): Fetch raw signals from source
+- _collect_signals(): Fetch raw signals from source, either returning a
+  list or, for long-running collectors, yielding signals (or small batches
+  of them) as an async generator so they are saved while fetching continues
 - _convert_to_signals(): Convert raw data to Signal objects
 """
 
 from __future__ import annotations
 
+import asyncio
+import inspect
 import logging
 from abc import ABC, abstractmethod
 from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator, Callable, Dict, List, Optional, TypeVar
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, TypeVar
 
 import httpx
 
 from collectors.retry_strategy import RetryConfig, with_retry
 from discovery_engine.mcp_server import CollectorResult, CollectorStatus
 from storage.signal_store import SignalStore
+from utils.http_pool import get_http_client
 from utils.rate_limiter import AsyncRateLimiter, get_rate_limiter
 from verification.verification_gate_v2 import Signal
 
+if TYPE_CHECKING:
+    from storage.source_asset_store import BufferedSnapshotWriter, SourceAssetStore
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
@@ -45,6 +54,7 @@ class BaseCollector(ABC):
     - Batch error handling (don't fail entire run if one signal fails)
     - Accurate counting (signals_new vs signals_suppressed)
     - Async context manager pattern
+    - Optional incremental fetching via a per-collector watermark
 
     Usage:
         class MyCollector(BaseCollector):
@@ -52,10 +62,32 @@ class BaseCollector(ABC):
                 # Fetch and convert signals
                 return signals
 
+        # Or stream them: each yield (a Signal or a list of them) is
+        # saved in the background while the next page is fetched
+        class MyStreamingCollector(BaseCollector):
+            async def _collect_signals(self) -> AsyncIterator[Signal]:
+                async for page in pages():
+                    yield [to_signal(item) for item in page]
+
         collector = MyCollector(store=signal_store)
         result = await collector.run(dry_run=True)
     """
 
+    # Signals written per SignalStore transaction in _save_signals()
+    SAVE_BATCH_SIZE = 500
+
+    # Yields (signals or batches) a streaming collector may run ahead of
+    # the store writer before it has to wait
+    STREAM_QUEUE_SIZE = 100
+
+    # Incremental collectors fetch only items newer than the watermark (the
+    # newest item time saved by their previous run) minus WATERMARK_OVERLAP,
+    # which re-covers items published late or whose metrics still change.
+    # They must append to self._errors on any fetch failure they recover
+    # from, so an incomplete run never moves the watermark.
+    INCREMENTAL = False
+    WATERMARK_OVERLAP = timedelta(hours=1)
+
     def __init__(
         self,
         store: Optional[SignalStore] = None,
@@ -78,6 +110,9 @@ class BaseCollector(ABC):
         self.api_name = api_name
         self.asset_store = asset_store
 
+        # Group-committing snapshot writer, set inside _asset_batch()
+        self._asset_writer: Optional["BufferedSnapshotWriter"] = None
+
         # Set up rate limiter based on api_name
         if api_name:
             self._rate_limiter = get_rate_limiter(api_name)
@@ -88,6 +123,12 @@ class BaseCollector(ABC):
         # Track what we've seen in this run
         self._processed_canonical_keys: set[str] = set()
 
+        # Watermark loaded at the start of run(), and the newest item time
+        # seen during it (saved once its signals are)
+        self.incremental = self.INCREMENTAL
+        self._watermark: Optional[datetime] = None
+        self._next_watermark: Optional[datetime] = None
+
         # Statistics
         self._signals_found = 0
         self._signals_new = 0
@@ -113,6 +154,9 @@ class BaseCollector(ABC):
         2. Convert to Signal objects
         3. Return list of signals
 
+        It may instead be an async generator yielding Signals or lists of
+        them; run() then saves them batch by batch as they arrive.
+
         Returns:
             List of Signal objects
         """
@@ -138,33 +182,43 @@ class BaseCollector(ABC):
         self._signals_new = 0
         self._signals_suppressed = 0
         self._errors = []
+        self._next_watermark = None
+        self._watermark = await self._load_watermark()
 
         try:
             # Use context manager if needed
             async with self:
                 # Collect signals from source
-                signals = await self._collect_signals()
-                self._signals_found = len(signals)
+                collected = self._collect_signals()
+                persist = bool(self.store and not dry_run)
 
-                logger.info(f"Collected {self._signals_found} signals from {self.collector_name}")
+                if inspect.isasyncgen(collected):
+                    # Streaming collector: batches are saved as they arrive
+                    await self._consume_signal_stream(collected, dry_run)
+                    logger.info(f"Collected {self._signals_found} signals from {self.collector_name}")
 
-                # If we have a store and not in dry run mode, save signals
-                if self.store and not dry_run:
-                    await self._save_signals(signals)
+                    # Only once every batch is in: items may arrive out of order
+                    if persist and self.incremental:
+                        await self._advance_watermark()
                 else:
-                    # In dry run or no store, just check for duplicates
-                    if self.store:
-                        await self._check_duplicates(signals)
-                    else:
-                        # No store = all signals are "new"
-                        self._signals_new = self._signals_found
-                        self._signals_suppressed = 0
+                    signals = await collected
+                    self._signals_found = len(signals)
+
+                    logger.info(f"Collected {self._signals_found} signals from {self.collector_name}")
+
+                    await self._process_signals(signals, dry_run)
+
+                    # Only after every chunk has committed in its own
+                    # transaction, so it never passes an unsaved item
+                    if persist and self.incremental:
+                        await self._advance_watermark()
 
                 # Determine status
                 if dry_run:
                     status = CollectorStatus.DRY_RUN
                 elif self._errors:
-                    status = CollectorStatus.PARTIAL_SUCCESS
+                    # No partial status: saved signals are still counted below
+                    status = CollectorStatus.ERROR
                 else:
                     status = CollectorStatus.SUCCESS
 
@@ -180,20 +234,137 @@ class BaseCollector(ABC):
 
         except Exception as e:
             logger.exception(f"{self.collector_name} collector failed")
+            # Streamed batches saved before the failure are kept and counted
             return CollectorResult(
                 collector=self.collector_name,
                 status=CollectorStatus.ERROR,
-                signals_found=0,
-                signals_new=0,
-                signals_suppressed=0,
+                signals_found=self._signals_found,
+                signals_new=self._signals_new,
+                signals_suppressed=self._signals_suppressed,
                 dry_run=dry_run,
                 error_message=str(e),
             )
 
+    async def _process_signals(self, signals: List[Signal], dry_run: bool) -> None:
+        """Save signals, or in dry run / without a store, just count them."""
+        if self.store and not dry_run:
+            await self._save_signals(signals)
+        elif self.store:
+            # In dry run, just check for duplicates
+            await self._check_duplicates(signals)
+        else:
+            # No store = all signals are "new"
+            self._signals_new += len(signals)
+
+    async def _consume_signal_stream(
+        self, stream: AsyncIterator[Any], dry_run: bool
+    ) -> None:
+        """
+        Drain a streaming _collect_signals() through a bounded queue.
+
+        The collector keeps fetching while a background task saves what it
+        has yielded so far, merging queued yields into one store batch of
+        up to SAVE_BATCH_SIZE. When the queue is full the collector waits,
+        so memory stays bounded by STREAM_QUEUE_SIZE yields. If the
+        collector fails, everything it yielded before is still saved.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.STREAM_QUEUE_SIZE)
+        writer = asyncio.create_task(self._drain_signal_queue(queue, dry_run))
+
+        try:
+            async for item in stream:
+                batch = list(item) if isinstance(item, (list, tuple)) else [item]
+                if batch:
+                    self._signals_found += len(batch)
+                    await queue.put(batch)
+        finally:
+            await stream.aclose()
+            await queue.put(None)  # End of stream
+            await writer
+
+    async def _drain_signal_queue(self, queue: asyncio.Queue, dry_run: bool) -> None:
+        """Writer side of _consume_signal_stream(); never raises, so the queue always drains."""
+        finished = False
+        while not finished:
+            batch = await queue.get()
+            if batch is None:
+                break
+
+            # Merge whatever else is already waiting, up to one store batch
+            while len(batch) < self.SAVE_BATCH_SIZE and not queue.empty():
+                more = queue.get_nowait()
+                if more is None:
+                    finished = True
+                    break
+                batch.extend(more)
+
+            try:
+                await self._process_signals(batch, dry_run)
+            except Exception as e:
+                error_msg = f"Error processing batch of {len(batch)} streamed signals: {e}"
+                logger.error(error_msg)
+                self._errors.append(error_msg)
+
+    async def _load_watermark(self) -> Optional[datetime]:
+        """Read this collector's watermark, or None (full lookback)."""
+        if not (self.incremental and self.store):
+            return None
+        try:
+            watermark = await self.store.get_watermark(self.collector_name)
+        except Exception as e:
+            logger.warning(f"Could not load {self.collector_name} watermark, fetching full window: {e}")
+            return None
+        if watermark:
+            logger.info(f"{self.collector_name} resuming from watermark {watermark.isoformat()}")
+        return watermark
+
+    def _fetch_cutoff(self, lookback_days: int) -> datetime:
+        """
+        Oldest item time to fetch: the lookback window, narrowed to the
+        watermark minus WATERMARK_OVERLAP when one exists.
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(days=lookback_days)
+        if self._watermark:
+            cutoff = max(cutoff, self._watermark - self.WATERMARK_OVERLAP)
+        return cutoff
+
+    def _observe_item_time(self, item_time: Optional[datetime]) -> None:
+        """Record an item's publish time; the newest becomes the next watermark."""
+        if item_time is None:
+            return
+        if item_time.tzinfo is None:
+            item_time = item_time.replace(tzinfo=timezone.utc)
+        if self._next_watermark is None or item_time > self._next_watermark:
+            self._next_watermark = item_time
+
+    async def _advance_watermark(self) -> None:
+        """
+        Save the newest item time seen this run as the watermark.
+
+        Skipped if the run recorded any error: a signal that failed to
+        save, or a page or request the collector could not fetch. The
+        next run then fetches those items again.
+        """
+        if self._next_watermark is None:
+            return
+        if self._errors:
+            logger.warning(
+                f"Not advancing {self.collector_name} watermark: "
+                f"run incomplete ({len(self._errors)} errors)"
+            )
+            return
+        await self.store.set_watermark(self.collector_name, self._next_watermark)
+
     async def _save_signals(self, signals: List[Signal]) -> None:
         """
         Save signals to SignalStore with deduplication checking.
 
+        Signals are written in chunks of SAVE_BATCH_SIZE through
+        SignalStore.save_signals_batch(), so each chunk costs one
+        transaction instead of one per signal. If a chunk fails as a
+        whole, its signals are retried one at a time so a single bad
+        signal doesn't fail the entire batch.
+
         Updates:
         - self._signals_new: Count of successfully saved signals
         - self._signals_suppressed: Count of duplicate/suppressed signals
@@ -208,68 +379,44 @@ class BaseCollector(ABC):
 
         logger.info(f"Saving {len(signals)} signals to SignalStore...")
 
+        batch: List[tuple[Signal, str]] = []
         for signal in signals:
-            try:
-                # Extract canonical key from signal
-                canonical_key = self._extract_canonical_key(signal)
-
-                if not canonical_key:
-                    logger.warning(
-                        f"Signal {signal.id} has no canonical key, "
-                        f"using signal ID as fallback"
-                    )
-                    canonical_key = signal.id
-
-                # Skip if we already processed this key in this run
-                if canonical_key in self._processed_canonical_keys:
-                    logger.debug(f"Already processed {canonical_key} in this run")
-                    self._signals_suppressed += 1
-                    continue
-
-                # Check if already in database
-                is_duplicate = await self.store.is_duplicate(canonical_key)
-
-                if is_duplicate:
-                    logger.debug(f"Duplicate signal: {canonical_key}")
-                    self._signals_suppressed += 1
-                    self._processed_canonical_keys.add(canonical_key)
-                    continue
-
-                # Check suppression cache (already in Notion?)
-                suppression = await self.store.check_suppression(canonical_key)
-                if suppression:
-                    logger.debug(
-                        f"Suppressed signal: {canonical_key} "
-                        f"(already in Notion as {suppression.notion_page_id})"
-                    )
-                    self._signals_suppressed += 1
-                    self._processed_canonical_keys.add(canonical_key)
-                    continue
-
-                # New signal! Save it
-                signal_id = await self.store.save_signal(
-                    signal_type=signal.signal_type,
-                    source_api=signal.source_api,
-                    canonical_key=canonical_key,
-                    confidence=signal.confidence,
-                    raw_data=signal.raw_data,
-                    company_name=signal.raw_data.get("company_name"),
-                    detected_at=signal.detected_at,
-                )
+            # Extract canonical key from signal
+            canonical_key = self._extract_canonical_key(signal)
 
-                logger.info(
-                    f"Saved signal {signal_id}: {signal.signal_type} "
-                    f"for {canonical_key} (confidence: {signal.confidence:.2f})"
+            if not canonical_key:
+                logger.warning(
+                    f"Signal {signal.id} has no canonical key, "
+                    f"using signal ID as fallback"
                 )
+                canonical_key = signal.id
 
-                self._signals_new += 1
-                self._processed_canonical_keys.add(canonical_key)
+            # Skip if we already processed this key in this run
+            if canonical_key in self._processed_canonical_keys:
+                logger.debug(f"Already processed {canonical_key} in this run")
+                self._signals_suppressed += 1
+                continue
 
+            self._processed_canonical_keys.add(canonical_key)
+            batch.append((signal, canonical_key))
+
+        for start in range(0, len(batch), self.SAVE_BATCH_SIZE):
+            chunk = batch[start:start + self.SAVE_BATCH_SIZE]
+            try:
+                await self._save_batch(chunk)
             except Exception as e:
-                error_msg = f"Error saving signal {signal.id}: {str(e)}"
-                logger.error(error_msg)
-                self._errors.append(error_msg)
-                # Continue with next signal - don't fail entire batch
+                logger.warning(
+                    f"Batch save of {len(chunk)} signals failed ({e}), "
+                    f"retrying individually"
+                )
+                for item in chunk:
+                    try:
+                        await self._save_batch([item])
+                    except Exception as e:
+                        error_msg = f"Error saving signal {item[0].id}: {str(e)}"
+                        logger.error(error_msg)
+                        self._errors.append(error_msg)
+                        # Continue with next signal - don't fail entire batch
 
         logger.info(
             f"Save complete: {self._signals_new} new, "
@@ -277,6 +424,38 @@ class BaseCollector(ABC):
             f"{len(self._errors)} errors"
         )
 
+    async def _save_batch(self, batch: List[tuple[Signal, str]]) -> None:
+        """Save (signal, canonical_key) pairs in one store transaction and update counts."""
+        results = await self.store.save_signals_batch([
+            {
+                "signal_type": signal.signal_type,
+                "source_api": signal.source_api,
+                "canonical_key": canonical_key,
+                "confidence": signal.confidence,
+                "raw_data": signal.raw_data,
+                "company_name": signal.raw_data.get("company_name"),
+                "detected_at": signal.detected_at,
+            }
+            for signal, canonical_key in batch
+        ])
+
+        for (signal, canonical_key), result in zip(batch, results):
+            if result.status == "duplicate":
+                logger.debug(f"Duplicate signal: {canonical_key}")
+                self._signals_suppressed += 1
+            elif result.status == "suppressed":
+                logger.debug(
+                    f"Suppressed signal: {canonical_key} "
+                    f"(already in Notion as {result.suppression.notion_page_id})"
+                )
+                self._signals_suppressed += 1
+            else:
+                logger.info(
+                    f"Saved signal {result.signal_id}: {signal.signal_type} "
+                    f"for {canonical_key} (confidence: {signal.confidence:.2f})"
+                )
+                self._signals_new += 1
+
     async def _check_duplicates(self, signals: List[Signal]) -> None:
         """
         Check signals against SignalStore for duplicates (dry run mode).
@@ -293,36 +472,40 @@ class BaseCollector(ABC):
 
         logger.info(f"Checking {len(signals)} signals for duplicates (dry run)...")
 
+        keys: List[str] = []
         for signal in signals:
-            try:
-                canonical_key = self._extract_canonical_key(signal)
+            canonical_key = self._extract_canonical_key(signal)
 
-                if not canonical_key:
-                    canonical_key = signal.id
+            if not canonical_key:
+                canonical_key = signal.id
 
-                # Skip if already checked in this run
-                if canonical_key in self._processed_canonical_keys:
-                    self._signals_suppressed += 1
-                    continue
+            # Skip if already checked in this run
+            if canonical_key in self._processed_canonical_keys:
+                self._signals_suppressed += 1
+                continue
 
-                # Check database
-                is_duplicate = await self.store.is_duplicate(canonical_key)
+            self._processed_canonical_keys.add(canonical_key)
+            keys.append(canonical_key)
 
-                if is_duplicate:
-                    self._signals_suppressed += 1
-                else:
-                    # Check suppression cache
-                    suppression = await self.store.check_suppression(canonical_key)
-                    if suppression:
-                        self._signals_suppressed += 1
-                    else:
-                        self._signals_new += 1
+        if not keys:
+            return
 
-                self._processed_canonical_keys.add(canonical_key)
+        try:
+            # Two set-based lookups instead of two queries per signal
+            existing = await self.store.existing_keys(keys)
+            suppressed = await self.store.suppression_for(
+                [key for key in keys if key not in existing]
+            )
+        except Exception as e:
+            logger.warning(f"Error checking {len(keys)} signals for duplicates: {e}")
+            # Assume new if we can't check
+            self._signals_new += len(keys)
+            return
 
-            except Exception as e:
-                logger.warning(f"Error checking signal {signal.id}: {e}")
-                # Assume new if we can't check
+        for canonical_key in keys:
+            if canonical_key in existing or canonical_key in suppressed:
+                self._signals_suppressed += 1
+            else:
                 self._signals_new += 1
 
     def _extract_canonical_key(self, signal: Signal) -> str:
@@ -360,14 +543,20 @@ class BaseCollector(ABC):
         """Get the rate limiter for this collector's API."""
         return self._rate_limiter
 
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Shared keep-alive client for this collector's API (owned by the pool, don't close)."""
+        return get_http_client(self.api_name or self.collector_name)
+
     async def _save_asset_with_change_detection(
         self, source_type: str, external_id: str, raw_data: Dict[str, Any]
     ) -> tuple[bool, list]:
         """
         Save asset and detect changes.
 
-        Saves the raw API response to SourceAssetStore and compares with
-        the latest snapshot to detect changes. Enables idempotent runs.
+        Records the raw API response in SourceAssetStore, which compares its
+        hash with the latest snapshot's. Unchanged payloads aren't rewritten,
+        so re-runs are idempotent.
 
         Args:
             source_type: Type of source (e.g., "github_repo", "product_hunt")
@@ -375,44 +564,50 @@ class BaseCollector(ABC):
             raw_data: Raw API response data as dict
 
         Returns:
-            (is_new, changes): is_new=True if first snapshot, changes=[] if no changes
+            (is_new, changes): is_new=True if first snapshot, changes=[] if no
+            changes, otherwise field-level [{"field", "old", "new"}] entries
         """
         if not self.asset_store:
             return (True, [])
 
-        import json
-        from datetime import datetime
-        from storage.source_asset_store import SourceAsset
-
-        # Get latest snapshot for change detection
-        latest = await self.asset_store.get_latest_snapshot(
+        # Hash comparison; unchanged payloads only touch fetched_at
+        recorder = self._asset_writer or self.asset_store
+        result = await recorder.record_snapshot(
             source_type=source_type,
             external_id=external_id,
+            raw_payload=raw_data,
         )
 
-        # Detect changes by comparing JSON representations
-        is_new = latest is None
-        changes = []
+        return (result.is_new, result.changes)
 
-        if not is_new:
-            # Compare latest and current data
-            latest_json = json.dumps(latest, sort_keys=True)
-            curr_json = json.dumps(raw_data, sort_keys=True)
-            if latest_json != curr_json:
-                # Record that changes were detected
-                changes = [{"field": "data", "old": latest, "new": raw_data}]
+    @asynccontextmanager
+    async def _asset_batch(
+        self, source_type: str, external_ids: Sequence[str] = ()
+    ) -> AsyncIterator[None]:
+        """
+        Batch the _save_asset_with_change_detection() calls made inside the block.
 
-        # Create and save the asset
-        asset = SourceAsset(
-            source_type=source_type,
-            external_id=external_id,
-            raw_payload=raw_data,
-            fetched_at=datetime.utcnow(),
-            change_detected=len(changes) > 0,
-        )
-        await self.asset_store.save_asset(asset)
+        Latest snapshots for external_ids are loaded in one query, and writes
+        are group-committed by a BufferedSnapshotWriter that is flushed on
+        exit. Ids not listed up front still work, at one lookup each.
 
-        return (is_new, changes)
+        Usage:
+            async with self._asset_batch(self.SOURCE_TYPE, [p.id for p in posts]):
+                for post in posts:
+                    is_new, changes = await self._save_asset_with_change_detection(...)
+        """
+        if not self.asset_store or self._asset_writer:
+            yield
+            return
+
+        async with self.asset_store.buffered_writer() as writer:
+            if external_ids:
+                await writer.prefetch(source_type, external_ids)
+            self._asset_writer = writer
+            try:
+                yield
+            finally:
+                self._asset_writer = None
 
     async def _fetch_with_retry(self, func: Callable[[], T]) -> T:
         """
@@ -481,10 +676,11 @@ class BaseCollector(ABC):
             Exception: On exhausted retries
         """
         async def do_request() -> Any:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.get(url, headers=headers, params=params)
-                response.raise_for_status()
-                return response.json()
+            response = await self.http_client.get(
+                url, headers=headers, params=params, timeout=timeout
+            )
+            response.raise_for_status()
+            return response.json()
 
         return await self._fetch_with_retry(do_request)
 
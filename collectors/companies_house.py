@@ -326,6 +326,9 @@ class CompaniesHouseCollector(BaseCollector):
         result = await collector.run(dry_run=False)
     """
 
+    # SourceAssetStore source_type for raw snapshots
+    SOURCE_TYPE = "companies_house"
+
     def __init__(
         self,
         store: Optional[SignalStore] = None,
@@ -403,21 +406,22 @@ class CompaniesHouseCollector(BaseCollector):
 
         # Convert to signals and detect changes
         signals = []
-        for company in companies:
-            # Save raw data and detect changes
-            if self.asset_store:
-                is_new, changes = await self._save_asset_with_change_detection(
-                    source_type=self.SOURCE_TYPE,
-                    external_id=company.company_number,
-                    raw_data=company.to_dict() if hasattr(company, 'to_dict') else vars(company),
-                )
-
-                # Skip unchanged companies
-                if not is_new and not changes:
-                    logger.debug(f"Skipping unchanged company: {company.company_number}")
-                    continue
-
-            signals.append(company.to_signal())
+        async with self._asset_batch(self.SOURCE_TYPE, [company.company_number for company in companies]):
+            for company in companies:
+                # Save raw data and detect changes
+                if self.asset_store:
+                    is_new, changes = await self._save_asset_with_change_detection(
+                        source_type=self.SOURCE_TYPE,
+                        external_id=company.company_number,
+                        raw_data=company.to_dict() if hasattr(company, 'to_dict') else vars(company),
+                    )
+
+                    # Skip unchanged companies
+                    if not is_new and not changes:
+                        logger.debug(f"Skipping unchanged company: {company.company_number}")
+                        continue
+
+                signals.append(company.to_signal())
 
         return signals
 
@@ -36,9 +36,10 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import logging
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 from urllib.parse import urlparse
 
 import httpx
@@ -52,7 +53,7 @@ from collectors.base import BaseCollector
 from collectors.retry_strategy import with_retry, RetryConfig
 from discovery_engine.mcp_server import CollectorResult, CollectorStatus
 from storage.signal_store import SignalStore
-from utils.rate_limiter import get_rate_limiter
+from utils.rate_limiter import AsyncRateLimiter, get_rate_limiter
 from utils.canonical_keys import build_canonical_key, build_canonical_key_candidates, normalize_domain
 from verification.verification_gate_v2 import Signal, VerificationStatus
 
@@ -89,9 +90,25 @@ RDAP_ENDPOINTS = {
     "generic": "https://rdap.org/domain/",
 }
 
-# Rate limiting
-RDAP_REQUEST_DELAY = 0.5  # seconds between requests (be respectful)
+# Rate limiting: each RDAP server (registry) gets its own concurrency cap and
+# requests-per-second budget, so .com, .io and .ai lookups run in parallel
+# without hammering any single registry
+RDAP_SERVER_LIMITS: Dict[str, Dict[str, int]] = {
+    "rdap.verisign.com": {"concurrency": 8, "rate": 10},  # .com / .net
+    "rdap.google.com": {"concurrency": 4, "rate": 5},     # .dev / .app
+    "rdap.org": {"concurrency": 2, "rate": 2},            # Bootstrap redirector
+}
+RDAP_DEFAULT_SERVER_LIMITS = {"concurrency": 4, "rate": 2}
+RDAP_MAX_CONCURRENCY = 16  # Lookups in flight across all servers
+RDAP_MEMO_TTL = 24 * 3600  # seconds; registration data rarely changes
+RDAP_MEMO_MAX_ENTRIES = 10_000  # Oldest lookups are dropped past this
 RDAP_TIMEOUT = 10.0  # seconds
+RDAP_HEADERS = {"Accept": "application/rdap+json,application/json"}
+
+
+def rdap_endpoint(tld: str) -> str:
+    """RDAP base URL for a TLD (rdap.org bootstrap for unlisted TLDs)."""
+    return RDAP_ENDPOINTS.get(tld, RDAP_ENDPOINTS["generic"])
 
 
 # =============================================================================
@@ -274,12 +291,22 @@ class DomainWhoisCollector(BaseCollector):
         # Most RDAP servers don't provide feeds, so this is mainly for enrichment
     """
 
+    # SourceAssetStore source_type for raw snapshots
+    SOURCE_TYPE = "domain_registration"
+
+    # Lookups by normalized domain: (time.monotonic() when fetched, result),
+    # shared by all instances in the process. None means not registered.
+    # Kept in fetch order so expired and oldest entries sit at the front.
+    _rdap_memo: Dict[str, Tuple[float, Optional["DomainRegistration"]]] = {}
+
     def __init__(
         self,
         store: Optional[SignalStore] = None,
         lookback_days: int = 90,
         max_domains: int = 100,
         tech_tlds_only: bool = False,
+        max_concurrency: int = RDAP_MAX_CONCURRENCY,
+        memo_ttl: float = RDAP_MEMO_TTL,
     ):
         """
         Args:
@@ -287,12 +314,19 @@ class DomainWhoisCollector(BaseCollector):
             lookback_days: Only flag domains registered within this window
             max_domains: Maximum number of domains to check
             tech_tlds_only: Only return signals for tech TLDs
+            max_concurrency: RDAP lookups in flight across all servers
+            memo_ttl: Seconds to reuse a domain's lookup result (0 = off)
         """
         super().__init__(store=store, collector_name="domain_whois")
 
         self.lookback_days = lookback_days
         self.max_domains = max_domains
         self.tech_tlds_only = tech_tlds_only
+        self.max_concurrency = max(1, max_concurrency)
+        self.memo_ttl = memo_ttl
+
+        # Per-RDAP-server (semaphore, rate limiter), created on first use
+        self._server_limits: Dict[str, Tuple[asyncio.Semaphore, AsyncRateLimiter]] = {}
 
         self._client: Optional[httpx.AsyncClient] = None
         self._processed_domains: Set[str] = set()
@@ -300,19 +334,14 @@ class DomainWhoisCollector(BaseCollector):
 
     async def __aenter__(self):
         """Async context manager entry"""
-        self._client = httpx.AsyncClient(
-            timeout=RDAP_TIMEOUT,
-            follow_redirects=True,
-            headers={
-                "Accept": "application/rdap+json,application/json",
-            }
-        )
+        # Pooled keep-alive client (and HTTP cache, when configured); the
+        # pool closes it, not the collector
+        self._client = self.http_client
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        if self._client:
-            await self._client.aclose()
+        self._client = None
 
     async def run(
         self,
@@ -414,7 +443,7 @@ class DomainWhoisCollector(BaseCollector):
         Returns:
             List of DomainRegistration objects
         """
-        registrations: List[DomainRegistration] = []
+        to_check: Dict[str, None] = {}  # Ordered set
 
         for domain in domains:
             # Normalize domain
@@ -427,20 +456,71 @@ class DomainWhoisCollector(BaseCollector):
                 logger.debug(f"Already processed: {normalized}")
                 continue
 
-            try:
-                registration = await self._fetch_domain_rdap(normalized)
-                if registration:
-                    registrations.append(registration)
-                    self._processed_domains.add(normalized)
+            to_check[normalized] = None
+
+        # Concurrent lookups, bounded overall and per RDAP server
+        slots = asyncio.Semaphore(self.max_concurrency)
+        results = await asyncio.gather(
+            *(self._check_domain(domain, slots) for domain in to_check)
+        )
+        return [registration for registration in results if registration]
+
+    def _limits_for_server(self, server: str) -> Tuple[asyncio.Semaphore, AsyncRateLimiter]:
+        """Concurrency semaphore and rate limiter for an RDAP server."""
+        if server not in self._server_limits:
+            limits = RDAP_SERVER_LIMITS.get(server, RDAP_DEFAULT_SERVER_LIMITS)
+            self._server_limits[server] = (
+                asyncio.Semaphore(limits["concurrency"]),
+                AsyncRateLimiter(rate=limits["rate"], period=1),
+            )
+        return self._server_limits[server]
+
+    async def _check_domain(
+        self, domain: str, slots: asyncio.Semaphore
+    ) -> Optional[DomainRegistration]:
+        """
+        Look up one normalized domain, reusing a fresh memoized result.
 
-                # Rate limiting
-                await asyncio.sleep(RDAP_REQUEST_DELAY)
+        Errors are logged and not memoized, so the next run retries.
+        """
+        memo = self._rdap_memo.get(domain)
+        if memo and time.monotonic() - memo[0] < self.memo_ttl:
+            registration = memo[1]
+        else:
+            if memo:
+                self._rdap_memo.pop(domain, None)
 
+            tld = domain.rsplit(".", 1)[-1].lower()
+            server = urlparse(rdap_endpoint(tld)).netloc
+            server_slots, server_limiter = self._limits_for_server(server)
+
+            try:
+                async with slots, server_slots:
+                    await server_limiter.acquire()
+                    registration = await self._fetch_domain_rdap(domain)
             except Exception as e:
-                logger.warning(f"Error checking domain {normalized}: {e}")
-                continue
+                logger.warning(f"Error checking domain {domain}: {e}")
+                return None
+
+            if self.memo_ttl > 0:
+                self._remember(domain, registration)
 
-        return registrations
+        if registration:
+            self._processed_domains.add(domain)
+        return registration
+
+    def _remember(self, domain: str, registration: Optional[DomainRegistration]) -> None:
+        """Memoize a lookup, dropping expired entries and the oldest past the cap"""
+        memo = self._rdap_memo
+        now = time.monotonic()
+        memo.pop(domain, None)
+        memo[domain] = (now, registration)
+
+        while memo:
+            oldest = next(iter(memo))
+            if now - memo[oldest][0] < self.memo_ttl and len(memo) <= RDAP_MEMO_MAX_ENTRIES:
+                break
+            del memo[oldest]
 
     async def _fetch_domain_rdap(self, domain: str) -> Optional[DomainRegistration]:
         """
@@ -461,8 +541,7 @@ class DomainWhoisCollector(BaseCollector):
         tld = parts[-1].lower()
 
         # Choose RDAP endpoint
-        rdap_base = RDAP_ENDPOINTS.get(tld, RDAP_ENDPOINTS["generic"])
-        rdap_url = f"{rdap_base}{domain}"
+        rdap_url = f"{rdap_endpoint(tld)}{domain}"
 
         logger.debug(f"Fetching RDAP data: {rdap_url}")
 
@@ -472,7 +551,12 @@ class DomainWhoisCollector(BaseCollector):
 
             # Wrap HTTP request with retry logic
             async def fetch_rdap():
-                response = await self._client.get(rdap_url)
+                response = await self._client.get(
+                    rdap_url,
+                    headers=RDAP_HEADERS,
+                    timeout=RDAP_TIMEOUT,
+                    follow_redirects=True,
+                )
 
                 # 404 is expected for non-registered domains - don't retry
                 if response.status_code == 404:
@@ -507,7 +591,7 @@ class DomainWhoisCollector(BaseCollector):
         tld: str,
         rdap_url: str,
         rdap_data: Dict[str, Any]
-    ) -> Optional[DomainRegistration]:
+    ) -> DomainRegistration:
         """
         Parse RDAP JSON response into DomainRegistration.
 
@@ -519,6 +603,10 @@ class DomainWhoisCollector(BaseCollector):
         - entities: registrar, registrant
         - nameservers
         - status
+
+        Raises:
+            ValueError: If the response is malformed. Unlike a 404 this says
+                nothing about registration, so it must not be memoized.
         """
         try:
             # Extract registration/expiration dates from events
@@ -617,8 +705,7 @@ class DomainWhoisCollector(BaseCollector):
             )
 
         except Exception as e:
-            logger.error(f"Error parsing RDAP response for {domain}: {e}")
-            return None
+            raise ValueError(f"Error parsing RDAP response for {domain}: {e}") from e
 
     async def check_domain(self, domain: str) -> Optional[DomainRegistration]:
         """
@@ -11,7 +11,7 @@ Focus areas:
 Strategy:
 1. Search for trending repos by stars/recency
 2. Filter by relevant topics (ai, ml, llm, infrastructure, developer-tools)
-3. Identify the company/org behind the repo
+3. Identify the company/org behind the repo (batched GraphQL, REST fallback)
 4. Calculate spike metrics (growth rate, velocity)
 5. Build canonical keys for deduplication
 6. Return signals compatible with verification_gate_v2
@@ -111,6 +111,27 @@ MIN_GROWTH_RATE = 0.1  # 10% growth in lookback period
 GITHUB_RATE_LIMIT_DELAY = 1.0  # seconds between requests
 GITHUB_MAX_RETRIES = 3
 
+# GraphQL batch enrichment: repos per query (GitHub allows up to 100 aliased
+# nodes; 50 keeps each query well under the 500k-node and timeout limits)
+GRAPHQL_BATCH_SIZE = 50
+
+# Fields fetched per repo; the owner fragment replaces the REST
+# /orgs/{login} -> /users/{login} lookups
+GRAPHQL_REPO_FIELDS = """
+    nameWithOwner
+    stargazerCount
+    forkCount
+    pushedAt
+    updatedAt
+    repositoryTopics(first: 20) { nodes { topic { name } } }
+    owner {
+      __typename
+      login
+      ... on Organization { name description websiteUrl email }
+      ... on User { name company bio websiteUrl email }
+    }
+"""
+
 
 # =============================================================================
 # DATA CLASSES
@@ -204,6 +225,9 @@ class GitHubCollector(BaseCollector):
         result = await collector.run(dry_run=False)
     """
 
+    # SourceAssetStore source_type for raw snapshots
+    SOURCE_TYPE = "github_repo"
+
     def __init__(
         self,
         store: Optional[SignalStore] = None,
@@ -212,6 +236,7 @@ class GitHubCollector(BaseCollector):
         max_repos: int = 100,
         topic_mode: TopicMode = TopicMode.TECH,
         star_change_threshold: float = 0.10,
+        use_graphql: bool = True,
     ):
         """
         Args:
@@ -221,8 +246,10 @@ class GitHubCollector(BaseCollector):
             max_repos: Maximum repos to analyze per run
             topic_mode: TopicMode.TECH (default) or TopicMode.CONSUMER
             star_change_threshold: Minimum percentage change in stars to detect (default 10%)
+            use_graphql: Enrich repos in batched GraphQL queries (REST per
+                repo for anything GraphQL can't resolve)
         """
-        super().__init__(store=store, collector_name="github")
+        super().__init__(store=store, collector_name="github", api_name="github")
 
         self.github_token = github_token or os.getenv("GITHUB_TOKEN")
         if not self.github_token:
@@ -232,6 +259,7 @@ class GitHubCollector(BaseCollector):
         self.max_repos = max_repos
         self.topic_mode = topic_mode
         self.star_change_threshold = star_change_threshold
+        self.use_graphql = use_graphql
 
         self.base_url = "https://api.github.com"
         self.headers = {
@@ -249,13 +277,13 @@ class GitHubCollector(BaseCollector):
 
     async def __aenter__(self):
         """Async context manager entry"""
-        self.client = httpx.AsyncClient(timeout=30.0)
+        # Pooled keep-alive client; the pool closes it, not the collector
+        self.client = self.http_client
         return await super().__aenter__()
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        if self.client:
-            await self.client.aclose()
+        self.client = None
         return await super().__aexit__(exc_type, exc_val, exc_tb)
 
     async def _collect_signals(self) -> List[Signal]:
@@ -273,23 +301,40 @@ class GitHubCollector(BaseCollector):
         # Step 2: Enrich with metrics and owner data
         logger.info("Enriching repository data...")
         enriched_repos: List[RepoMetrics] = []
-        for repo_data in repos[:self.max_repos]:
+        candidates = repos[:self.max_repos]
+        to_enrich: List[Dict[str, Any]] = []
+        async with self._asset_batch(
+            self.SOURCE_TYPE, [repo_data.get('full_name') for repo_data in candidates]
+        ):
+            for repo_data in candidates:
+                try:
+                    repo_name = repo_data.get('full_name')
+
+                    # Save raw data and detect changes
+                    if self.asset_store:
+                        is_new, changes = await self._save_asset_with_change_detection(
+                            source_type=self.SOURCE_TYPE,
+                            external_id=repo_name,
+                            raw_data=repo_data,
+                        )
+
+                        # Skip unchanged repos (already processed)
+                        if not is_new and not changes:
+                            logger.debug(f"Skipping unchanged repository: {repo_name}")
+                            continue
+
+                    to_enrich.append(repo_data)
+                except Exception as e:
+                    logger.warning(f"Failed to enrich {repo_data.get('full_name')}: {e}")
+                    # Continue with next repo - don't fail entire batch
+
+        # Batch-fetch owner details (and fresh counts) so enrichment below
+        # needs no per-repo REST calls
+        if self.use_graphql and to_enrich:
+            await self._prefetch_graphql(to_enrich)
+
+        for repo_data in to_enrich:
             try:
-                repo_name = repo_data.get('full_name')
-
-                # Save raw data and detect changes
-                if self.asset_store:
-                    is_new, changes = await self._save_asset_with_change_detection(
-                        source_type=self.SOURCE_TYPE,
-                        external_id=repo_name,
-                        raw_data=repo_data,
-                    )
-
-                    # Skip unchanged repos (already processed)
-                    if not is_new and not changes:
-                        logger.debug(f"Skipping unchanged repository: {repo_name}")
-                        continue
-
                 metrics = await self._enrich_repo_metrics(repo_data)
                 if metrics.is_relevant:
                     enriched_repos.append(metrics)
@@ -370,6 +415,97 @@ class GitHubCollector(BaseCollector):
         # Wrap the request with retry logic
         return await with_retry(make_request, self.retry_config)
 
+    async def _prefetch_graphql(self, repos: List[Dict[str, Any]]) -> int:
+        """
+        Enrich repos in GraphQL batches of GRAPHQL_BATCH_SIZE.
+
+        Updates each repo dict in place with current stars, forks, topics
+        and push/update times, and fills the owner cache, so
+        _enrich_repo_metrics() makes no REST calls for them. Repos in a
+        failed batch, or that GraphQL can't resolve, are left to the REST
+        path.
+
+        Returns:
+            Number of repos resolved via GraphQL
+        """
+        resolved = 0
+        for start in range(0, len(repos), GRAPHQL_BATCH_SIZE):
+            batch = repos[start:start + GRAPHQL_BATCH_SIZE]
+            try:
+                nodes = await self._graphql_repo_batch(
+                    [repo_data["full_name"] for repo_data in batch]
+                )
+            except Exception as e:
+                logger.warning(
+                    f"GraphQL batch of {len(batch)} repos failed, falling back to REST: {e}"
+                )
+                continue
+
+            for repo_data, node in zip(batch, nodes):
+                if node:
+                    self._apply_graphql_node(repo_data, node)
+                    resolved += 1
+
+        logger.info(f"GraphQL enriched {resolved}/{len(repos)} repositories")
+        return resolved
+
+    async def _graphql_repo_batch(self, full_names: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch one batch of repositories in a single GraphQL query.
+
+        Returns:
+            One node per full name, in order (None where not resolved)
+        """
+        variables: Dict[str, str] = {}
+        params: List[str] = []
+        fields: List[str] = []
+        for i, full_name in enumerate(full_names):
+            owner, name = full_name.split("/", 1)
+            variables[f"o{i}"] = owner
+            variables[f"n{i}"] = name
+            params.append(f"$o{i}: String!, $n{i}: String!")
+            fields.append(f"r{i}: repository(owner: $o{i}, name: $n{i}) {{{GRAPHQL_REPO_FIELDS}}}")
+
+        query = f"query({', '.join(params)}) {{\n" + "\n".join(fields) + "\n}"
+        result = await self._github_request(
+            "POST", "/graphql", json={"query": query, "variables": variables}
+        )
+
+        data = result.get("data")
+        if not isinstance(data, dict):
+            raise ValueError(f"GraphQL response has no data: {result.get('errors')}")
+        if result.get("errors"):
+            # Partial success (e.g. a renamed or deleted repo resolves to null)
+            logger.debug(f"GraphQL batch errors: {result['errors']}")
+
+        return [data.get(f"r{i}") for i in range(len(full_names))]
+
+    def _apply_graphql_node(self, repo_data: Dict[str, Any], node: Dict[str, Any]) -> None:
+        """Merge a GraphQL repository node into REST-shaped repo and owner data."""
+        repo_data["stargazers_count"] = node.get("stargazerCount", repo_data.get("stargazers_count"))
+        repo_data["forks_count"] = node.get("forkCount", repo_data.get("forks_count"))
+        for rest_key, graphql_key in (("pushed_at", "pushedAt"), ("updated_at", "updatedAt")):
+            if node.get(graphql_key):
+                repo_data[rest_key] = node[graphql_key]
+
+        topic_nodes = (node.get("repositoryTopics") or {}).get("nodes") or []
+        if topic_nodes:
+            repo_data["topics"] = [t["topic"]["name"] for t in topic_nodes if t.get("topic")]
+
+        owner = node.get("owner") or {}
+        login = owner.get("login")
+        if login and login not in self._org_cache:
+            is_org = owner.get("__typename") == "Organization"
+            self._org_cache[login] = {
+                "login": login,
+                "name": owner.get("name"),
+                "type": "Organization" if is_org else "User",
+                "company": owner.get("company"),
+                "bio": owner.get("description") if is_org else owner.get("bio"),
+                "blog": owner.get("websiteUrl"),
+                "email": owner.get("email") or None,
+            }
+
     async def _rate_limit(self):
         """Proactive rate limiting between requests"""
         now = datetime.now(timezone.utc)
@@ -818,52 +954,52 @@ class GitHubCollector(BaseCollector):
             - "changed": List of repo dicts with significant changes
             - "unchanged": List of repo dicts with minor/no changes
         """
-        from storage.source_asset_store import SourceAsset
-
         delta: Dict[str, List[Dict[str, Any]]] = {
             "new": [],
             "changed": [],
             "unchanged": [],
         }
 
-        for repo in current_repos:
-            full_name = repo.get("full_name", "")
-            current_stars = repo.get("stargazers_count", 0)
-
-            # Get previous snapshot
-            previous = await asset_store.get_latest_snapshot(
-                source_type="github_repo",
-                external_id=full_name,
+        async with asset_store.buffered_writer() as writer:
+            # Previous snapshots for all repos in one lookup; writes are group-committed
+            previous_snapshots = await writer.prefetch(
+                "github_repo", [repo.get("full_name", "") for repo in current_repos]
             )
 
-            change_detected = False
-            if previous is None:
-                # New repo - not in previous snapshot
-                delta["new"].append(repo)
-                change_detected = True
-            else:
-                # Existing repo - check for significant change
-                previous_stars = previous.get("stargazers_count", 0)
+            for repo in current_repos:
+                full_name = repo.get("full_name", "")
+                current_stars = repo.get("stargazers_count", 0)
 
-                if previous_stars > 0:
-                    change_rate = (current_stars - previous_stars) / previous_stars
-                else:
-                    change_rate = 1.0 if current_stars > 0 else 0.0
+                previous = previous_snapshots.get(full_name)
 
-                if change_rate >= self.star_change_threshold:
-                    delta["changed"].append(repo)
+                change_detected = False
+                if previous is None:
+                    # New repo - not in previous snapshot
+                    delta["new"].append(repo)
                     change_detected = True
                 else:
-                    delta["unchanged"].append(repo)
-
-            # Save current snapshot
-            await asset_store.save_asset(SourceAsset(
-                source_type="github_repo",
-                external_id=full_name,
-                raw_payload=repo,
-                fetched_at=datetime.now(timezone.utc),
-                change_detected=change_detected,
-            ))
+                    # Existing repo - check for significant change
+                    previous_stars = previous.get("stargazers_count", 0)
+
+                    if previous_stars > 0:
+                        change_rate = (current_stars - previous_stars) / previous_stars
+                    else:
+                        change_rate = 1.0 if current_stars > 0 else 0.0
+
+                    if change_rate >= self.star_change_threshold:
+                        delta["changed"].append(repo)
+                        change_detected = True
+                    else:
+                        delta["unchanged"].append(repo)
+
+                # Save current snapshot (an identical payload only touches fetched_at)
+                await writer.record_snapshot(
+                    source_type="github_repo",
+                    external_id=full_name,
+                    raw_payload=repo,
+                    fetched_at=datetime.now(timezone.utc),
+                    change_detected=change_detected,
+                )
 
         logger.info(
             f"Delta computed: {len(delta['new'])} new, "
@@ -226,6 +226,14 @@ class HackerNewsCollector(BaseCollector):
         result = await collector.run(dry_run=True)
     """
 
+    # SourceAssetStore source_type for raw snapshots
+    SOURCE_TYPE = "hacker_news"
+
+    # Show HN mode fetches only posts since the last saved run. Points keep
+    # accruing after posting, so re-check the day before the watermark too.
+    INCREMENTAL = True
+    WATERMARK_OVERLAP = timedelta(days=1)
+
     def __init__(
         self,
         store: Optional[SignalStore] = None,
@@ -250,6 +258,9 @@ class HackerNewsCollector(BaseCollector):
         self.search_domains = search_domains
         self.client: Optional[httpx.AsyncClient] = None
 
+        # Domain searches cover a caller-chosen list, not one feed
+        self.incremental = self.INCREMENTAL and not search_domains
+
     async def __aenter__(self):
         self.client = httpx.AsyncClient(timeout=30.0)
         return self
@@ -263,21 +274,22 @@ class HackerNewsCollector(BaseCollector):
         posts = await self._fetch_posts()
 
         signals = []
-        for post in posts:
-            # Save raw data and detect changes
-            if self.asset_store:
-                is_new, changes = await self._save_asset_with_change_detection(
-                    source_type=self.SOURCE_TYPE,
-                    external_id=str(post.story_id),
-                    raw_data=post.to_dict() if hasattr(post, 'to_dict') else vars(post),
-                )
-
-                # Skip unchanged posts
-                if not is_new and not changes:
-                    logger.debug(f"Skipping unchanged HN post: {post.story_id}")
-                    continue
-
-            signals.append(post.to_signal())
+        async with self._asset_batch(self.SOURCE_TYPE, [post.object_id for post in posts]):
+            for post in posts:
+                # Save raw data and detect changes
+                if self.asset_store:
+                    is_new, changes = await self._save_asset_with_change_detection(
+                        source_type=self.SOURCE_TYPE,
+                        external_id=post.object_id,
+                        raw_data=post.to_dict() if hasattr(post, 'to_dict') else vars(post),
+                    )
+
+                    # Skip unchanged posts
+                    if not is_new and not changes:
+                        logger.debug(f"Skipping unchanged HN post: {post.object_id}")
+                        continue
+
+                signals.append(post.to_signal())
 
         return signals
 
@@ -290,8 +302,8 @@ class HackerNewsCollector(BaseCollector):
         """
         posts: List[HackerNewsPost] = []
 
-        # Calculate timestamp for lookback
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=self.lookback_days)
+        # Calculate timestamp for lookback (narrowed to the watermark on incremental runs)
+        cutoff_date = self._fetch_cutoff(self.lookback_days)
         cutoff_timestamp = int(cutoff_date.timestamp())
 
         if self.search_domains:
@@ -307,6 +319,8 @@ class HackerNewsCollector(BaseCollector):
 
         # Filter by minimum points
         filtered_posts = [p for p in posts if p.points >= self.min_points]
+        for post in filtered_posts:
+            self._observe_item_time(post.created_at)
 
         logger.info(
             f"Fetched {len(filtered_posts)} HN posts "
@@ -361,11 +375,16 @@ class HackerNewsCollector(BaseCollector):
                 page += 1
                 await asyncio.sleep(0.2)  # Rate limit courtesy
 
+            # A failed page leaves the run incomplete, which keeps the
+            # watermark where it was
             except httpx.HTTPError as e:
-                logger.error(f"HN HTTP error: {e}")
+                error_msg = f"HN HTTP error on page {page + 1}: {e}"
+                logger.error(error_msg)
+                self._errors.append(error_msg)
                 break
             except Exception as e:
                 logger.exception(f"HN fetch error: {e}")
+                self._errors.append(f"HN fetch error on page {page + 1}: {e}")
                 break
 
         return posts
@@ -27,7 +27,7 @@ import os
 import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 import httpx
 
@@ -37,6 +37,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from collectors.base import BaseCollector
 from collectors.retry_strategy import RetryConfig
 from storage.signal_store import SignalStore
+from utils.rate_limiter import AsyncRateLimiter
 from verification.verification_gate_v2 import Signal, VerificationStatus
 
 if TYPE_CHECKING:
@@ -54,6 +55,18 @@ LEVER_API = "https://api.lever.co/v0/postings"
 ASHBY_API = "https://api.ashbyhq.com/posting-api/job-board"
 WORKABLE_CAREERS_URL = "https://apply.workable.com"
 
+# Platforms in order of prevalence; earlier platforms win when several match
+ATS_PLATFORMS = ("greenhouse", "ashby", "lever", "workable")
+
+# Per-ATS-host limits: probes in flight and requests per second
+ATS_HOST_LIMITS: Dict[str, Dict[str, int]] = {
+    "greenhouse": {"concurrency": 8, "rate": 10},
+    "ashby": {"concurrency": 4, "rate": 5},
+    "lever": {"concurrency": 4, "rate": 5},
+    "workable": {"concurrency": 2, "rate": 2},  # HTML pages, be gentle
+}
+DOMAIN_CONCURRENCY = 8  # Domains checked at once
+
 # Engineering role keywords for classification
 ENGINEERING_KEYWORDS = frozenset([
     "engineer", "developer", "software", "sre", "devops", "backend",
@@ -331,6 +344,14 @@ class JobPostingsCollector(BaseCollector):
     - Engineering-heavy = tech company
     """
 
+    # SourceAssetStore source_type for the board found for each domain
+    SOURCE_TYPE = "job_board"
+
+    # Board found per domain: (platform, board_id), shared by all instances
+    # in the process. Across runs the asset store snapshots serve the same
+    # purpose.
+    _known_boards: Dict[str, Tuple[str, str]] = {}
+
     def __init__(
         self,
         domains: List[str],
@@ -338,6 +359,7 @@ class JobPostingsCollector(BaseCollector):
         asset_store: Optional["SourceAssetStore"] = None,
         retry_config: Optional[RetryConfig] = None,
         timeout: float = 30.0,
+        max_concurrency: int = DOMAIN_CONCURRENCY,
     ):
         """
         Args:
@@ -346,6 +368,7 @@ class JobPostingsCollector(BaseCollector):
             asset_store: Optional SourceAssetStore for change detection
             retry_config: Retry configuration (default: 3 retries with backoff)
             timeout: HTTP request timeout in seconds
+            max_concurrency: Number of domains checked at once
         """
         super().__init__(
             store=store,
@@ -356,12 +379,21 @@ class JobPostingsCollector(BaseCollector):
         )
         self.domains = domains
         self.timeout = timeout
+        self.max_concurrency = max(1, max_concurrency)
+
+        # Per-ATS-host (semaphore, rate limiter), created on first use
+        self._host_limits: Dict[str, Tuple[asyncio.Semaphore, AsyncRateLimiter]] = {}
 
-    async def check_domain(self, domain: str) -> Optional[JobPostingSignal]:
+    async def check_domain(
+        self, domain: str, known_board: Optional[Tuple[str, str]] = None
+    ) -> Optional[JobPostingSignal]:
         """
         Check all ATS platforms for job postings at the given domain.
 
-        Tries each platform in order of prevalence:
+        A board remembered from an earlier check is tried first. Otherwise
+        every (board_id, platform) candidate is probed in parallel, and the
+        outstanding probes are cancelled once the result is decided. Ties
+        go to earlier board ids, then platforms in order of prevalence:
         1. Greenhouse (most common)
         2. Ashby (YC/seed favorites)
         3. Lever (mid-stage)
@@ -369,37 +401,57 @@ class JobPostingsCollector(BaseCollector):
 
         Args:
             domain: Company domain (e.g., "anthropic.com")
+            known_board: (platform, board_id) found on an earlier run
 
         Returns:
             JobPostingSignal if found, None otherwise
         """
-        board_ids = self._generate_board_ids(domain)
-
-        for board_id in board_ids:
-            # 1. Greenhouse (most common for tech startups)
-            signal = await self._check_greenhouse(board_id, domain)
+        known_board = known_board or self._known_boards.get(domain)
+        if known_board:
+            platform, board_id = known_board
+            signal = await self._probe(platform, board_id, domain)
             if signal:
                 return signal
+            logger.debug(f"Known {platform} board {board_id} gone for {domain}, re-probing")
 
-            # 2. Ashby (high value for YC/early stage)
-            signal = await self._check_ashby(board_id, domain)
-            if signal:
-                return signal
-
-            # 3. Lever
-            signal = await self._check_lever(board_id, domain)
-            if signal:
-                return signal
-
-            # 4. Workable
-            signal = await self._check_workable(board_id, domain)
-            if signal:
-                return signal
-
-            # Small delay between board_id attempts
-            await asyncio.sleep(0.05)
+        probes = [
+            asyncio.create_task(self._probe(platform, board_id, domain))
+            for board_id in self._generate_board_ids(domain)
+            for platform in ATS_PLATFORMS
+            if (platform, board_id) != known_board
+        ]
+        try:
+            # Await in priority order: a hit is returned only once every
+            # higher-priority probe has missed
+            for probe in probes:
+                signal = await probe
+                if signal:
+                    return signal
+            return None
+        finally:
+            for probe in probes:
+                probe.cancel()
+            await asyncio.gather(*probes, return_exceptions=True)
+
+    def _limits_for_host(self, platform: str) -> Tuple[asyncio.Semaphore, AsyncRateLimiter]:
+        """Concurrency semaphore and rate limiter for an ATS host."""
+        if platform not in self._host_limits:
+            limits = ATS_HOST_LIMITS[platform]
+            self._host_limits[platform] = (
+                asyncio.Semaphore(limits["concurrency"]),
+                AsyncRateLimiter(rate=limits["rate"], period=1),
+            )
+        return self._host_limits[platform]
 
-        return None
+    async def _probe(
+        self, platform: str, board_id: str, domain: str
+    ) -> Optional[JobPostingSignal]:
+        """Check one board on one ATS within that host's limits."""
+        semaphore, limiter = self._limits_for_host(platform)
+        async with semaphore:
+            await limiter.acquire()
+            check = getattr(self, f"_check_{platform}")
+            return await check(board_id, domain)
 
     def _generate_board_ids(self, domain: str) -> List[str]:
         """
@@ -658,12 +710,13 @@ class JobPostingsCollector(BaseCollector):
         try:
             # Use a raw HTTP request since this returns HTML, not JSON
             async def fetch_workable():
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.get(url, follow_redirects=True)
-                    if response.status_code == 404:
-                        return None
-                    response.raise_for_status()
-                    return response.text
+                response = await self.http_client.get(
+                    url, follow_redirects=True, timeout=self.timeout
+                )
+                if response.status_code == 404:
+                    return None
+                response.raise_for_status()
+                return response.text
 
             html = await self._fetch_with_retry(fetch_workable)
         except Exception as e:
@@ -851,33 +904,79 @@ class JobPostingsCollector(BaseCollector):
         Returns:
             List of Signal objects for verification gate
         """
-        signals: List[Signal] = []
-
-        for domain in self.domains:
+        # Normalize and dedupe, preserving order
+        domains = list(dict.fromkeys(
+            clean for clean in (d.lower().replace("www.", "").strip() for d in self.domains)
+            if clean
+        ))
+        known_boards = await self._load_known_boards(domains)
+
+        # Domains run concurrently; per-ATS-host limits bound the requests
+        slots = asyncio.Semaphore(self.max_concurrency)
+        async with self._asset_batch(self.SOURCE_TYPE, domains):
+            results = await asyncio.gather(*(
+                self._collect_domain(domain, known_boards.get(domain), slots)
+                for domain in domains
+            ))
+
+        return [signal for signal in results if signal]
+
+    async def _load_known_boards(self, domains: List[str]) -> Dict[str, Tuple[str, str]]:
+        """Boards found on earlier runs, from the asset store and this process."""
+        known: Dict[str, Tuple[str, str]] = {}
+        if self.asset_store and domains:
             try:
-                # Normalize domain
-                clean_domain = domain.lower().replace("www.", "").strip()
-                if not clean_domain:
-                    continue
-
-                # Check all ATS platforms
-                job_signal = await self.check_domain(clean_domain)
-
-                if job_signal:
-                    logger.info(
-                        f"Found {job_signal.total_positions} jobs at {clean_domain} "
-                        f"via {job_signal.ats_platform}"
-                    )
-                    signals.append(job_signal.to_signal())
+                snapshots = await self.asset_store.get_latest_snapshots(self.SOURCE_TYPE, domains)
+            except Exception as e:
+                logger.warning(f"Could not load known ATS boards: {e}")
+                snapshots = {}
+            for domain, snapshot in snapshots.items():
+                if snapshot.get("ats_platform") in ATS_PLATFORMS and snapshot.get("board_id"):
+                    known[domain] = (snapshot["ats_platform"], snapshot["board_id"])
+
+        for domain in domains:
+            if domain in self._known_boards:
+                known[domain] = self._known_boards[domain]
+        return known
+
+    async def _collect_domain(
+        self,
+        domain: str,
+        known_board: Optional[Tuple[str, str]],
+        slots: asyncio.Semaphore,
+    ) -> Optional[Signal]:
+        """Check one domain and record the board it uses."""
+        try:
+            async with slots:
+                job_signal = await self.check_domain(domain, known_board)
+            if not job_signal:
+                return None
 
-                # Rate limiting between domains
-                await asyncio.sleep(0.2)
+            logger.info(
+                f"Found {job_signal.total_positions} jobs at {domain} "
+                f"via {job_signal.ats_platform}"
+            )
 
-            except Exception as e:
-                logger.warning(f"Error checking domain {domain}: {e}")
-                self._errors.append(f"Domain {domain}: {str(e)}")
+            snapshot = job_signal.raw_snapshot
+            board_id = snapshot.get("board_id") or snapshot.get("company_id")  # Lever: company_id
+            if board_id:
+                self._known_boards[domain] = (job_signal.ats_platform, board_id)
+                await self._save_asset_with_change_detection(
+                    source_type=self.SOURCE_TYPE,
+                    external_id=domain,
+                    raw_data={
+                        **snapshot,
+                        "ats_platform": job_signal.ats_platform,
+                        "board_id": board_id,
+                    },
+                )
+
+            return job_signal.to_signal()
 
-        return signals
+        except Exception as e:
+            logger.warning(f"Error checking domain {domain}: {e}")
+            self._errors.append(f"Domain {domain}: {str(e)}")
+            return None
 
 
 # =============================================================================
@@ -366,6 +366,9 @@ class LinkedInCollector(BaseCollector):
     Requires PROXYCURL_API_KEY environment variable.
     """
 
+    # SourceAssetStore source_type for raw snapshots
+    SOURCE_TYPE = "linkedin_company"
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -429,49 +432,51 @@ class LinkedInCollector(BaseCollector):
 
         signals: List[Signal] = []
 
-        # Look up companies by LinkedIn URL
-        for url in self.company_urls:
-            try:
-                company = await self._fetch_company(url)
-                if company:
-                    # Save raw data and detect changes
-                    if self.asset_store:
-                        is_new, changes = await self._save_asset_with_change_detection(
-                            source_type=self.SOURCE_TYPE,
-                            external_id=company.id or url,
-                            raw_data=company.to_dict() if hasattr(company, 'to_dict') else vars(company),
-                        )
-
-                        # Skip unchanged companies
-                        if not is_new and not changes:
-                            logger.debug(f"Skipping unchanged LinkedIn company: {url}")
-                            continue
-
-                    signals.append(company.to_signal())
-            except Exception as e:
-                logger.error(f"Error fetching company {url}: {e}")
-
-        # Look up companies by domain
-        for domain in self.company_domains:
-            try:
-                company = await self._resolve_company_by_domain(domain)
-                if company:
-                    # Save raw data and detect changes
-                    if self.asset_store:
-                        is_new, changes = await self._save_asset_with_change_detection(
-                            source_type=self.SOURCE_TYPE,
-                            external_id=company.id or domain,
-                            raw_data=company.to_dict() if hasattr(company, 'to_dict') else vars(company),
-                        )
-
-                        # Skip unchanged companies
-                        if not is_new and not changes:
-                            logger.debug(f"Skipping unchanged LinkedIn company for domain: {domain}")
-                            continue
-
-                    signals.append(company.to_signal())
-            except Exception as e:
-                logger.error(f"Error resolving domain {domain}: {e}")
+        # Ids are only known after each lookup, so writes are batched without prefetch
+        async with self._asset_batch(self.SOURCE_TYPE):
+            # Look up companies by LinkedIn URL
+            for url in self.company_urls:
+                try:
+                    company = await self._fetch_company(url)
+                    if company:
+                        # Save raw data and detect changes
+                        if self.asset_store:
+                            is_new, changes = await self._save_asset_with_change_detection(
+                                source_type=self.SOURCE_TYPE,
+                                external_id=company.id or url,
+                                raw_data=company.to_dict() if hasattr(company, 'to_dict') else vars(company),
+                            )
+
+                            # Skip unchanged companies
+                            if not is_new and not changes:
+                                logger.debug(f"Skipping unchanged LinkedIn company: {url}")
+                                continue
+
+                        signals.append(company.to_signal())
+                except Exception as e:
+                    logger.error(f"Error fetching company {url}: {e}")
+
+            # Look up companies by domain
+            for domain in self.company_domains:
+                try:
+                    company = await self._resolve_company_by_domain(domain)
+                    if company:
+                        # Save raw data and detect changes
+                        if self.asset_store:
+                            is_new, changes = await self._save_asset_with_change_detection(
+                                source_type=self.SOURCE_TYPE,
+                                external_id=company.id or domain,
+                                raw_data=company.to_dict() if hasattr(company, 'to_dict') else vars(company),
+                            )
+
+                            # Skip unchanged companies
+                            if not is_new and not changes:
+                                logger.debug(f"Skipping unchanged LinkedIn company for domain: {domain}")
+                                continue
+
+                        signals.append(company.to_signal())
+                except Exception as e:
+                    logger.error(f"Error resolving domain {domain}: {e}")
 
         logger.info(f"Collected {len(signals)} LinkedIn signals")
         return signals
@@ -162,6 +162,14 @@ class ProductHuntCollector(BaseCollector):
         result = await collector.run(dry_run=True)
     """
 
+    # SourceAssetStore source_type for raw snapshots
+    SOURCE_TYPE = "product_hunt"
+
+    # Fetch only launches since the last saved run. Votes keep coming in
+    # after launch day, so re-check the day before the watermark too.
+    INCREMENTAL = True
+    WATERMARK_OVERLAP = timedelta(days=1)
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -199,21 +207,22 @@ class ProductHuntCollector(BaseCollector):
         launches = await self._fetch_launches()
 
         signals = []
-        for launch in launches:
-            # Save raw data and detect changes
-            if self.asset_store:
-                is_new, changes = await self._save_asset_with_change_detection(
-                    source_type=self.SOURCE_TYPE,
-                    external_id=launch.id,
-                    raw_data=launch.to_dict(),
-                )
-
-                # Skip unchanged launches
-                if not is_new and not changes:
-                    logger.debug(f"Skipping unchanged Product Hunt launch: {launch.id}")
-                    continue
-
-            signals.append(launch.to_signal())
+        async with self._asset_batch(self.SOURCE_TYPE, [launch.product_id for launch in launches]):
+            for launch in launches:
+                # Save raw data and detect changes
+                if self.asset_store:
+                    is_new, changes = await self._save_asset_with_change_detection(
+                        source_type=self.SOURCE_TYPE,
+                        external_id=launch.product_id,
+                        raw_data=launch.to_dict() if hasattr(launch, 'to_dict') else vars(launch),
+                    )
+
+                    # Skip unchanged launches
+                    if not is_new and not changes:
+                        logger.debug(f"Skipping unchanged Product Hunt launch: {launch.product_id}")
+                        continue
+
+                signals.append(launch.to_signal())
 
         return signals
 
@@ -221,9 +230,8 @@ class ProductHuntCollector(BaseCollector):
         """Fetch recent launches from Product Hunt API."""
         launches: List[ProductHuntLaunch] = []
 
-        # Calculate date range
-        end_date = datetime.now(timezone.utc)
-        start_date = end_date - timedelta(days=self.lookback_days)
+        # Calculate date range (narrowed to the watermark on incremental runs)
+        start_date = self._fetch_cutoff(self.lookback_days)
 
         # GraphQL query for posts
         query = """
@@ -308,7 +316,9 @@ class ProductHuntCollector(BaseCollector):
                 data = await with_retry(fetch_product_hunt, self.retry_config)
 
                 if "errors" in data:
-                    logger.error(f"Product Hunt GraphQL errors: {data['errors']}")
+                    error_msg = f"Product Hunt GraphQL errors: {data['errors']}"
+                    logger.error(error_msg)
+                    self._errors.append(error_msg)
                     break
 
                 posts = data.get("data", {}).get("posts", {})
@@ -366,6 +376,7 @@ class ProductHuntCollector(BaseCollector):
                         thumbnail_url=node.get("thumbnail", {}).get("url", ""),
                     )
                     launches.append(launch)
+                    self._observe_item_time(launched_at)
 
                 # Check for more pages
                 page_info = posts.get("pageInfo", {})
@@ -378,11 +389,16 @@ class ProductHuntCollector(BaseCollector):
                 # Rate limit courtesy
                 await asyncio.sleep(0.5)
 
+            # A failed page leaves the run incomplete, which keeps the
+            # watermark where it was (pages are ordered by votes, not date)
             except httpx.HTTPError as e:
-                logger.error(f"Product Hunt HTTP error: {e}")
+                error_msg = f"Product Hunt HTTP error on page {page + 1}: {e}"
+                logger.error(error_msg)
+                self._errors.append(error_msg)
                 break
             except Exception as e:
                 logger.exception(f"Product Hunt fetch error: {e}")
+                self._errors.append(f"Product Hunt fetch error on page {page + 1}: {e}")
                 break
 
         logger.info(f"Fetched {len(launches)} Product Hunt launches")
@@ -30,7 +30,7 @@ import logging
 import re
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Set
 from urllib.parse import urlencode
 
@@ -42,6 +42,7 @@ from discovery_engine.mcp_server import CollectorResult, CollectorStatus
 from storage.signal_store import SignalStore
 from utils.rate_limiter import get_rate_limiter
 from utils.canonical_keys import build_canonical_key_candidates, canonical_key_from_external_refs
+from utils.xml_stream import ATOM_ENTRY, ATOM_NS, aiter_elements, iter_elements
 from verification.verification_gate_v2 import Signal, VerificationStatus
 
 logger = logging.getLogger(__name__)
@@ -103,6 +104,23 @@ AI_INFRASTRUCTURE_SIC_CODES = {
 # Combine all target SIC codes
 TARGET_SIC_CODES = HEALTHTECH_SIC_CODES | CLEANTECH_SIC_CODES | AI_INFRASTRUCTURE_SIC_CODES
 
+# FormDFiling fields filled in from primary_doc.xml (restored from the
+# SignalStore enrichment cache on later runs)
+ENRICHED_FIELDS = (
+    "offering_amount",
+    "offering_sold",
+    "minimum_investment",
+    "sic_code",
+    "industry_group",
+    "issuer_type",
+    "state",
+    "country",
+    "website",
+)
+
+# primary_doc.xml sections read by _parse_form_d_xml (parsed one at a time)
+FORM_D_SECTIONS = ("offeringData", "issuerData")
+
 
 # =============================================================================
 # DATA CLASSES
@@ -258,6 +276,9 @@ class SECEdgarCollector(BaseCollector):
         result = await collector.run(dry_run=False)
     """
 
+    # SourceAssetStore source_type for raw snapshots
+    SOURCE_TYPE = "sec_filing"
+
     # SEC EDGAR endpoints
     FORM_D_RSS_URL = "https://www.sec.gov/cgi-bin/browse-edgar"
     FORM_D_SEARCH_URL = "https://www.sec.gov/cgi-bin/browse-edgar"
@@ -265,8 +286,15 @@ class SECEdgarCollector(BaseCollector):
     # SEC requires User-Agent per their fair use policy
     DEFAULT_USER_AGENT = "Press On Ventures Discovery Engine (research@pressonvc.com)"
 
-    # Rate limiting (SEC allows reasonable automated access)
-    REQUEST_DELAY_SECONDS = 0.15  # ~6 requests/second (well under SEC's limit)
+    # Form D documents fetched at once; the shared sec_edgar rate limiter
+    # (10 requests/second, SEC's fair access limit) sets the actual pace
+    ENRICH_CONCURRENCY = 10
+
+    # SignalStore enrichment cache source for parsed primary_doc.xml fields
+    ENRICHMENT_SOURCE = "sec_form_d"
+
+    # Keep only filings newer than the last saved run
+    INCREMENTAL = True
 
     def __init__(
         self,
@@ -284,7 +312,7 @@ class SECEdgarCollector(BaseCollector):
             max_filings: Maximum number of filings to process
             target_sectors_only: Only return filings in target sectors
         """
-        super().__init__(store=store, collector_name="sec_edgar")
+        super().__init__(store=store, collector_name="sec_edgar", api_name="sec_edgar")
 
         self.user_agent = user_agent or self.DEFAULT_USER_AGENT
         self.lookback_days = lookback_days
@@ -292,21 +320,18 @@ class SECEdgarCollector(BaseCollector):
         self.target_sectors_only = target_sectors_only
 
         self._client: Optional[httpx.AsyncClient] = None
+        self._headers = {"User-Agent": self.user_agent}
         self._processed_accession_numbers: Set[str] = set()
 
     async def __aenter__(self):
         """Async context manager entry"""
-        self._client = httpx.AsyncClient(
-            headers={"User-Agent": self.user_agent},
-            timeout=30.0,
-            follow_redirects=True,
-        )
+        # Pooled keep-alive client; the pool closes it, not the collector
+        self._client = self.http_client
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        if self._client:
-            await self._client.aclose()
+        self._client = None
 
     async def _collect_signals(self) -> List[Signal]:
         """
@@ -327,21 +352,22 @@ class SECEdgarCollector(BaseCollector):
 
         # Convert to signals and detect changes
         signals = []
-        for filing in filings:
-            # Save raw data and detect changes
-            if self.asset_store:
-                is_new, changes = await self._save_asset_with_change_detection(
-                    source_type=self.SOURCE_TYPE,
-                    external_id=filing.accession_number,
-                    raw_data=filing.to_dict() if hasattr(filing, 'to_dict') else vars(filing),
-                )
-
-                # Skip unchanged filings
-                if not is_new and not changes:
-                    logger.debug(f"Skipping unchanged SEC filing: {filing.accession_number}")
-                    continue
-
-            signals.append(filing.to_signal())
+        async with self._asset_batch(self.SOURCE_TYPE, [filing.accession_number for filing in filings]):
+            for filing in filings:
+                # Save raw data and detect changes
+                if self.asset_store:
+                    is_new, changes = await self._save_asset_with_change_detection(
+                        source_type=self.SOURCE_TYPE,
+                        external_id=filing.accession_number,
+                        raw_data=filing.to_dict() if hasattr(filing, 'to_dict') else vars(filing),
+                    )
+
+                    # Skip unchanged filings
+                    if not is_new and not changes:
+                        logger.debug(f"Skipping unchanged SEC filing: {filing.accession_number}")
+                        continue
+
+                signals.append(filing.to_signal())
 
         return signals
 
@@ -372,30 +398,37 @@ class SECEdgarCollector(BaseCollector):
             # Use rate limiter before making request
             await self.rate_limiter.acquire()
 
-            # Wrap HTTP request with retry logic
+            # Wrap HTTP request with retry logic. Entries are parsed as the
+            # feed streams in; each attempt starts over with an empty list.
             async def fetch_atom_feed():
-                response = await self._client.get(url)
-                response.raise_for_status()
-                return response.text
-
-            response_text = await with_retry(fetch_atom_feed, self.retry_config)
-
-            # Parse Atom XML feed
-            filings = self._parse_form_d_atom_feed(response_text)
-
-            # Filter by date
-            cutoff_date = datetime.now(timezone.utc) - timedelta(days=self.lookback_days)
+                fetched: List[FormDFiling] = []
+                async with self._client.stream(
+                    "GET", url, headers=self._headers, follow_redirects=True
+                ) as response:
+                    response.raise_for_status()
+                    async for entry in aiter_elements(response.aiter_bytes(), ATOM_ENTRY):
+                        filing = self._parse_atom_entry(entry)
+                        if filing:
+                            fetched.append(filing)
+                return fetched
+
+            filings = await with_retry(fetch_atom_feed, self.retry_config)
+
+            # Filter by date (narrowed to the watermark on incremental runs)
+            cutoff_date = self._fetch_cutoff(self.lookback_days)
             filings = [f for f in filings if f.filing_date >= cutoff_date]
 
             logger.info(f"Parsed {len(filings)} filings within lookback window")
 
             # Enrich filings with detailed data (fetch individual Form D XML)
-            # Note: This is rate-limited to avoid hammering SEC servers
-            for filing in filings[:self.max_filings]:
-                if filing.accession_number not in self._processed_accession_numbers:
-                    await self._enrich_filing(filing)
-                    self._processed_accession_numbers.add(filing.accession_number)
-                    await asyncio.sleep(self.REQUEST_DELAY_SECONDS)
+            failed = await self._enrich_filings(filings[:self.max_filings])
+
+            # Keep the watermark below the oldest filing that failed to
+            # enrich, so the next run fetches it again
+            hold_back = min((f.filing_date for f in failed), default=None)
+            for filing in filings:
+                if hold_back is None or filing.filing_date < hold_back:
+                    self._observe_item_time(filing.filing_date)
 
         except Exception as e:
             logger.error(f"Error fetching Form D feed: {e}")
@@ -421,48 +454,10 @@ class SECEdgarCollector(BaseCollector):
         filings: List[FormDFiling] = []
 
         try:
-            # Parse XML
-            root = ET.fromstring(atom_xml)
-
-            # Atom namespace
-            ns = {"atom": "http://www.w3.org/2005/Atom"}
-
-            # Extract entries
-            for entry in root.findall("atom:entry", ns):
-                try:
-                    # Extract basic info from feed
-                    title = entry.find("atom:title", ns)
-                    title_text = title.text if title is not None else ""
-
-                    # Parse title: "D - Company Name (CIK) (Filer)"
-                    company_name, cik = self._parse_atom_title(title_text)
-
-                    # Extract accession number from ID
-                    id_elem = entry.find("atom:id", ns)
-                    id_text = id_elem.text if id_elem is not None else ""
-                    accession_number = self._extract_accession_number(id_text)
-
-                    # Extract filing date
-                    updated = entry.find("atom:updated", ns)
-                    filing_date = self._parse_date(updated.text if updated is not None else "")
-
-                    # Extract filing URL
-                    link = entry.find("atom:link", ns)
-                    filing_url = link.get("href", "") if link is not None else ""
-
-                    if company_name and cik and accession_number:
-                        filing = FormDFiling(
-                            cik=cik,
-                            company_name=company_name,
-                            accession_number=accession_number,
-                            filing_date=filing_date,
-                            filing_url=filing_url,
-                        )
-                        filings.append(filing)
-
-                except Exception as e:
-                    logger.warning(f"Error parsing Atom entry: {e}")
-                    continue
+            for entry in iter_elements(atom_xml, ATOM_ENTRY):
+                filing = self._parse_atom_entry(entry)
+                if filing:
+                    filings.append(filing)
 
         except Exception as e:
             logger.error(f"Error parsing Atom XML: {e}")
@@ -470,6 +465,46 @@ class SECEdgarCollector(BaseCollector):
 
         return filings
 
+    def _parse_atom_entry(self, entry: ET.Element) -> Optional[FormDFiling]:
+        """Build a filing from one Atom <entry>, or None if it lacks name/CIK/accession."""
+        ns = {"atom": ATOM_NS}
+
+        try:
+            # Extract basic info from feed
+            title = entry.find("atom:title", ns)
+            title_text = title.text if title is not None else ""
+
+            # Parse title: "D - Company Name (CIK) (Filer)"
+            company_name, cik = self._parse_atom_title(title_text)
+
+            # Extract accession number from ID
+            id_elem = entry.find("atom:id", ns)
+            id_text = id_elem.text if id_elem is not None else ""
+            accession_number = self._extract_accession_number(id_text)
+
+            # Extract filing date
+            updated = entry.find("atom:updated", ns)
+            filing_date = self._parse_date(updated.text if updated is not None else "")
+
+            # Extract filing URL
+            link = entry.find("atom:link", ns)
+            filing_url = link.get("href", "") if link is not None else ""
+
+        except Exception as e:
+            logger.warning(f"Error parsing Atom entry: {e}")
+            return None
+
+        if not (company_name and cik and accession_number):
+            return None
+
+        return FormDFiling(
+            cik=cik,
+            company_name=company_name,
+            accession_number=accession_number,
+            filing_date=filing_date,
+            filing_url=filing_url,
+        )
+
     def _parse_atom_title(self, title: str) -> tuple[str, str]:
         """
         Parse Atom entry title to extract company name and CIK.
@@ -507,7 +542,85 @@ class SECEdgarCollector(BaseCollector):
             # Fallback to current time if parsing fails
             return datetime.now(timezone.utc)
 
-    async def _enrich_filing(self, filing: FormDFiling) -> None:
+    async def _enrich_filings(self, filings: List[FormDFiling]) -> List[FormDFiling]:
+        """
+        Enrich filings with a bounded pool of concurrent workers.
+
+        Each worker waits on the shared sec_edgar rate limiter, fetches a
+        Form D document and parses it while the other workers' requests are
+        in flight. primary_doc.xml never changes once filed, so accession
+        numbers enriched on earlier runs are restored from the SignalStore
+        enrichment cache instead of refetched.
+
+        Returns:
+            Filings whose Form D request failed (to be retried on a later run)
+        """
+        pending = [
+            filing for filing in filings
+            if filing.accession_number not in self._processed_accession_numbers
+        ]
+        cached = await self._load_enrichment([filing.accession_number for filing in pending])
+
+        queue: asyncio.Queue[FormDFiling] = asyncio.Queue()
+        for filing in pending:
+            if filing.accession_number in cached:
+                self._restore_enrichment(filing, cached[filing.accession_number])
+                self._processed_accession_numbers.add(filing.accession_number)
+            else:
+                queue.put_nowait(filing)
+
+        if cached:
+            logger.info(f"Restored {len(cached)} Form D enrichments from cache")
+
+        enriched: Dict[str, Dict[str, Any]] = {}
+        failed: List[FormDFiling] = []
+
+        async def worker() -> None:
+            while not queue.empty():
+                filing = queue.get_nowait()
+                if await self._enrich_filing(filing):
+                    enriched[filing.accession_number] = {
+                        **{name: getattr(filing, name) for name in ENRICHED_FIELDS},
+                        "form_d_xml_parsed": bool(filing.raw_data.get("form_d_xml_parsed")),
+                    }
+                else:
+                    failed.append(filing)
+                self._processed_accession_numbers.add(filing.accession_number)
+
+        workers = min(self.ENRICH_CONCURRENCY, queue.qsize())
+        await asyncio.gather(*(worker() for _ in range(workers)))
+
+        await self._save_enrichment(enriched)
+        return failed
+
+    async def _load_enrichment(self, accession_numbers: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Cached enrichment results by accession number (empty without a store)."""
+        if not self.store or not accession_numbers:
+            return {}
+        try:
+            return await self.store.get_enriched(self.ENRICHMENT_SOURCE, accession_numbers)
+        except Exception as e:
+            logger.warning(f"Could not load Form D enrichment cache: {e}")
+            return {}
+
+    async def _save_enrichment(self, enriched: Dict[str, Dict[str, Any]]) -> None:
+        """Remember enriched accession numbers so later runs skip them."""
+        if not self.store or not enriched:
+            return
+        try:
+            await self.store.save_enriched(self.ENRICHMENT_SOURCE, enriched)
+        except Exception as e:
+            logger.warning(f"Could not save Form D enrichment cache: {e}")
+
+    def _restore_enrichment(self, filing: FormDFiling, data: Dict[str, Any]) -> None:
+        """Apply cached primary_doc.xml fields to a filing."""
+        for name in ENRICHED_FIELDS:
+            if name in data:
+                setattr(filing, name, data[name])
+        if data.get("form_d_xml_parsed"):
+            filing.raw_data["form_d_xml_parsed"] = True
+
+    async def _enrich_filing(self, filing: FormDFiling) -> bool:
         """
         Enrich a filing with detailed data from the actual Form D XML.
 
@@ -516,6 +629,10 @@ class SECEdgarCollector(BaseCollector):
         - Issuer type, industry classification
         - Related persons (executives, directors)
         - Sometimes website/contact info
+
+        Returns:
+            True if SEC answered (document parsed, or no primary_doc.xml),
+            False if the request failed and should be retried on a later run
         """
         try:
             # Build URL to Form D primary document
@@ -537,7 +654,9 @@ class SECEdgarCollector(BaseCollector):
 
             # Wrap HTTP request with retry logic
             async def fetch_form_d_xml():
-                response = await self._client.get(doc_url)
+                response = await self._client.get(
+                    doc_url, headers=self._headers, follow_redirects=True
+                )
 
                 # If primary_doc.xml doesn't exist, return None (don't retry 404s)
                 if response.status_code == 404:
@@ -552,9 +671,11 @@ class SECEdgarCollector(BaseCollector):
             # Parse Form D XML if we got content (not 404)
             if response_text:
                 self._parse_form_d_xml(filing, response_text)
+            return True
 
         except Exception as e:
             logger.warning(f"Could not enrich filing {filing.accession_number}: {e}")
+            return False
 
     def _parse_form_d_xml(self, filing: FormDFiling, xml_content: str) -> None:
         """
@@ -569,62 +690,18 @@ class SECEdgarCollector(BaseCollector):
         - signatureBlock/authorizedRepresentative
         """
         try:
-            root = ET.fromstring(xml_content)
-
             # Note: Form D XML doesn't use namespaces (as of 2024)
+            seen: Set[str] = set()
+            for section in iter_elements(xml_content, FORM_D_SECTIONS):
+                # Only the first of each section counts
+                if section.tag in seen:
+                    continue
+                seen.add(section.tag)
 
-            # Extract offering amounts
-            offering_data = root.find(".//offeringData")
-            if offering_data is not None:
-                total_offering = offering_data.find("totalOfferingAmount")
-                if total_offering is not None and total_offering.text:
-                    filing.offering_amount = float(total_offering.text)
-
-                amount_sold = offering_data.find("totalAmountSold")
-                if amount_sold is not None and amount_sold.text:
-                    filing.offering_sold = float(amount_sold.text)
-
-                min_investment = offering_data.find("minimumInvestmentAccepted")
-                if min_investment is not None and min_investment.text:
-                    filing.minimum_investment = float(min_investment.text)
-
-            # Extract industry classification
-            issuer_data = root.find(".//issuerData")
-            if issuer_data is not None:
-                # Industry group (SIC code approach)
-                industry_group = issuer_data.find(".//industryGroupType")
-                if industry_group is not None and industry_group.text:
-                    sic_code = industry_group.text.strip()
-                    filing.sic_code = sic_code
-                    filing.industry_group = self._classify_industry(sic_code)
-
-                # Issuer type
-                entity_type = issuer_data.find(".//issuerEntityType")
-                if entity_type is not None and entity_type.text:
-                    filing.issuer_type = entity_type.text.strip()
-
-                # Location
-                issuer_address = issuer_data.find(".//issuerAddress")
-                if issuer_address is not None:
-                    state = issuer_address.find("stateOrCountry")
-                    if state is not None and state.text:
-                        filing.state = state.text.strip()
-
-                    country = issuer_address.find("stateOrCountryDescription")
-                    if country is not None and country.text:
-                        filing.country = country.text.strip()
-
-            # Try to extract website (sometimes in relatedPersons section)
-            # Note: Form D doesn't consistently include website, but worth checking
-            for related_person in root.findall(".//relatedPersonInfo"):
-                relationship = related_person.find(".//relationship")
-                if relationship is not None:
-                    # Sometimes contact info includes company website
-                    address = related_person.find(".//address")
-                    if address is not None:
-                        # This is a stretch - Form D rarely has website
-                        # But we log it for potential manual enrichment
-                        pass
+                if section.tag == "offeringData":
+                    self._parse_offering_data(filing, section)
+                else:
+                    self._parse_issuer_data(filing, section)
 
             # Store raw XML for audit trail
             filing.raw_data["form_d_xml_parsed"] = True
@@ -632,6 +709,45 @@ class SECEdgarCollector(BaseCollector):
         except Exception as e:
             logger.warning(f"Error parsing Form D XML: {e}")
 
+    def _parse_offering_data(self, filing: FormDFiling, offering_data: ET.Element) -> None:
+        """Extract offering amounts from an <offeringData> section."""
+        total_offering = offering_data.find("totalOfferingAmount")
+        if total_offering is not None and total_offering.text:
+            filing.offering_amount = float(total_offering.text)
+
+        amount_sold = offering_data.find("totalAmountSold")
+        if amount_sold is not None and amount_sold.text:
+            filing.offering_sold = float(amount_sold.text)
+
+        min_investment = offering_data.find("minimumInvestmentAccepted")
+        if min_investment is not None and min_investment.text:
+            filing.minimum_investment = float(min_investment.text)
+
+    def _parse_issuer_data(self, filing: FormDFiling, issuer_data: ET.Element) -> None:
+        """Extract industry, issuer type and location from an <issuerData> section."""
+        # Industry group (SIC code approach)
+        industry_group = issuer_data.find(".//industryGroupType")
+        if industry_group is not None and industry_group.text:
+            sic_code = industry_group.text.strip()
+            filing.sic_code = sic_code
+            filing.industry_group = self._classify_industry(sic_code)
+
+        # Issuer type
+        entity_type = issuer_data.find(".//issuerEntityType")
+        if entity_type is not None and entity_type.text:
+            filing.issuer_type = entity_type.text.strip()
+
+        # Location
+        issuer_address = issuer_data.find(".//issuerAddress")
+        if issuer_address is not None:
+            state = issuer_address.find("stateOrCountry")
+            if state is not None and state.text:
+                filing.state = state.text.strip()
+
+            country = issuer_address.find("stateOrCountryDescription")
+            if country is not None and country.text:
+                filing.country = country.text.strip()
+
     def _classify_industry(self, sic_code: str) -> Optional[str]:
         """
         Classify SIC code into thesis-fit industry groups.
@@ -13,11 +13,21 @@ Run:
     python -m pytest collectors/test_arxiv_enhanced.py -v
 """
 
+import httpx
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 from datetime import datetime, timedelta, timezone
 
 
+def _serve(body):
+    """Patch the pooled HTTP client so every request is answered with body."""
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+    return patch(
+        "collectors.base.get_http_client",
+        return_value=httpx.AsyncClient(transport=transport),
+    )
+
+
 # =============================================================================
 # BASE INTEGRATION TESTS (from existing)
 # =============================================================================
@@ -196,8 +206,7 @@ class TestArxivAPIIntegration:
 </feed>'''
 
         async with collector:
-            with patch.object(collector, "_fetch_with_retry", new_callable=AsyncMock) as mock_retry:
-                mock_retry.return_value = mock_xml.encode()
+            with _serve(mock_xml.encode()):
                 papers = await collector._fetch_papers()
 
                 assert len(papers) == 1
@@ -230,8 +239,7 @@ class TestArxivAPIIntegration:
 </feed>'''
 
         async with collector:
-            with patch.object(collector, "_fetch_with_retry", new_callable=AsyncMock) as mock_retry:
-                mock_retry.return_value = mock_xml.encode()
+            with _serve(mock_xml.encode()):
                 papers = await collector._fetch_papers()
 
                 # Old paper should be filtered out
@@ -264,8 +272,7 @@ class TestArxivAPIIntegration:
         collector = ArxivCollector(categories=["cs.AI"])
 
         async with collector:
-            with patch.object(collector, "_fetch_with_retry", new_callable=AsyncMock) as mock_retry:
-                mock_retry.return_value = b"<invalid xml>"
+            with _serve(b"<invalid xml>"):
                 papers = await collector._fetch_papers()
 
                 # Should handle parse error gracefully
@@ -286,6 +293,47 @@ class TestArxivAPIIntegration:
 
                 assert papers == []
 
+    @pytest.mark.asyncio
+    async def test_stream_failure_does_not_advance_watermark(self):
+        """A feed cut off after its newest entry must not move the watermark"""
+        from collectors.arxiv import ArxivCollector
+        from collectors.retry_strategy import RetryConfig
+        from storage.signal_store import SignalStore
+        from utils.rate_limiter import AsyncRateLimiter
+
+        newest = (datetime.now(timezone.utc) - timedelta(days=1)).isoformat()
+        head = f'''<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+    <entry>
+        <id>http://arxiv.org/abs/2610.00001</id>
+        <published>{newest}</published>
+        <title>Newest Paper</title>
+        <author><name>John Doe</name></author>
+    </entry>'''.encode()
+
+        async def truncated():
+            yield head
+            raise httpx.ReadError("connection reset")
+
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=truncated()))
+        store = SignalStore(":memory:")
+        await store.initialize()
+        try:
+            collector = ArxivCollector(store=store, categories=["cs.AI"])
+            collector.retry_config = RetryConfig(max_retries=0)
+            collector._rate_limiter = AsyncRateLimiter(rate=None, period=1)
+            with patch(
+                "collectors.base.get_http_client",
+                return_value=httpx.AsyncClient(transport=transport),
+            ):
+                result = await collector.run(dry_run=False)
+
+            assert result.signals_new == 0
+            assert "connection reset" in (result.error_message or "")
+            assert await store.get_watermark("arxiv") is None
+        finally:
+            await store.close()
+
 
 class TestConfidenceScoring:
     """Test confidence score calculation."""
@@ -430,8 +478,7 @@ async def test_full_collection_flow():
 </feed>'''
 
     async with collector:
-        with patch.object(collector, "_fetch_with_retry", new_callable=AsyncMock) as mock_retry:
-            mock_retry.return_value = mock_xml.encode()
+        with _serve(mock_xml.encode()):
             signals = await collector._collect_signals()
 
             assert len(signals) == 1
@@ -0,0 +1,63 @@
+"""
+Tests for BaseCollector._save_asset_with_change_detection.
+"""
+
+import pytest
+
+from collectors.base import BaseCollector
+from storage.source_asset_store import SourceAssetStore
+
+
+class _Collector(BaseCollector):
+    async def _collect_signals(self):
+        return []
+
+
+class TestSaveAssetWithChangeDetection:
+    """Change detection through SourceAssetStore.record_snapshot"""
+
+    @pytest.mark.asyncio
+    async def test_new_unchanged_changed(self):
+        """First save is new, a repeat is a no-op, an edit reports old/new"""
+        store = SourceAssetStore(":memory:")
+        await store.initialize()
+        collector = _Collector(collector_name="test", asset_store=store)
+
+        assert await collector._save_asset_with_change_detection(
+            "github_repo", "owner/repo", {"stars": 1}
+        ) == (True, [])
+        assert await collector._save_asset_with_change_detection(
+            "github_repo", "owner/repo", {"stars": 1}
+        ) == (False, [])
+        assert await store.get_snapshot_count("github_repo", "owner/repo") == 1
+
+        is_new, changes = await collector._save_asset_with_change_detection(
+            "github_repo", "owner/repo", {"stars": 2}
+        )
+        assert is_new is False
+        assert changes == [{"field": "stars", "old": 1, "new": 2}]
+
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_asset_batch_group_commits(self):
+        """Inside _asset_batch, snapshots are written when the block exits"""
+        store = SourceAssetStore(":memory:")
+        await store.initialize()
+        await store.record_snapshot("github_repo", "a", {"stars": 1})
+        collector = _Collector(collector_name="test", asset_store=store)
+
+        async with collector._asset_batch("github_repo", ["a", "b"]):
+            assert await collector._save_asset_with_change_detection(
+                "github_repo", "a", {"stars": 2}
+            ) == (False, [{"field": "stars", "old": 1, "new": 2}])
+            assert await collector._save_asset_with_change_detection(
+                "github_repo", "b", {"stars": 1}
+            ) == (True, [])
+            assert await store.get_snapshot_count("github_repo", "a") == 1
+
+        assert collector._asset_writer is None
+        assert await store.get_latest_snapshot("github_repo", "a") == {"stars": 2}
+        assert await store.get_latest_snapshot("github_repo", "b") == {"stars": 1}
+
+        await store.close()
@@ -226,9 +226,8 @@ class TestBaseCollectorHttpFetch:
         attempts = []
 
         # Mock httpx client
-        with patch('httpx.AsyncClient') as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client = AsyncMock()
+        with patch('collectors.base.get_http_client', return_value=mock_client):
 
             async def mock_get(url, **kwargs):
                 attempts.append(1)
@@ -271,9 +270,8 @@ class TestBaseCollectorHttpFetch:
         collector._rate_limiter = mock_limiter
 
         # Mock httpx
-        with patch('httpx.AsyncClient') as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client = AsyncMock()
+        with patch('collectors.base.get_http_client', return_value=mock_client):
 
             mock_response = MagicMock()
             mock_response.status_code = 200
@@ -0,0 +1,129 @@
+"""
+Tests for streaming (async generator) collectors in BaseCollector.
+"""
+
+import asyncio
+
+import pytest
+
+from collectors.base import BaseCollector
+from discovery_engine.mcp_server import CollectorStatus
+from storage.signal_store import SignalStore
+from verification.verification_gate_v2 import Signal
+
+
+def _signal(n: int) -> Signal:
+    return Signal(
+        id=f"s{n}",
+        signal_type="feed_item",
+        confidence=0.5,
+        source_api="feed",
+        raw_data={"canonical_key": f"feed:{n}"},
+    )
+
+
+class _StreamingCollector(BaseCollector):
+    """Yields pages of signals, optionally failing after some pages."""
+
+    def __init__(self, store=None, pages=(), fail_after=None, on_page=None):
+        super().__init__(store=store, collector_name="stream")
+        self.pages = pages
+        self.fail_after = fail_after
+        self.on_page = on_page
+        self.yielded = 0
+
+    async def _collect_signals(self):
+        for index, page in enumerate(self.pages):
+            if index == self.fail_after:
+                raise RuntimeError("source went away")
+            yield page
+            self.yielded += 1
+            if self.on_page:
+                await self.on_page(self, index)
+
+
+class TestStreamingCollectors:
+    """Saving overlaps fetching; partial progress survives failures"""
+
+    @pytest.mark.asyncio
+    async def test_single_signals_and_batches(self):
+        """Yielded Signals and lists are all saved, duplicates suppressed"""
+        store = SignalStore(":memory:")
+        await store.initialize()
+        try:
+            pages = [_signal(1), [_signal(2), _signal(3)], [], [_signal(3), _signal(4)]]
+            result = await _StreamingCollector(store, pages).run(dry_run=False)
+
+            assert result.status == CollectorStatus.SUCCESS
+            assert result.signals_found == 5
+            assert (result.signals_new, result.signals_suppressed) == (4, 1)
+            assert await store.existing_keys([f"feed:{n}" for n in range(1, 5)]) == {
+                "feed:1", "feed:2", "feed:3", "feed:4"
+            }
+        finally:
+            await store.close()
+
+    @pytest.mark.asyncio
+    async def test_first_page_saved_while_fetching_continues(self):
+        """The writer persists a page before the collector has finished"""
+        store = SignalStore(":memory:")
+        await store.initialize()
+        seen_while_running = []
+
+        async def wait_for_save(collector, index):
+            if index == 0:
+                for _ in range(100):
+                    if await store.is_duplicate("feed:1"):
+                        break
+                    await asyncio.sleep(0.01)
+                seen_while_running.append(await store.is_duplicate("feed:1"))
+
+        try:
+            pages = [[_signal(1)], [_signal(2)]]
+            result = await _StreamingCollector(store, pages, on_page=wait_for_save).run(dry_run=False)
+
+            assert seen_while_running == [True]
+            assert result.signals_new == 2
+        finally:
+            await store.close()
+
+    @pytest.mark.asyncio
+    async def test_failure_keeps_pages_already_yielded(self):
+        """A crash mid-stream reports an error but earlier pages stay saved"""
+        store = SignalStore(":memory:")
+        await store.initialize()
+        try:
+            pages = [[_signal(1), _signal(2)], [_signal(3)], [_signal(4)]]
+            result = await _StreamingCollector(store, pages, fail_after=2).run(dry_run=False)
+
+            assert result.status == CollectorStatus.ERROR
+            assert result.error_message == "source went away"
+            assert result.signals_new == 3
+            assert await store.existing_keys(["feed:1", "feed:3", "feed:4"]) == {"feed:1", "feed:3"}
+        finally:
+            await store.close()
+
+    @pytest.mark.asyncio
+    async def test_queue_bounds_how_far_the_collector_runs_ahead(self):
+        """With the writer stalled, the collector blocks once the queue is full"""
+        release = asyncio.Event()
+        collector = _StreamingCollector(pages=[[_signal(n)] for n in range(20)])
+        collector.STREAM_QUEUE_SIZE = 2
+
+        process = collector._process_signals
+
+        async def stalled_process(signals, dry_run):
+            await release.wait()
+            await process(signals, dry_run)
+
+        collector._process_signals = stalled_process
+        run = asyncio.create_task(collector.run(dry_run=True))
+
+        await asyncio.sleep(0.05)
+        # One batch in the writer, two queued, one waiting to be put
+        assert collector.yielded <= 4
+
+        release.set()
+        result = await run
+        assert result.signals_found == 20
+        assert result.signals_new == 20
@@ -0,0 +1,134 @@
+"""
+Tests for incremental collection watermarks in BaseCollector.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from collectors.base import BaseCollector
+from discovery_engine.mcp_server import CollectorStatus
+from storage.signal_store import SignalStore
+from verification.verification_gate_v2 import Signal
+
+
+class _FeedCollector(BaseCollector):
+    """Serves a fixed feed, keeping only items newer than the fetch cutoff."""
+
+    INCREMENTAL = True
+
+    def __init__(self, store, items):
+        super().__init__(store=store, collector_name="feed")
+        self.items = items  # (item_id, published_at)
+        self.cutoffs = []
+
+    async def _collect_signals(self):
+        cutoff = self._fetch_cutoff(lookback_days=30)
+        self.cutoffs.append(cutoff)
+
+        signals = []
+        for item_id, published_at in self.items:
+            if published_at < cutoff:
+                continue
+            self._observe_item_time(published_at)
+            signals.append(Signal(
+                id=item_id,
+                signal_type="feed_item",
+                confidence=0.5,
+                source_api="feed",
+                raw_data={"canonical_key": f"feed:{item_id}"},
+                detected_at=published_at,
+            ))
+        return signals
+
+
+def _feed(*hours_ago):
+    now = datetime.now(timezone.utc)
+    return [(f"item{h}", now - timedelta(hours=h)) for h in hours_ago]
+
+
+class TestWatermarks:
+    """Watermark load, cutoff and atomic advance"""
+
+    @pytest.mark.asyncio
+    async def test_second_run_fetches_from_watermark(self):
+        """After a saved run, only items since the watermark (minus overlap) are fetched"""
+        store = SignalStore(":memory:")
+        await store.initialize()
+        try:
+            items = _feed(48, 24, 5)
+            first = _FeedCollector(store, items)
+            result = await first.run(dry_run=False)
+            assert result.signals_new == 3
+            assert await store.get_watermark("feed") == items[-1][1]
+
+            second = _FeedCollector(store, items + _feed(1))
+            result = await second.run(dry_run=False)
+
+            assert second.cutoffs[0] == items[-1][1] - BaseCollector.WATERMARK_OVERLAP
+            assert result.signals_found == 2  # item5 again, inside the overlap
+            assert (result.signals_new, result.signals_suppressed) == (1, 1)
+        finally:
+            await store.close()
+
+    @pytest.mark.asyncio
+    async def test_dry_run_does_not_advance(self):
+        """Dry runs read the watermark but never move it"""
+        store = SignalStore(":memory:")
+        await store.initialize()
+        try:
+            collector = _FeedCollector(store, _feed(24, 5))
+            result = await collector.run(dry_run=True)
+
+            assert result.status == CollectorStatus.DRY_RUN
+            assert await store.get_watermark("feed") is None
+        finally:
+            await store.close()
+
+    @pytest.mark.asyncio
+    async def test_save_errors_block_advance(self):
+        """If any signal fails to save, the next run refetches the whole window"""
+        store = SignalStore(":memory:")
+        await store.initialize()
+        try:
+            collector = _FeedCollector(store, _feed(24, 5))
+
+            async def failing_batch(batch):
+                raise RuntimeError("disk full")
+
+            collector._save_batch = failing_batch
+            result = await collector.run(dry_run=False)
+
+            assert result.status == CollectorStatus.ERROR
+            assert await store.get_watermark("feed") is None
+        finally:
+            await store.close()
+
+    @pytest.mark.asyncio
+    async def test_chunks_commit_before_watermark(self):
+        """Each chunk commits on its own; the watermark is written after the last"""
+        store = SignalStore(":memory:")
+        await store.initialize()
+        try:
+            collector = _FeedCollector(store, _feed(48, 24, 5))
+            collector.SAVE_BATCH_SIZE = 1
+            save_batch = collector._save_batch
+            in_transaction = []
+
+            async def tracking_batch(batch):
+                in_transaction.append(store._db.in_transaction)
+                await save_batch(batch)
+
+            async def failing_advance():
+                raise RuntimeError("crashed before the watermark")
+
+            collector._save_batch = tracking_batch
+            collector._advance_watermark = failing_advance
+            result = await collector.run(dry_run=False)
+
+            assert in_transaction == [False, False, False]
+            assert result.status == CollectorStatus.ERROR
+            assert result.signals_new == 3  # Saved signals stay saved
+            assert await store.get_watermark("feed") is None
+        finally:
+            await store.close()
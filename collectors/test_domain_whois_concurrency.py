@@ -0,0 +1,159 @@
+"""
+Tests for concurrent RDAP lookups in DomainWhoisCollector.
+
+_fetch_domain_rdap is replaced with a fake so no network access is needed.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from collectors.domain_whois import (
+    RDAP_SERVER_LIMITS,
+    DomainRegistration,
+    DomainWhoisCollector,
+)
+
+
+def _registration(domain: str) -> DomainRegistration:
+    return DomainRegistration(
+        domain=domain,
+        tld=domain.rsplit(".", 1)[-1],
+        registration_date=datetime.now(timezone.utc),
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_memo():
+    DomainWhoisCollector._rdap_memo.clear()
+    yield
+    DomainWhoisCollector._rdap_memo.clear()
+
+
+class _FakeRdap:
+    """Records calls and peak concurrency, per RDAP server and overall."""
+
+    def __init__(self, missing=(), failing=()):
+        self.calls = []
+        self.in_flight = {}
+        self.peak = {}
+        self.missing = set(missing)
+        self.failing = set(failing)
+
+    async def __call__(self, domain):
+        self.calls.append(domain)
+        key = "verisign" if domain.endswith(".com") else "other"
+        for k in (key, "all"):
+            self.in_flight[k] = self.in_flight.get(k, 0) + 1
+            self.peak[k] = max(self.peak.get(k, 0), self.in_flight[k])
+        await asyncio.sleep(0.01)
+        for k in (key, "all"):
+            self.in_flight[k] -= 1
+
+        if domain in self.failing:
+            raise RuntimeError("RDAP server error")
+        if domain in self.missing:
+            return None
+        return _registration(domain)
+
+
+class TestConcurrentRdapLookups:
+    """Test bounded fan-out, ordering and memoization"""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded_per_server_and_overall(self, monkeypatch):
+        """.com lookups respect verisign's cap; the total respects max_concurrency"""
+        monkeypatch.setitem(
+            RDAP_SERVER_LIMITS, "rdap.verisign.com", {"concurrency": 3, "rate": 1000}
+        )
+        collector = DomainWhoisCollector(max_concurrency=5, memo_ttl=0)
+        fake = _FakeRdap()
+        collector._fetch_domain_rdap = fake
+
+        domains = [f"site{i}.com" for i in range(10)] + [f"site{i}.ai" for i in range(4)]
+        registrations = await collector._check_domains(domains)
+
+        assert [r.domain for r in registrations] == domains
+        assert fake.peak["verisign"] == 3
+        assert fake.peak["all"] <= 5
+
+    @pytest.mark.asyncio
+    async def test_dedupes_and_skips_missing_and_errors(self):
+        """Duplicates are fetched once; 404s and errors yield no registration"""
+        collector = DomainWhoisCollector()
+        fake = _FakeRdap(missing={"gone.io"}, failing={"broken.io"})
+        collector._fetch_domain_rdap = fake
+
+        registrations = await collector._check_domains(
+            ["acme.io", "https://www.acme.io", "gone.io", "broken.io"]
+        )
+
+        assert [r.domain for r in registrations] == ["acme.io"]
+        assert sorted(fake.calls) == ["acme.io", "broken.io", "gone.io"]
+
+    @pytest.mark.asyncio
+    async def test_results_memoized_across_collectors(self):
+        """A fresh memo entry (including not-registered) skips the lookup; errors are retried"""
+        fake = _FakeRdap(missing={"gone.io"}, failing={"broken.io"})
+        domains = ["acme.io", "gone.io", "broken.io"]
+
+        first = DomainWhoisCollector()
+        first._fetch_domain_rdap = fake
+        await first._check_domains(domains)
+
+        second = DomainWhoisCollector()
+        second._fetch_domain_rdap = fake
+        registrations = await second._check_domains(domains)
+
+        assert [r.domain for r in registrations] == ["acme.io"]
+        assert fake.calls.count("acme.io") == 1
+        assert fake.calls.count("gone.io") == 1
+        assert fake.calls.count("broken.io") == 2
+
+        expired = DomainWhoisCollector(memo_ttl=0)
+        expired._fetch_domain_rdap = fake
+        await expired._check_domains(["acme.io"])
+        assert fake.calls.count("acme.io") == 2
+
+    @pytest.mark.asyncio
+    async def test_malformed_response_not_memoized(self):
+        """A body that fails to parse is an error, not a cached not-registered"""
+        from collectors.retry_strategy import RetryConfig
+        from utils.rate_limiter import AsyncRateLimiter
+
+        bodies = [{"events": "garbled"}, {"events": []}]
+
+        def handler(request):
+            return httpx.Response(200, json=bodies.pop(0))
+
+        for _ in range(2):
+            collector = DomainWhoisCollector()
+            collector.retry_config = RetryConfig(max_retries=0)
+            collector._rate_limiter = AsyncRateLimiter(rate=None, period=1)
+            collector._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            try:
+                registrations = await collector._check_domains(["acme.io"])
+            finally:
+                await collector._client.aclose()
+
+        assert bodies == []  # Second collector fetched again
+        assert [r.domain for r in registrations] == ["acme.io"]
+
+    @pytest.mark.asyncio
+    async def test_memo_prunes_expired_and_caps_size(self, monkeypatch):
+        """Expired entries are dropped and the memo never grows past its cap"""
+        import time
+
+        monkeypatch.setattr("collectors.domain_whois.RDAP_MEMO_MAX_ENTRIES", 2)
+        DomainWhoisCollector._rdap_memo["stale.io"] = (
+            time.monotonic() - 2 * 3600, _registration("stale.io")
+        )
+
+        fake = _FakeRdap()
+        collector = DomainWhoisCollector(max_concurrency=1, memo_ttl=3600)
+        collector._fetch_domain_rdap = fake
+        await collector._check_domains(["a.io", "b.io", "c.io"])
+
+        assert list(DomainWhoisCollector._rdap_memo) == ["b.io", "c.io"]
@@ -752,3 +752,121 @@ class TestGitHubRetryLogic:
         assert isinstance(collector.retry_config, RetryConfig)
         # GitHub API should use reasonable retry settings
         assert collector.retry_config.max_retries >= 3
+
+
+class TestGraphQLEnrichment:
+    """Test batched GraphQL enrichment with REST fallback."""
+
+    @staticmethod
+    def _repo(i: int) -> dict:
+        return {
+            "full_name": f"org{i}/repo{i}",
+            "owner": {"login": f"org{i}"},
+            "description": "LLM tooling",
+            "stargazers_count": 1000,
+            "forks_count": 10,
+            "watchers_count": 1000,
+            "open_issues_count": 1,
+            "language": "Python",
+            "topics": [],
+            "created_at": "2025-01-01T00:00:00Z",
+            "updated_at": "2026-01-01T00:00:00Z",
+            "pushed_at": "2026-01-01T00:00:00Z",
+            "html_url": f"https://github.com/org{i}/repo{i}",
+        }
+
+    @staticmethod
+    def _graphql_handler(calls, null_names=()):
+        """Answer GraphQL queries with one node per aliased repository."""
+        import json
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            if request.url.path != "/graphql":
+                if request.url.path.startswith("/orgs/"):
+                    return httpx.Response(404, json={"message": "Not Found"})
+                return httpx.Response(200, json={"login": request.url.path.split("/")[-1], "bio": "rest"})
+
+            variables = json.loads(request.content)["variables"]
+            data = {}
+            for key, owner in variables.items():
+                if not key.startswith("o"):
+                    continue
+                i = key[1:]
+                name = variables[f"n{i}"]
+                data[f"r{i}"] = None if name in null_names else {
+                    "nameWithOwner": f"{owner}/{name}",
+                    "stargazerCount": 1500,
+                    "forkCount": 20,
+                    "pushedAt": "2026-02-01T00:00:00Z",
+                    "updatedAt": "2026-02-01T00:00:00Z",
+                    "repositoryTopics": {"nodes": [{"topic": {"name": "llm"}}]},
+                    "owner": {
+                        "__typename": "Organization",
+                        "login": owner,
+                        "name": owner.title(),
+                        "description": "We build LLM tools",
+                        "websiteUrl": f"https://{owner}.ai",
+                        "email": "",
+                    },
+                }
+            return httpx.Response(200, json={"data": data})
+
+        return handler
+
+    @pytest.mark.asyncio
+    async def test_batches_replace_per_repo_rest_calls(self):
+        """120 repos should need 3 GraphQL queries and no REST owner lookups"""
+        from collectors.github import GitHubCollector
+
+        collector = GitHubCollector(github_token="fake_token", max_repos=120)
+        calls = []
+        collector.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(self._graphql_handler(calls))
+        )
+        collector._search_trending_repos = AsyncMock(
+            return_value=[self._repo(i) for i in range(120)]
+        )
+
+        await collector._collect_signals()
+
+        assert calls == ["/graphql"] * 3
+        assert collector._org_cache["org7"]["type"] == "Organization"
+        assert collector._org_cache["org7"]["blog"] == "https://org7.ai"
+
+        metrics = await collector._enrich_repo_metrics(self._repo(7) | {"topics": ["llm"]})
+        assert metrics.owner_type == "Organization"
+        assert metrics.owner_bio == "We build LLM tools"
+
+        await collector.client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_unresolved_repos_fall_back_to_rest(self):
+        """Null GraphQL nodes and failed batches use the REST owner lookup"""
+        from collectors.github import GitHubCollector
+        from collectors.retry_strategy import RetryConfig
+
+        collector = GitHubCollector(github_token="fake_token")
+        collector.retry_config = RetryConfig(max_retries=0)
+        calls = []
+        collector.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(self._graphql_handler(calls, null_names={"repo1"}))
+        )
+        repos = [self._repo(0), self._repo(1)]
+
+        assert await collector._prefetch_graphql(repos) == 1
+        assert repos[0]["stargazers_count"] == 1500
+        assert repos[0]["topics"] == ["llm"]
+        assert repos[1]["stargazers_count"] == 1000
+
+        metrics = await collector._enrich_repo_metrics(repos[1])
+        assert calls == ["/graphql", "/orgs/org1", "/users/org1"]
+        assert metrics.owner_type == "User"
+
+        async def fail(*args, **kwargs):
+            raise httpx.ConnectError("down")
+
+        collector._github_request = fail
+        assert await collector._prefetch_graphql([self._repo(2)]) == 0
+
+        await collector.client.aclose()
@@ -490,3 +490,47 @@ class TestHackerNewsCollectorAsync:
 
         assert len(posts) == 1
         assert posts[0].points == 100
+
+    async def test_failed_page_does_not_advance_watermark(self):
+        """Posts from pages that loaded are saved; the watermark stays put"""
+        import httpx
+        from collectors.hacker_news import HN_ALGOLIA_API, HackerNewsCollector
+        from collectors.retry_strategy import RetryConfig
+        from storage.signal_store import SignalStore
+        from utils.rate_limiter import AsyncRateLimiter
+
+        created_at = datetime.now(timezone.utc) - timedelta(hours=2)
+        page1 = httpx.Response(
+            200,
+            json={
+                "hits": [{
+                    "objectID": "12345",
+                    "title": "Show HN: My Startup",
+                    "url": "https://mystartup.com",
+                    "points": 150,
+                    "created_at_i": int(created_at.timestamp()),
+                    "_tags": ["story", "show_hn"],
+                }],
+                "page": 0,
+                "nbPages": 2,
+            },
+            request=httpx.Request("GET", HN_ALGOLIA_API),
+        )
+
+        store = SignalStore(":memory:")
+        await store.initialize()
+        try:
+            collector = HackerNewsCollector(store=store)
+            collector.retry_config = RetryConfig(max_retries=0)
+            collector._rate_limiter = AsyncRateLimiter(rate=None, period=1)
+            with patch(
+                "httpx.AsyncClient.get",
+                side_effect=[page1, httpx.ReadTimeout("Timed out")],
+            ):
+                result = await collector.run(dry_run=False)
+
+            assert result.signals_new == 1
+            assert "page 2" in result.error_message
+            assert await store.get_watermark("hacker_news") is None
+        finally:
+            await store.close()
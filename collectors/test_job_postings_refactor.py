@@ -10,6 +10,7 @@ Covers:
 - Change detection patterns
 """
 
+import asyncio
 import hashlib
 import json
 from datetime import datetime, timedelta, timezone
@@ -549,6 +550,113 @@ class TestJobPostingsCollectorIntegration:
             assert result.ats_platform == "greenhouse"
 
 
+# =============================================================================
+# CONCURRENT PROBING TESTS
+# =============================================================================
+
+@pytest.fixture
+def clear_known_boards():
+    from collectors.job_postings import JobPostingsCollector
+
+    JobPostingsCollector._known_boards.clear()
+    yield
+    JobPostingsCollector._known_boards.clear()
+
+
+def _fake_ats(collector, hits, calls, delays=None):
+    """Replace the _check_* methods with fakes that hit for (platform, board_id) in hits."""
+    from collectors.job_postings import ATS_PLATFORMS, JobPostingSignal
+
+    def make_check(platform):
+        async def check(board_id, domain):
+            calls.append((platform, board_id))
+            await asyncio.sleep((delays or {}).get((platform, board_id), 0.01))
+            if (platform, board_id) not in hits:
+                return None
+            return JobPostingSignal(
+                company_name=board_id,
+                company_domain=domain,
+                ats_platform=platform,
+                total_positions=3,
+                engineering_positions=1,
+                raw_snapshot={"board_id": board_id, "job_count": 3},
+            )
+        return check
+
+    for platform in ATS_PLATFORMS:
+        setattr(collector, f"_check_{platform}", make_check(platform))
+
+
+@pytest.mark.usefixtures("clear_known_boards")
+class TestConcurrentProbing:
+    """Test parallel probing, cancel-on-hit and remembered boards"""
+
+    @pytest.mark.asyncio
+    async def test_priority_hit_wins_and_rest_cancelled(self):
+        """A slower higher-priority hit beats a faster one; outstanding probes are cancelled"""
+        from collectors.job_postings import JobPostingsCollector
+
+        collector = JobPostingsCollector(domains=[])
+        calls = []
+        slow = {("greenhouse", "acme"): 0.05, ("workable", "acmehq"): 5.0}
+        _fake_ats(collector, {("greenhouse", "acme"), ("lever", "acme")}, calls, slow)
+
+        result = await asyncio.wait_for(collector.check_domain("acme.com"), timeout=2)
+
+        assert (result.ats_platform, result.raw_snapshot["board_id"]) == ("greenhouse", "acme")
+        assert ("lever", "acme") in calls  # Probed in parallel, not after
+
+    @pytest.mark.asyncio
+    async def test_per_host_concurrency_limit(self, monkeypatch):
+        """No more probes than the host's limit run against one ATS at once"""
+        from collectors import job_postings
+        from collectors.job_postings import JobPostingsCollector
+
+        monkeypatch.setitem(
+            job_postings.ATS_HOST_LIMITS, "greenhouse", {"concurrency": 2, "rate": 1000}
+        )
+        collector = JobPostingsCollector(domains=[])
+        in_flight, peak = [0], [0]
+
+        async def check_greenhouse(board_id, domain):
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0.01)
+            in_flight[0] -= 1
+            return None
+
+        _fake_ats(collector, set(), [])
+        collector._check_greenhouse = check_greenhouse
+
+        assert await collector.check_domain("jacob-bar.com") is None
+        assert peak[0] == 2
+
+    @pytest.mark.asyncio
+    async def test_known_board_remembered_across_runs(self):
+        """A board found on one run is probed directly on the next, via the asset store"""
+        from collectors.job_postings import JobPostingsCollector
+        from storage.source_asset_store import SourceAssetStore
+
+        asset_store = SourceAssetStore(":memory:")
+        await asset_store.initialize()
+
+        first = JobPostingsCollector(domains=["www.acme.com", "other.io"], asset_store=asset_store)
+        _fake_ats(first, {("lever", "acmehq")}, [])
+        signals = await first._collect_signals()
+        assert [s.raw_data["ats_platform"] for s in signals] == ["lever"]
+
+        JobPostingsCollector._known_boards.clear()  # New process
+        second = JobPostingsCollector(domains=["acme.com"], asset_store=asset_store)
+        calls = []
+        _fake_ats(second, {("lever", "acmehq")}, calls)
+        signals = await second._collect_signals()
+
+        assert len(signals) == 1
+        assert calls == [("lever", "acmehq")]
+
+        await asset_store.close()
+
+
 # =============================================================================
 # GREENHOUSE API TESTS
 # =============================================================================
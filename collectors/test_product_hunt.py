@@ -471,6 +471,51 @@ class TestErrorHandling:
 
                 assert launches == []
 
+    @pytest.mark.asyncio
+    async def test_failed_page_does_not_advance_watermark(self):
+        """Launches from pages that loaded are saved; the watermark stays put"""
+        from collectors.product_hunt import ProductHuntCollector
+        from collectors.retry_strategy import RetryConfig
+        from storage.signal_store import SignalStore
+        from utils.rate_limiter import AsyncRateLimiter
+        from unittest.mock import patch
+        import httpx
+
+        launched_at = datetime.now(timezone.utc) - timedelta(days=1)
+        page1 = httpx.Response(
+            200,
+            json={"data": {"posts": {
+                "edges": [{"node": {
+                    "id": "1",
+                    "name": "Product 1",
+                    "tagline": "First",
+                    "website": "https://prod1.com",
+                    "votesCount": 100,
+                    "createdAt": launched_at.isoformat(),
+                }}],
+                "pageInfo": {"hasNextPage": True, "endCursor": "cursor123"},
+            }}},
+            request=httpx.Request("POST", "https://api.producthunt.com/v2/api/graphql"),
+        )
+
+        store = SignalStore(":memory:")
+        await store.initialize()
+        try:
+            collector = ProductHuntCollector(api_key="test_key", store=store)
+            collector.retry_config = RetryConfig(max_retries=0)
+            collector._rate_limiter = AsyncRateLimiter(rate=None, period=1)
+            with patch(
+                "httpx.AsyncClient.post",
+                side_effect=[page1, httpx.ConnectError("Connection reset")],
+            ):
+                result = await collector.run(dry_run=False)
+
+            assert result.signals_new == 1
+            assert "page 2" in result.error_message
+            assert await store.get_watermark("product_hunt") is None
+        finally:
+            await store.close()
+
     @pytest.mark.asyncio
     async def test_filters_low_vote_launches(self):
         """Should filter out launches below minimum votes."""
@@ -7,8 +7,8 @@ Run with: python -m pytest collectors/test_sec_edgar.py -v
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock, patch, Mock
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch, Mock
 
 import pytest
 import httpx
@@ -364,21 +364,14 @@ async def test_collector_run_dry_run(sample_atom_feed, sample_form_d_xml_healtht
     """Test collector run in dry_run mode"""
     collector = SECEdgarCollector(lookback_days=30, max_filings=10)
 
-    # Mock HTTP responses
-    with patch("httpx.AsyncClient.get") as mock_get:
-        # First call: Atom feed
-        atom_response = AsyncMock()
-        atom_response.text = sample_atom_feed
-        atom_response.status_code = 200
-        atom_response.raise_for_status = MagicMock()
-
-        # Subsequent calls: Form D XML (404 for simplicity in this test)
-        xml_response = AsyncMock()
-        xml_response.status_code = 404
-        xml_response.raise_for_status = MagicMock()
-
-        mock_get.side_effect = [atom_response, xml_response, xml_response]
+    # Mock HTTP responses: the Atom feed, then 404 for every Form D XML
+    def handler(request):
+        if request.url.path.endswith("primary_doc.xml"):
+            return httpx.Response(404)
+        return httpx.Response(200, text=sample_atom_feed)
 
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    with patch("collectors.base.get_http_client", return_value=client):
         result = await collector.run(dry_run=True)
 
         assert result.collector == "sec_edgar"
@@ -392,9 +385,11 @@ async def test_collector_error_handling():
     collector = SECEdgarCollector()
 
     # Mock HTTP error
-    with patch("httpx.AsyncClient.get") as mock_get:
-        mock_get.side_effect = Exception("Network error")
+    def handler(request):
+        raise Exception("Network error")
 
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    with patch("collectors.base.get_http_client", return_value=client):
         result = await collector.run(dry_run=True)
 
         assert result.status == CollectorStatus.ERROR
@@ -529,6 +524,151 @@ class TestSECEdgarRetryLogic:
         assert isinstance(collector.rate_limiter, AsyncRateLimiter)
 
 
+# =============================================================================
+# ENRICHMENT PIPELINE TESTS
+# =============================================================================
+
+class _FakeSECClient:
+    """Serves Form D XML for any primary_doc.xml, tracking concurrency."""
+
+    def __init__(self, xml: str, failing: tuple = ()):
+        self.xml = xml
+        self.failing = failing
+        self.urls = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def get(self, url, **kwargs):
+        self.urls.append(url)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.02)
+        self.in_flight -= 1
+        request = httpx.Request("GET", url)
+        if any(accession in url for accession in self.failing):
+            return httpx.Response(500, request=request)
+        return httpx.Response(200, text=self.xml, request=request)
+
+
+def _filings(count: int):
+    return [
+        FormDFiling(
+            cik=str(1000 + i),
+            company_name=f"Company {i}",
+            accession_number=f"0000000000-24-{i:06d}",
+            filing_date=datetime.now(timezone.utc),
+        )
+        for i in range(count)
+    ]
+
+
+class TestFormDEnrichmentPipeline:
+    """Test concurrent enrichment and the persistent enrichment cache"""
+
+    @pytest.mark.asyncio
+    async def test_enriches_concurrently_within_bound(self, sample_form_d_xml_healthtech):
+        """Workers overlap requests, never exceeding ENRICH_CONCURRENCY"""
+        collector = SECEdgarCollector()
+        collector.ENRICH_CONCURRENCY = 4
+        collector._client = _FakeSECClient(sample_form_d_xml_healthtech)
+        filings = _filings(8)
+
+        await collector._enrich_filings(filings)
+
+        assert 1 < collector._client.peak <= 4
+        assert all(f.industry_group == "healthtech" for f in filings)
+        assert all(f.offering_amount == 2500000.0 for f in filings)
+
+    @pytest.mark.asyncio
+    async def test_enriched_accessions_remembered_across_runs(self, sample_form_d_xml_healthtech):
+        """Cached accession numbers are restored without a request; failures are retried"""
+        from collectors.retry_strategy import RetryConfig
+        from storage.signal_store import SignalStore
+
+        store = SignalStore(":memory:")
+        await store.initialize()
+        try:
+            first = SECEdgarCollector(store=store)
+            first.retry_config = RetryConfig(max_retries=0)
+            first._client = _FakeSECClient(sample_form_d_xml_healthtech, failing=("24000002",))
+            await first._enrich_filings(_filings(3))
+
+            second = SECEdgarCollector(store=store)
+            second._client = _FakeSECClient(sample_form_d_xml_healthtech)
+            filings = _filings(3)
+            await second._enrich_filings(filings)
+
+            assert len(second._client.urls) == 1
+            assert "24000002" in second._client.urls[0]
+            assert filings[0].industry_group == "healthtech"
+            assert filings[0].state == "CA"
+            assert filings[0].raw_data["form_d_xml_parsed"] is True
+        finally:
+            await store.close()
+
+
+class TestStreamedAtomFeed:
+    """Test parsing the Form D feed as it streams in"""
+
+    @pytest.mark.asyncio
+    async def test_entries_parsed_across_chunks(self, sample_atom_feed):
+        """Entries split over many small chunks still parse, in feed order"""
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%dT00:00:00+00:00")
+        feed = sample_atom_feed.replace("2024-01-15T00:00:00-05:00", today).replace(
+            "2024-01-14T00:00:00-05:00", today
+        ).encode()
+
+        async def chunked():
+            for start in range(0, len(feed), 50):
+                yield feed[start:start + 50]
+
+        def handler(request):
+            if request.url.path.endswith("primary_doc.xml"):
+                return httpx.Response(404)
+            return httpx.Response(200, content=chunked())
+
+        collector = SECEdgarCollector(lookback_days=30)
+        collector._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            filings = await collector._fetch_recent_form_d_filings()
+        finally:
+            await collector._client.aclose()
+
+        assert [f.company_name for f in filings] == ["ACME HEALTH INC", "CLEANTECH VENTURES LLC"]
+        assert filings[1].accession_number == "7654321098-24-005678"
+
+    @pytest.mark.asyncio
+    async def test_watermark_held_below_failed_enrichment(self, sample_atom_feed):
+        """A filing whose Form D request failed is not passed by the watermark"""
+        from collectors.retry_strategy import RetryConfig
+        from utils.rate_limiter import AsyncRateLimiter
+
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+        newer, older = now - timedelta(hours=1), now - timedelta(hours=5)
+        feed = sample_atom_feed.replace(
+            "2024-01-15T00:00:00-05:00", newer.isoformat()
+        ).replace("2024-01-14T00:00:00-05:00", older.isoformat())
+
+        def handler(request):
+            if "123456789024001234" in request.url.path:  # ACME HEALTH (newer)
+                return httpx.Response(500)
+            if request.url.path.endswith("primary_doc.xml"):
+                return httpx.Response(404)
+            return httpx.Response(200, text=feed)
+
+        collector = SECEdgarCollector(lookback_days=30)
+        collector.retry_config = RetryConfig(max_retries=0)
+        collector._rate_limiter = AsyncRateLimiter(rate=None, period=1)
+        collector._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            filings = await collector._fetch_recent_form_d_filings()
+        finally:
+            await collector._client.aclose()
+
+        assert len(filings) == 2
+        assert collector._next_watermark == older
+
+
 if __name__ == "__main__":
     # Run tests with: python collectors/test_sec_edgar.py
     pytest.main([__file__, "-v", "--tb=short"])
@@ -31,7 +31,7 @@ import logging
 import os
 import sys
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 import httpx
@@ -170,6 +170,12 @@ class USPTOCollector(BaseCollector):
         result = await collector.run(dry_run=True)
     """
 
+    # SourceAssetStore source_type for raw snapshots
+    SOURCE_TYPE = "uspto_patent"
+
+    # Query only patents granted since the last saved run
+    INCREMENTAL = True
+
     def __init__(
         self,
         keywords: Optional[List[str]] = None,
@@ -210,21 +216,22 @@ class USPTOCollector(BaseCollector):
         patents = await self._fetch_patents()
 
         signals = []
-        for patent in patents:
-            # Save raw data and detect changes
-            if self.asset_store:
-                is_new, changes = await self._save_asset_with_change_detection(
-                    source_type=self.SOURCE_TYPE,
-                    external_id=patent.patent_number,
-                    raw_data=patent.to_dict() if hasattr(patent, 'to_dict') else vars(patent),
-                )
+        async with self._asset_batch(self.SOURCE_TYPE, [patent.patent_number for patent in patents]):
+            for patent in patents:
+                # Save raw data and detect changes
+                if self.asset_store:
+                    is_new, changes = await self._save_asset_with_change_detection(
+                        source_type=self.SOURCE_TYPE,
+                        external_id=patent.patent_number,
+                        raw_data=patent.to_dict() if hasattr(patent, 'to_dict') else vars(patent),
+                    )
 
-                # Skip unchanged patents
-                if not is_new and not changes:
-                    logger.debug(f"Skipping unchanged patent: {patent.patent_number}")
-                    continue
+                    # Skip unchanged patents
+                    if not is_new and not changes:
+                        logger.debug(f"Skipping unchanged patent: {patent.patent_number}")
+                        continue
 
-            signals.append(patent.to_signal())
+                signals.append(patent.to_signal())
 
         return signals
 
@@ -232,9 +239,8 @@ class USPTOCollector(BaseCollector):
         """Fetch recent patents from PatentsView API."""
         patents: List[PatentFiling] = []
 
-        # Calculate date range
-        end_date = datetime.now(timezone.utc)
-        start_date = end_date - timedelta(days=self.lookback_days)
+        # Calculate date range (narrowed to the watermark on incremental runs)
+        start_date = self._fetch_cutoff(self.lookback_days)
 
         # Build query
         # PatentsView uses a specific query format
@@ -289,18 +295,17 @@ class USPTOCollector(BaseCollector):
         try:
             # Use _fetch_with_retry for automatic retry and rate limiting
             async def fetch_patents():
-                async with httpx.AsyncClient(timeout=60.0) as client:
-                    response = await client.post(
-                        PATENTSVIEW_API,
-                        json={
-                            "q": query,
-                            "f": fields,
-                            "o": options,
-                        },
-                        headers={"Content-Type": "application/json"},
-                    )
-                    response.raise_for_status()
-                    return response.json()
+                response = await self.http_client.post(
+                    PATENTSVIEW_API,
+                    json={
+                        "q": query,
+                        "f": fields,
+                        "o": options,
+                    },
+                    headers={"Content-Type": "application/json"},
+                )
+                response.raise_for_status()
+                return response.json()
 
             # Acquire rate limit before request
             await self.rate_limiter.acquire()
@@ -318,6 +323,7 @@ class USPTOCollector(BaseCollector):
                     filing_date = datetime.strptime(
                         patent_date_str, "%Y-%m-%d"
                     ).replace(tzinfo=timezone.utc)
+                    self._observe_item_time(filing_date)
                 except ValueError:
                     filing_date = datetime.now(timezone.utc)
 
@@ -366,9 +372,12 @@ class USPTOCollector(BaseCollector):
                 patents.append(patent)
 
         except httpx.HTTPError as e:
-            logger.error(f"USPTO HTTP error: {e}")
+            error_msg = f"USPTO HTTP error: {e}"
+            logger.error(error_msg)
+            self._errors.append(error_msg)
         except Exception as e:
             logger.exception(f"USPTO fetch error: {e}")
+            self._errors.append(f"USPTO fetch error: {e}")
 
         logger.info(f"Fetched {len(patents)} USPTO patents")
         return patents
@@ -23,6 +23,8 @@ from xml.etree import ElementTree as ET
 
 import aiohttp
 
+from utils.xml_stream import ATOM_ENTRY, CHUNK_SIZE, aiter_elements, iter_elements
+
 from .base import ConsumerCollector, Signal
 
 logger = logging.getLogger(__name__)
@@ -37,6 +39,9 @@ RSS_FEEDS = {
     "nosh": "https://www.nosh.com/feed/",
 }
 
+# Feed entries: RSS 2.0 <item> and Atom <entry>
+FEED_ITEM_TAGS = ("item", ATOM_ENTRY)
+
 # Keywords indicating new product launch (vs. industry news)
 LAUNCH_KEYWORDS = [
     "launch", "launches", "launching",
@@ -126,17 +131,22 @@ class BevNetCollector(ConsumerCollector):
                     logger.error(f"{feed_name} RSS error: {response.status}")
                     return []
 
-                content = await response.text()
-                items = self._parse_rss(content)
+                # Parse items as the body streams in instead of buffering it
+                item_count = 0
+                chunks = response.content.iter_chunked(CHUNK_SIZE)
+                async for element in aiter_elements(chunks, FEED_ITEM_TAGS):
+                    item = self._parse_feed_element(element)
+                    item_count += 1
 
-                for item in items:
                     # Filter for launch announcements
                     if self._is_launch_announcement(item):
                         signal = self._item_to_signal(feed_name, item)
                         signals.append(signal)
 
-                logger.debug(f"{feed_name}: {len(items)} items, {len(signals)} launches")
+                logger.debug(f"{feed_name}: {item_count} items, {len(signals)} launches")
 
+        except ET.ParseError as e:
+            logger.error(f"{feed_name} RSS parse error: {e}")
         except Exception as e:
             logger.error(f"{feed_name} RSS fetch failed: {e}")
 
@@ -147,22 +157,20 @@ class BevNetCollector(ConsumerCollector):
         items = []
 
         try:
-            root = ET.fromstring(content)
-
-            # Handle both RSS 2.0 and Atom formats
-            # RSS 2.0: /rss/channel/item
-            for item in root.findall(".//item"):
-                items.append(self._parse_rss_item(item))
-
-            # Atom: /feed/entry
-            for entry in root.findall(".//{http://www.w3.org/2005/Atom}entry"):
-                items.append(self._parse_atom_entry(entry))
+            for element in iter_elements(content, FEED_ITEM_TAGS):
+                items.append(self._parse_feed_element(element))
 
         except ET.ParseError as e:
             logger.error(f"RSS parse error: {e}")
 
         return items
 
+    def _parse_feed_element(self, element: ET.Element) -> Dict[str, Any]:
+        """Parse an RSS 2.0 <item> or Atom <entry>."""
+        if element.tag == ATOM_ENTRY:
+            return self._parse_atom_entry(element)
+        return self._parse_rss_item(element)
+
     def _parse_rss_item(self, item: ET.Element) -> Dict[str, Any]:
         """Parse RSS 2.0 item element."""
         title = item.findtext("title", "")
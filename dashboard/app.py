@@ -30,7 +30,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 # Load .env from project root
 load_dotenv(Path(__file__).parent.parent / ".env")
 
-from storage.signal_store import SignalStore
+from storage.signal_store import SignalStore, decode_raw_data
 from utils.signal_health import SignalHealthMonitor
 
 # =============================================================================
@@ -38,6 +38,7 @@ from utils.signal_health import SignalHealthMonitor
 # =============================================================================
 
 DB_PATH = os.environ.get("DISCOVERY_DB_PATH", "signals.db")
+DB_WAL_MODE = os.environ.get("DISCOVERY_DB_WAL", "false").lower() == "true"
 NOTION_API_KEY = os.environ.get("NOTION_API_KEY", "")
 NOTION_DATABASE_ID = os.environ.get("NOTION_DATABASE_ID", "")
 
@@ -338,7 +339,7 @@ def run_async(coro):
 @st.cache_resource
 def get_store():
     """Get or create signal store (cached)."""
-    store = SignalStore(DB_PATH)
+    store = SignalStore(DB_PATH, wal_mode=DB_WAL_MODE)
     run_async(store.initialize())
     return store
 
@@ -348,32 +349,51 @@ def get_store():
 # =============================================================================
 
 @st.cache_data(ttl=60)
-def load_signals(_store, days_back: int = 7):
-    """Load signals from database."""
+def load_signals(_store, days_back: int = 7, query: str = ""):
+    """Load signals from database (FTS search when query is set)."""
     async def _load():
         if not _store._db:
             await _store.initialize()
 
         cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
 
-        cursor = await _store._db.execute(
-            """
-            SELECT s.id, s.signal_type, s.source_api, s.canonical_key,
-                   s.company_name, s.confidence, s.raw_data,
-                   s.detected_at, s.created_at,
-                   p.status as processing_status, p.notion_page_id
-            FROM signals s
-            LEFT JOIN signal_processing p ON s.id = p.signal_id
-            WHERE s.created_at >= ?
-            ORDER BY s.confidence DESC, s.created_at DESC
-            """,
-            (cutoff.isoformat(),)
-        )
-
-        rows = await cursor.fetchall()
+        if query.strip():
+            matches = await _store.search(query, limit=500, since=cutoff)
+            return [
+                {
+                    "id": sig.id,
+                    "signal_type": sig.signal_type,
+                    "source_api": sig.source_api,
+                    "canonical_key": sig.canonical_key,
+                    "company_name": sig.company_name or "Unknown",
+                    "confidence": sig.confidence,
+                    "raw_data": sig.raw_data,
+                    "detected_at": sig.detected_at.isoformat(),
+                    "created_at": sig.created_at.isoformat(),
+                    "processing_status": sig.processing_status or "pending",
+                    "notion_page_id": sig.notion_page_id,
+                }
+                for sig in matches
+            ]
+
+        async with _store.reader() as db:
+            cursor = await db.execute(
+                """
+                SELECT s.id, s.signal_type, s.source_api, s.canonical_key,
+                       s.company_name, s.confidence, s.raw_data,
+                       s.detected_at, s.created_at,
+                       p.status as processing_status, p.notion_page_id
+                FROM signals s
+                LEFT JOIN signal_processing p ON s.id = p.signal_id
+                WHERE s.created_at_epoch >= ?
+                ORDER BY s.confidence DESC, s.created_at_epoch DESC
+                """,
+                (int(cutoff.timestamp()),)
+            )
+            rows = await cursor.fetchall()
+
         signals = []
         for row in rows:
-            import json
             signals.append({
                 "id": row[0],
                 "signal_type": row[1],
@@ -381,7 +401,7 @@ def load_signals(_store, days_back: int = 7):
                 "canonical_key": row[3],
                 "company_name": row[4] or "Unknown",
                 "confidence": row[5],
-                "raw_data": json.loads(row[6]) if row[6] else {},
+                "raw_data": decode_raw_data(row[6]) if row[6] else {},
                 "detected_at": row[7],
                 "created_at": row[8],
                 "processing_status": row[9] or "pending",
@@ -799,12 +819,13 @@ def main():
         # Filters
         with st.sidebar:
             st.markdown('<div class="section-header">Filters</div>', unsafe_allow_html=True)
+            query = st.text_input("Search", placeholder="Company, description, title...")
             days = st.selectbox("Time Range", [7, 14, 30, 90], format_func=lambda x: f"Last {x} days")
             source = st.selectbox("Source", ["All", "github", "sec_edgar", "companies_house",
                                              "product_hunt", "hacker_news", "arxiv", "uspto"])
             min_conf = st.slider("Min Confidence", 0.0, 1.0, 0.0, 0.1)
 
-        signals = load_signals(store, days_back=days)
+        signals = load_signals(store, days_back=days, query=query)
         health = load_health_report(store)
 
         # Top metrics
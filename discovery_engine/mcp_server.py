@@ -153,7 +153,8 @@ async def get_signal_store() -> SignalStore:
     global _signal_store
     if _signal_store is None:
         db_path = os.environ.get("SIGNAL_DB_PATH", "signals.db")
-        _signal_store = SignalStore(db_path=db_path)
+        wal_mode = os.environ.get("DISCOVERY_DB_WAL", "false").lower() == "true"
+        _signal_store = SignalStore(db_path=db_path, wal_mode=wal_mode)
         await _signal_store.initialize()
     return _signal_store
 
@@ -563,6 +564,28 @@ async def list_tools() -> list[Tool]:
                 "required": ["discovery_id"],
             },
         ),
+        Tool(
+            name="search_signals",
+            description="Full-text search over stored signals (company names, descriptions, titles)",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": "Search text, e.g. 'robotics warehouse'",
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Max results (default: 20)",
+                    },
+                    "signal_type": {
+                        "type": "string",
+                        "description": "Only this signal type",
+                    },
+                },
+                "required": ["query"],
+            },
+        ),
         Tool(
             name="build_canonical_key",
             description="Build canonical key(s) from company identifiers",
@@ -602,6 +625,26 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
                  "This tool will run signals through the verification gate.",
         )]
 
+    elif name == "search_signals":
+        try:
+            store = await get_signal_store()
+            signals = await store.search(
+                arguments.get("query", ""),
+                limit=int(arguments.get("limit", 20)),
+                signal_type=arguments.get("signal_type") or None,
+            )
+            if not signals:
+                return [TextContent(type="text", text="No matching signals.")]
+            lines = [
+                f"{s.company_name or s.canonical_key} ({s.canonical_key}) - "
+                f"{s.signal_type} via {s.source_api}, confidence {s.confidence:.2f}, "
+                f"{s.processing_status or 'pending'}, detected {s.detected_at.date().isoformat()}"
+                for s in signals
+            ]
+            return [TextContent(type="text", text="\n".join(lines))]
+        except Exception as e:
+            return [TextContent(type="text", text=f"Error searching signals: {str(e)}")]
+
     elif name == "build_canonical_key":
         try:
             primary_key = build_canonical_key(
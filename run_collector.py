@@ -8,12 +8,16 @@ Usage:
     python run_collector.py sec_edgar --dry-run
     python run_collector.py github --max-repos 50
     python run_collector.py sec_edgar --lookback 60 --max 100
+
+Set RATE_LIMIT_DB_PATH to share API rate limits with other running
+collectors and pipelines (use the same path for all of them).
 """
 
 import argparse
 import asyncio
 import json
 import logging
+import os
 import sys
 from datetime import datetime
 
@@ -26,6 +30,14 @@ logging.basicConfig(
 )
 
 
+async def with_shared_rate_limits(run, args):
+    """Run a collector command, drawing on RATE_LIMIT_DB_PATH's shared budgets if set."""
+    from utils.rate_limiter import shared_rate_limits
+
+    async with shared_rate_limits(os.environ.get("RATE_LIMIT_DB_PATH")):
+        return await run(args)
+
+
 async def run_sec_edgar(args):
     """Run SEC EDGAR Form D collector."""
     from collectors.sec_edgar import SECEdgarCollector
@@ -170,13 +182,13 @@ Examples:
 
     # Run collector
     if args.collector == "sec_edgar":
-        asyncio.run(run_sec_edgar(args))
+        asyncio.run(with_shared_rate_limits(run_sec_edgar, args))
     elif args.collector == "github":
-        asyncio.run(run_github(args))
+        asyncio.run(with_shared_rate_limits(run_github, args))
     elif args.collector == "companies_house":
-        asyncio.run(run_companies_house(args))
+        asyncio.run(with_shared_rate_limits(run_companies_house, args))
     elif args.collector == "domain_whois":
-        asyncio.run(run_domain_whois(args))
+        asyncio.run(with_shared_rate_limits(run_domain_whois, args))
     else:
         print(f"Unknown collector: {args.collector}")
         sys.exit(1)
@@ -873,12 +873,25 @@ Examples:
 
 Environment variables:
   DISCOVERY_DB_PATH          - Path to SQLite database (default: signals.db)
+  DISCOVERY_DB_WAL           - WAL mode + read connection pool (default: false)
+  ARCHIVE_DB_PATH            - Archive database for old signals/runs (default: none)
+  RETENTION_DAYS             - Archive pushed/rejected signals older than N days (default: 0 = off)
+  HTTP_MAX_CONNECTIONS       - Connection pool size per API client (default: 20)
+  HTTP_MAX_KEEPALIVE         - Idle keep-alive connections per API client (default: 10)
+  HTTP_KEEPALIVE_EXPIRY      - Seconds an idle connection is kept open (default: 30)
+  HTTP_TIMEOUT               - Default HTTP request timeout in seconds (default: 30)
+  HTTP2                      - Use HTTP/2 when the h2 package is installed (default: false)
+  HTTP_CACHE_PATH            - On-disk conditional HTTP cache database (default: none = off)
+  HTTP_CACHE_MAX_MB          - HTTP cache size before LRU eviction (default: 256)
+  HTTP_CACHE_TTLS            - Per-API cache TTL seconds, e.g. github=600,sec_edgar=3600
+  RATE_LIMIT_DB_PATH         - SQLite file for API rate limits shared across processes (default: none = per process)
   NOTION_API_KEY             - Notion integration token
   NOTION_DATABASE_ID         - Notion database ID
   GITHUB_TOKEN               - GitHub API token
   COMPANIES_HOUSE_API_KEY    - UK Companies House API key
   PARALLEL_COLLECTORS        - Run collectors in parallel (default: true)
   BATCH_SIZE                 - Processing batch size (default: 50)
+  DRAIN_PENDING              - Process the whole pending backlog per run (default: false)
   STRICT_MODE                - Require 2+ sources for auto-push (default: false)
   USE_GATING                 - Enable consumer filtering (default: true)
   USE_ENTITIES               - Enable entity resolution (default: false)
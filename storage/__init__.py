@@ -8,6 +8,8 @@ Main components:
 - SignalStore: Async SQLite storage with connection pooling
 - StoredSignal: Signal data loaded from database
 - SuppressionEntry: Suppression cache entry
+- SaveResult: Per-signal outcome of SignalStore.save_signals_batch()
+- ConnectionManager: Shared SQLite writer/transactions across stores
 
 Quick start:
     from storage import signal_store
@@ -34,10 +36,12 @@ Quick start:
         await store.mark_pushed(signal_id, "notion-page-123")
 """
 
+from storage.connection_manager import ConnectionManager
 from storage.signal_store import (
     SignalStore,
     StoredSignal,
     SuppressionEntry,
+    SaveResult,
     signal_store,
     CURRENT_SCHEMA_VERSION,
 )
@@ -46,7 +50,9 @@ __all__ = [
     "SignalStore",
     "StoredSignal",
     "SuppressionEntry",
+    "SaveResult",
     "signal_store",
+    "ConnectionManager",
     "CURRENT_SCHEMA_VERSION",
 ]
 
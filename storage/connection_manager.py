@@ -0,0 +1,344 @@
+"""
+Shared SQLite connection manager for Discovery Engine stores.
+
+SignalStore, EntityResolutionStore and FounderStore all live in the same
+SQLite file (config.db_path). Giving each store its own aiosqlite
+connection means three writers contending for the file lock, occasional
+"database is locked" errors under load, and no way to commit a write that
+spans stores. A ConnectionManager owns:
+
+- The single writer connection, and the asyncio lock that serializes it
+- Nested transactions (SAVEPOINTs), so store methods compose inside an
+  outer cross-store transaction
+- Bounded lock waits (lock_timeout for the in-process lock, SQLite
+  busy_timeout for other processes)
+- The optional WAL read-only connection pool
+
+Usage:
+    conn = ConnectionManager("signals.db", wal_mode=True)
+    await conn.initialize()
+
+    signals = SignalStore(connection=conn)
+    founders = FounderStore(connection=conn)
+    await signals.initialize()
+    await founders.initialize()
+
+    # Commits (or rolls back) both writes together
+    async with conn.transaction():
+        signal_id = await signals.save_signal(...)
+        await founders.link_founder_to_signal(founder_id, signal_id)
+
+    # Stores built on a shared manager don't close it; the owner does
+    await conn.close()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional
+
+import aiosqlite
+
+logger = logging.getLogger(__name__)
+
+
+# Pragmas applied to the writer connection when wal_mode=True
+WAL_WRITER_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",  # fsync on checkpoint, not every commit
+    "PRAGMA cache_size = -20000",   # ~20 MB page cache
+    "PRAGMA mmap_size = 268435456",  # 256 MB memory-mapped I/O
+)
+
+# Pragmas applied to each pooled read-only connection
+WAL_READER_PRAGMAS = (
+    "PRAGMA query_only = ON",
+    "PRAGMA cache_size = -8000",
+    "PRAGMA mmap_size = 268435456",
+)
+
+
+class ConnectionManager:
+    """
+    Owns the write connection (and optional read pool) for one SQLite file.
+
+    Features:
+    - One writer connection shared by every store built on this manager
+    - BEGIN IMMEDIATE transactions, so the file write lock is taken up front
+      and waits are bounded by busy_timeout instead of failing on upgrade
+    - Re-entrant transaction(): nested calls from the task that already
+      holds the transaction become SAVEPOINTs
+    - Opt-in WAL mode with a pool of read-only connections
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path = "signals.db",
+        wal_mode: bool = False,
+        read_pool_size: int = 4,
+        lock_timeout: float = 30.0,
+        busy_timeout_ms: int = 5000,
+    ):
+        """
+        Initialize connection manager.
+
+        Args:
+            db_path: Path to SQLite database file
+            wal_mode: Enable WAL journaling with tuned pragmas and a read-only
+                connection pool (ignored for :memory:)
+            read_pool_size: Number of read-only connections when wal_mode=True
+            lock_timeout: Max seconds to wait for the write lock before
+                raising TimeoutError
+            busy_timeout_ms: SQLite busy_timeout for cross-process file locks
+        """
+        self.db_path = Path(db_path)
+        self.wal_mode = wal_mode
+        self.read_pool_size = read_pool_size
+        self.lock_timeout = lock_timeout
+        self.busy_timeout_ms = busy_timeout_ms
+
+        self._db: Optional[aiosqlite.Connection] = None
+        self._lock = asyncio.Lock()
+        self._owner: Optional[asyncio.Task] = None  # Task holding the write lock
+        self._depth = 0  # Transaction nesting of the owner (0 = none open)
+        self._read_pool: Optional[asyncio.Queue[aiosqlite.Connection]] = None
+        self._read_conns: List[aiosqlite.Connection] = []
+        self._attached: Dict[str, Path] = {}
+
+    @property
+    def connection(self) -> Optional[aiosqlite.Connection]:
+        """The writer connection (None until initialize() is called)."""
+        return self._db
+
+    @property
+    def in_memory(self) -> bool:
+        return str(self.db_path) == ":memory:"
+
+    @property
+    def has_read_pool(self) -> bool:
+        return self._read_pool is not None
+
+    def is_attached(self, schema: str) -> bool:
+        """True if a database is attached under this schema name."""
+        return schema in self._attached
+
+    async def initialize(self) -> None:
+        """
+        Open the writer connection. Safe to call more than once, so every
+        store sharing this manager can call it from its own initialize().
+        """
+        if self._db:
+            return
+
+        if not self.in_memory:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._db = await aiosqlite.connect(str(self.db_path))
+        await self._db.execute("PRAGMA foreign_keys = ON")
+        await self._db.execute(f"PRAGMA busy_timeout = {self.busy_timeout_ms}")
+
+        if self.wal_mode and not self.in_memory:
+            for pragma in WAL_WRITER_PRAGMAS:
+                await self._db.execute(pragma)
+
+        logger.debug(f"ConnectionManager opened writer: {self.db_path}")
+
+    async def open_read_pool(self) -> None:
+        """
+        Open the read-only connection pool (WAL mode only, idempotent).
+
+        Called by stores after their migrations so readers start against an
+        up-to-date schema.
+        """
+        if (
+            self._read_pool is not None
+            or not self.wal_mode
+            or self.in_memory
+            or self.read_pool_size <= 0
+        ):
+            return
+
+        uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+        pool: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+
+        for _ in range(self.read_pool_size):
+            conn = await aiosqlite.connect(uri, uri=True)
+            await conn.execute(f"PRAGMA busy_timeout = {self.busy_timeout_ms}")
+            for pragma in WAL_READER_PRAGMAS:
+                await conn.execute(pragma)
+            for schema, path in self._attached.items():
+                await self._attach_reader(conn, path, schema)
+            self._read_conns.append(conn)
+            pool.put_nowait(conn)
+
+        self._read_pool = pool
+        logger.info(f"Opened {self.read_pool_size} read connections: {self.db_path}")
+
+    async def attach(self, path: str | Path, schema: str) -> None:
+        """
+        ATTACH another database file under `schema` (idempotent).
+
+        Attached on the writer and on every pooled reader (including ones
+        opened later), so queries can use `schema.table` from either.
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized. Call initialize() first.")
+        if not schema.isidentifier():
+            raise ValueError(f"Invalid schema name: {schema!r}")
+        if schema in self._attached:
+            return
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # ATTACH can't run inside a transaction, so hold the write lock
+        async with self.exclusive() as db:
+            await db.execute("ATTACH DATABASE ? AS " + schema, (str(path),))
+
+        for conn in self._read_conns:
+            await self._attach_reader(conn, path, schema)
+
+        self._attached[schema] = path
+        logger.info(f"Attached {path} as {schema}")
+
+    async def _attach_reader(
+        self,
+        conn: aiosqlite.Connection,
+        path: Path,
+        schema: str,
+    ) -> None:
+        uri = f"{path.resolve().as_uri()}?mode=ro"
+        await conn.execute("ATTACH DATABASE ? AS " + schema, (uri,))
+
+    async def close(self) -> None:
+        """Close the read pool and the writer connection."""
+        for conn in self._read_conns:
+            await conn.close()
+        self._read_conns = []
+        self._read_pool = None
+
+        if self._db:
+            await self._db.close()
+            self._db = None
+        self._attached = {}
+
+    @asynccontextmanager
+    async def reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Context manager yielding a connection for read-only queries.
+
+        In WAL mode this checks a connection out of the read pool, so reads
+        run concurrently with (and never wait on) the writer. Otherwise it
+        yields the writer connection under the write lock, so a read never
+        sees another task's uncommitted transaction. The task that already
+        holds the lock reads straight through (seeing its own writes), and
+        may open a transaction inside the read.
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized. Call initialize() first.")
+
+        if self._read_pool is None:
+            task = asyncio.current_task()
+            if self._owner is task:
+                yield self._db
+                return
+
+            await self._acquire_lock()
+            self._owner = task
+            try:
+                yield self._db
+            finally:
+                self._owner = None
+                self._lock.release()
+            return
+
+        conn = await self._read_pool.get()
+        try:
+            yield conn
+        finally:
+            self._read_pool.put_nowait(conn)
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Context manager for write transactions.
+
+        The outermost call takes the write lock (waiting at most
+        lock_timeout seconds) and runs BEGIN IMMEDIATE ... COMMIT. Calls
+        nested inside it from the same task use SAVEPOINTs, so a store
+        method's own transaction joins the caller's.
+
+        Usage:
+            async with manager.transaction() as conn:
+                await conn.execute(...)
+                # Commits on success, rolls back on exception
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized. Call initialize() first.")
+
+        task = asyncio.current_task()
+
+        if self._depth > 0 and self._owner is task:
+            self._depth += 1
+            savepoint = f"sp_{self._depth}"
+            await self._db.execute(f"SAVEPOINT {savepoint}")
+            try:
+                yield self._db
+                await self._db.execute(f"RELEASE {savepoint}")
+            except BaseException:
+                await self._db.execute(f"ROLLBACK TO {savepoint}")
+                await self._db.execute(f"RELEASE {savepoint}")
+                raise
+            finally:
+                self._depth -= 1
+            return
+
+        # Already holding the lock for a read (non-WAL reader())
+        holds_lock = self._owner is task
+        if not holds_lock:
+            await self._acquire_lock()
+
+        self._owner = task
+        self._depth = 1
+        try:
+            await self._db.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._db
+                await self._db.commit()
+            except BaseException:
+                await self._db.rollback()
+                raise
+        finally:
+            self._depth = 0
+            if not holds_lock:
+                self._owner = None
+                self._lock.release()
+
+    @asynccontextmanager
+    async def exclusive(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Hold the write lock without opening a transaction.
+
+        For statements SQLite refuses to run inside one (ATTACH, VACUUM,
+        some PRAGMAs). Not re-entrant: don't call it inside transaction().
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized. Call initialize() first.")
+
+        await self._acquire_lock()
+        try:
+            yield self._db
+        finally:
+            self._lock.release()
+
+    async def _acquire_lock(self) -> None:
+        """Take the write lock, waiting at most lock_timeout seconds."""
+        try:
+            await asyncio.wait_for(self._lock.acquire(), timeout=self.lock_timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"Timed out after {self.lock_timeout}s waiting for write lock on {self.db_path}"
+            ) from None
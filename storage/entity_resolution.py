@@ -20,7 +20,9 @@ import logging
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Optional, Dict, Any, List
+from typing import AsyncContextManager, Optional, Dict, Any, List
+
+from storage.connection_manager import ConnectionManager
 
 logger = logging.getLogger(__name__)
 
@@ -80,23 +82,44 @@ class EntityResolutionStore:
         lead_key = await store.get_lead_for_asset("github_repo", "startup/app")
     """
 
-    def __init__(self, db_path: str):
+    def __init__(
+        self,
+        db_path: str = "signals.db",
+        connection: Optional[ConnectionManager] = None,
+    ):
         """
         Initialize EntityResolutionStore.
 
         Args:
             db_path: Path to SQLite database. Use ":memory:" for in-memory.
+            connection: Shared ConnectionManager (db_path is then taken from
+                it and close() leaves it open)
         """
-        self.db_path = db_path
-        self._db: Optional[aiosqlite.Connection] = None
+        self._owns_connection = connection is None
+        self._conn = connection or ConnectionManager(db_path)
+        self.db_path = str(self._conn.db_path)
+
+    @property
+    def _db(self) -> Optional[aiosqlite.Connection]:
+        return self._conn.connection
+
+    def transaction(self) -> AsyncContextManager[aiosqlite.Connection]:
+        """Write transaction on the underlying ConnectionManager."""
+        return self._conn.transaction()
 
     async def initialize(self) -> None:
         """Initialize database connection and create tables."""
-        self._db = await aiosqlite.connect(self.db_path)
-        self._db.row_factory = aiosqlite.Row
+        await self._conn.initialize()
+
+        async with self.transaction() as conn:
+            await self._create_tables(conn)
+
+        logger.info(f"EntityResolutionStore initialized at {self.db_path}")
 
+    async def _create_tables(self, conn: aiosqlite.Connection) -> None:
+        """Create resolution tables and indexes if missing."""
         # Main linking table
-        await self._db.execute("""
+        await conn.execute("""
             CREATE TABLE IF NOT EXISTS asset_to_lead (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 asset_id INTEGER NOT NULL,
@@ -112,19 +135,19 @@ class EntityResolutionStore:
         """)
 
         # Index for looking up lead by asset
-        await self._db.execute("""
+        await conn.execute("""
             CREATE INDEX IF NOT EXISTS idx_asset_to_lead_asset
             ON asset_to_lead(asset_source_type, asset_external_id, resolved_by DESC)
         """)
 
         # Index for looking up assets by lead
-        await self._db.execute("""
+        await conn.execute("""
             CREATE INDEX IF NOT EXISTS idx_asset_to_lead_lead
             ON asset_to_lead(lead_canonical_key)
         """)
 
         # Asset registry (tracks which assets exist for unresolved queries)
-        await self._db.execute("""
+        await conn.execute("""
             CREATE TABLE IF NOT EXISTS asset_registry (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 asset_id INTEGER NOT NULL UNIQUE,
@@ -134,14 +157,11 @@ class EntityResolutionStore:
             )
         """)
 
-        await self._db.execute("""
+        await conn.execute("""
             CREATE INDEX IF NOT EXISTS idx_asset_registry_lookup
             ON asset_registry(source_type, external_id)
         """)
 
-        await self._db.commit()
-        logger.info(f"EntityResolutionStore initialized at {self.db_path}")
-
     async def create_link(self, link: AssetToLead) -> int:
         """
         Create or update a link between asset and lead.
@@ -157,49 +177,49 @@ class EntityResolutionStore:
         """
         import json
 
-        # Check if a link already exists
-        existing = await self._get_existing_link(
-            link.asset_source_type,
-            link.asset_external_id,
-        )
-
-        if existing:
-            # Manual always wins, otherwise higher confidence wins
-            should_replace = (
-                link.resolved_by == ResolutionMethod.MANUAL
-                or (
-                    existing["resolved_by"] != ResolutionMethod.MANUAL.value
-                    and link.confidence > existing["confidence"]
-                )
+        async with self.transaction() as conn:
+            # Check if a link already exists
+            existing = await self._get_existing_link(
+                link.asset_source_type,
+                link.asset_external_id,
             )
 
-            if should_replace:
-                await self._db.execute(
-                    "DELETE FROM asset_to_lead WHERE id = ?",
-                    (existing["id"],),
+            if existing:
+                # Manual always wins, otherwise higher confidence wins
+                should_replace = (
+                    link.resolved_by == ResolutionMethod.MANUAL
+                    or (
+                        existing["resolved_by"] != ResolutionMethod.MANUAL.value
+                        and link.confidence > existing["confidence"]
+                    )
                 )
-            else:
-                # Keep existing link
-                return existing["id"]
 
-        cursor = await self._db.execute(
-            """INSERT INTO asset_to_lead
-               (asset_id, asset_source_type, asset_external_id,
-                lead_canonical_key, confidence, resolved_by, resolved_at, metadata)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                link.asset_id,
-                link.asset_source_type,
-                link.asset_external_id,
-                link.lead_canonical_key,
-                link.confidence,
-                link.resolved_by.value,
-                link.resolved_at.isoformat(),
-                json.dumps(link.metadata) if link.metadata else None,
-            ),
-        )
-        await self._db.commit()
-        return cursor.lastrowid
+                if should_replace:
+                    await conn.execute(
+                        "DELETE FROM asset_to_lead WHERE id = ?",
+                        (existing["id"],),
+                    )
+                else:
+                    # Keep existing link
+                    return existing["id"]
+
+            cursor = await conn.execute(
+                """INSERT INTO asset_to_lead
+                   (asset_id, asset_source_type, asset_external_id,
+                    lead_canonical_key, confidence, resolved_by, resolved_at, metadata)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    link.asset_id,
+                    link.asset_source_type,
+                    link.asset_external_id,
+                    link.lead_canonical_key,
+                    link.confidence,
+                    link.resolved_by.value,
+                    link.resolved_at.isoformat(),
+                    json.dumps(link.metadata) if link.metadata else None,
+                ),
+            )
+            return cursor.lastrowid
 
     async def _get_existing_link(
         self,
@@ -313,13 +333,13 @@ class EntityResolutionStore:
             source_type: Type of source.
             external_id: Source-specific identifier.
         """
-        await self._db.execute(
-            """INSERT OR REPLACE INTO asset_registry
-               (asset_id, source_type, external_id)
-               VALUES (?, ?, ?)""",
-            (asset_id, source_type, external_id),
-        )
-        await self._db.commit()
+        async with self.transaction() as conn:
+            await conn.execute(
+                """INSERT OR REPLACE INTO asset_registry
+                   (asset_id, source_type, external_id)
+                   VALUES (?, ?, ?)""",
+                (asset_id, source_type, external_id),
+            )
 
     async def get_unresolved_assets(
         self,
@@ -394,11 +414,11 @@ class EntityResolutionStore:
         Args:
             link_id: Database ID of the link to delete.
         """
-        await self._db.execute(
-            "DELETE FROM asset_to_lead WHERE id = ?",
-            (link_id,),
-        )
-        await self._db.commit()
+        async with self.transaction() as conn:
+            await conn.execute(
+                "DELETE FROM asset_to_lead WHERE id = ?",
+                (link_id,),
+            )
 
     def _row_to_link(self, row) -> AssetToLead:
         """Convert database row to AssetToLead."""
@@ -417,7 +437,6 @@ class EntityResolutionStore:
         )
 
     async def close(self) -> None:
-        """Close database connection."""
-        if self._db:
-            await self._db.close()
-            self._db = None
+        """Close database connection, unless it belongs to a shared manager."""
+        if self._owns_connection:
+            await self._conn.close()
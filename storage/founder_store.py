@@ -25,18 +25,19 @@ Usage:
 
 from __future__ import annotations
 
-import asyncio
 import json
 import logging
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, AsyncIterator, Set
+from typing import Any, AsyncContextManager, Dict, List, Optional, AsyncIterator, Set
 from enum import Enum
 
 import aiosqlite
 
+from storage.connection_manager import ConnectionManager
+
 logger = logging.getLogger(__name__)
 
 
@@ -432,48 +433,40 @@ class FounderStore:
     def __init__(
         self,
         db_path: str | Path = "signals.db",
+        connection: Optional[ConnectionManager] = None,
     ):
         """
         Initialize founder store.
 
         Args:
             db_path: Path to SQLite database file (shared with SignalStore)
+            connection: Shared ConnectionManager, e.g. SignalStore.connection
+                (db_path is then taken from it and close() leaves it open)
         """
-        self.db_path = Path(db_path)
-        self._db: Optional[aiosqlite.Connection] = None
-        self._lock = asyncio.Lock()
+        self._owns_connection = connection is None
+        self._conn = connection or ConnectionManager(db_path)
+        self.db_path = self._conn.db_path
+
+    @property
+    def _db(self) -> Optional[aiosqlite.Connection]:
+        return self._conn.connection
 
     async def initialize(self) -> None:
         """Initialize database connection and apply migrations."""
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-
-        self._db = await aiosqlite.connect(str(self.db_path))
-        await self._db.execute("PRAGMA foreign_keys = ON")
+        await self._conn.initialize()
 
         await self._apply_migrations()
 
         logger.info(f"FounderStore initialized: {self.db_path}")
 
     async def close(self) -> None:
-        """Close database connection."""
-        if self._db:
-            await self._db.close()
-            self._db = None
-
-    @asynccontextmanager
-    async def transaction(self) -> AsyncIterator[aiosqlite.Connection]:
-        """Context manager for transactions."""
-        if not self._db:
-            raise RuntimeError("Database not initialized")
+        """Close database connection, unless it belongs to a shared manager."""
+        if self._owns_connection:
+            await self._conn.close()
 
-        async with self._lock:
-            try:
-                await self._db.execute("BEGIN")
-                yield self._db
-                await self._db.commit()
-            except Exception:
-                await self._db.rollback()
-                raise
+    def transaction(self) -> AsyncContextManager[aiosqlite.Connection]:
+        """Context manager for transactions (SAVEPOINT when nested)."""
+        return self._conn.transaction()
 
     async def _apply_migrations(self) -> None:
         """Apply pending schema migrations."""
@@ -868,16 +861,16 @@ class FounderStore:
 
         now = datetime.now(timezone.utc).isoformat()
 
-        await self._db.execute(
-            """
-            INSERT INTO founder_signals (founder_id, signal_id, relationship, created_at)
-            VALUES (?, ?, ?, ?)
-            ON CONFLICT(founder_id, signal_id) DO UPDATE SET
-                relationship = excluded.relationship
-            """,
-            (founder_id, signal_id, relationship.value, now)
-        )
-        await self._db.commit()
+        async with self.transaction() as conn:
+            await conn.execute(
+                """
+                INSERT INTO founder_signals (founder_id, signal_id, relationship, created_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(founder_id, signal_id) DO UPDATE SET
+                    relationship = excluded.relationship
+                """,
+                (founder_id, signal_id, relationship.value, now)
+            )
 
     async def get_founders_for_signal(
         self,
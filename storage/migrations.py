@@ -14,18 +14,37 @@ Usage:
     # Import data (after migration)
     python storage/migrations.py import backup.json signals.db
 
+    # Streaming export/import for large databases (one JSON record per line,
+    # constant memory; add .gz to compress). Imports keep clear of archived
+    # signal ids when the archive is given (or ARCHIVE_DB_PATH is set).
+    python storage/migrations.py export signals.db backup.ndjson.gz
+    python storage/migrations.py import backup.ndjson.gz signals.db [archive.db]
+
     # Validate schema
     python storage/migrations.py validate signals.db
 """
 
 import asyncio
+import gzip
 import json
+import os
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import IO, Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from storage.signal_store import (
+    ARCHIVE_SCHEMA,
+    SignalStore,
+    CURRENT_SCHEMA_VERSION,
+    decode_raw_data,
+    encode_raw_data,
+)
 
-from signal_store import SignalStore, CURRENT_SCHEMA_VERSION
+# Rows per fetchmany()/executemany() batch for streaming export/import
+STREAM_BATCH_SIZE = 1000
 
 
 async def list_migrations(db_path: str) -> None:
@@ -91,7 +110,7 @@ async def export_data(db_path: str, output_path: str) -> None:
                 "canonical_key": row[3],
                 "company_name": row[4],
                 "confidence": row[5],
-                "raw_data": row[6],
+                "raw_data": json.dumps(decode_raw_data(row[6])),
                 "detected_at": row[7],
                 "created_at": row[8],
             })
@@ -258,7 +277,289 @@ async def import_data(input_path: str, db_path: str) -> None:
 
         await store._db.commit()
 
+        # Imported rows bypass save_signal, so rebuild the per-company
+        # counters and the search index
+        await store.rebuild_company_aggregates()
+        await store.rebuild_search_index()
+
+        print("\nImport complete!")
+
+    finally:
+        await store.close()
+
+
+# =============================================================================
+# STREAMING EXPORT/IMPORT (NDJSON)
+# =============================================================================
+#
+# One JSON object per line: a header, then {"table": ..., "row": {...}} records
+# grouped by table (signals before processing, so imports can remap ids).
+
+_SIGNAL_COLUMNS = [
+    "id", "signal_type", "source_api", "canonical_key",
+    "company_name", "confidence", "raw_data",
+    "detected_at", "created_at",
+]
+_PROCESSING_COLUMNS = [
+    "signal_id", "status", "notion_page_id",
+    "processed_at", "error_message", "metadata",
+]
+_SUPPRESSION_COLUMNS = [
+    "canonical_key", "notion_page_id", "status",
+    "company_name", "cached_at", "expires_at", "metadata",
+]
+
+
+def is_ndjson_path(path: str) -> bool:
+    """True if path names a streaming (.ndjson / .ndjson.gz) export."""
+    return path.endswith((".ndjson", ".ndjson.gz", ".jsonl", ".jsonl.gz"))
+
+
+def _open_stream(path: str, mode: str) -> IO[str]:
+    """Open an NDJSON file for text I/O, gzip-compressed if it ends in .gz."""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _progress(table: str, count: int, done: bool = False) -> None:
+    """Print a running row counter on one line."""
+    print(f"  {table}: {count:,} rows", end="\n" if done else "\r", flush=True)
+
+
+async def export_ndjson(
+    db_path: str,
+    output_path: str,
+    batch_size: int = STREAM_BATCH_SIZE,
+) -> Dict[str, int]:
+    """
+    Export all data to an NDJSON file in constant memory.
+
+    Rows are read with fetchmany() and written as they arrive. raw_data is
+    written as decoded JSON, whatever its on-disk encoding.
+
+    Returns:
+        Row counts per table
+    """
+    store = SignalStore(db_path)
+    await store.initialize()
+
+    tables = [
+        ("signals", _SIGNAL_COLUMNS, "ORDER BY id"),
+        ("signal_processing", _PROCESSING_COLUMNS, "ORDER BY signal_id"),
+        ("suppression_cache", _SUPPRESSION_COLUMNS, "ORDER BY canonical_key"),
+    ]
+    counts = {}
+
+    try:
+        print(f"\nExporting {db_path} to {output_path}...")
+
+        with _open_stream(output_path, "w") as f:
+            f.write(json.dumps({
+                "type": "header",
+                "exported_at": datetime.now(timezone.utc).isoformat(),
+                "schema_version": CURRENT_SCHEMA_VERSION,
+            }) + "\n")
+
+            for table, columns, order_by in tables:
+                count = 0
+                cursor = await store._db.execute(
+                    f"SELECT {', '.join(columns)} FROM {table} {order_by}"
+                )
+                while True:
+                    rows = await cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    for row in rows:
+                        record = dict(zip(columns, row))
+                        if table == "signals":
+                            record["raw_data"] = decode_raw_data(record["raw_data"])
+                        f.write(json.dumps({"table": table, "row": record}) + "\n")
+                    count += len(rows)
+                    _progress(table, count)
+                await cursor.close()
+
+                _progress(table, count, done=True)
+                counts[table] = count
+
+        return counts
+
+    finally:
+        await store.close()
+
+
+async def _max_signal_id(store: SignalStore) -> int:
+    """
+    Highest signal id ever used: live rows, ids AUTOINCREMENT has handed
+    out (including signals since archived) and the attached archive.
+    """
+    cursor = await store._db.execute(
+        """
+        SELECT MAX(
+            COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'signals'), 0),
+            COALESCE((SELECT MAX(id) FROM signals), 0)
+        )
+        """
+    )
+    max_id = (await cursor.fetchone())[0]
+
+    if store.has_archive:
+        cursor = await store._db.execute(
+            f"SELECT COALESCE(MAX(id), 0) FROM {ARCHIVE_SCHEMA}.signals"
+        )
+        max_id = max(max_id, (await cursor.fetchone())[0])
+
+    return max_id
+
+
+async def import_ndjson(
+    input_path: str,
+    db_path: str,
+    batch_size: int = STREAM_BATCH_SIZE,
+    archive_path: Optional[str] = None,
+) -> Dict[str, int]:
+    """
+    Import an NDJSON export in constant memory.
+
+    The file is read line by line and rows are inserted with executemany()
+    in batches of batch_size, one transaction per batch. Signal ids are
+    shifted past every id the target has used, so importing into a
+    non-empty database needs no id map and archive_signals() never
+    overwrites an archived signal with an imported one.
+
+    Args:
+        input_path: NDJSON export (optionally .gz)
+        db_path: Target SignalStore database
+        batch_size: Rows per executemany()/transaction
+        archive_path: The target's archive database, if it has one
+
+    Returns:
+        Row counts per table
+    """
+    store = SignalStore(db_path, archive_path=archive_path)
+    await store.initialize()
+
+    counts = {"signals": 0, "signal_processing": 0, "suppression_cache": 0}
+
+    try:
+        id_offset = await _max_signal_id(store)
+
+        print(f"\nImporting data from {input_path} to {db_path}...")
+
+        async def flush(table: str, batch: List[tuple]) -> None:
+            if not batch:
+                return
+            async with store.transaction() as conn:
+                if table == "signals":
+                    await conn.executemany(
+                        """
+                        INSERT INTO signals (
+                            id, signal_type, source_api, canonical_key, company_name,
+                            confidence, raw_data, detected_at, created_at
+                        )
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        batch
+                    )
+                elif table == "signal_processing":
+                    await conn.executemany(
+                        """
+                        INSERT INTO signal_processing (
+                            signal_id, status, notion_page_id,
+                            processed_at, error_message, metadata,
+                            created_at, updated_at
+                        )
+                        SELECT ?, ?, ?, ?, ?, ?, ?, ?
+                        WHERE EXISTS (SELECT 1 FROM signals WHERE id = ?1)
+                        """,
+                        batch
+                    )
+                else:
+                    await conn.executemany(
+                        """
+                        INSERT INTO suppression_cache (
+                            canonical_key, notion_page_id, status,
+                            company_name, cached_at, expires_at, metadata
+                        )
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                        ON CONFLICT(canonical_key) DO UPDATE SET
+                            notion_page_id = excluded.notion_page_id,
+                            status = excluded.status,
+                            company_name = excluded.company_name,
+                            cached_at = excluded.cached_at,
+                            expires_at = excluded.expires_at,
+                            metadata = excluded.metadata
+                        """,
+                        batch
+                    )
+            counts[table] += len(batch)
+            _progress(table, counts[table])
+            batch.clear()
+
+        current = None
+        batch: List[tuple] = []
+        now = datetime.now(timezone.utc).isoformat()
+
+        with _open_stream(input_path, "r") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+
+                if record.get("type") == "header":
+                    print(f"  Export schema version: {record.get('schema_version')}")
+                    print(f"  Current schema version: {CURRENT_SCHEMA_VERSION}")
+                    continue
+
+                table, row = record["table"], record["row"]
+                if table != current:
+                    await flush(current, batch)
+                    if current:
+                        _progress(current, counts[current], done=True)
+                    current = table
+
+                if table == "signals":
+                    batch.append((
+                        row["id"] + id_offset,
+                        row["signal_type"],
+                        row["source_api"],
+                        row["canonical_key"],
+                        row["company_name"],
+                        row["confidence"],
+                        encode_raw_data(row["raw_data"], store.compress_raw_data),
+                        row["detected_at"],
+                        row["created_at"],
+                    ))
+                elif table == "signal_processing":
+                    batch.append((
+                        row["signal_id"] + id_offset,
+                        row["status"],
+                        row["notion_page_id"],
+                        row["processed_at"],
+                        row["error_message"],
+                        row["metadata"],
+                        now,
+                        now,
+                    ))
+                elif table == "suppression_cache":
+                    batch.append(tuple(row[col] for col in _SUPPRESSION_COLUMNS))
+                else:
+                    raise ValueError(f"Unknown table in export: {table}")
+
+                if len(batch) >= batch_size:
+                    await flush(table, batch)
+
+        await flush(current, batch)
+        if current:
+            _progress(current, counts[current], done=True)
+
+        # Imported rows bypass save_signal, so rebuild the per-company
+        # counters and the search index
+        await store.rebuild_company_aggregates()
+        await store.rebuild_search_index()
+
         print("\nImport complete!")
+        return counts
 
     finally:
         await store.close()
@@ -389,11 +690,11 @@ Commands:
     list <db_path>
         List all applied migrations
 
-    export <db_path> <output.json>
-        Export database to JSON file
+    export <db_path> <output.json|output.ndjson[.gz]>
+        Export database to JSON file (.ndjson streams in constant memory)
 
-    import <input.json> <db_path>
-        Import JSON file into database
+    import <input.json|input.ndjson[.gz]> <db_path>
+        Import JSON or NDJSON file into database
 
     validate <db_path>
         Validate database schema
@@ -404,6 +705,7 @@ Commands:
 Examples:
     python migrations.py list signals.db
     python migrations.py export signals.db backup.json
+    python migrations.py export signals.db backup.ndjson.gz
     python migrations.py import backup.json signals_new.db
     python migrations.py validate signals.db
     python migrations.py info signals.db
@@ -430,14 +732,21 @@ async def main():
             print("Error: Missing arguments")
             print_usage()
             sys.exit(1)
-        await export_data(sys.argv[2], sys.argv[3])
+        if is_ndjson_path(sys.argv[3]):
+            await export_ndjson(sys.argv[2], sys.argv[3])
+        else:
+            await export_data(sys.argv[2], sys.argv[3])
 
     elif command == "import":
         if len(sys.argv) < 4:
             print("Error: Missing arguments")
             print_usage()
             sys.exit(1)
-        await import_data(sys.argv[2], sys.argv[3])
+        if is_ndjson_path(sys.argv[2]):
+            archive_path = sys.argv[4] if len(sys.argv) > 4 else os.getenv("ARCHIVE_DB_PATH")
+            await import_ndjson(sys.argv[2], sys.argv[3], archive_path=archive_path or None)
+        else:
+            await import_data(sys.argv[2], sys.argv[3])
 
     elif command == "validate":
         if len(sys.argv) < 3:
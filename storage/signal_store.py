@@ -7,12 +7,17 @@ Provides persistent SQLite storage for signals with:
 - Notion suppression cache
 - Migration support
 - Connection pooling via aiosqlite
+- Optional WAL mode with a read-only connection pool
+- zlib-compressed raw_data, decoded lazily on access
 
 Tables:
   - signals: Raw signals from collectors
   - signal_processing: Processing state and Notion linkage
   - suppression_cache: Local cache of Notion DB to avoid duplicate pushes
+  - enriched_items: Per-source enrichment results for immutable items
+  - collector_watermarks: Newest item time each incremental collector has saved
   - schema_migrations: Track applied migrations
+  - migration_backfills: Track completed post-migration backfills
 
 Usage:
     store = SignalStore("signals.db")
@@ -28,14 +33,25 @@ Usage:
         "raw_data": {...}
     })
 
+    # Save many signals in one transaction
+    results = await store.save_signals_batch([{...}, {...}])
+
     # Check for duplicates
     is_dup = await store.is_duplicate("domain:acme.ai")
+    seen = await store.existing_keys(["domain:acme.ai", "domain:other.io"])
 
     # Get pending signals
     pending = await store.get_pending_signals()
 
     # Mark as pushed
     await store.mark_pushed(signal_id, notion_page_id="abc-123")
+
+WAL mode (readers never block the writer):
+    store = SignalStore("signals.db", wal_mode=True, read_pool_size=4)
+    await store.initialize()
+
+    async with store.reader() as db:
+        cursor = await db.execute("SELECT COUNT(*) FROM signals")
 """
 
 from __future__ import annotations
@@ -43,15 +59,21 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import re
 import uuid
+import zlib
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, AsyncIterator, TYPE_CHECKING
+from typing import (
+    Any, AsyncContextManager, Dict, Iterable, List, Optional, AsyncIterator, TYPE_CHECKING,
+)
 
 import aiosqlite
 
+from storage.connection_manager import ConnectionManager
+
 if TYPE_CHECKING:
     from workflows.pipeline import PipelineStats
 
@@ -62,7 +84,14 @@ logger = logging.getLogger(__name__)
 # SCHEMA VERSION
 # =============================================================================
 
-CURRENT_SCHEMA_VERSION = 3
+CURRENT_SCHEMA_VERSION = 9
+
+# Max bound parameters per IN (...) lookup; stays under SQLite's
+# historical SQLITE_MAX_VARIABLE_NUMBER default of 999.
+LOOKUP_CHUNK_SIZE = 500
+
+# Width of company_signal_buckets time buckets
+SIGNAL_BUCKET_SECONDS = 3600
 
 # SQL for creating tables (migrations applied in order)
 MIGRATIONS = {
@@ -191,31 +220,363 @@ MIGRATIONS = {
     CREATE INDEX IF NOT EXISTS idx_outbox_next_attempt ON notion_outbox(next_attempt_at);
     CREATE INDEX IF NOT EXISTS idx_outbox_created_at ON notion_outbox(created_at);
     """
+    ,
+    4: """
+    -- Epoch-second copies of the ISO timestamps. Time-window filters compare
+    -- these directly so they stay index range scans; wrapping the ISO
+    -- columns in datetime() forces a full table scan.
+    ALTER TABLE signals ADD COLUMN detected_at_epoch INTEGER;
+    ALTER TABLE signals ADD COLUMN created_at_epoch INTEGER;
+
+    UPDATE signals SET
+        detected_at_epoch = CAST(strftime('%s', detected_at) AS INTEGER),
+        created_at_epoch = CAST(strftime('%s', created_at) AS INTEGER);
+
+    CREATE INDEX IF NOT EXISTS idx_signals_detected_at_epoch ON signals(detected_at_epoch);
+    CREATE INDEX IF NOT EXISTS idx_signals_created_at_epoch ON signals(created_at_epoch);
+    CREATE INDEX IF NOT EXISTS idx_signals_key_detected_at_epoch
+        ON signals(canonical_key, detected_at_epoch);
+
+    -- Fill the epoch columns for inserts that only set the ISO columns
+    -- (SignalStore sets both; this covers imports and ad-hoc SQL)
+    CREATE TRIGGER IF NOT EXISTS trg_signals_epoch_fill
+    AFTER INSERT ON signals
+    WHEN NEW.detected_at_epoch IS NULL OR NEW.created_at_epoch IS NULL
+    BEGIN
+        UPDATE signals SET
+            detected_at_epoch = COALESCE(
+                NEW.detected_at_epoch, CAST(strftime('%s', NEW.detected_at) AS INTEGER)
+            ),
+            created_at_epoch = COALESCE(
+                NEW.created_at_epoch, CAST(strftime('%s', NEW.created_at) AS INTEGER)
+            )
+        WHERE id = NEW.id;
+    END;
+    """
+    ,
+    5: """
+    -- Per-company aggregates maintained on save, so velocity/momentum reads
+    -- don't rescan signal history
+    CREATE TABLE IF NOT EXISTS company_signal_stats (
+        canonical_key TEXT PRIMARY KEY,
+        total_signals INTEGER NOT NULL DEFAULT 0,
+        first_signal_epoch INTEGER,
+        last_signal_epoch INTEGER,
+        updated_at TEXT NOT NULL
+    );
+
+    -- Hourly signal counts per company/type/source (detected_at based)
+    CREATE TABLE IF NOT EXISTS company_signal_buckets (
+        canonical_key TEXT NOT NULL,
+        bucket_epoch INTEGER NOT NULL,  -- start of the hour, epoch seconds
+        signal_type TEXT NOT NULL,
+        source_api TEXT NOT NULL,
+        signal_count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (canonical_key, bucket_epoch, signal_type, source_api)
+    ) WITHOUT ROWID;
+
+    INSERT OR IGNORE INTO company_signal_stats (
+        canonical_key, total_signals, first_signal_epoch, last_signal_epoch, updated_at
+    )
+    SELECT canonical_key, COUNT(*), MIN(detected_at_epoch), MAX(detected_at_epoch),
+           strftime('%Y-%m-%dT%H:%M:%S+00:00', 'now')
+    FROM signals
+    GROUP BY canonical_key;
+
+    INSERT OR IGNORE INTO company_signal_buckets (
+        canonical_key, bucket_epoch, signal_type, source_api, signal_count
+    )
+    SELECT canonical_key, detected_at_epoch - detected_at_epoch % 3600,
+           signal_type, source_api, COUNT(*)
+    FROM signals
+    GROUP BY 1, 2, 3, 4;
+    """
+    ,
+    6: """
+    -- Full-text index over company names and raw_data text fields, keyed by
+    -- signals.id. raw_data may be a zlib BLOB, which SQL can't read, so rows
+    -- are added by SignalStore's write path (and rebuild_search_index), not
+    -- by an insert trigger.
+    CREATE VIRTUAL TABLE IF NOT EXISTS signals_fts USING fts5(
+        company_name,
+        canonical_key,
+        body,
+        tokenize = 'porter unicode61'
+    );
+
+    CREATE TRIGGER IF NOT EXISTS trg_signals_fts_delete
+    AFTER DELETE ON signals
+    BEGIN
+        DELETE FROM signals_fts WHERE rowid = OLD.id;
+    END;
+    """
+    ,
+    7: """
+    -- Enrichment results for items whose detail documents never change
+    -- (e.g. SEC accession numbers), so collectors fetch each one once
+    CREATE TABLE IF NOT EXISTS enriched_items (
+        source TEXT NOT NULL,
+        item_key TEXT NOT NULL,
+        data TEXT NOT NULL,  -- JSON
+        enriched_at TEXT NOT NULL,
+        PRIMARY KEY (source, item_key)
+    ) WITHOUT ROWID;
+    """
+    ,
+    8: """
+    -- Newest item time each incremental collector has saved; the next run
+    -- fetches only items after it instead of the whole lookback window
+    CREATE TABLE IF NOT EXISTS collector_watermarks (
+        collector TEXT PRIMARY KEY,
+        watermark TEXT NOT NULL,  -- ISO 8601, UTC
+        watermark_epoch INTEGER NOT NULL,
+        updated_at TEXT NOT NULL
+    );
+    """
+    ,
+    9: """
+    -- Backfills recorded apart from schema_migrations: a backfill that is
+    -- interrupted after its migration commits is rerun on the next start
+    CREATE TABLE IF NOT EXISTS migration_backfills (
+        version INTEGER PRIMARY KEY,
+        completed_at TEXT NOT NULL
+    );
+    """
 }
 
+# Migrations that need a Python backfill after their SQL runs
+# (version -> SignalStore method name). Backfills must be safe to rerun
+# from the start; each runs until it completes once.
+MIGRATION_BACKFILLS = {
+    6: "rebuild_search_index",
+}
+
+
+# =============================================================================
+# SEARCH INDEX
+# =============================================================================
+
+# Top-level raw_data string fields copied into signals_fts.body
+SEARCH_TEXT_FIELDS = ("title", "name", "description", "summary", "tagline", "why_now")
+
+# bm25() column weights: company_name, canonical_key, body
+SEARCH_RANK_WEIGHTS = (10.0, 5.0, 1.0)
+
+
+def search_text(raw_data: Dict[str, Any]) -> str:
+    """Concatenate the indexed text fields of a raw_data payload."""
+    return "\n".join(
+        value for field_name in SEARCH_TEXT_FIELDS
+        if isinstance(value := raw_data.get(field_name), str) and value
+    )
+
+
+def _fts_match_query(query: str) -> Optional[str]:
+    """
+    Turn free text into an FTS5 MATCH expression.
+
+    Every word must match, as a prefix ("acme.ai" -> "acme"* AND "ai"*),
+    so user input never hits FTS5 query-syntax errors.
+    """
+    terms = re.findall(r"\w+", query)
+    if not terms:
+        return None
+    return " AND ".join(f'"{term}"*' for term in terms)
+
+
+# =============================================================================
+# ARCHIVE SCHEMA
+# =============================================================================
+
+# Schema name the archive database is attached under
+ARCHIVE_SCHEMA = "archive"
+
+# Processing statuses that are final, so their signals can leave the hot DB
+ARCHIVABLE_STATUSES = ("pushed", "rejected")
+
+# Cold tier for signals, signal_processing and pipeline_runs. Rows keep their
+# hot-DB ids, so founder_signals links and Notion metadata stay valid.
+ARCHIVE_TABLES = f"""
+    CREATE TABLE IF NOT EXISTS {ARCHIVE_SCHEMA}.signals (
+        id INTEGER PRIMARY KEY,
+        signal_type TEXT NOT NULL,
+        source_api TEXT NOT NULL,
+        canonical_key TEXT NOT NULL,
+        company_name TEXT,
+        confidence REAL NOT NULL,
+        raw_data TEXT NOT NULL,  -- JSON text or zlib BLOB (see encode_raw_data)
+        detected_at TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        detected_at_epoch INTEGER,
+        created_at_epoch INTEGER,
+        archived_at TEXT NOT NULL
+    );
+
+    CREATE INDEX IF NOT EXISTS {ARCHIVE_SCHEMA}.idx_archive_signals_key_detected_at_epoch
+        ON signals(canonical_key, detected_at_epoch);
+
+    CREATE TABLE IF NOT EXISTS {ARCHIVE_SCHEMA}.signal_processing (
+        id INTEGER PRIMARY KEY,
+        signal_id INTEGER NOT NULL,
+        status TEXT NOT NULL,
+        notion_page_id TEXT,
+        processed_at TEXT,
+        error_message TEXT,
+        metadata TEXT,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    );
+
+    CREATE INDEX IF NOT EXISTS {ARCHIVE_SCHEMA}.idx_archive_processing_signal_id
+        ON signal_processing(signal_id);
+
+    CREATE TABLE IF NOT EXISTS {ARCHIVE_SCHEMA}.pipeline_runs AS
+        SELECT * FROM main.pipeline_runs WHERE 0;
+"""
+
+_SIGNAL_COLUMNS = (
+    "id, signal_type, source_api, canonical_key, company_name, confidence, "
+    "raw_data, detected_at, created_at, detected_at_epoch, created_at_epoch"
+)
+_PROCESSING_COLUMNS = (
+    "id, signal_id, status, notion_page_id, processed_at, error_message, "
+    "metadata, created_at, updated_at"
+)
+
+
+# =============================================================================
+# RAW DATA ENCODING
+# =============================================================================
+
+# Payloads at least this large (compact JSON bytes) are stored zlib-compressed
+RAW_DATA_COMPRESS_MIN_BYTES = 256
+
+# Prefix marking a zlib-compressed raw_data BLOB. Rows written before
+# compression are plain JSON TEXT and decode unchanged.
+RAW_DATA_ZLIB_MARKER = b"\x00z1"
+
+
+def encode_raw_data(raw_data: Dict[str, Any], compress: bool = True) -> str | bytes:
+    """
+    Encode a raw_data payload for the signals.raw_data column.
+
+    Returns compact JSON text, or a marker-prefixed zlib BLOB when compress
+    is set and the payload is large enough to benefit.
+    """
+    text = json.dumps(raw_data, separators=(",", ":"))
+    if not compress:
+        return text
+
+    encoded = text.encode("utf-8")
+    if len(encoded) < RAW_DATA_COMPRESS_MIN_BYTES:
+        return text
+    return RAW_DATA_ZLIB_MARKER + zlib.compress(encoded)
+
+
+def decode_raw_data(value: str | bytes) -> Dict[str, Any]:
+    """Decode a signals.raw_data column value (compressed BLOB or JSON text)."""
+    if isinstance(value, (bytes, memoryview)):
+        value = bytes(value)
+        if value.startswith(RAW_DATA_ZLIB_MARKER):
+            value = zlib.decompress(value[len(RAW_DATA_ZLIB_MARKER):])
+    return json.loads(value)
+
 
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
 
-@dataclass
 class StoredSignal:
-    """A signal loaded from the database"""
-    id: int
-    signal_type: str
-    source_api: str
-    canonical_key: str
-    company_name: Optional[str]
-    confidence: float
-    raw_data: Dict[str, Any]
-    detected_at: datetime
-    created_at: datetime
+    """
+    A signal loaded from the database.
+
+    Slotted (no per-instance __dict__), and raw_data is decoded on first
+    access: hot paths like velocity and health checks that only read keys,
+    types and timestamps never pay for decompressing/parsing the payload.
+    """
+
+    __slots__ = (
+        "id", "signal_type", "source_api", "canonical_key", "company_name",
+        "confidence", "detected_at", "created_at",
+        "processing_status", "notion_page_id", "processed_at", "error_message",
+        "_raw_data", "_raw_encoded",
+    )
+
+    def __init__(
+        self,
+        id: int,
+        signal_type: str,
+        source_api: str,
+        canonical_key: str,
+        company_name: Optional[str],
+        confidence: float,
+        raw_data: Optional[Dict[str, Any]],
+        detected_at: datetime,
+        created_at: datetime,
+        # Processing info (if joined)
+        processing_status: Optional[str] = None,
+        notion_page_id: Optional[str] = None,
+        processed_at: Optional[datetime] = None,
+        error_message: Optional[str] = None,
+    ):
+        self.id = id
+        self.signal_type = signal_type
+        self.source_api = source_api
+        self.canonical_key = canonical_key
+        self.company_name = company_name
+        self.confidence = confidence
+        self.detected_at = detected_at
+        self.created_at = created_at
+        self.processing_status = processing_status
+        self.notion_page_id = notion_page_id
+        self.processed_at = processed_at
+        self.error_message = error_message
+        self._raw_data = raw_data
+        self._raw_encoded: Optional[str | bytes] = None
+
+    @classmethod
+    def _lazy(cls, raw_encoded: str | bytes, **fields: Any) -> StoredSignal:
+        """Build a signal whose raw_data is decoded from the column on first access."""
+        signal = cls(raw_data=None, **fields)
+        signal._raw_encoded = raw_encoded
+        return signal
+
+    @property
+    def raw_data(self) -> Dict[str, Any]:
+        if self._raw_data is None:
+            if self._raw_encoded is None:
+                return {}
+            self._raw_data = decode_raw_data(self._raw_encoded)
+            self._raw_encoded = None
+        return self._raw_data
+
+    @raw_data.setter
+    def raw_data(self, value: Dict[str, Any]) -> None:
+        self._raw_data = value
+        self._raw_encoded = None
+
+    def _fields(self) -> tuple:
+        return (
+            self.id, self.signal_type, self.source_api, self.canonical_key,
+            self.company_name, self.confidence, self.raw_data,
+            self.detected_at, self.created_at, self.processing_status,
+            self.notion_page_id, self.processed_at, self.error_message,
+        )
 
-    # Processing info (if joined)
-    processing_status: Optional[str] = None
-    notion_page_id: Optional[str] = None
-    processed_at: Optional[datetime] = None
-    error_message: Optional[str] = None
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, StoredSignal):
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    __hash__ = None  # mutable, like the dataclass it replaces
+
+    def __repr__(self) -> str:
+        return (
+            f"StoredSignal(id={self.id!r}, signal_type={self.signal_type!r}, "
+            f"source_api={self.source_api!r}, canonical_key={self.canonical_key!r}, "
+            f"confidence={self.confidence!r}, detected_at={self.detected_at!r}, "
+            f"processing_status={self.processing_status!r})"
+        )
 
 
 @dataclass
@@ -230,6 +591,38 @@ class SuppressionEntry:
     metadata: Optional[Dict[str, Any]] = None
 
 
+@dataclass
+class SaveResult:
+    """Per-signal outcome of a batch save"""
+    canonical_key: str
+    status: str  # 'saved', 'duplicate', 'suppressed'
+    signal_id: Optional[int] = None
+    suppression: Optional[SuppressionEntry] = None
+
+    @property
+    def saved(self) -> bool:
+        return self.status == "saved"
+
+
+@dataclass
+class SignalBucket:
+    """Signals for one company/type/source within one hourly bucket"""
+    canonical_key: str
+    signal_type: str
+    source_api: str
+    bucket_start: datetime
+    count: int
+
+
+@dataclass
+class CompanySignalStats:
+    """All-time signal totals for one company"""
+    canonical_key: str
+    total_signals: int
+    first_signal_at: Optional[datetime]
+    last_signal_at: Optional[datetime]
+
+
 # =============================================================================
 # SIGNAL STORE
 # =============================================================================
@@ -244,12 +637,21 @@ class SignalStore:
     - Transaction support
     - JSON serialization for complex fields
     - TTL-based suppression cache
+    - Opt-in WAL mode: one writer connection plus a pool of read-only
+      connections, so dashboard/health reads don't queue behind ingestion
+    - Optional archive database for signals whose processing is final
+      (see archive_signals / apply_retention)
     """
 
     def __init__(
         self,
         db_path: str | Path = "signals.db",
         suppression_ttl_days: int = 7,
+        wal_mode: bool = False,
+        read_pool_size: int = 4,
+        connection: Optional[ConnectionManager] = None,
+        compress_raw_data: bool = True,
+        archive_path: Optional[str | Path] = None,
     ):
         """
         Initialize signal store.
@@ -257,59 +659,92 @@ class SignalStore:
         Args:
             db_path: Path to SQLite database file
             suppression_ttl_days: How long to cache Notion entries before re-checking
+            wal_mode: Enable WAL journaling with tuned pragmas and route reads
+                through a read-only connection pool (ignored for :memory:)
+            read_pool_size: Number of read-only connections when wal_mode=True
+            connection: Shared ConnectionManager (wal_mode/read_pool_size are
+                then taken from it and close() leaves it open)
+            compress_raw_data: Store large raw_data payloads zlib-compressed
+                (existing rows in either format always read back)
+            archive_path: SQLite file to attach as the cold tier for
+                archived signals and pipeline runs (created if missing)
         """
-        self.db_path = Path(db_path)
         self.suppression_ttl_days = suppression_ttl_days
-        self._db: Optional[aiosqlite.Connection] = None
-        self._lock = asyncio.Lock()
+        self.compress_raw_data = compress_raw_data
+        self.archive_path = Path(archive_path) if archive_path else None
+        self._owns_connection = connection is None
+        self._conn = connection or ConnectionManager(
+            db_path, wal_mode=wal_mode, read_pool_size=read_pool_size
+        )
+        self.db_path = self._conn.db_path
+        self.wal_mode = self._conn.wal_mode
+        self.read_pool_size = self._conn.read_pool_size
+
+    @property
+    def _db(self) -> Optional[aiosqlite.Connection]:
+        return self._conn.connection
+
+    @property
+    def connection(self) -> ConnectionManager:
+        """The ConnectionManager this store reads and writes through."""
+        return self._conn
 
     async def initialize(self) -> None:
         """
         Initialize database connection and apply migrations.
         Should be called once at startup.
         """
-        # Create parent directories if needed
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Connect to database
-        self._db = await aiosqlite.connect(str(self.db_path))
-
-        # Enable foreign keys
-        await self._db.execute("PRAGMA foreign_keys = ON")
+        await self._conn.initialize()
 
         # Apply migrations
         await self._apply_migrations()
 
-        logger.info(f"SignalStore initialized: {self.db_path}")
+        if self.archive_path:
+            await self.attach_archive(self.archive_path)
+
+        # Readers are opened after migrations so they see the full schema
+        await self._conn.open_read_pool()
+
+        logger.info(
+            f"SignalStore initialized: {self.db_path}"
+            f"{f' (WAL, {self.read_pool_size} readers)' if self._conn.has_read_pool else ''}"
+        )
 
     async def close(self) -> None:
-        """Close database connection."""
-        if self._db:
-            await self._db.close()
-            self._db = None
+        """Close database connection(s), unless they belong to a shared manager."""
+        if self._owns_connection:
+            await self._conn.close()
+
+    def reader(self) -> AsyncContextManager[aiosqlite.Connection]:
+        """
+        Context manager yielding a connection for read-only queries.
+
+        In WAL mode this checks a connection out of the read pool, so reads
+        run concurrently with (and never wait on) the writer. Otherwise it
+        yields the single shared connection.
+
+        Usage:
+            async with store.reader() as db:
+                cursor = await db.execute("SELECT ...")
+                rows = await cursor.fetchall()
+        """
+        return self._conn.reader()
 
-    @asynccontextmanager
-    async def transaction(self) -> AsyncIterator[aiosqlite.Connection]:
+    def transaction(self) -> AsyncContextManager[aiosqlite.Connection]:
         """
         Context manager for transactions.
 
+        Nested inside another transaction on the same ConnectionManager
+        (e.g. a cross-store write), this becomes a SAVEPOINT and commits
+        with the outer transaction.
+
         Usage:
             async with store.transaction() as conn:
                 await conn.execute(...)
                 await conn.execute(...)
                 # Commits on success, rolls back on exception
         """
-        if not self._db:
-            raise RuntimeError("Database not initialized. Call initialize() first.")
-
-        async with self._lock:
-            try:
-                await self._db.execute("BEGIN")
-                yield self._db
-                await self._db.commit()
-            except Exception:
-                await self._db.rollback()
-                raise
+        return self._conn.transaction()
 
     # =========================================================================
     # MIGRATIONS
@@ -357,6 +792,26 @@ class SignalStore:
 
             logger.info(f"Migration v{version} applied successfully")
 
+        await self._run_pending_backfills()
+
+    async def _run_pending_backfills(self) -> None:
+        """Run backfills that have not completed yet, recording each on success."""
+        cursor = await self._db.execute("SELECT version FROM migration_backfills")
+        completed = {row[0] for row in await cursor.fetchall()}
+
+        for version in sorted(MIGRATION_BACKFILLS.keys()):
+            if version in completed:
+                continue
+
+            logger.info(f"Running backfill for migration v{version}...")
+            await getattr(self, MIGRATION_BACKFILLS[version])()
+
+            async with self.transaction() as conn:
+                await conn.execute(
+                    "INSERT INTO migration_backfills (version, completed_at) VALUES (?, ?)",
+                    (version, datetime.now(timezone.utc).isoformat())
+                )
+
     # =========================================================================
     # SIGNAL OPERATIONS
     # =========================================================================
@@ -389,9 +844,10 @@ class SignalStore:
                 """
                 INSERT INTO signals (
                     signal_type, source_api, canonical_key, company_name,
-                    confidence, raw_data, detected_at, created_at
+                    confidence, raw_data, detected_at, created_at,
+                    detected_at_epoch, created_at_epoch
                 )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     signal_type,
@@ -399,9 +855,11 @@ class SignalStore:
                     canonical_key,
                     company_name,
                     confidence,
-                    json.dumps(raw_data),
+                    encode_raw_data(raw_data, self.compress_raw_data),
                     detected_at.isoformat(),
                     created_at.isoformat(),
+                    _to_epoch(detected_at),
+                    _to_epoch(created_at),
                 )
             )
 
@@ -418,29 +876,222 @@ class SignalStore:
                 (signal_id, created_at.isoformat(), created_at.isoformat())
             )
 
+            await self._bump_company_aggregates(
+                conn,
+                [(canonical_key, signal_type, source_api, _to_epoch(detected_at))],
+                created_at.isoformat(),
+            )
+
+            await conn.execute(
+                """
+                INSERT INTO signals_fts (rowid, company_name, canonical_key, body)
+                VALUES (?, ?, ?, ?)
+                """,
+                (signal_id, company_name, canonical_key, search_text(raw_data))
+            )
+
         logger.debug(f"Saved signal {signal_id}: {signal_type} for {canonical_key}")
         return signal_id
 
-    async def get_signal(self, signal_id: int) -> Optional[StoredSignal]:
-        """Get a signal by ID."""
+    async def save_signals_batch(
+        self,
+        signals: List[Dict[str, Any]],
+        check_suppression: bool = True,
+    ) -> List[SaveResult]:
+        """
+        Save many signals in a single transaction.
+
+        Each entry takes the same keys as save_signal(). Signals whose
+        canonical_key is already stored (or appears earlier in the batch)
+        are reported as 'duplicate', keys with a live suppression cache
+        entry as 'suppressed'. The rest are inserted together with their
+        pending signal_processing rows using executemany.
+
+        Returns one SaveResult per input signal, in input order.
+        """
         if not self._db:
             raise RuntimeError("Database not initialized")
 
-        cursor = await self._db.execute(
+        if not signals:
+            return []
+
+        now = datetime.now(timezone.utc)
+        created_at = now.isoformat()
+        created_at_epoch = _to_epoch(now)
+        results: List[SaveResult] = []
+        rows: List[tuple] = []
+        search_rows: List[tuple] = []
+        seen_keys: set[str] = set()
+
+        async with self.transaction() as conn:
+            keys = [sig["canonical_key"] for sig in signals]
+            existing = await self.existing_keys(keys)
+            suppressed = await self.suppression_for(keys) if check_suppression else {}
+
+            for sig in signals:
+                canonical_key = sig["canonical_key"]
+
+                if canonical_key in seen_keys or canonical_key in existing:
+                    results.append(SaveResult(canonical_key, "duplicate"))
+                    continue
+                seen_keys.add(canonical_key)
+
+                if check_suppression:
+                    suppression = suppressed.get(canonical_key)
+                    if suppression:
+                        results.append(
+                            SaveResult(canonical_key, "suppressed", suppression=suppression)
+                        )
+                        continue
+
+                detected_at = sig.get("detected_at") or datetime.now(timezone.utc)
+                rows.append((
+                    sig["signal_type"],
+                    sig["source_api"],
+                    canonical_key,
+                    sig.get("company_name"),
+                    sig["confidence"],
+                    encode_raw_data(sig["raw_data"], self.compress_raw_data),
+                    detected_at.isoformat(),
+                    created_at,
+                    _to_epoch(detected_at),
+                    created_at_epoch,
+                ))
+                search_rows.append((
+                    sig.get("company_name"),
+                    canonical_key,
+                    search_text(sig["raw_data"]),
+                ))
+                results.append(SaveResult(canonical_key, "saved"))
+
+            if rows:
+                # AUTOINCREMENT ids are strictly increasing, so everything
+                # above the current max belongs to this insert (we hold the
+                # write lock for the whole transaction).
+                cursor = await conn.execute("SELECT COALESCE(MAX(id), 0) FROM signals")
+                max_id = (await cursor.fetchone())[0]
+
+                await conn.executemany(
+                    """
+                    INSERT INTO signals (
+                        signal_type, source_api, canonical_key, company_name,
+                        confidence, raw_data, detected_at, created_at,
+                        detected_at_epoch, created_at_epoch
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    rows,
+                )
+
+                cursor = await conn.execute(
+                    "SELECT id FROM signals WHERE id > ? ORDER BY id",
+                    (max_id,)
+                )
+                signal_ids = [row[0] for row in await cursor.fetchall()]
+                if len(signal_ids) != len(rows):
+                    raise RuntimeError(
+                        f"Batch insert returned {len(signal_ids)} ids for {len(rows)} rows"
+                    )
+
+                await conn.executemany(
+                    """
+                    INSERT INTO signal_processing (
+                        signal_id, status, created_at, updated_at
+                    )
+                    VALUES (?, 'pending', ?, ?)
+                    """,
+                    [(signal_id, created_at, created_at) for signal_id in signal_ids],
+                )
+
+                await self._bump_company_aggregates(
+                    conn,
+                    [(row[2], row[0], row[1], row[8]) for row in rows],
+                    created_at,
+                )
+
+                await conn.executemany(
+                    """
+                    INSERT INTO signals_fts (rowid, company_name, canonical_key, body)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    [
+                        (signal_id, *search_row)
+                        for signal_id, search_row in zip(signal_ids, search_rows)
+                    ],
+                )
+
+                saved = iter(signal_ids)
+                for result in results:
+                    if result.saved:
+                        result.signal_id = next(saved)
+
+        logger.debug(f"Batch saved {len(rows)}/{len(signals)} signals")
+        return results
+
+    async def _bump_company_aggregates(
+        self,
+        conn: aiosqlite.Connection,
+        saved: List[tuple[str, str, str, int]],
+        now: str,
+    ) -> None:
+        """
+        Add newly saved signals to company_signal_stats/company_signal_buckets.
+
+        Args:
+            conn: Connection inside the caller's save transaction
+            saved: (canonical_key, signal_type, source_api, detected_at_epoch)
+            now: ISO timestamp for updated_at
+        """
+        await conn.executemany(
             """
-            SELECT
-                s.id, s.signal_type, s.source_api, s.canonical_key,
-                s.company_name, s.confidence, s.raw_data,
-                s.detected_at, s.created_at,
-                p.status, p.notion_page_id, p.processed_at, p.error_message
-            FROM signals s
-            LEFT JOIN signal_processing p ON s.id = p.signal_id
-            WHERE s.id = ?
+            INSERT INTO company_signal_stats (
+                canonical_key, total_signals, first_signal_epoch, last_signal_epoch, updated_at
+            )
+            VALUES (?, 1, ?, ?, ?)
+            ON CONFLICT(canonical_key) DO UPDATE SET
+                total_signals = total_signals + 1,
+                first_signal_epoch = MIN(first_signal_epoch, excluded.first_signal_epoch),
+                last_signal_epoch = MAX(last_signal_epoch, excluded.last_signal_epoch),
+                updated_at = excluded.updated_at
+            """,
+            [(key, epoch, epoch, now) for key, _, _, epoch in saved],
+        )
+        await conn.executemany(
+            """
+            INSERT INTO company_signal_buckets (
+                canonical_key, bucket_epoch, signal_type, source_api, signal_count
+            )
+            VALUES (?, ?, ?, ?, 1)
+            ON CONFLICT(canonical_key, bucket_epoch, signal_type, source_api) DO UPDATE SET
+                signal_count = signal_count + 1
             """,
-            (signal_id,)
+            [
+                (key, epoch - epoch % SIGNAL_BUCKET_SECONDS, signal_type, source_api)
+                for key, signal_type, source_api, epoch in saved
+            ],
         )
 
-        row = await cursor.fetchone()
+    async def get_signal(self, signal_id: int) -> Optional[StoredSignal]:
+        """Get a signal by ID."""
+        if not self._db:
+            raise RuntimeError("Database not initialized")
+
+        async with self.reader() as db:
+            cursor = await db.execute(
+                """
+                SELECT
+                    s.id, s.signal_type, s.source_api, s.canonical_key,
+                    s.company_name, s.confidence, s.raw_data,
+                    s.detected_at, s.created_at,
+                    p.status, p.notion_page_id, p.processed_at, p.error_message
+                FROM signals s
+                LEFT JOIN signal_processing p ON s.id = p.signal_id
+                WHERE s.id = ?
+                """,
+                (signal_id,)
+            )
+            row = await cursor.fetchone()
+
         if not row:
             return None
 
@@ -484,55 +1135,311 @@ class SignalStore:
             query += " LIMIT ?"
             params.append(limit)
 
-        cursor = await self._db.execute(query, params)
-        rows = await cursor.fetchall()
+        async with self.reader() as db:
+            cursor = await db.execute(query, params)
+            rows = await cursor.fetchall()
 
         return [self._row_to_signal(row) for row in rows]
 
-    async def get_signals_for_company(
+    async def iter_pending_signals(
         self,
-        canonical_key: str,
-    ) -> List[StoredSignal]:
-        """Get all signals for a company (by canonical key)."""
+        page_size: int = 500,
+        after: Optional[tuple[datetime | str, int]] = None,
+        signal_type: Optional[str] = None,
+    ) -> AsyncIterator[List[StoredSignal]]:
+        """
+        Stream pending signals oldest-first, one page at a time.
+
+        Uses keyset pagination on (detected_at, id) rather than OFFSET, so
+        each page is an index range scan and the cursor stays correct while
+        the caller marks yielded signals as processed. Only one page is held
+        in memory, and no connection is held between pages.
+
+        Args:
+            page_size: Signals per yielded page
+            after: Resume cursor (detected_at, id); only signals strictly
+                after it are returned, e.g. (last.detected_at, last.id)
+            signal_type: Filter by signal type (e.g., "github_spike")
+
+        Usage:
+            async for page in store.iter_pending_signals(page_size=200):
+                for signal in page:
+                    ...
+        """
         if not self._db:
             raise RuntimeError("Database not initialized")
 
-        cursor = await self._db.execute(
+        if after is not None:
+            detected_at, last_id = after
+            if isinstance(detected_at, datetime):
+                detected_at = detected_at.isoformat()
+            cursor_key: Optional[tuple[str, int]] = (detected_at, last_id)
+        else:
+            cursor_key = None
+
+        while True:
+            query = """
+                SELECT
+                    s.id, s.signal_type, s.source_api, s.canonical_key,
+                    s.company_name, s.confidence, s.raw_data,
+                    s.detected_at, s.created_at,
+                    p.status, p.notion_page_id, p.processed_at, p.error_message
+                FROM signals s
+                INNER JOIN signal_processing p ON s.id = p.signal_id
+                WHERE p.status = 'pending'
             """
-            SELECT
-                s.id, s.signal_type, s.source_api, s.canonical_key,
-                s.company_name, s.confidence, s.raw_data,
-                s.detected_at, s.created_at,
-                p.status, p.notion_page_id, p.processed_at, p.error_message
-            FROM signals s
-            LEFT JOIN signal_processing p ON s.id = p.signal_id
-            WHERE s.canonical_key = ?
-            ORDER BY s.detected_at DESC
-            """,
-            (canonical_key,)
-        )
+            params: List[Any] = []
 
-        rows = await cursor.fetchall()
-        return [self._row_to_signal(row) for row in rows]
+            if cursor_key is not None:
+                query += " AND (s.detected_at, s.id) > (?, ?)"
+                params.extend(cursor_key)
 
-    async def is_duplicate(self, canonical_key: str) -> bool:
+            if signal_type:
+                query += " AND s.signal_type = ?"
+                params.append(signal_type)
+
+            query += " ORDER BY s.detected_at, s.id LIMIT ?"
+            params.append(page_size)
+
+            async with self.reader() as db:
+                cursor = await db.execute(query, params)
+                rows = await cursor.fetchall()
+
+            if not rows:
+                return
+
+            # Advance on the stored text value so the comparison is exact
+            cursor_key = (rows[-1][7], rows[-1][0])
+            yield [self._row_to_signal(row) for row in rows]
+
+            if len(rows) < page_size:
+                return
+
+    async def get_signals_for_company(
+        self,
+        canonical_key: str,
+        since: Optional[datetime] = None,
+        include_archive: bool = False,
+    ) -> List[StoredSignal]:
         """
-        Check if we already have signals for this canonical key.
-        Returns True if any signals exist, False otherwise.
+        Get all signals for a company (by canonical key).
+
+        Args:
+            canonical_key: Company canonical key
+            since: Only return signals detected at or after this time
+                (served by the (canonical_key, detected_at_epoch) index)
+            include_archive: Also read archived signals (needs an attached
+                archive; ignored otherwise)
         """
         if not self._db:
             raise RuntimeError("Database not initialized")
 
-        cursor = await self._db.execute(
-            "SELECT COUNT(*) FROM signals WHERE canonical_key = ?",
-            (canonical_key,)
-        )
-        row = await cursor.fetchone()
-        return row[0] > 0 if row else False
+        schemas = ["main"]
+        if include_archive and self.has_archive:
+            schemas.append(ARCHIVE_SCHEMA)
+
+        selects = []
+        params: List[Any] = []
+        for schema in schemas:
+            select = f"""
+                SELECT
+                    s.id, s.signal_type, s.source_api, s.canonical_key,
+                    s.company_name, s.confidence, s.raw_data,
+                    s.detected_at, s.created_at,
+                    p.status, p.notion_page_id, p.processed_at, p.error_message
+                FROM {schema}.signals s
+                LEFT JOIN {schema}.signal_processing p ON s.id = p.signal_id
+                WHERE s.canonical_key = ?
+            """
+            params.append(canonical_key)
+
+            if since is not None:
+                select += " AND s.detected_at_epoch >= ?"
+                params.append(_to_epoch(since))
+
+            selects.append(select)
+
+        query = " UNION ALL ".join(selects) + " ORDER BY 8 DESC"
+
+        async with self.reader() as db:
+            cursor = await db.execute(query, params)
+            rows = await cursor.fetchall()
+
+        return [self._row_to_signal(row) for row in rows]
+
+    async def is_duplicate(self, canonical_key: str) -> bool:
+        """
+        Check if we already have signals for this canonical key.
+        Returns True if any signals exist (hot or archived), False otherwise.
+        """
+        return bool(await self.existing_keys([canonical_key]))
+
+    async def existing_keys(self, canonical_keys: Iterable[str]) -> set[str]:
+        """
+        Set-based is_duplicate(): return the subset of canonical_keys that
+        already have at least one stored signal, archived ones included.
+
+        Keys are looked up in chunks of LOOKUP_CHUNK_SIZE, so N keys cost
+        ceil(N / LOOKUP_CHUNK_SIZE) indexed queries.
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized")
+
+        schemas = ["main"] + ([ARCHIVE_SCHEMA] if self.has_archive else [])
+
+        found: set[str] = set()
+        async with self.reader() as db:
+            for chunk in _chunks(canonical_keys):
+                placeholders = ", ".join("?" * len(chunk))
+                query = " UNION ".join(
+                    f"SELECT canonical_key FROM {schema}.signals "
+                    f"WHERE canonical_key IN ({placeholders})"
+                    for schema in schemas
+                )
+                cursor = await db.execute(query, chunk * len(schemas))
+                found.update(row[0] for row in await cursor.fetchall())
+
+        return found
+
+    async def get_signal_buckets(
+        self,
+        canonical_keys: Iterable[str],
+        since: datetime,
+    ) -> Dict[str, List[SignalBucket]]:
+        """
+        Hourly signal counts per company since a cutoff, oldest first.
+
+        Reads company_signal_buckets (primary-key range scan per company), so
+        the cost depends on the window, not on how much history a company has.
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized")
+
+        since_epoch = _to_epoch(since) - _to_epoch(since) % SIGNAL_BUCKET_SECONDS
+        buckets: Dict[str, List[SignalBucket]] = {}
+
+        async with self.reader() as db:
+            for chunk in _chunks(canonical_keys):
+                placeholders = ",".join("?" * len(chunk))
+                cursor = await db.execute(
+                    f"""
+                    SELECT canonical_key, bucket_epoch, signal_type, source_api, signal_count
+                    FROM company_signal_buckets
+                    WHERE canonical_key IN ({placeholders}) AND bucket_epoch >= ?
+                    ORDER BY canonical_key, bucket_epoch
+                    """,
+                    (*chunk, since_epoch)
+                )
+                for key, epoch, signal_type, source_api, count in await cursor.fetchall():
+                    buckets.setdefault(key, []).append(SignalBucket(
+                        canonical_key=key,
+                        signal_type=signal_type,
+                        source_api=source_api,
+                        bucket_start=datetime.fromtimestamp(epoch, tz=timezone.utc),
+                        count=count,
+                    ))
+
+        return buckets
+
+    async def get_company_signal_stats(
+        self,
+        canonical_keys: Iterable[str],
+    ) -> Dict[str, CompanySignalStats]:
+        """All-time totals per company from company_signal_stats."""
+        if not self._db:
+            raise RuntimeError("Database not initialized")
+
+        def from_epoch(epoch: Optional[int]) -> Optional[datetime]:
+            return datetime.fromtimestamp(epoch, tz=timezone.utc) if epoch is not None else None
+
+        stats: Dict[str, CompanySignalStats] = {}
+
+        async with self.reader() as db:
+            for chunk in _chunks(canonical_keys):
+                placeholders = ",".join("?" * len(chunk))
+                cursor = await db.execute(
+                    f"""
+                    SELECT canonical_key, total_signals, first_signal_epoch, last_signal_epoch
+                    FROM company_signal_stats
+                    WHERE canonical_key IN ({placeholders})
+                    """,
+                    chunk
+                )
+                for key, total, first, last in await cursor.fetchall():
+                    stats[key] = CompanySignalStats(
+                        canonical_key=key,
+                        total_signals=total,
+                        first_signal_at=from_epoch(first),
+                        last_signal_at=from_epoch(last),
+                    )
+
+        return stats
+
+    async def search(
+        self,
+        query: str,
+        limit: int = 50,
+        signal_type: Optional[str] = None,
+        source_api: Optional[str] = None,
+        since: Optional[datetime] = None,
+    ) -> List[StoredSignal]:
+        """
+        Full-text search over company names, canonical keys and raw_data
+        text fields (see SEARCH_TEXT_FIELDS), best matches first.
+
+        Every word in query must match as a prefix; ranking is bm25 with
+        company name matches weighted highest.
+
+        Args:
+            query: Free text, e.g. "acme robotics"
+            limit: Max results
+            signal_type: Only this signal type
+            source_api: Only this source
+            since: Only signals detected at or after this time
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized")
+
+        match = _fts_match_query(query)
+        if not match:
+            return []
+
+        sql = f"""
+            SELECT
+                s.id, s.signal_type, s.source_api, s.canonical_key,
+                s.company_name, s.confidence, s.raw_data,
+                s.detected_at, s.created_at,
+                p.status, p.notion_page_id, p.processed_at, p.error_message
+            FROM signals_fts f
+            JOIN signals s ON s.id = f.rowid
+            LEFT JOIN signal_processing p ON s.id = p.signal_id
+            WHERE signals_fts MATCH ?
+        """
+        params: List[Any] = [match]
+
+        if signal_type:
+            sql += " AND s.signal_type = ?"
+            params.append(signal_type)
+        if source_api:
+            sql += " AND s.source_api = ?"
+            params.append(source_api)
+        if since is not None:
+            sql += " AND s.detected_at_epoch >= ?"
+            params.append(_to_epoch(since))
+
+        weights = ", ".join(str(w) for w in SEARCH_RANK_WEIGHTS)
+        sql += f" ORDER BY bm25(signals_fts, {weights}), s.detected_at_epoch DESC LIMIT ?"
+        params.append(limit)
+
+        async with self.reader() as db:
+            cursor = await db.execute(sql, params)
+            rows = await cursor.fetchall()
+
+        return [self._row_to_signal(row) for row in rows]
 
     # =========================================================================
-    # PROCESSING STATE
-    # =========================================================================
+    # PROCESSING STATE
+    # =========================================================================
 
     async def mark_pushed(
         self,
@@ -635,20 +1542,109 @@ class SignalStore:
 
         logger.info(f"Marked signal {signal_id} as queued for Notion")
 
+    async def mark_pushed_many(
+        self,
+        signal_ids: Iterable[int],
+        notion_page_id: str,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Mark several signals as pushed to the same Notion page in one transaction."""
+        now = datetime.now(timezone.utc).isoformat()
+        await self._update_processing_many(
+            signal_ids,
+            """
+            SET status = 'pushed',
+                notion_page_id = ?,
+                processed_at = ?,
+                metadata = ?,
+                updated_at = ?
+            """,
+            (notion_page_id, now, json.dumps(metadata) if metadata else None, now),
+            f"pushed (Notion: {notion_page_id})",
+        )
+
+    async def mark_rejected_many(
+        self,
+        signal_ids: Iterable[int],
+        reason: str,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Mark several signals as rejected with the same reason in one transaction."""
+        now = datetime.now(timezone.utc).isoformat()
+        await self._update_processing_many(
+            signal_ids,
+            """
+            SET status = 'rejected',
+                processed_at = ?,
+                error_message = ?,
+                metadata = ?,
+                updated_at = ?
+            """,
+            (now, reason, json.dumps(metadata) if metadata else None, now),
+            f"rejected: {reason}",
+        )
+
+    async def mark_queued_many(
+        self,
+        signal_ids: Iterable[int],
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Mark several signals as queued for Notion write in one transaction."""
+        now = datetime.now(timezone.utc).isoformat()
+        await self._update_processing_many(
+            signal_ids,
+            """
+            SET status = 'queued',
+                notion_page_id = NULL,
+                processed_at = ?,
+                error_message = NULL,
+                metadata = ?,
+                updated_at = ?
+            """,
+            (now, json.dumps(metadata) if metadata else None, now),
+            "queued for Notion",
+        )
+
+    async def _update_processing_many(
+        self,
+        signal_ids: Iterable[int],
+        set_clause: str,
+        params: tuple,
+        description: str,
+    ) -> None:
+        """Apply one signal_processing UPDATE to many signal ids (chunked IN lists)."""
+        if not self._db:
+            raise RuntimeError("Database not initialized")
+
+        chunks = _chunks(signal_ids)
+        if not chunks:
+            return
+
+        async with self.transaction() as conn:
+            for chunk in chunks:
+                placeholders = ",".join("?" * len(chunk))
+                await conn.execute(
+                    f"UPDATE signal_processing {set_clause} WHERE signal_id IN ({placeholders})",
+                    (*params, *chunk)
+                )
+
+        logger.info(f"Marked {sum(len(c) for c in chunks)} signals as {description}")
+
     async def get_processing_stats(self) -> Dict[str, int]:
         """Get counts by processing status."""
         if not self._db:
             raise RuntimeError("Database not initialized")
 
-        cursor = await self._db.execute(
-            """
-            SELECT status, COUNT(*)
-            FROM signal_processing
-            GROUP BY status
-            """
-        )
+        async with self.reader() as db:
+            cursor = await db.execute(
+                """
+                SELECT status, COUNT(*)
+                FROM signal_processing
+                GROUP BY status
+                """
+            )
+            rows = await cursor.fetchall()
 
-        rows = await cursor.fetchall()
         return {status: count for status, count in rows}
 
     # =========================================================================
@@ -704,19 +1700,20 @@ class SignalStore:
         if not self._db:
             raise RuntimeError("Database not initialized")
 
-        cursor = await self._db.execute(
-            """
-            SELECT id, idempotency_key, payload_json, status, attempts,
-                   next_attempt_at, last_error, created_at, updated_at
-            FROM notion_outbox
-            WHERE status = 'pending'
-            ORDER BY created_at ASC
-            LIMIT ?
-            """,
-            (limit,)
-        )
+        async with self.reader() as db:
+            cursor = await db.execute(
+                """
+                SELECT id, idempotency_key, payload_json, status, attempts,
+                       next_attempt_at, last_error, created_at, updated_at
+                FROM notion_outbox
+                WHERE status = 'pending'
+                ORDER BY created_at ASC
+                LIMIT ?
+                """,
+                (limit,)
+            )
+            rows = await cursor.fetchall()
 
-        rows = await cursor.fetchall()
         return [
             {
                 "id": row[0],
@@ -844,30 +1841,56 @@ class SignalStore:
 
         now = datetime.now(timezone.utc).isoformat()
 
-        cursor = await self._db.execute(
-            """
-            SELECT
-                canonical_key, notion_page_id, status, company_name,
-                cached_at, expires_at, metadata
-            FROM suppression_cache
-            WHERE canonical_key = ? AND expires_at > ?
-            """,
-            (canonical_key, now)
-        )
+        async with self.reader() as db:
+            cursor = await db.execute(
+                """
+                SELECT
+                    canonical_key, notion_page_id, status, company_name,
+                    cached_at, expires_at, metadata
+                FROM suppression_cache
+                WHERE canonical_key = ? AND expires_at > ?
+                """,
+                (canonical_key, now)
+            )
+            row = await cursor.fetchone()
 
-        row = await cursor.fetchone()
         if not row:
             return None
 
-        return SuppressionEntry(
-            canonical_key=row[0],
-            notion_page_id=row[1],
-            status=row[2],
-            company_name=row[3],
-            cached_at=datetime.fromisoformat(row[4]),
-            expires_at=datetime.fromisoformat(row[5]),
-            metadata=json.loads(row[6]) if row[6] else None,
-        )
+        return self._row_to_suppression(row)
+
+    async def suppression_for(
+        self,
+        canonical_keys: Iterable[str],
+    ) -> Dict[str, SuppressionEntry]:
+        """
+        Set-based check_suppression(): return live suppression entries for
+        the given keys, keyed by canonical_key. Missing or expired keys are
+        simply absent from the result.
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized")
+
+        now = datetime.now(timezone.utc).isoformat()
+        entries: Dict[str, SuppressionEntry] = {}
+
+        async with self.reader() as db:
+            for chunk in _chunks(canonical_keys):
+                placeholders = ", ".join("?" * len(chunk))
+                cursor = await db.execute(
+                    f"""
+                    SELECT
+                        canonical_key, notion_page_id, status, company_name,
+                        cached_at, expires_at, metadata
+                    FROM suppression_cache
+                    WHERE canonical_key IN ({placeholders}) AND expires_at > ?
+                    """,
+                    (*chunk, now)
+                )
+                for row in await cursor.fetchall():
+                    entries[row[0]] = self._row_to_suppression(row)
+
+        return entries
 
     async def clean_expired_cache(self) -> int:
         """
@@ -891,63 +1914,198 @@ class SignalStore:
 
         return count
 
+    # =========================================================================
+    # ENRICHMENT CACHE
+    # =========================================================================
+
+    async def get_enriched(
+        self,
+        source: str,
+        item_keys: Iterable[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Return stored enrichment results for the given items, keyed by
+        item_key. Items never enriched are absent from the result.
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized")
+
+        enriched: Dict[str, Dict[str, Any]] = {}
+
+        async with self.reader() as db:
+            for chunk in _chunks(item_keys):
+                placeholders = ", ".join("?" * len(chunk))
+                cursor = await db.execute(
+                    f"""
+                    SELECT item_key, data FROM enriched_items
+                    WHERE source = ? AND item_key IN ({placeholders})
+                    """,
+                    (source, *chunk)
+                )
+                for item_key, data in await cursor.fetchall():
+                    enriched[item_key] = json.loads(data)
+
+        return enriched
+
+    async def save_enriched(
+        self,
+        source: str,
+        items: Dict[str, Dict[str, Any]],
+    ) -> int:
+        """
+        Record enrichment results (item_key -> data) in one transaction.
+        Returns number of items written.
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized")
+
+        if not items:
+            return 0
+
+        now = datetime.now(timezone.utc).isoformat()
+
+        async with self.transaction() as conn:
+            await conn.executemany(
+                """
+                INSERT INTO enriched_items (source, item_key, data, enriched_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(source, item_key) DO UPDATE SET
+                    data = excluded.data,
+                    enriched_at = excluded.enriched_at
+                """,
+                [
+                    (source, item_key, json.dumps(data, default=str), now)
+                    for item_key, data in items.items()
+                ]
+            )
+
+        return len(items)
+
+    # =========================================================================
+    # COLLECTOR WATERMARKS
+    # =========================================================================
+
+    async def get_watermark(self, collector: str) -> Optional[datetime]:
+        """
+        Return the newest item time saved by a collector, or None if it
+        has never completed an incremental run.
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized")
+
+        async with self.reader() as db:
+            cursor = await db.execute(
+                "SELECT watermark FROM collector_watermarks WHERE collector = ?",
+                (collector,)
+            )
+            row = await cursor.fetchone()
+
+        return datetime.fromisoformat(row[0]) if row else None
+
+    async def set_watermark(self, collector: str, watermark: datetime) -> bool:
+        """
+        Advance a collector's watermark. Never moves it backwards.
+
+        Call only after the signals up to this time have been saved.
+
+        Returns True if the stored watermark changed.
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized")
+
+        if watermark.tzinfo is None:
+            watermark = watermark.replace(tzinfo=timezone.utc)
+        watermark = watermark.astimezone(timezone.utc)
+
+        async with self.transaction() as conn:
+            cursor = await conn.execute(
+                """
+                INSERT INTO collector_watermarks (
+                    collector, watermark, watermark_epoch, updated_at
+                )
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(collector) DO UPDATE SET
+                    watermark = excluded.watermark,
+                    watermark_epoch = excluded.watermark_epoch,
+                    updated_at = excluded.updated_at
+                WHERE excluded.watermark_epoch > collector_watermarks.watermark_epoch
+                """,
+                (
+                    collector,
+                    watermark.isoformat(),
+                    _to_epoch(watermark),
+                    datetime.now(timezone.utc).isoformat(),
+                )
+            )
+            changed = cursor.rowcount > 0
+
+        if changed:
+            logger.info(f"Advanced {collector} watermark to {watermark.isoformat()}")
+        return changed
+
     # =========================================================================
     # UTILITIES
     # =========================================================================
 
     def _row_to_signal(self, row: tuple) -> StoredSignal:
-        """Convert database row to StoredSignal object."""
-        # Helper to ensure timezone-aware datetimes
-        def parse_datetime(dt_str: str) -> datetime:
-            dt = datetime.fromisoformat(dt_str)
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt
-
-        return StoredSignal(
+        """Convert database row to StoredSignal object (raw_data decoded lazily)."""
+        return StoredSignal._lazy(
+            row[6],
             id=row[0],
             signal_type=row[1],
             source_api=row[2],
             canonical_key=row[3],
             company_name=row[4],
             confidence=row[5],
-            raw_data=json.loads(row[6]),
-            detected_at=parse_datetime(row[7]),
-            created_at=parse_datetime(row[8]),
+            detected_at=_parse_datetime(row[7]),
+            created_at=_parse_datetime(row[8]),
             processing_status=row[9] if len(row) > 9 else None,
             notion_page_id=row[10] if len(row) > 10 else None,
-            processed_at=parse_datetime(row[11]) if len(row) > 11 and row[11] else None,
+            processed_at=_parse_datetime(row[11]) if len(row) > 11 and row[11] else None,
             error_message=row[12] if len(row) > 12 else None,
         )
 
+    def _row_to_suppression(self, row: tuple) -> SuppressionEntry:
+        """Convert suppression_cache row to SuppressionEntry object."""
+        return SuppressionEntry(
+            canonical_key=row[0],
+            notion_page_id=row[1],
+            status=row[2],
+            company_name=row[3],
+            cached_at=datetime.fromisoformat(row[4]),
+            expires_at=datetime.fromisoformat(row[5]),
+            metadata=json.loads(row[6]) if row[6] else None,
+        )
+
     async def get_stats(self) -> Dict[str, Any]:
         """Get overall database statistics."""
         if not self._db:
             raise RuntimeError("Database not initialized")
 
-        # Signal counts by type
-        cursor = await self._db.execute(
-            """
-            SELECT signal_type, COUNT(*)
-            FROM signals
-            GROUP BY signal_type
-            """
-        )
-        signal_counts = dict(await cursor.fetchall())
-
-        # Processing stats
+        # Processing stats (checks out its own reader)
         processing_stats = await self.get_processing_stats()
 
-        # Suppression cache stats
-        cursor = await self._db.execute(
-            "SELECT COUNT(*) FROM suppression_cache WHERE expires_at > ?",
-            (datetime.now(timezone.utc).isoformat(),)
-        )
-        active_cache_entries = (await cursor.fetchone())[0]
+        async with self.reader() as db:
+            # Signal counts by type
+            cursor = await db.execute(
+                """
+                SELECT signal_type, COUNT(*)
+                FROM signals
+                GROUP BY signal_type
+                """
+            )
+            signal_counts = dict(await cursor.fetchall())
+
+            # Suppression cache stats
+            cursor = await db.execute(
+                "SELECT COUNT(*) FROM suppression_cache WHERE expires_at > ?",
+                (datetime.now(timezone.utc).isoformat(),)
+            )
+            active_cache_entries = (await cursor.fetchone())[0]
 
-        # Total signals
-        cursor = await self._db.execute("SELECT COUNT(*) FROM signals")
-        total_signals = (await cursor.fetchone())[0]
+            # Total signals
+            cursor = await db.execute("SELECT COUNT(*) FROM signals")
+            total_signals = (await cursor.fetchone())[0]
 
         return {
             "total_signals": total_signals,
@@ -957,6 +2115,368 @@ class SignalStore:
             "database_path": str(self.db_path),
         }
 
+    async def compact_raw_data(self, batch_size: int = 500) -> int:
+        """
+        Re-encode raw_data rows still stored as plain JSON text.
+
+        Walks the signals table in id order, one short transaction per
+        batch, so it can run alongside ingestion. Run VACUUM afterwards to
+        return the freed pages to the filesystem.
+
+        Returns the number of rows rewritten in compressed form.
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized")
+
+        rewritten = 0
+        last_id = 0
+
+        while True:
+            async with self.transaction() as conn:
+                cursor = await conn.execute(
+                    """
+                    SELECT id, raw_data FROM signals
+                    WHERE id > ? AND typeof(raw_data) = 'text'
+                    ORDER BY id
+                    LIMIT ?
+                    """,
+                    (last_id, batch_size)
+                )
+                rows = await cursor.fetchall()
+                if not rows:
+                    break
+
+                updates = []
+                for signal_id, raw in rows:
+                    encoded = encode_raw_data(json.loads(raw))
+                    if isinstance(encoded, bytes):
+                        updates.append((encoded, signal_id))
+
+                await conn.executemany(
+                    "UPDATE signals SET raw_data = ? WHERE id = ?",
+                    updates,
+                )
+
+            rewritten += len(updates)
+            last_id = rows[-1][0]
+
+        logger.info(f"Compacted raw_data for {rewritten} signals")
+        return rewritten
+
+    async def rebuild_search_index(self, batch_size: int = 500) -> int:
+        """
+        Rebuild signals_fts from the signals table.
+
+        Runs as the migration v6 backfill (again on the next start if it
+        was interrupted) and after bulk imports; save_signal keeps the
+        index current otherwise. Walks signals in id order, one
+        transaction per batch.
+
+        Returns the number of signals indexed.
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized")
+
+        async with self.transaction() as conn:
+            await conn.execute("DELETE FROM signals_fts")
+
+        indexed = 0
+        last_id = 0
+
+        while True:
+            async with self.transaction() as conn:
+                cursor = await conn.execute(
+                    """
+                    SELECT id, company_name, canonical_key, raw_data FROM signals
+                    WHERE id > ?
+                    ORDER BY id
+                    LIMIT ?
+                    """,
+                    (last_id, batch_size)
+                )
+                rows = await cursor.fetchall()
+                if not rows:
+                    break
+
+                await conn.executemany(
+                    """
+                    INSERT INTO signals_fts (rowid, company_name, canonical_key, body)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    [
+                        (signal_id, company_name, canonical_key, search_text(decode_raw_data(raw)))
+                        for signal_id, company_name, canonical_key, raw in rows
+                    ],
+                )
+
+            indexed += len(rows)
+            last_id = rows[-1][0]
+
+        logger.info(f"Rebuilt search index for {indexed} signals")
+        return indexed
+
+    async def rebuild_company_aggregates(self) -> None:
+        """
+        Recompute company_signal_stats/company_signal_buckets from signals.
+
+        save_signal keeps the counters current; this is for rows written
+        behind its back (bulk imports, manual repairs). Archived signals
+        are counted too when an archive is attached.
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized")
+
+        now = datetime.now(timezone.utc).isoformat()
+        source = "SELECT canonical_key, signal_type, source_api, detected_at_epoch FROM main.signals"
+        if self.has_archive:
+            source += (
+                " UNION ALL SELECT canonical_key, signal_type, source_api, detected_at_epoch"
+                f" FROM {ARCHIVE_SCHEMA}.signals"
+            )
+
+        async with self.transaction() as conn:
+            await conn.execute("DELETE FROM company_signal_stats")
+            await conn.execute("DELETE FROM company_signal_buckets")
+            await conn.execute(
+                f"""
+                INSERT INTO company_signal_stats (
+                    canonical_key, total_signals, first_signal_epoch, last_signal_epoch, updated_at
+                )
+                SELECT canonical_key, COUNT(*), MIN(detected_at_epoch), MAX(detected_at_epoch), ?
+                FROM ({source})
+                GROUP BY canonical_key
+                """,
+                (now,)
+            )
+            await conn.execute(
+                f"""
+                INSERT INTO company_signal_buckets (
+                    canonical_key, bucket_epoch, signal_type, source_api, signal_count
+                )
+                SELECT canonical_key, detected_at_epoch - detected_at_epoch % ?,
+                       signal_type, source_api, COUNT(*)
+                FROM ({source})
+                GROUP BY 1, 2, 3, 4
+                """,
+                (SIGNAL_BUCKET_SECONDS,)
+            )
+
+    # =========================================================================
+    # RETENTION / ARCHIVE
+    # =========================================================================
+
+    @property
+    def has_archive(self) -> bool:
+        """True once an archive database is attached."""
+        return self._conn.is_attached(ARCHIVE_SCHEMA)
+
+    async def attach_archive(self, archive_path: str | Path) -> None:
+        """
+        Attach archive_path as the cold tier and create its tables.
+
+        Safe to call more than once. With a shared ConnectionManager the
+        archive is visible to every store on it.
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized")
+
+        self.archive_path = Path(archive_path)
+        await self._conn.attach(self.archive_path, ARCHIVE_SCHEMA)
+
+        async with self.transaction() as conn:
+            for statement in ARCHIVE_TABLES.split(";"):
+                if statement.strip():
+                    await conn.execute(statement)
+
+    async def archive_signals(
+        self,
+        older_than_days: int,
+        statuses: Iterable[str] = ARCHIVABLE_STATUSES,
+        batch_size: int = 500,
+        compress: Optional[bool] = None,
+    ) -> int:
+        """
+        Move signals with a final processing status into the archive.
+
+        Signals created more than older_than_days ago whose status is in
+        statuses are copied (ids unchanged) with their processing rows, then
+        deleted from the hot tables, one short transaction per batch so
+        ingestion can interleave. company_signal_stats is left as is, so
+        all-time totals still include archived signals.
+
+        Args:
+            older_than_days: Minimum age (by created_at) to archive
+            statuses: Processing statuses eligible for archiving
+            batch_size: Signals moved per transaction
+            compress: zlib-compress plain-text raw_data on the way out
+                (defaults to compress_raw_data)
+
+        Returns:
+            Number of signals archived
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized")
+        if not self.has_archive:
+            raise RuntimeError("No archive attached (pass archive_path or call attach_archive)")
+
+        compress = self.compress_raw_data if compress is None else compress
+        statuses = list(statuses)
+        status_placeholders = ", ".join("?" * len(statuses))
+        cutoff = _to_epoch(datetime.now(timezone.utc) - timedelta(days=older_than_days))
+        archived_at = datetime.now(timezone.utc).isoformat()
+        select_columns = ", ".join(f"s.{col.strip()}" for col in _SIGNAL_COLUMNS.split(","))
+        archived = 0
+
+        while True:
+            async with self.transaction() as conn:
+                cursor = await conn.execute(
+                    f"""
+                    SELECT {select_columns}
+                    FROM signals s
+                    JOIN signal_processing p ON p.signal_id = s.id
+                    WHERE s.created_at_epoch < ? AND p.status IN ({status_placeholders})
+                    ORDER BY s.id
+                    LIMIT ?
+                    """,
+                    (cutoff, *statuses, batch_size)
+                )
+                rows = await cursor.fetchall()
+                if not rows:
+                    break
+
+                ids = [row[0] for row in rows]
+                id_placeholders = ", ".join("?" * len(ids))
+
+                if compress:
+                    rows = [
+                        (*row[:6], encode_raw_data(json.loads(row[6])), *row[7:])
+                        if isinstance(row[6], str) else row
+                        for row in rows
+                    ]
+
+                await conn.executemany(
+                    f"""
+                    INSERT OR REPLACE INTO {ARCHIVE_SCHEMA}.signals
+                        ({_SIGNAL_COLUMNS}, archived_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    [(*row, archived_at) for row in rows],
+                )
+                await conn.execute(
+                    f"""
+                    INSERT OR REPLACE INTO {ARCHIVE_SCHEMA}.signal_processing ({_PROCESSING_COLUMNS})
+                    SELECT {_PROCESSING_COLUMNS} FROM signal_processing
+                    WHERE signal_id IN ({id_placeholders})
+                    """,
+                    ids
+                )
+                await conn.execute(
+                    f"DELETE FROM signal_processing WHERE signal_id IN ({id_placeholders})",
+                    ids
+                )
+                await conn.execute(
+                    f"DELETE FROM signals WHERE id IN ({id_placeholders})",
+                    ids
+                )
+
+            archived += len(ids)
+
+        logger.info(f"Archived {archived} signals older than {older_than_days} days")
+        return archived
+
+    async def archive_pipeline_runs(self, older_than_days: int) -> int:
+        """Move pipeline_runs rows created more than older_than_days ago into the archive."""
+        if not self._db:
+            raise RuntimeError("Database not initialized")
+        if not self.has_archive:
+            raise RuntimeError("No archive attached (pass archive_path or call attach_archive)")
+
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=older_than_days)).isoformat()
+
+        async with self.transaction() as conn:
+            await conn.execute(
+                f"""
+                INSERT INTO {ARCHIVE_SCHEMA}.pipeline_runs
+                SELECT * FROM pipeline_runs
+                WHERE created_at < ?
+                  AND run_id NOT IN (SELECT run_id FROM {ARCHIVE_SCHEMA}.pipeline_runs)
+                """,
+                (cutoff,)
+            )
+            cursor = await conn.execute(
+                "DELETE FROM pipeline_runs WHERE created_at < ?",
+                (cutoff,)
+            )
+            moved = cursor.rowcount
+
+        logger.info(f"Archived {moved} pipeline runs older than {older_than_days} days")
+        return moved
+
+    async def vacuum(self, max_pages: Optional[int] = None) -> int:
+        """
+        Return free pages in the hot database to the filesystem.
+
+        The first call switches the file to auto_vacuum=INCREMENTAL with a
+        one-off full VACUUM; later calls only run incremental_vacuum, which
+        is cheap and doesn't rewrite the file.
+
+        Args:
+            max_pages: Cap on pages freed per incremental call (None = all)
+
+        Returns:
+            Number of pages freed
+        """
+        if not self._db:
+            raise RuntimeError("Database not initialized")
+
+        async with self._conn.exclusive() as db:
+            cursor = await db.execute("PRAGMA main.freelist_count")
+            free_before = (await cursor.fetchone())[0]
+
+            cursor = await db.execute("PRAGMA main.auto_vacuum")
+            if (await cursor.fetchone())[0] == 2:  # INCREMENTAL
+                pragma = "PRAGMA main.incremental_vacuum"
+                if max_pages is not None:
+                    pragma += f"({int(max_pages)})"
+                # Frees one page per step, so drain the cursor
+                cursor = await db.execute(pragma)
+                await cursor.fetchall()
+            else:
+                await db.execute("PRAGMA main.auto_vacuum = INCREMENTAL")
+                await db.execute("VACUUM main")
+
+            cursor = await db.execute("PRAGMA main.freelist_count")
+            free_after = (await cursor.fetchone())[0]
+
+        freed = max(free_before - free_after, 0)
+        logger.info(f"Vacuumed {self.db_path}: {freed} pages freed")
+        return freed
+
+    async def apply_retention(
+        self,
+        older_than_days: int,
+        batch_size: int = 500,
+        vacuum_pages: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """
+        Archive finished signals and old pipeline runs, then vacuum.
+
+        Returns:
+            Dict with signals_archived, pipeline_runs_archived, pages_freed
+        """
+        signals_archived = await self.archive_signals(older_than_days, batch_size=batch_size)
+        runs_archived = await self.archive_pipeline_runs(older_than_days)
+
+        pages_freed = 0
+        if signals_archived or runs_archived:
+            pages_freed = await self.vacuum(max_pages=vacuum_pages)
+
+        return {
+            "signals_archived": signals_archived,
+            "pipeline_runs_archived": runs_archived,
+            "pages_freed": pages_freed,
+        }
+
     # =========================================================================
     # PIPELINE METRICS
     # =========================================================================
@@ -1040,24 +2560,25 @@ class SignalStore:
         if not self._db:
             raise RuntimeError("Database not initialized")
 
-        cursor = await self._db.execute(
-            """
-            SELECT
-                run_id, started_at, completed_at, duration_seconds,
-                collectors_run, collectors_succeeded, collectors_failed, signals_collected,
-                signals_stored, signals_deduplicated,
-                signals_processed, signals_auto_push, signals_needs_review,
-                signals_held, signals_rejected,
-                prospects_created, prospects_updated, prospects_skipped,
-                errors, health_report
-            FROM pipeline_runs
-            ORDER BY started_at DESC
-            LIMIT ?
-            """,
-            (limit,)
-        )
+        async with self.reader() as db:
+            cursor = await db.execute(
+                """
+                SELECT
+                    run_id, started_at, completed_at, duration_seconds,
+                    collectors_run, collectors_succeeded, collectors_failed, signals_collected,
+                    signals_stored, signals_deduplicated,
+                    signals_processed, signals_auto_push, signals_needs_review,
+                    signals_held, signals_rejected,
+                    prospects_created, prospects_updated, prospects_skipped,
+                    errors, health_report
+                FROM pipeline_runs
+                ORDER BY started_at DESC
+                LIMIT ?
+                """,
+                (limit,)
+            )
+            rows = await cursor.fetchall()
 
-        rows = await cursor.fetchall()
         return [self._row_to_pipeline_run(row) for row in rows]
 
     async def get_pipeline_run(self, run_id: str) -> Optional[Dict[str, Any]]:
@@ -1073,23 +2594,24 @@ class SignalStore:
         if not self._db:
             raise RuntimeError("Database not initialized")
 
-        cursor = await self._db.execute(
-            """
-            SELECT
-                run_id, started_at, completed_at, duration_seconds,
-                collectors_run, collectors_succeeded, collectors_failed, signals_collected,
-                signals_stored, signals_deduplicated,
-                signals_processed, signals_auto_push, signals_needs_review,
-                signals_held, signals_rejected,
-                prospects_created, prospects_updated, prospects_skipped,
-                errors, health_report
-            FROM pipeline_runs
-            WHERE run_id = ?
-            """,
-            (run_id,)
-        )
+        async with self.reader() as db:
+            cursor = await db.execute(
+                """
+                SELECT
+                    run_id, started_at, completed_at, duration_seconds,
+                    collectors_run, collectors_succeeded, collectors_failed, signals_collected,
+                    signals_stored, signals_deduplicated,
+                    signals_processed, signals_auto_push, signals_needs_review,
+                    signals_held, signals_rejected,
+                    prospects_created, prospects_updated, prospects_skipped,
+                    errors, health_report
+                FROM pipeline_runs
+                WHERE run_id = ?
+                """,
+                (run_id,)
+            )
+            row = await cursor.fetchone()
 
-        row = await cursor.fetchone()
         if not row:
             return None
 
@@ -1121,6 +2643,27 @@ class SignalStore:
         }
 
 
+def _parse_datetime(dt_str: str) -> datetime:
+    """Parse an ISO timestamp, treating naive values as UTC."""
+    dt = datetime.fromisoformat(dt_str)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def _to_epoch(dt: datetime) -> int:
+    """Epoch seconds for a datetime; naive values are treated as UTC."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+def _chunks(items: Iterable[Any], size: int = LOOKUP_CHUNK_SIZE) -> List[List[Any]]:
+    """De-duplicate items (preserving order) and split into IN-list sized chunks."""
+    unique = list(dict.fromkeys(items))
+    return [unique[i:i + size] for i in range(0, len(unique), size)]
+
+
 # =============================================================================
 # CONTEXT MANAGER FOR EASY USAGE
 # =============================================================================
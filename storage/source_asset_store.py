@@ -4,10 +4,16 @@ SourceAssetStore: Raw snapshot storage for the Two-Entity Model.
 This module stores raw assets from various sources (GitHub repos, Product Hunt
 launches, etc.) before they're converted to signals. It enables:
 
-1. Change detection: Compare current snapshot to previous
+1. Change detection: Compare a canonical payload hash with the latest
+   snapshot's, so unchanged payloads are never rewritten
 2. Entity resolution: Link multiple assets to the same company
 3. Audit trail: Full history of what we've seen
 
+Snapshots are delta-encoded: every entity's history is a chain of periodic
+full keyframes, each followed by up to keyframe_interval - 1 compact JSON
+diffs against the snapshot before it. Reads reconstruct full payloads, so
+callers never see the encoding.
+
 The Two-Entity Model:
 - SourceAsset: Raw data from a source (this store)
 - Lead: Company entity in CRM (Notion)
@@ -15,14 +21,130 @@ The Two-Entity Model:
 Assets can be linked to Leads through the asset_to_lead mapping table.
 """
 import aiosqlite
+import asyncio
+import copy
+import hashlib
 import json
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Sequence, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
+# A full snapshot is stored at least every KEYFRAME_INTERVAL snapshots, which
+# bounds how many deltas a read has to apply
+KEYFRAME_INTERVAL = 20
+
+ENCODING_FULL = "full"
+ENCODING_DELTA = "delta"
+
+# Bound on bound parameters per batched lookup (SQLite's default limit is 999)
+LOOKUP_CHUNK_SIZE = 500
+
+# BufferedSnapshotWriter defaults: flush at this many pending writes, or this
+# long after the first one was queued
+WRITE_BUFFER_ROWS = 200
+WRITE_BUFFER_DELAY_MS = 500
+
+_INSERT_SNAPSHOT_SQL = """INSERT INTO source_assets
+               (source_type, external_id, raw_payload, fetched_at, change_detected,
+                payload_hash, encoding, base_id, chain_length)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+
+def payload_hash(raw_payload: Dict[str, Any]) -> str:
+    """
+    Canonical SHA-256 of a payload (sorted keys, compact separators), so
+    equal payloads hash equally regardless of key order.
+    """
+    canonical = json.dumps(raw_payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+# =============================================================================
+# PAYLOAD DELTAS
+# =============================================================================
+
+def _same_value(a: Any, b: Any) -> bool:
+    """Equality that also tells apart JSON types Python considers equal (1 vs true)."""
+    return a == b and (
+        json.dumps(a, sort_keys=True, default=str) == json.dumps(b, sort_keys=True, default=str)
+    )
+
+
+def _diff_into(old: Dict[str, Any], new: Dict[str, Any], path: List[str], delta: Dict[str, list]) -> None:
+    for key in old:
+        if key not in new:
+            delta["unset"].append(path + [key])
+    for key, value in new.items():
+        if key not in old:
+            delta["set"].append([path + [key], value])
+        elif isinstance(value, dict) and isinstance(old[key], dict):
+            _diff_into(old[key], value, path + [key], delta)
+        elif not _same_value(old[key], value):
+            delta["set"].append([path + [key], value])
+
+
+def diff_payloads(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, list]:
+    """
+    Compute a delta that turns old into new.
+
+    Nested objects are diffed key by key; any other value (including lists)
+    is replaced whole. Paths are lists of keys, so keys containing dots are
+    unambiguous.
+
+    Returns:
+        {"set": [[path, value], ...], "unset": [path, ...]}
+    """
+    delta: Dict[str, list] = {"set": [], "unset": []}
+    _diff_into(old, new, [], delta)
+    return delta
+
+
+def apply_payload_delta(payload: Dict[str, Any], delta: Dict[str, list]) -> Dict[str, Any]:
+    """Apply a diff_payloads() delta to a copy of payload."""
+    result = copy.deepcopy(payload)
+    for path in delta["unset"]:
+        parent = result
+        for key in path[:-1]:
+            parent = parent[key]
+        parent.pop(path[-1], None)
+    for path, value in delta["set"]:
+        parent = result
+        for key in path[:-1]:
+            parent = parent.setdefault(key, {})
+        parent[path[-1]] = value
+    return result
+
+
+def _value_at(payload: Dict[str, Any], path: List[str]) -> Any:
+    for key in path:
+        if not isinstance(payload, dict) or key not in payload:
+            return None
+        payload = payload[key]
+    return payload
+
+
+def field_changes(old: Dict[str, Any], new: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Field-level differences between two payloads.
+
+    Returns:
+        [{"field": "owner.login", "old": ..., "new": ...}, ...] with dotted
+        paths; added fields have old=None, removed fields new=None.
+    """
+    delta = diff_payloads(old, new)
+    changes = [
+        {"field": ".".join(path), "old": _value_at(old, path), "new": None}
+        for path in delta["unset"]
+    ]
+    changes.extend(
+        {"field": ".".join(path), "old": _value_at(old, path), "new": value}
+        for path, value in delta["set"]
+    )
+    return changes
+
 
 @dataclass
 class SourceAsset:
@@ -39,6 +161,26 @@ class SourceAsset:
     id: Optional[int] = None  # Database ID (set after save)
     change_detected: bool = False  # True if this differs from previous snapshot
     created_at: Optional[datetime] = None  # When record was created
+    payload_hash: Optional[str] = None  # Canonical hash of raw_payload (set on save)
+
+
+@dataclass
+class SnapshotWrite:
+    """Outcome of SourceAssetStore.record_snapshot()."""
+    asset_id: Optional[int]  # New row, or the existing latest row if unchanged
+    # (None for a BufferedSnapshotWriter insert that hasn't been flushed yet)
+    is_new: bool  # First snapshot for this (source_type, external_id)
+    changed: bool  # Payload differs from the previous latest snapshot
+    changes: List[Dict[str, Any]] = field(default_factory=list)  # field_changes() vs previous
+
+
+@dataclass
+class _LatestSnapshot:
+    """Latest row for an entity, with its reconstructed payload."""
+    id: int
+    payload_hash: str
+    chain_length: int
+    payload: Dict[str, Any]
 
 
 class SourceAssetStore:
@@ -65,14 +207,17 @@ class SourceAssetStore:
         previous = await store.get_previous_snapshot("github_repo", "owner/repo")
     """
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, keyframe_interval: int = KEYFRAME_INTERVAL):
         """
         Initialize SourceAssetStore.
 
         Args:
             db_path: Path to SQLite database. Use ":memory:" for in-memory.
+            keyframe_interval: Store a full snapshot at least this often per
+                entity; the snapshots in between are deltas.
         """
         self.db_path = db_path
+        self.keyframe_interval = max(1, keyframe_interval)
         self._db: Optional[aiosqlite.Connection] = None
 
     async def initialize(self) -> None:
@@ -88,16 +233,40 @@ class SourceAssetStore:
                 raw_payload TEXT NOT NULL,
                 fetched_at TIMESTAMP NOT NULL,
                 change_detected BOOLEAN DEFAULT FALSE,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                payload_hash TEXT,
+                encoding TEXT NOT NULL DEFAULT 'full',
+                base_id INTEGER,
+                chain_length INTEGER NOT NULL DEFAULT 0
             )
         """)
 
+        # Databases created before these columns existed; their rows are
+        # all full keyframes
+        cursor = await self._db.execute("PRAGMA table_info(source_assets)")
+        columns = {row[1] for row in await cursor.fetchall()}
+        for column, ddl in (
+            ("payload_hash", "payload_hash TEXT"),
+            ("encoding", "encoding TEXT NOT NULL DEFAULT 'full'"),
+            ("base_id", "base_id INTEGER"),
+            ("chain_length", "chain_length INTEGER NOT NULL DEFAULT 0"),
+        ):
+            if column not in columns:
+                await self._db.execute(f"ALTER TABLE source_assets ADD COLUMN {ddl}")
+
         # Index for efficient lookups
         await self._db.execute("""
             CREATE INDEX IF NOT EXISTS idx_source_assets_lookup
             ON source_assets(source_type, external_id, fetched_at DESC)
         """)
 
+        # Index for change detection: the latest hash per entity is found
+        # without reading raw_payload, which is only decoded on a change
+        await self._db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_source_assets_latest_hash
+            ON source_assets(source_type, external_id, fetched_at DESC, payload_hash)
+        """)
+
         # Index for finding assets with changes
         await self._db.execute("""
             CREATE INDEX IF NOT EXISTS idx_source_assets_changes
@@ -105,32 +274,319 @@ class SourceAssetStore:
         """)
 
         await self._db.commit()
+        await self._backfill_payload_hashes()
         logger.info(f"SourceAssetStore initialized at {self.db_path}")
 
+    async def _backfill_payload_hashes(self, batch_size: int = 500) -> None:
+        """Hash rows saved before payload_hash existed (one-time, batched)."""
+        while True:
+            cursor = await self._db.execute(
+                """SELECT id, raw_payload FROM source_assets
+                   WHERE payload_hash IS NULL
+                   LIMIT ?""",
+                (batch_size,),
+            )
+            rows = await cursor.fetchall()
+            if not rows:
+                return
+            # Rows without a hash predate delta encoding, so they are full
+            await self._db.executemany(
+                "UPDATE source_assets SET payload_hash = ? WHERE id = ?",
+                [(payload_hash(json.loads(row[1])), row[0]) for row in rows],
+            )
+            await self._db.commit()
+
+    # =========================================================================
+    # DELTA ENCODING
+    # =========================================================================
+
+    async def _load_payload(self, asset_id: int) -> Dict[str, Any]:
+        """Reconstruct a snapshot by applying its delta chain to the keyframe."""
+        cursor = await self._db.execute(
+            """WITH RECURSIVE chain(id, base_id, encoding, raw_payload, depth) AS (
+                   SELECT id, base_id, encoding, raw_payload, 0
+                   FROM source_assets WHERE id = ?
+                   UNION ALL
+                   SELECT s.id, s.base_id, s.encoding, s.raw_payload, chain.depth + 1
+                   FROM source_assets s JOIN chain ON s.id = chain.base_id
+                   WHERE chain.encoding = 'delta'
+               )
+               SELECT encoding, raw_payload FROM chain ORDER BY depth DESC""",
+            (asset_id,),
+        )
+        rows = await cursor.fetchall()
+        if not rows or rows[0][0] != ENCODING_FULL:
+            raise ValueError(f"Snapshot {asset_id} has no keyframe")
+
+        payload = json.loads(rows[0][1])
+        for row in rows[1:]:
+            payload = apply_payload_delta(payload, json.loads(row[1]))
+        return payload
+
+    async def _decode_payload(self, row) -> Dict[str, Any]:
+        """Full payload for a row selected with id, encoding, raw_payload."""
+        if row["encoding"] == ENCODING_FULL:
+            return json.loads(row["raw_payload"])
+        return await self._load_payload(row["id"])
+
+    async def _latest_row(self, source_type: str, external_id: str):
+        cursor = await self._db.execute(
+            """SELECT id, payload_hash, chain_length FROM source_assets
+               WHERE source_type = ? AND external_id = ?
+               ORDER BY fetched_at DESC
+               LIMIT 1""",
+            (source_type, external_id),
+        )
+        return await cursor.fetchone()
+
+    async def _load_latest_snapshots(
+        self,
+        source_type: str,
+        external_ids: Sequence[str],
+    ) -> Dict[str, _LatestSnapshot]:
+        """
+        Latest row per external_id with reconstructed payloads.
+
+        One query per LOOKUP_CHUNK_SIZE ids: the latest rows and their delta
+        chains are fetched together by a recursive CTE.
+        """
+        ids = list(dict.fromkeys(external_ids))
+        chains: Dict[str, List[Any]] = {}
+        for start in range(0, len(ids), LOOKUP_CHUNK_SIZE):
+            chunk = ids[start:start + LOOKUP_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            cursor = await self._db.execute(
+                f"""WITH RECURSIVE latest AS (
+                       SELECT id FROM (
+                           SELECT id, ROW_NUMBER() OVER (
+                               PARTITION BY external_id ORDER BY fetched_at DESC
+                           ) AS position
+                           FROM source_assets
+                           WHERE source_type = ? AND external_id IN ({placeholders})
+                       ) WHERE position = 1
+                   ),
+                   chain(root_id, id, base_id, encoding, raw_payload, depth) AS (
+                       SELECT s.id, s.id, s.base_id, s.encoding, s.raw_payload, 0
+                       FROM source_assets s JOIN latest ON s.id = latest.id
+                       UNION ALL
+                       SELECT chain.root_id, s.id, s.base_id, s.encoding, s.raw_payload,
+                              chain.depth + 1
+                       FROM source_assets s JOIN chain ON s.id = chain.base_id
+                       WHERE chain.encoding = 'delta'
+                   )
+                   SELECT a.external_id, a.id, a.payload_hash, a.chain_length,
+                          chain.encoding, chain.raw_payload
+                   FROM chain JOIN source_assets a ON a.id = chain.root_id
+                   ORDER BY chain.root_id, chain.depth DESC""",
+                (source_type, *chunk),
+            )
+            for row in await cursor.fetchall():
+                chains.setdefault(row[0], []).append(row)
+
+        latest: Dict[str, _LatestSnapshot] = {}
+        for external_id, rows in chains.items():
+            if rows[0]["encoding"] != ENCODING_FULL:
+                raise ValueError(f"Snapshot {rows[0]['id']} has no keyframe")
+            payload = json.loads(rows[0]["raw_payload"])
+            for row in rows[1:]:
+                payload = apply_payload_delta(payload, json.loads(row["raw_payload"]))
+            latest[external_id] = _LatestSnapshot(
+                id=rows[0]["id"],
+                payload_hash=rows[0]["payload_hash"],
+                chain_length=rows[0]["chain_length"],
+                payload=payload,
+            )
+        return latest
+
+    def _encode_snapshot(
+        self,
+        asset: SourceAsset,
+        base_id: Optional[int],
+        base_payload: Optional[Dict[str, Any]],
+        base_chain_length: int,
+    ) -> tuple:
+        """INSERT parameters storing asset as a delta against base_payload, or as a keyframe."""
+        asset.payload_hash = payload_hash(asset.raw_payload)
+        chain_length = base_chain_length + 1
+        if base_payload is None or chain_length >= self.keyframe_interval:
+            encoding, stored, base_id, chain_length = (
+                ENCODING_FULL, asset.raw_payload, None, 0
+            )
+        else:
+            encoding, stored = ENCODING_DELTA, diff_payloads(base_payload, asset.raw_payload)
+
+        return (
+            asset.source_type,
+            asset.external_id,
+            json.dumps(stored, default=str),  # same encoding payload_hash() uses
+            asset.fetched_at.isoformat(),
+            asset.change_detected,
+            asset.payload_hash,
+            encoding,
+            base_id,
+            chain_length,
+        )
+
+    async def _insert_snapshot(
+        self,
+        asset: SourceAsset,
+        base_id: Optional[int],
+        base_payload: Optional[Dict[str, Any]],
+        base_chain_length: int,
+    ) -> int:
+        """Insert asset as a delta against base_payload, or as a keyframe."""
+        cursor = await self._db.execute(
+            _INSERT_SNAPSHOT_SQL,
+            self._encode_snapshot(asset, base_id, base_payload, base_chain_length),
+        )
+        await self._db.commit()
+        return cursor.lastrowid
+
+    async def compact_snapshots(self, keyframe_interval: Optional[int] = None) -> int:
+        """
+        Re-encode entities whose history is not in canonical keyframe form.
+
+        An entity is rewritten when a delta chain has grown to the interval
+        or longer (e.g. after lowering keyframe_interval), or when it has
+        more keyframes than the interval calls for (rows saved before delta
+        encoding). Each entity's snapshots are re-encoded in fetch order: a
+        keyframe every keyframe_interval rows, deltas in between.
+
+        Args:
+            keyframe_interval: Interval to compact to (default: the store's).
+
+        Returns:
+            Number of entities rewritten.
+        """
+        interval = max(1, keyframe_interval or self.keyframe_interval)
+        cursor = await self._db.execute(
+            """SELECT source_type, external_id FROM source_assets
+               GROUP BY source_type, external_id
+               HAVING MAX(chain_length) >= ?
+                   OR SUM(encoding = 'full') > (COUNT(*) + ? - 1) / ?""",
+            (interval, interval, interval),
+        )
+        entities = await cursor.fetchall()
+
+        for source_type, external_id in entities:
+            cursor = await self._db.execute(
+                """SELECT id, encoding, raw_payload FROM source_assets
+                   WHERE source_type = ? AND external_id = ?
+                   ORDER BY fetched_at, id""",
+                (source_type, external_id),
+            )
+            rows = await cursor.fetchall()
+            payloads = [await self._decode_payload(row) for row in rows]
+
+            updates = []
+            for position, (row, payload) in enumerate(zip(rows, payloads)):
+                chain_length = position % interval
+                if chain_length == 0:
+                    updates.append(
+                        (ENCODING_FULL, json.dumps(payload), None, 0, row["id"])
+                    )
+                else:
+                    delta = diff_payloads(payloads[position - 1], payload)
+                    updates.append(
+                        (ENCODING_DELTA, json.dumps(delta), rows[position - 1]["id"],
+                         chain_length, row["id"])
+                    )
+            await self._db.executemany(
+                """UPDATE source_assets
+                   SET encoding = ?, raw_payload = ?, base_id = ?, chain_length = ?
+                   WHERE id = ?""",
+                updates,
+            )
+            await self._db.commit()
+
+        if entities:
+            logger.info(f"Compacted snapshot chains for {len(entities)} entities")
+        return len(entities)
+
     async def save_asset(self, asset: SourceAsset) -> int:
         """
         Save a source asset.
 
+        Stored as a delta against the entity's latest snapshot unless a
+        keyframe is due.
+
         Args:
             asset: SourceAsset to save.
 
         Returns:
             Database ID of the saved asset.
         """
-        cursor = await self._db.execute(
-            """INSERT INTO source_assets
-               (source_type, external_id, raw_payload, fetched_at, change_detected)
-               VALUES (?, ?, ?, ?, ?)""",
-            (
-                asset.source_type,
-                asset.external_id,
-                json.dumps(asset.raw_payload),
-                asset.fetched_at.isoformat(),
-                asset.change_detected,
+        latest = await self._latest_row(asset.source_type, asset.external_id)
+        if not latest:
+            return await self._insert_snapshot(asset, None, None, 0)
+        return await self._insert_snapshot(
+            asset, latest["id"], await self._load_payload(latest["id"]), latest["chain_length"]
+        )
+
+    async def record_snapshot(
+        self,
+        source_type: str,
+        external_id: str,
+        raw_payload: Dict[str, Any],
+        fetched_at: Optional[datetime] = None,
+        change_detected: Optional[bool] = None,
+    ) -> SnapshotWrite:
+        """
+        Save a snapshot only if its payload changed.
+
+        Compares the payload's hash with the latest snapshot's hash. If they
+        match, only that row's fetched_at is updated; otherwise a new row is
+        inserted (as a delta when possible) with change_detected set when a
+        previous snapshot existed, and the field-level changes are returned.
+
+        Args:
+            source_type: Type of source (github_repo, etc.)
+            external_id: Source-specific identifier.
+            raw_payload: Current payload.
+            fetched_at: When it was fetched (default: now, UTC).
+            change_detected: Flag for a newly inserted row (default: True
+                when a previous snapshot existed). For callers with their
+                own notion of a significant change.
+
+        Returns:
+            SnapshotWrite describing what happened.
+        """
+        fetched_at = fetched_at or datetime.utcnow()
+        digest = payload_hash(raw_payload)
+
+        latest = await self._latest_row(source_type, external_id)
+
+        if latest and latest["payload_hash"] == digest:
+            await self._db.execute(
+                "UPDATE source_assets SET fetched_at = ? WHERE id = ?",
+                (fetched_at.isoformat(), latest["id"]),
+            )
+            await self._db.commit()
+            return SnapshotWrite(asset_id=latest["id"], is_new=False, changed=False)
+
+        asset = SourceAsset(
+            source_type=source_type,
+            external_id=external_id,
+            raw_payload=raw_payload,
+            fetched_at=fetched_at,
+            change_detected=(
+                latest is not None if change_detected is None else change_detected
             ),
         )
-        await self._db.commit()
-        return cursor.lastrowid
+        if not latest:
+            asset_id = await self._insert_snapshot(asset, None, None, 0)
+            return SnapshotWrite(asset_id=asset_id, is_new=True, changed=False)
+
+        previous = await self._load_payload(latest["id"])
+        asset_id = await self._insert_snapshot(
+            asset, latest["id"], previous, latest["chain_length"]
+        )
+        return SnapshotWrite(
+            asset_id=asset_id,
+            is_new=False,
+            changed=True,
+            changes=field_changes(previous, raw_payload),
+        )
 
     async def get_asset(self, asset_id: int) -> Optional[SourceAsset]:
         """
@@ -148,7 +604,7 @@ class SourceAssetStore:
         row = await cursor.fetchone()
         if not row:
             return None
-        return self._row_to_asset(row)
+        return self._row_to_asset(row, await self._decode_payload(row))
 
     async def get_previous_snapshot(
         self,
@@ -168,7 +624,7 @@ class SourceAssetStore:
             Raw payload of previous snapshot, or None if no previous.
         """
         cursor = await self._db.execute(
-            """SELECT raw_payload FROM source_assets
+            """SELECT id, encoding, raw_payload FROM source_assets
                WHERE source_type = ? AND external_id = ?
                ORDER BY fetched_at DESC
                LIMIT 1 OFFSET 1""",
@@ -177,7 +633,7 @@ class SourceAssetStore:
         row = await cursor.fetchone()
         if not row:
             return None
-        return json.loads(row[0])
+        return await self._decode_payload(row)
 
     async def get_latest_snapshot(
         self,
@@ -195,7 +651,7 @@ class SourceAssetStore:
             Raw payload of latest snapshot, or None if none exists.
         """
         cursor = await self._db.execute(
-            """SELECT raw_payload FROM source_assets
+            """SELECT id, encoding, raw_payload FROM source_assets
                WHERE source_type = ? AND external_id = ?
                ORDER BY fetched_at DESC
                LIMIT 1""",
@@ -204,7 +660,40 @@ class SourceAssetStore:
         row = await cursor.fetchone()
         if not row:
             return None
-        return json.loads(row[0])
+        return await self._decode_payload(row)
+
+    async def get_latest_snapshots(
+        self,
+        source_type: str,
+        external_ids: Sequence[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the most recent snapshot for many entities at once.
+
+        Args:
+            source_type: Type of source.
+            external_ids: Source-specific identifiers.
+
+        Returns:
+            Dict mapping external_id to its latest raw payload; ids without
+            a snapshot are absent.
+        """
+        latest = await self._load_latest_snapshots(source_type, external_ids)
+        return {external_id: snapshot.payload for external_id, snapshot in latest.items()}
+
+    def buffered_writer(
+        self,
+        max_rows: int = WRITE_BUFFER_ROWS,
+        max_delay_ms: int = WRITE_BUFFER_DELAY_MS,
+    ) -> "BufferedSnapshotWriter":
+        """
+        Create a writer that group-commits record_snapshot() writes.
+
+        Args:
+            max_rows: Flush once this many writes are pending.
+            max_delay_ms: Flush this long after the first pending write.
+        """
+        return BufferedSnapshotWriter(self, max_rows=max_rows, max_delay_ms=max_delay_ms)
 
     async def get_assets_with_changes(
         self,
@@ -239,7 +728,7 @@ class SourceAssetStore:
             )
 
         rows = await cursor.fetchall()
-        return [self._row_to_asset(row) for row in rows]
+        return [self._row_to_asset(row, await self._decode_payload(row)) for row in rows]
 
     async def count_by_source_type(self) -> Dict[str, int]:
         """
@@ -279,16 +768,17 @@ class SourceAssetStore:
         row = await cursor.fetchone()
         return row[0]
 
-    def _row_to_asset(self, row) -> SourceAsset:
-        """Convert database row to SourceAsset."""
+    def _row_to_asset(self, row, raw_payload: Dict[str, Any]) -> SourceAsset:
+        """Convert database row and its reconstructed payload to SourceAsset."""
         return SourceAsset(
             id=row[0],
             source_type=row[1],
             external_id=row[2],
-            raw_payload=json.loads(row[3]),
+            raw_payload=raw_payload,
             fetched_at=datetime.fromisoformat(row[4]),
             change_detected=bool(row[5]),
             created_at=datetime.fromisoformat(row[6]) if row[6] else None,
+            payload_hash=row[7],
         )
 
     async def close(self) -> None:
@@ -296,3 +786,163 @@ class SourceAssetStore:
         if self._db:
             await self._db.close()
             self._db = None
+
+
+class BufferedSnapshotWriter:
+    """
+    Group-committing front end for SourceAssetStore.record_snapshot().
+
+    Writes are queued and committed together once max_rows are pending,
+    max_delay_ms after the first of them was queued, or when the writer is
+    closed. Snapshots loaded with prefetch() let record_snapshot() decide
+    without a query per entity.
+
+    Usage:
+        async with store.buffered_writer() as writer:
+            previous = await writer.prefetch("github_repo", names)
+            for name, payload in repos.items():
+                result = await writer.record_snapshot("github_repo", name, payload)
+    """
+
+    def __init__(self, store: SourceAssetStore, max_rows: int, max_delay_ms: int):
+        self._store = store
+        self.max_rows = max(1, max_rows)
+        self.max_delay = max(0, max_delay_ms) / 1000
+        self._latest: Dict[Tuple[str, str], Optional[_LatestSnapshot]] = {}
+        self._inserts: List[tuple] = []
+        self._touches: List[tuple] = []
+        self._pending_keys: Set[Tuple[str, str]] = set()
+        self._lock = asyncio.Lock()
+        self._timer: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "BufferedSnapshotWriter":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    @property
+    def pending(self) -> int:
+        """Number of queued writes not yet committed."""
+        return len(self._inserts) + len(self._touches)
+
+    async def prefetch(
+        self,
+        source_type: str,
+        external_ids: Sequence[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the latest snapshots for external_ids in one batched lookup.
+
+        Returns:
+            Same as SourceAssetStore.get_latest_snapshots().
+        """
+        latest = await self._store._load_latest_snapshots(source_type, external_ids)
+        for external_id in external_ids:
+            self._latest[(source_type, external_id)] = latest.get(external_id)
+        return {external_id: snapshot.payload for external_id, snapshot in latest.items()}
+
+    async def record_snapshot(
+        self,
+        source_type: str,
+        external_id: str,
+        raw_payload: Dict[str, Any],
+        fetched_at: Optional[datetime] = None,
+        change_detected: Optional[bool] = None,
+    ) -> SnapshotWrite:
+        """
+        Queue a snapshot; same semantics as SourceAssetStore.record_snapshot().
+
+        Inserted rows get their ids on flush, so asset_id is None for them.
+        """
+        key = (source_type, external_id)
+        if key in self._pending_keys:
+            # The delta base would be an unflushed row
+            await self.flush()
+        if key not in self._latest:
+            found = await self._store._load_latest_snapshots(source_type, [external_id])
+            self._latest[key] = found.get(external_id)
+
+        fetched_at = fetched_at or datetime.utcnow()
+        latest = self._latest[key]
+
+        async with self._lock:
+            if latest and latest.payload_hash == payload_hash(raw_payload):
+                self._touches.append((fetched_at.isoformat(), latest.id))
+                result = SnapshotWrite(asset_id=latest.id, is_new=False, changed=False)
+            else:
+                asset = SourceAsset(
+                    source_type=source_type,
+                    external_id=external_id,
+                    raw_payload=raw_payload,
+                    fetched_at=fetched_at,
+                    change_detected=(
+                        latest is not None if change_detected is None else change_detected
+                    ),
+                )
+                if latest:
+                    params = self._store._encode_snapshot(
+                        asset, latest.id, latest.payload, latest.chain_length
+                    )
+                else:
+                    params = self._store._encode_snapshot(asset, None, None, 0)
+                self._inserts.append(params)
+                self._pending_keys.add(key)
+                del self._latest[key]
+                result = SnapshotWrite(
+                    asset_id=None,
+                    is_new=latest is None,
+                    changed=latest is not None,
+                    changes=field_changes(latest.payload, raw_payload) if latest else [],
+                )
+
+        if self.pending >= self.max_rows:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+        return result
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.max_delay)
+        self._timer = None
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"Buffered snapshot flush failed: {e}")
+
+    async def flush(self) -> int:
+        """
+        Commit all queued writes in one transaction.
+
+        Returns:
+            Number of writes committed.
+        """
+        async with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self.pending:
+                return 0
+
+            db = self._store._db
+            try:
+                if self._inserts:
+                    await db.executemany(_INSERT_SNAPSHOT_SQL, self._inserts)
+                if self._touches:
+                    await db.executemany(
+                        "UPDATE source_assets SET fetched_at = ? WHERE id = ?",
+                        self._touches,
+                    )
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+
+            flushed = self.pending
+            self._inserts, self._touches = [], []
+            self._pending_keys.clear()
+            return flushed
+
+    async def close(self) -> None:
+        """Flush remaining writes."""
+        await self.flush()
@@ -0,0 +1,173 @@
+"""Tests for the shared ConnectionManager."""
+import asyncio
+
+import pytest
+
+from storage.connection_manager import ConnectionManager
+from storage.entity_resolution import AssetToLead, EntityResolutionStore, ResolutionMethod
+from storage.founder_store import FounderStore
+from storage.signal_store import SignalStore
+
+
+@pytest.fixture
+async def shared():
+    """SignalStore, EntityResolutionStore and FounderStore on one connection."""
+    conn = ConnectionManager(":memory:")
+    await conn.initialize()
+
+    signals = SignalStore(connection=conn)
+    links = EntityResolutionStore(connection=conn)
+    founders = FounderStore(connection=conn)
+    for store in (signals, links, founders):
+        await store.initialize()
+
+    yield conn, signals, links
+    await conn.close()
+
+
+def _link(canonical_key: str) -> AssetToLead:
+    return AssetToLead(
+        asset_id=1,
+        asset_source_type="github_repo",
+        asset_external_id="startup/app",
+        lead_canonical_key=canonical_key,
+        confidence=0.9,
+        resolved_by=ResolutionMethod.DOMAIN_MATCH,
+    )
+
+
+async def _save(signals: SignalStore, canonical_key: str) -> int:
+    return await signals.save_signal(
+        signal_type="github_spike",
+        source_api="github",
+        canonical_key=canonical_key,
+        confidence=0.8,
+        raw_data={},
+    )
+
+
+class TestSharedConnection:
+    """Stores built on one ConnectionManager."""
+
+    async def test_stores_share_one_writer(self, shared):
+        """Every store should use the manager's connection."""
+        conn, signals, links = shared
+
+        assert signals._db is conn.connection
+        assert links._db is conn.connection
+
+    async def test_cross_store_commit(self, shared):
+        """Writes from two stores in one transaction should both commit."""
+        conn, signals, links = shared
+
+        async with conn.transaction():
+            signal_id = await _save(signals, "domain:startup.com")
+            await links.create_link(_link("domain:startup.com"))
+
+        assert await signals.get_signal(signal_id) is not None
+        assert await links.get_lead_for_asset("github_repo", "startup/app") == "domain:startup.com"
+
+    async def test_cross_store_rollback(self, shared):
+        """A failure after both writes should roll back both."""
+        conn, signals, links = shared
+
+        with pytest.raises(ValueError):
+            async with conn.transaction():
+                await _save(signals, "domain:startup.com")
+                await links.create_link(_link("domain:startup.com"))
+                raise ValueError("boom")
+
+        assert not await signals.is_duplicate("domain:startup.com")
+        assert await links.get_lead_for_asset("github_repo", "startup/app") is None
+
+    async def test_nested_failure_rolls_back_savepoint_only(self, shared):
+        """An inner transaction that fails should not undo the outer one."""
+        conn, signals, _ = shared
+
+        async with conn.transaction():
+            await _save(signals, "domain:kept.com")
+            with pytest.raises(ValueError):
+                async with signals.transaction() as db:
+                    await db.execute("DELETE FROM signal_processing")
+                    raise ValueError("boom")
+
+        assert await signals.get_processing_stats() == {"pending": 1}
+
+    async def test_closing_store_keeps_shared_connection(self, shared):
+        """A store that doesn't own the manager should leave it open."""
+        conn, signals, _ = shared
+
+        await signals.close()
+
+        assert conn.connection is not None
+
+
+class TestLockTimeout:
+    """Bounded waits on the write lock."""
+
+    async def test_lock_wait_times_out(self):
+        """A second task should give up after lock_timeout seconds."""
+        conn = ConnectionManager(":memory:", lock_timeout=0.05)
+        await conn.initialize()
+        try:
+            held = asyncio.Event()
+            release = asyncio.Event()
+
+            async def hold_lock():
+                async with conn.transaction():
+                    held.set()
+                    await release.wait()
+
+            holder = asyncio.create_task(hold_lock())
+            await held.wait()
+
+            with pytest.raises(TimeoutError):
+                async with conn.transaction():
+                    pass
+
+            release.set()
+            await holder
+        finally:
+            await conn.close()
+
+
+class TestReaderIsolation:
+    """Non-WAL reads through the shared writer connection."""
+
+    async def test_reader_waits_for_other_tasks_transaction(self, shared):
+        """Another task's uncommitted rows should never be visible to a read."""
+        conn, signals, _ = shared
+        written = asyncio.Event()
+        release = asyncio.Event()
+
+        async def write_then_roll_back():
+            with pytest.raises(RuntimeError):
+                async with conn.transaction():
+                    await _save(signals, "domain:ghost.ai")
+                    written.set()
+                    await release.wait()
+                    raise RuntimeError("rolled back")
+
+        writer = asyncio.create_task(write_then_roll_back())
+        await written.wait()
+
+        read = asyncio.create_task(signals.is_duplicate("domain:ghost.ai"))
+        await asyncio.sleep(0.01)
+        assert not read.done()  # Blocked until the transaction ends
+
+        release.set()
+        await writer
+        assert await read is False
+
+    async def test_reads_and_writes_nest_in_one_task(self, shared):
+        """The lock holder reads its own writes and may write inside a read."""
+        conn, signals, _ = shared
+
+        async with conn.transaction():
+            await _save(signals, "domain:mine.ai")
+            assert await signals.is_duplicate("domain:mine.ai")
+
+        async with conn.reader():
+            await _save(signals, "domain:nested.ai")
+
+        assert await signals.is_duplicate("domain:nested.ai")
@@ -0,0 +1,132 @@
+"""Tests for streaming NDJSON export/import in storage/migrations.py."""
+import gzip
+import json
+
+import pytest
+from datetime import datetime, timezone
+
+from storage.migrations import export_ndjson, import_ndjson, is_ndjson_path
+from storage.signal_store import SignalStore
+
+
+async def _seed(db_path: str, count: int, prefix: str = "co") -> None:
+    store = SignalStore(db_path)
+    await store.initialize()
+    try:
+        results = await store.save_signals_batch([
+            {
+                "signal_type": "github_spike",
+                "source_api": "github",
+                "canonical_key": f"domain:{prefix}{i}.ai",
+                "company_name": f"Co {i}",
+                "confidence": 0.8,
+                "raw_data": {"stars": i, "readme": "x" * 400},
+                "detected_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+            }
+            for i in range(count)
+        ])
+        await store.mark_rejected_many([results[0].signal_id], "too small")
+    finally:
+        await store.close()
+
+
+class TestNdjsonRoundTrip:
+    """export_ndjson followed by import_ndjson."""
+
+    @pytest.mark.parametrize("suffix", [".ndjson", ".ndjson.gz"])
+    async def test_round_trip(self, tmp_path, suffix):
+        """Every row should survive, with batches smaller than the table."""
+        source = str(tmp_path / "source.db")
+        target = str(tmp_path / "target.db")
+        backup = str(tmp_path / f"backup{suffix}")
+        await _seed(source, 25)
+
+        exported = await export_ndjson(source, backup, batch_size=10)
+        imported = await import_ndjson(backup, target, batch_size=10)
+
+        assert exported == imported == {
+            "signals": 25, "signal_processing": 25, "suppression_cache": 0,
+        }
+
+        store = SignalStore(target)
+        await store.initialize()
+        try:
+            signal = (await store.get_signals_for_company("domain:co3.ai"))[0]
+            assert signal.raw_data == {"stars": 3, "readme": "x" * 400}
+            assert await store.get_processing_stats() == {"pending": 24, "rejected": 1}
+            stats = await store.get_company_signal_stats(["domain:co3.ai"])
+            assert stats["domain:co3.ai"].total_signals == 1
+        finally:
+            await store.close()
+
+    async def test_gzip_output_is_compressed_ndjson(self, tmp_path):
+        """.gz exports should be gzip files with one JSON object per line."""
+        source = str(tmp_path / "source.db")
+        backup = str(tmp_path / "backup.ndjson.gz")
+        await _seed(source, 3)
+
+        await export_ndjson(source, backup)
+
+        with gzip.open(backup, "rt") as f:
+            records = [json.loads(line) for line in f]
+        assert records[0]["type"] == "header"
+        assert [r["table"] for r in records[1:4]] == ["signals"] * 3
+
+    async def test_import_into_non_empty_db_shifts_ids(self, tmp_path):
+        """Imported ids should not collide with existing rows."""
+        source = str(tmp_path / "source.db")
+        target = str(tmp_path / "target.db")
+        backup = str(tmp_path / "backup.ndjson")
+        await _seed(source, 3)
+        await _seed(target, 3, prefix="other")
+        await export_ndjson(source, backup)
+
+        await import_ndjson(backup, target)
+
+        store = SignalStore(target)
+        await store.initialize()
+        try:
+            assert (await store.get_stats())["total_signals"] == 6
+            assert await store.get_processing_stats() == {"pending": 4, "rejected": 2}
+        finally:
+            await store.close()
+
+    async def test_import_skips_archived_ids(self, tmp_path):
+        """Imported ids should clear archived ones, so archiving never overwrites."""
+        source = str(tmp_path / "source.db")
+        target = str(tmp_path / "target.db")
+        archive = str(tmp_path / "archive.db")
+        backup = str(tmp_path / "backup.ndjson")
+        await _seed(source, 3)
+        await export_ndjson(source, backup)
+
+        # Every target signal archived: the hot table is empty
+        await _seed(target, 3, prefix="old")
+        store = SignalStore(target, archive_path=archive)
+        await store.initialize()
+        try:
+            await store.mark_rejected_many([1, 2, 3], "old")
+            assert await store.archive_signals(older_than_days=-1) == 3
+        finally:
+            await store.close()
+
+        await import_ndjson(backup, target, archive_path=archive)
+
+        store = SignalStore(target, archive_path=archive)
+        await store.initialize()
+        try:
+            await store.mark_rejected_many([4, 5, 6], "imported")
+            assert await store.archive_signals(older_than_days=-1) == 3
+
+            ids = []
+            for key in ["domain:old0.ai", "domain:old1.ai", "domain:co0.ai", "domain:co1.ai"]:
+                ids += [s.id for s in await store.get_signals_for_company(key, include_archive=True)]
+            assert sorted(ids) == [1, 2, 4, 5]
+        finally:
+            await store.close()
+
+    def test_is_ndjson_path(self):
+        """Only NDJSON suffixes select the streaming format."""
+        assert is_ndjson_path("backup.ndjson.gz")
+        assert is_ndjson_path("backup.jsonl")
+        assert not is_ndjson_path("backup.json")
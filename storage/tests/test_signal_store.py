@@ -0,0 +1,776 @@
+"""Tests for SignalStore batch and set-oriented operations."""
+import asyncio
+import json
+
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from storage.signal_store import SignalStore, SuppressionEntry
+
+
+def _signal(canonical_key: str, **overrides):
+    signal = {
+        "signal_type": "github_spike",
+        "source_api": "github",
+        "canonical_key": canonical_key,
+        "company_name": canonical_key.split(":")[-1],
+        "confidence": 0.8,
+        "raw_data": {"repo": canonical_key},
+        "detected_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+    }
+    signal.update(overrides)
+    return signal
+
+
+@pytest.fixture
+async def store():
+    store = SignalStore(":memory:")
+    await store.initialize()
+    yield store
+    await store.close()
+
+
+class TestSaveSignalsBatch:
+    """Tests for SignalStore.save_signals_batch."""
+
+    async def test_saves_all_new_signals(self, store):
+        """Should insert signals and pending processing rows in one call."""
+        results = await store.save_signals_batch([
+            _signal("domain:a.ai"),
+            _signal("domain:b.ai"),
+            _signal("domain:c.ai"),
+        ])
+
+        assert [r.status for r in results] == ["saved", "saved", "saved"]
+        assert len({r.signal_id for r in results}) == 3
+
+        for result in results:
+            stored = await store.get_signal(result.signal_id)
+            assert stored.canonical_key == result.canonical_key
+            assert stored.processing_status == "pending"
+
+        stats = await store.get_processing_stats()
+        assert stats == {"pending": 3}
+
+    async def test_reports_duplicates_and_suppressed(self, store):
+        """Should skip stored keys, repeated keys and suppressed keys."""
+        await store.save_signal(**_signal("domain:existing.ai"))
+        await store.update_suppression_cache([
+            SuppressionEntry(
+                canonical_key="domain:notion.ai",
+                notion_page_id="page-1",
+                status="Source",
+            )
+        ])
+
+        results = await store.save_signals_batch([
+            _signal("domain:existing.ai"),
+            _signal("domain:new.ai"),
+            _signal("domain:new.ai", signal_type="job_posting"),
+            _signal("domain:notion.ai"),
+        ])
+
+        assert [r.status for r in results] == [
+            "duplicate", "saved", "duplicate", "suppressed"
+        ]
+        assert results[1].signal_id is not None
+        assert results[3].suppression.notion_page_id == "page-1"
+        assert (await store.get_stats())["total_signals"] == 2
+
+    async def test_empty_batch(self, store):
+        """Should return an empty list without touching the database."""
+        assert await store.save_signals_batch([]) == []
+
+
+class TestSetLookups:
+    """Tests for existing_keys / suppression_for."""
+
+    async def test_existing_keys(self, store):
+        """Should return only keys that have stored signals."""
+        await store.save_signals_batch([_signal("domain:a.ai"), _signal("domain:b.ai")])
+
+        found = await store.existing_keys(["domain:a.ai", "domain:b.ai", "domain:c.ai"])
+
+        assert found == {"domain:a.ai", "domain:b.ai"}
+        assert await store.existing_keys([]) == set()
+
+    async def test_existing_keys_spans_chunks(self, store):
+        """Should handle more keys than fit in one IN (...) list."""
+        keys = [f"domain:co{i}.ai" for i in range(1200)]
+        await store.save_signals_batch([_signal(key) for key in keys[::2]])
+
+        found = await store.existing_keys(keys)
+
+        assert found == set(keys[::2])
+
+    async def test_suppression_for_skips_expired(self, store):
+        """Should return live entries only, keyed by canonical key."""
+        now = datetime.now(timezone.utc)
+        await store.update_suppression_cache([
+            SuppressionEntry(
+                canonical_key="domain:live.ai",
+                notion_page_id="page-live",
+                status="Source",
+            ),
+            SuppressionEntry(
+                canonical_key="domain:expired.ai",
+                notion_page_id="page-expired",
+                status="Source",
+                expires_at=now - timedelta(days=1),
+            ),
+        ])
+
+        entries = await store.suppression_for(
+            ["domain:live.ai", "domain:expired.ai", "domain:unknown.ai"]
+        )
+
+        assert list(entries) == ["domain:live.ai"]
+        assert entries["domain:live.ai"].notion_page_id == "page-live"
+
+
+class TestEnrichmentCache:
+    """Tests for get_enriched / save_enriched."""
+
+    async def test_round_trip_per_source(self, store):
+        """Should return saved data for known keys of the same source only."""
+        assert await store.save_enriched("sec_form_d", {
+            "0001-24-000001": {"offering_amount": 1500000.0, "sic_code": "7372"},
+            "0001-24-000002": {"offering_amount": None},
+        }) == 2
+
+        found = await store.get_enriched(
+            "sec_form_d", ["0001-24-000001", "0001-24-000002", "0001-24-000003"]
+        )
+
+        assert found == {
+            "0001-24-000001": {"offering_amount": 1500000.0, "sic_code": "7372"},
+            "0001-24-000002": {"offering_amount": None},
+        }
+        assert await store.get_enriched("other", ["0001-24-000001"]) == {}
+
+    async def test_save_overwrites(self, store):
+        """Re-saving an item should replace its data."""
+        await store.save_enriched("sec_form_d", {"a": {"state": "CA"}})
+        await store.save_enriched("sec_form_d", {"a": {"state": "NY"}})
+
+        assert await store.get_enriched("sec_form_d", ["a"]) == {"a": {"state": "NY"}}
+        assert await store.save_enriched("sec_form_d", {}) == 0
+
+
+class TestWatermarks:
+    """Tests for get_watermark / set_watermark."""
+
+    async def test_set_and_get(self, store):
+        """Should return None until set, then the saved UTC time."""
+        assert await store.get_watermark("arxiv") is None
+
+        when = datetime(2024, 6, 1, 12, 30, tzinfo=timezone.utc)
+        assert await store.set_watermark("arxiv", when) is True
+
+        assert await store.get_watermark("arxiv") == when
+        assert await store.get_watermark("uspto") is None
+
+    async def test_never_moves_backwards(self, store):
+        """An older watermark should be ignored; naive times are UTC."""
+        newer = datetime(2024, 6, 2, tzinfo=timezone.utc)
+        await store.set_watermark("sec_edgar", newer)
+
+        assert await store.set_watermark("sec_edgar", datetime(2024, 6, 1)) is False
+        assert await store.get_watermark("sec_edgar") == newer
+
+        assert await store.set_watermark("sec_edgar", datetime(2024, 6, 3)) is True
+        assert await store.get_watermark("sec_edgar") == datetime(2024, 6, 3, tzinfo=timezone.utc)
+
+
+class TestWalMode:
+    """Tests for opt-in WAL mode and the read connection pool."""
+
+    async def test_wal_mode_uses_read_pool(self, tmp_path):
+        """Reads should go through read-only pooled connections."""
+        store = SignalStore(tmp_path / "wal.db", wal_mode=True, read_pool_size=2)
+        await store.initialize()
+        try:
+            cursor = await store._db.execute("PRAGMA journal_mode")
+            assert (await cursor.fetchone())[0] == "wal"
+
+            await store.save_signals_batch([_signal("domain:a.ai")])
+
+            async with store.reader() as db:
+                assert db is not store._db
+                cursor = await db.execute("SELECT COUNT(*) FROM signals")
+                assert (await cursor.fetchone())[0] == 1
+
+                with pytest.raises(Exception):
+                    await db.execute("DELETE FROM signals")
+
+            assert await store.existing_keys(["domain:a.ai"]) == {"domain:a.ai"}
+        finally:
+            await store.close()
+
+    async def test_reads_do_not_wait_for_writer(self, tmp_path):
+        """A reader should not block while a write transaction is open."""
+        store = SignalStore(tmp_path / "wal.db", wal_mode=True, read_pool_size=1)
+        await store.initialize()
+        try:
+            await store.save_signal(**_signal("domain:a.ai"))
+
+            async with store.transaction() as conn:
+                await conn.execute("DELETE FROM signal_processing")
+                # Writer lock is held; the pooled reader still sees committed data
+                stats = await asyncio.wait_for(store.get_processing_stats(), timeout=1)
+                assert stats == {"pending": 1}
+        finally:
+            await store.close()
+
+    async def test_memory_db_ignores_wal(self):
+        """In-memory stores have no file to share, so reads use the writer."""
+        store = SignalStore(":memory:", wal_mode=True)
+        await store.initialize()
+        try:
+            async with store.reader() as db:
+                assert db is store._db
+        finally:
+            await store.close()
+
+
+class TestIterPendingSignals:
+    """Tests for keyset-paginated iter_pending_signals."""
+
+    async def _seed(self, store, count):
+        base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        await store.save_signals_batch([
+            _signal(f"domain:co{i}.ai", detected_at=base + timedelta(minutes=i % 3))
+            for i in range(count)
+        ])
+
+    async def test_pages_cover_backlog_in_order(self, store):
+        """Should yield every pending signal once, ordered by (detected_at, id)."""
+        await self._seed(store, 7)
+
+        pages = [page async for page in store.iter_pending_signals(page_size=3)]
+
+        assert [len(page) for page in pages] == [3, 3, 1]
+        flat = [s for page in pages for s in page]
+        assert len({s.id for s in flat}) == 7
+        assert [(s.detected_at, s.id) for s in flat] == sorted(
+            (s.detected_at, s.id) for s in flat
+        )
+
+    async def test_marking_processed_does_not_skip_rows(self, store):
+        """Processing a page before fetching the next must not shift the cursor."""
+        await self._seed(store, 5)
+
+        seen = []
+        async for page in store.iter_pending_signals(page_size=2):
+            for signal in page:
+                seen.append(signal.id)
+                await store.mark_rejected(signal.id, "test")
+
+        assert len(seen) == 5
+        assert await store.get_processing_stats() == {"rejected": 5}
+
+    async def test_resume_after_cursor(self, store):
+        """Should return only signals after the given (detected_at, id)."""
+        await self._seed(store, 4)
+        first = [page async for page in store.iter_pending_signals(page_size=2)][0]
+        last = first[-1]
+
+        rest = [
+            s
+            async for page in store.iter_pending_signals(
+                page_size=10, after=(last.detected_at, last.id)
+            )
+            for s in page
+        ]
+
+        assert len(rest) == 2
+        assert not {s.id for s in rest} & {s.id for s in first}
+
+
+class TestEpochColumns:
+    """Tests for the epoch timestamp columns (migration v4)."""
+
+    async def test_saves_write_epoch_columns(self, store):
+        """save_signal and save_signals_batch should fill both epoch columns."""
+        detected = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        await store.save_signal(**_signal("domain:a.ai"))
+        await store.save_signals_batch([_signal("domain:b.ai")])
+
+        cursor = await store._db.execute(
+            "SELECT detected_at_epoch, created_at_epoch FROM signals"
+        )
+        for detected_epoch, created_epoch in await cursor.fetchall():
+            assert detected_epoch == int(detected.timestamp())
+            assert created_epoch > detected_epoch
+
+    async def test_trigger_fills_raw_inserts(self, store):
+        """Inserts that only set ISO columns should still get epochs."""
+        await store._db.execute(
+            """
+            INSERT INTO signals (signal_type, source_api, canonical_key,
+                                 confidence, raw_data, detected_at, created_at)
+            VALUES ('x', 'y', 'domain:raw.ai', 0.5, '{}',
+                    '2026-01-02T03:04:05.123456+00:00', '2026-01-02T03:04:05+00:00')
+            """
+        )
+
+        cursor = await store._db.execute(
+            "SELECT detected_at_epoch, created_at_epoch FROM signals"
+        )
+        expected = int(datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc).timestamp())
+        assert await cursor.fetchone() == (expected, expected)
+
+    async def test_migration_backfills_existing_rows(self, tmp_path):
+        """Upgrading a v3 database should backfill epochs from the ISO columns."""
+        from storage.signal_store import MIGRATIONS
+
+        db_path = tmp_path / "v3.db"
+        store = SignalStore(db_path)
+        await store.connection.initialize()
+        db = store._db
+        for version in (1, 2, 3):
+            await db.executescript(MIGRATIONS[version])
+            await db.execute(
+                "INSERT INTO schema_migrations VALUES (?, '2025-01-01', '')", (version,)
+            )
+        await db.execute(
+            """
+            INSERT INTO signals (signal_type, source_api, canonical_key,
+                                 confidence, raw_data, detected_at, created_at)
+            VALUES ('x', 'y', 'domain:old.ai', 0.5, '{}',
+                    '2025-06-01T12:00:00+02:00', '2025-06-01T10:00:00+00:00')
+            """
+        )
+        await db.commit()
+        await store.close()
+
+        store = SignalStore(db_path)
+        await store.initialize()
+        try:
+            cursor = await store._db.execute(
+                "SELECT detected_at_epoch, created_at_epoch FROM signals"
+            )
+            expected = int(datetime(2025, 6, 1, 10, tzinfo=timezone.utc).timestamp())
+            assert await cursor.fetchone() == (expected, expected)
+        finally:
+            await store.close()
+
+    async def test_get_signals_for_company_since(self, store):
+        """since= should drop signals detected before the cutoff."""
+        base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        await store.save_signal(**_signal("domain:a.ai", detected_at=base))
+        await store.save_signal(
+            **_signal("domain:a.ai", signal_type="job_posting", detected_at=base + timedelta(days=10))
+        )
+
+        recent = await store.get_signals_for_company(
+            "domain:a.ai", since=base + timedelta(days=5)
+        )
+
+        assert [s.signal_type for s in recent] == ["job_posting"]
+        assert len(await store.get_signals_for_company("domain:a.ai")) == 2
+
+
+class TestRawDataEncoding:
+    """Tests for compressed raw_data and lazy StoredSignal decoding."""
+
+    async def test_large_payload_stored_compressed(self, store):
+        """Large payloads should be stored as a marked BLOB and read back intact."""
+        payload = {"description": "x" * 2000, "stars": 42}
+        signal_id = await store.save_signal(**_signal("domain:a.ai", raw_data=payload))
+
+        cursor = await store._db.execute(
+            "SELECT typeof(raw_data), length(raw_data) FROM signals WHERE id = ?",
+            (signal_id,)
+        )
+        kind, size = await cursor.fetchone()
+        assert kind == "blob"
+        assert size < 500
+
+        assert (await store.get_signal(signal_id)).raw_data == payload
+
+    async def test_legacy_text_rows_still_read(self, store):
+        """Rows written before compression (JSON text) should decode unchanged."""
+        signal_id = await store.save_signal(**_signal("domain:a.ai"))
+        await store._db.execute(
+            "UPDATE signals SET raw_data = ? WHERE id = ?",
+            ('{\n  "legacy": true\n}', signal_id)
+        )
+
+        assert (await store.get_signal(signal_id)).raw_data == {"legacy": True}
+
+    async def test_raw_data_decoded_lazily(self, store):
+        """raw_data should stay encoded until first accessed."""
+        signal_id = await store.save_signal(**_signal("domain:a.ai"))
+
+        signal = await store.get_signal(signal_id)
+        assert signal._raw_data is None
+        assert not hasattr(signal, "__dict__")
+
+        assert signal.raw_data == {"repo": "domain:a.ai"}
+        assert signal._raw_encoded is None
+
+    async def test_compact_raw_data(self, store):
+        """compact_raw_data should rewrite large text rows as compressed BLOBs."""
+        payload = {"description": "y" * 2000}
+        await store.save_signal(**_signal("domain:a.ai"))
+        signal_id = await store.save_signal(**_signal("domain:b.ai", raw_data=payload))
+        await store._db.execute(
+            "UPDATE signals SET raw_data = ? WHERE id = ?",
+            (json.dumps(payload, indent=2), signal_id)
+        )
+        await store._db.commit()
+
+        assert await store.compact_raw_data(batch_size=1) == 1
+
+        cursor = await store._db.execute(
+            "SELECT typeof(raw_data) FROM signals WHERE id = ?", (signal_id,)
+        )
+        assert (await cursor.fetchone())[0] == "blob"
+        assert (await store.get_signal(signal_id)).raw_data == payload
+
+
+class TestProcessingStateMany:
+    """Tests for mark_*_many bulk status transitions."""
+
+    async def test_mark_many_variants(self, store):
+        """Each variant should update every listed signal and nothing else."""
+        results = await store.save_signals_batch(
+            [_signal(f"domain:co{i}.ai") for i in range(6)]
+        )
+        ids = [r.signal_id for r in results]
+
+        await store.mark_rejected_many(ids[:2], "too small", metadata={"k": 1})
+        await store.mark_queued_many(ids[2:4], metadata={"outbox_id": 7})
+        await store.mark_pushed_many(ids[4:5], notion_page_id="page-1")
+
+        assert await store.get_processing_stats() == {
+            "rejected": 2, "queued": 2, "pushed": 1, "pending": 1,
+        }
+        rejected = await store.get_signal(ids[0])
+        assert rejected.error_message == "too small"
+        pushed = await store.get_signal(ids[4])
+        assert pushed.notion_page_id == "page-1"
+
+    async def test_mark_many_spans_chunks_and_empty(self, store):
+        """Should handle more ids than one IN list, and no ids at all."""
+        results = await store.save_signals_batch(
+            [_signal(f"domain:co{i}.ai") for i in range(1100)]
+        )
+
+        await store.mark_rejected_many([], "noop")
+        await store.mark_rejected_many([r.signal_id for r in results], "bulk")
+
+        assert await store.get_processing_stats() == {"rejected": 1100}
+
+
+class TestCompanySignalStats:
+    """Tests for the save-maintained company counters (migration v5)."""
+
+    async def test_saves_update_stats_and_buckets(self, store):
+        """Single and batch saves should both bump the per-company counters."""
+        base = datetime(2026, 1, 1, 10, 15, tzinfo=timezone.utc)
+        await store.save_signal(**_signal("domain:a.ai", detected_at=base))
+        await store.save_signal(**_signal("domain:a.ai", detected_at=base + timedelta(minutes=30)))
+        await store.save_signal(
+            **_signal("domain:a.ai", signal_type="job_posting",
+                      source_api="jobs", detected_at=base + timedelta(days=2))
+        )
+        await store.save_signals_batch([
+            _signal("domain:b.ai", detected_at=base),
+            _signal("domain:c.ai", detected_at=base),
+        ])
+
+        stats = await store.get_company_signal_stats(
+            ["domain:a.ai", "domain:b.ai", "domain:missing.ai"]
+        )
+        assert sorted(stats) == ["domain:a.ai", "domain:b.ai"]
+        assert stats["domain:a.ai"].total_signals == 3
+        assert stats["domain:a.ai"].first_signal_at == base
+        assert stats["domain:a.ai"].last_signal_at == base + timedelta(days=2)
+        assert stats["domain:b.ai"].total_signals == 1
+
+        buckets = await store.get_signal_buckets(["domain:a.ai", "domain:c.ai"], since=base)
+        assert [(b.bucket_start, b.signal_type, b.count) for b in buckets["domain:a.ai"]] == [
+            (datetime(2026, 1, 1, 10, tzinfo=timezone.utc), "github_spike", 2),
+            (datetime(2026, 1, 3, 10, tzinfo=timezone.utc), "job_posting", 1),
+        ]
+        assert [b.count for b in buckets["domain:c.ai"]] == [1]
+
+    async def test_buckets_respect_since(self, store):
+        """Buckets older than the cutoff's hour should not be returned."""
+        base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        await store.save_signal(**_signal("domain:a.ai", detected_at=base))
+        await store.save_signal(**_signal("domain:a.ai", detected_at=base + timedelta(days=10)))
+
+        buckets = await store.get_signal_buckets(["domain:a.ai"], since=base + timedelta(days=5))
+
+        assert [b.count for b in buckets["domain:a.ai"]] == [1]
+
+    async def test_migration_backfills_counters(self, tmp_path):
+        """Upgrading a v4 database should build counters from existing signals."""
+        from storage.signal_store import MIGRATIONS
+
+        db_path = tmp_path / "v4.db"
+        store = SignalStore(db_path)
+        await store.connection.initialize()
+        db = store._db
+        for version in (1, 2, 3, 4):
+            await db.executescript(MIGRATIONS[version])
+            await db.execute(
+                "INSERT INTO schema_migrations VALUES (?, '2025-01-01', '')", (version,)
+            )
+        for signal_type, minute in (("x", 20), ("x", 40), ("y", 20)):
+            detected = f"2025-06-01T10:{minute}:00+00:00"
+            await db.execute(
+                """
+                INSERT INTO signals (signal_type, source_api, canonical_key,
+                                     confidence, raw_data, detected_at, created_at)
+                VALUES (?, 'src', 'domain:old.ai', 0.5, '{}', ?, ?)
+                """,
+                (signal_type, detected, detected)
+            )
+        await db.commit()
+        await store.close()
+
+        store = SignalStore(db_path)
+        await store.initialize()
+        try:
+            stats = await store.get_company_signal_stats(["domain:old.ai"])
+            assert stats["domain:old.ai"].total_signals == 3
+
+            buckets = await store.get_signal_buckets(
+                ["domain:old.ai"], since=datetime(2025, 6, 1, tzinfo=timezone.utc)
+            )
+            assert sorted((b.signal_type, b.count) for b in buckets["domain:old.ai"]) == [
+                ("x", 2), ("y", 1),
+            ]
+        finally:
+            await store.close()
+
+
+async def _age_signals(store: SignalStore, days: int) -> None:
+    """Backdate every signal's created_at_epoch by `days`."""
+    await store._db.execute(
+        "UPDATE signals SET created_at_epoch = created_at_epoch - ?",
+        (days * 86400,)
+    )
+    await store._db.commit()
+
+
+class TestArchive:
+    """Tests for hot/cold tiering via the attached archive database."""
+
+    @pytest.fixture
+    async def archived_store(self, tmp_path):
+        store = SignalStore(tmp_path / "hot.db", archive_path=tmp_path / "cold.db")
+        await store.initialize()
+        yield store
+        await store.close()
+
+    async def test_archives_only_old_finished_signals(self, archived_store):
+        """Old pushed/rejected signals move (ids kept); pending ones stay."""
+        store = archived_store
+        results = await store.save_signals_batch(
+            [_signal(f"domain:co{i}.ai") for i in range(3)]
+        )
+        ids = [r.signal_id for r in results]
+        await store.mark_pushed(ids[0], "page-1")
+        await store.mark_rejected(ids[1], "too small")
+        await _age_signals(store, 100)
+
+        assert await store.archive_signals(older_than_days=90, batch_size=1) == 2
+
+        assert await store.get_processing_stats() == {"pending": 1}
+        assert await store.get_signal(ids[0]) is None
+
+        archived = await store.get_signals_for_company("domain:co0.ai", include_archive=True)
+        assert [(s.id, s.processing_status, s.notion_page_id) for s in archived] == [
+            (ids[0], "pushed", "page-1"),
+        ]
+        assert archived[0].raw_data == {"repo": "domain:co0.ai"}
+        assert await store.get_signals_for_company("domain:co0.ai") == []
+
+    async def test_recent_signals_stay_hot(self, archived_store):
+        """Signals younger than the cutoff aren't archived."""
+        store = archived_store
+        signal_id = await store.save_signal(**_signal("domain:a.ai"))
+        await store.mark_rejected(signal_id, "no")
+
+        assert await store.archive_signals(older_than_days=30) == 0
+        assert await store.get_signal(signal_id) is not None
+
+    async def test_archived_keys_still_dedupe(self, archived_store):
+        """Archived companies should still count as existing keys."""
+        store = archived_store
+        signal_id = await store.save_signal(**_signal("domain:a.ai"))
+        await store.mark_rejected(signal_id, "no")
+        await _age_signals(store, 100)
+        await store.archive_signals(older_than_days=90)
+
+        assert await store.is_duplicate("domain:a.ai")
+        results = await store.save_signals_batch([_signal("domain:a.ai")])
+        assert results[0].status == "duplicate"
+
+    async def test_apply_retention_archives_runs_and_vacuums(self, archived_store):
+        """apply_retention should move old pipeline runs and leave incremental vacuum on."""
+        store = archived_store
+        old = (datetime.now(timezone.utc) - timedelta(days=100)).isoformat()
+        await store._db.execute(
+            "INSERT INTO pipeline_runs (run_id, started_at, created_at) VALUES ('r1', ?, ?)",
+            (old, old)
+        )
+        await store._db.commit()
+
+        result = await store.apply_retention(older_than_days=90)
+
+        assert result["pipeline_runs_archived"] == 1
+        assert await store.get_pipeline_runs() == []
+        cursor = await store._db.execute("PRAGMA main.auto_vacuum")
+        assert (await cursor.fetchone())[0] == 2
+        assert await store.vacuum() >= 0
+
+    async def test_wal_readers_see_archive(self, tmp_path):
+        """Pooled read connections should have the archive attached too."""
+        store = SignalStore(
+            tmp_path / "hot.db", wal_mode=True, archive_path=tmp_path / "cold.db"
+        )
+        await store.initialize()
+        try:
+            signal_id = await store.save_signal(**_signal("domain:a.ai"))
+            await store.mark_pushed(signal_id, "page-1")
+            await _age_signals(store, 100)
+            await store.archive_signals(older_than_days=90)
+
+            signals = await store.get_signals_for_company("domain:a.ai", include_archive=True)
+            assert [s.id for s in signals] == [signal_id]
+        finally:
+            await store.close()
+
+    async def test_archive_required(self, store):
+        """Archiving without an attached archive is an error."""
+        with pytest.raises(RuntimeError):
+            await store.archive_signals(older_than_days=90)
+
+
+class TestSearch:
+    """Tests for the signals_fts full-text index (migration v6)."""
+
+    async def test_matches_name_and_raw_text_fields(self, store):
+        """Company names and raw_data description/title should be searchable."""
+        await store.save_signal(**_signal(
+            "domain:acme.ai", company_name="Acme Robotics",
+            raw_data={"description": "Warehouse picking arms"},
+        ))
+        await store.save_signals_batch([_signal(
+            "domain:other.io", company_name="Other",
+            raw_data={"title": "Robotics for farms", "readme": "x" * 500},
+        )])
+
+        assert {s.canonical_key for s in await store.search("robotics")} == {
+            "domain:acme.ai", "domain:other.io",
+        }
+        assert [s.canonical_key for s in await store.search("warehouse arm")] == ["domain:acme.ai"]
+        assert [s.canonical_key for s in await store.search("farm")] == ["domain:other.io"]
+
+    async def test_name_matches_rank_first(self, store):
+        """A company-name hit should outrank a body-only hit."""
+        await store.save_signal(**_signal(
+            "domain:a.ai", company_name="Helper", raw_data={"description": "Quantum sensors"},
+        ))
+        await store.save_signal(**_signal(
+            "domain:b.ai", company_name="Quantum Labs", raw_data={"description": "Sensors"},
+        ))
+
+        results = await store.search("quantum")
+
+        assert [s.canonical_key for s in results] == ["domain:b.ai", "domain:a.ai"]
+
+    async def test_punctuation_and_filters(self, store):
+        """Raw user input shouldn't break FTS syntax; filters should apply."""
+        await store.save_signal(**_signal("domain:acme.ai", company_name="Acme"))
+        await store.save_signal(**_signal(
+            "domain:acme.io", company_name="Acme", signal_type="job_posting",
+        ))
+
+        assert len(await store.search("acme.ai")) == 1
+        assert [s.signal_type for s in await store.search("acme", signal_type="job_posting")] == [
+            "job_posting",
+        ]
+        assert await store.search("  ?!  ") == []
+
+    async def test_deleted_signals_leave_index(self, store):
+        """Deleting a signal should drop it from search results."""
+        signal_id = await store.save_signal(**_signal("domain:gone.ai", company_name="Gone"))
+        async with store.transaction() as conn:
+            await conn.execute("DELETE FROM signals WHERE id = ?", (signal_id,))
+
+        assert await store.search("gone") == []
+
+    async def test_migration_backfills_index(self, tmp_path):
+        """Upgrading a v5 database should index existing signals."""
+        from storage.signal_store import MIGRATIONS
+
+        db_path = tmp_path / "v5.db"
+        store = SignalStore(db_path)
+        await store.connection.initialize()
+        db = store._db
+        for version in range(1, 6):
+            await db.executescript(MIGRATIONS[version])
+            await db.execute(
+                "INSERT INTO schema_migrations VALUES (?, '2025-01-01', '')", (version,)
+            )
+        await db.execute(
+            """
+            INSERT INTO signals (signal_type, source_api, canonical_key, company_name,
+                                 confidence, raw_data, detected_at, created_at)
+            VALUES ('x', 'y', 'domain:old.ai', 'Old Co', 0.5,
+                    '{"summary": "Legacy fintech ledger"}',
+                    '2025-06-01T10:00:00+00:00', '2025-06-01T10:00:00+00:00')
+            """
+        )
+        await db.commit()
+        await store.close()
+
+        store = SignalStore(db_path)
+        await store.initialize()
+        try:
+            assert [s.canonical_key for s in await store.search("ledger")] == ["domain:old.ai"]
+        finally:
+            await store.close()
+
+    async def test_interrupted_backfill_resumes(self, tmp_path, monkeypatch):
+        """A rebuild cut off after migration v6 commits should rerun on the next start."""
+        db_path = tmp_path / "signals.db"
+        store = SignalStore(db_path)
+        await store.initialize()
+        await store.save_signal(**_signal(
+            "domain:old.ai", company_name="Old Co", raw_data={"summary": "Legacy ledger"},
+        ))
+        async with store.transaction() as conn:
+            await conn.execute("DELETE FROM signals_fts")
+            await conn.execute("DELETE FROM migration_backfills")
+        await store.close()
+
+        async def interrupted(self):
+            raise RuntimeError("killed mid-rebuild")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(SignalStore, "rebuild_search_index", interrupted)
+            store = SignalStore(db_path)
+            with pytest.raises(RuntimeError):
+                await store.initialize()
+            await store.close()
+
+        store = SignalStore(db_path)
+        await store.initialize()
+        try:
+            assert [s.canonical_key for s in await store.search("ledger")] == ["domain:old.ai"]
+
+            # Completed backfills don't run again
+            monkeypatch.setattr(SignalStore, "rebuild_search_index", interrupted)
+            await store.close()
+            store = SignalStore(db_path)
+            await store.initialize()
+        finally:
+            await store.close()
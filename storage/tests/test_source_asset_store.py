@@ -268,3 +268,270 @@ class TestSourceAssetStore:
         assert counts["product_hunt"] == 2
 
         await store.close()
+
+
+class TestRecordSnapshot:
+    """Test hash-based change detection in record_snapshot."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_payload_only_touches_fetched_at(self):
+        """Re-recording an identical payload should not add a row."""
+        store = SourceAssetStore(":memory:")
+        await store.initialize()
+
+        first = await store.record_snapshot(
+            "github_repo", "owner/repo", {"stars": 1, "name": "repo"},
+            fetched_at=datetime(2026, 1, 1),
+        )
+        second = await store.record_snapshot(
+            "github_repo", "owner/repo", {"name": "repo", "stars": 1},  # key order differs
+            fetched_at=datetime(2026, 1, 2),
+        )
+
+        assert (first.is_new, first.changed) == (True, False)
+        assert (second.is_new, second.changed) == (False, False)
+        assert second.asset_id == first.asset_id
+        assert await store.get_snapshot_count("github_repo", "owner/repo") == 1
+
+        asset = await store.get_asset(first.asset_id)
+        assert asset.fetched_at == datetime(2026, 1, 2)
+
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_changed_payload_inserts_new_snapshot(self):
+        """A different payload should insert a row flagged as changed."""
+        store = SourceAssetStore(":memory:")
+        await store.initialize()
+
+        await store.record_snapshot(
+            "github_repo", "owner/repo", {"stars": 1}, fetched_at=datetime(2026, 1, 1),
+        )
+        result = await store.record_snapshot(
+            "github_repo", "owner/repo", {"stars": 2}, fetched_at=datetime(2026, 1, 2),
+        )
+
+        assert result.changed is True
+        assert await store.get_snapshot_count("github_repo", "owner/repo") == 2
+        assert (await store.get_previous_snapshot("github_repo", "owner/repo")) == {"stars": 1}
+        assert (await store.get_asset(result.asset_id)).change_detected is True
+
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_initialize_backfills_legacy_rows(self, tmp_path):
+        """Rows from before payload_hash existed should get hashed on startup."""
+        import aiosqlite
+        from storage.source_asset_store import payload_hash
+
+        db_path = str(tmp_path / "assets.db")
+        async with aiosqlite.connect(db_path) as db:
+            await db.execute("""
+                CREATE TABLE source_assets (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    source_type TEXT NOT NULL,
+                    external_id TEXT NOT NULL,
+                    raw_payload TEXT NOT NULL,
+                    fetched_at TIMESTAMP NOT NULL,
+                    change_detected BOOLEAN DEFAULT FALSE,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            await db.execute(
+                """INSERT INTO source_assets (source_type, external_id, raw_payload, fetched_at)
+                   VALUES ('github_repo', 'owner/repo', '{"stars": 1}', '2026-01-01T00:00:00')"""
+            )
+            await db.commit()
+
+        store = SourceAssetStore(db_path)
+        await store.initialize()
+
+        asset = await store.get_asset(1)
+        assert asset.payload_hash == payload_hash({"stars": 1})
+
+        result = await store.record_snapshot("github_repo", "owner/repo", {"stars": 1})
+        assert result.changed is False
+        assert await store.get_snapshot_count("github_repo", "owner/repo") == 1
+
+        await store.close()
+
+
+class TestDeltaEncoding:
+    """Test keyframe + delta storage and reconstruction."""
+
+    @staticmethod
+    def _payload(i: int) -> dict:
+        return {
+            "name": "repo",
+            "stars": i,
+            "owner": {"login": "owner", "followers": i // 2},
+            "topics": ["ai"] + (["ml"] if i % 2 else []),
+            **({"archived": True} if i % 3 == 0 else {}),
+        }
+
+    @pytest.mark.asyncio
+    async def test_reconstructs_every_snapshot(self):
+        """Deltas should round-trip through latest, previous and get_asset."""
+        store = SourceAssetStore(":memory:", keyframe_interval=4)
+        await store.initialize()
+
+        ids = []
+        for i in range(10):
+            result = await store.record_snapshot(
+                "github_repo", "owner/repo", self._payload(i),
+                fetched_at=datetime(2026, 1, 1) + timedelta(hours=i),
+            )
+            ids.append(result.asset_id)
+
+        for i, asset_id in enumerate(ids):
+            assert (await store.get_asset(asset_id)).raw_payload == self._payload(i)
+        assert await store.get_latest_snapshot("github_repo", "owner/repo") == self._payload(9)
+        assert await store.get_previous_snapshot("github_repo", "owner/repo") == self._payload(8)
+
+        cursor = await store._db.execute(
+            "SELECT encoding, chain_length FROM source_assets ORDER BY id"
+        )
+        rows = [tuple(row) for row in await cursor.fetchall()]
+        assert [row[1] for row in rows] == [0, 1, 2, 3, 0, 1, 2, 3, 0, 1]
+        assert rows[0][0] == rows[4][0] == "full"
+        assert rows[1][0] == "delta"
+
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_field_level_changes(self):
+        """record_snapshot should report changed fields with dotted paths."""
+        store = SourceAssetStore(":memory:")
+        await store.initialize()
+
+        await store.record_snapshot(
+            "github_repo", "owner/repo",
+            {"stars": 1, "owner": {"login": "a"}, "homepage": "x.ai"},
+        )
+        result = await store.record_snapshot(
+            "github_repo", "owner/repo",
+            {"stars": 1, "owner": {"login": "b"}, "topics": ["ai"]},
+        )
+
+        assert sorted(result.changes, key=lambda c: c["field"]) == [
+            {"field": "homepage", "old": "x.ai", "new": None},
+            {"field": "owner.login", "old": "a", "new": "b"},
+            {"field": "topics", "old": None, "new": ["ai"]},
+        ]
+
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_compaction_rekeyframes_chains(self):
+        """Compaction should bound chains to a new interval without changing payloads."""
+        store = SourceAssetStore(":memory:", keyframe_interval=10)
+        await store.initialize()
+        for i in range(8):
+            await store.record_snapshot(
+                "github_repo", "owner/repo", self._payload(i),
+                fetched_at=datetime(2026, 1, 1) + timedelta(hours=i),
+            )
+
+        assert await store.compact_snapshots(keyframe_interval=3) == 1
+        assert await store.compact_snapshots(keyframe_interval=3) == 0
+
+        cursor = await store._db.execute("SELECT id, chain_length FROM source_assets ORDER BY id")
+        rows = await cursor.fetchall()
+        assert [row[1] for row in rows] == [0, 1, 2, 0, 1, 2, 0, 1]
+        for i, row in enumerate(rows):
+            assert (await store.get_asset(row[0])).raw_payload == self._payload(i)
+
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_compaction_delta_encodes_legacy_history(self, tmp_path):
+        """Histories stored as full rows should be rewritten as deltas."""
+        store = SourceAssetStore(str(tmp_path / "assets.db"), keyframe_interval=1)
+        await store.initialize()
+        for i in range(5):
+            await store.record_snapshot(
+                "github_repo", "owner/repo", self._payload(i),
+                fetched_at=datetime(2026, 1, 1) + timedelta(hours=i),
+            )
+        await store.close()
+
+        store = SourceAssetStore(str(tmp_path / "assets.db"))
+        await store.initialize()
+        assert await store.compact_snapshots() == 1
+
+        cursor = await store._db.execute("SELECT encoding FROM source_assets ORDER BY id")
+        assert [row[0] for row in await cursor.fetchall()] == ["full"] + ["delta"] * 4
+        assert await store.get_latest_snapshot("github_repo", "owner/repo") == self._payload(4)
+
+        await store.close()
+
+
+class TestBatchedSnapshots:
+    """Test get_latest_snapshots and BufferedSnapshotWriter."""
+
+    @pytest.mark.asyncio
+    async def test_get_latest_snapshots_reconstructs_deltas(self):
+        """One lookup should return the latest full payload per id."""
+        store = SourceAssetStore(":memory:", keyframe_interval=3)
+        await store.initialize()
+        for i in range(5):
+            for name in ("a/one", "b/two"):
+                await store.record_snapshot(
+                    "github_repo", name, {"name": name, "stars": i},
+                    fetched_at=datetime(2026, 1, 1) + timedelta(hours=i),
+                )
+        await store.record_snapshot("product_hunt", "a/one", {"votes": 1})
+
+        latest = await store.get_latest_snapshots("github_repo", ["a/one", "b/two", "c/none"])
+
+        assert latest == {
+            "a/one": {"name": "a/one", "stars": 4},
+            "b/two": {"name": "b/two", "stars": 4},
+        }
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_writer_group_commits_every_n_rows(self):
+        """Writes should be queued until max_rows are pending."""
+        store = SourceAssetStore(":memory:")
+        await store.initialize()
+        await store.record_snapshot("github_repo", "r0", {"stars": 0})
+
+        async with store.buffered_writer(max_rows=3, max_delay_ms=60_000) as writer:
+            previous = await writer.prefetch("github_repo", ["r0", "r1", "r2"])
+            assert previous == {"r0": {"stars": 0}}
+
+            unchanged = await writer.record_snapshot("github_repo", "r0", {"stars": 0})
+            new = await writer.record_snapshot("github_repo", "r1", {"stars": 1})
+            assert (unchanged.changed, new.is_new, new.asset_id) == (False, True, None)
+            assert writer.pending == 2
+            assert (await store.count_by_source_type()) == {"github_repo": 1}
+
+            await writer.record_snapshot("github_repo", "r2", {"stars": 2})
+            assert writer.pending == 0
+            assert (await store.count_by_source_type()) == {"github_repo": 3}
+
+            changed = await writer.record_snapshot("github_repo", "r2", {"stars": 3})
+            assert changed.changes == [{"field": "stars", "old": 2, "new": 3}]
+
+        assert await store.get_latest_snapshot("github_repo", "r2") == {"stars": 3}
+        assert await store.get_previous_snapshot("github_repo", "r2") == {"stars": 2}
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_writer_flushes_after_delay(self):
+        """Pending writes should be committed max_delay_ms after queueing."""
+        import asyncio
+
+        store = SourceAssetStore(":memory:")
+        await store.initialize()
+        writer = store.buffered_writer(max_rows=100, max_delay_ms=10)
+
+        await writer.record_snapshot("github_repo", "r1", {"stars": 1})
+        assert writer.pending == 1
+        await asyncio.sleep(0.05)
+
+        assert writer.pending == 0
+        assert await store.get_latest_snapshot("github_repo", "r1") == {"stars": 1}
+        await writer.close()
+        await store.close()
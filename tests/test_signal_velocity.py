@@ -7,6 +7,7 @@ from datetime import datetime, timezone, timedelta
 from unittest.mock import AsyncMock, MagicMock
 from dataclasses import dataclass
 
+from storage.signal_store import CompanySignalStats, SignalBucket
 from utils.signal_velocity import (
     SignalVelocityTracker,
     VelocityConfig,
@@ -32,8 +33,39 @@ class MockSignalStore:
     def __init__(self, signals=None):
         self.signals = signals or []
 
-    async def get_signals_for_company(self, canonical_key):
-        return [s for s in self.signals if s.canonical_key == canonical_key]
+    async def get_signals_for_company(self, canonical_key, since=None):
+        return [
+            s for s in self.signals
+            if s.canonical_key == canonical_key
+            and (since is None or s.detected_at >= since)
+        ]
+
+    async def get_signal_buckets(self, canonical_keys, since):
+        # One bucket per signal, starting exactly at detected_at
+        buckets = {}
+        for s in self.signals:
+            if s.canonical_key in canonical_keys and s.detected_at >= since:
+                buckets.setdefault(s.canonical_key, []).append(SignalBucket(
+                    canonical_key=s.canonical_key,
+                    signal_type=s.signal_type,
+                    source_api=s.source_api,
+                    bucket_start=s.detected_at,
+                    count=1,
+                ))
+        return buckets
+
+    async def get_company_signal_stats(self, canonical_keys):
+        stats = {}
+        for key in canonical_keys:
+            times = [s.detected_at for s in self.signals if s.canonical_key == key]
+            if times:
+                stats[key] = CompanySignalStats(
+                    canonical_key=key,
+                    total_signals=len(times),
+                    first_signal_at=min(times),
+                    last_signal_at=max(times),
+                )
+        return stats
 
     async def get_pending_signals(self, limit=None):
         return self.signals[:limit] if limit else self.signals
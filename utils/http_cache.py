@@ -0,0 +1,407 @@
+"""
+On-disk Conditional HTTP Cache for Discovery Engine Collectors.
+
+Provides a persistent GET cache that sits under the pooled HTTP clients
+(see utils/http_pool.py) as an httpx transport, with:
+- ETag / Last-Modified validators stored with each response
+- If-None-Match / If-Modified-Since on expired entries, with 304s served
+  from disk (GitHub doesn't count 304s against the rate limit)
+- Per-API TTLs during which no request is made at all
+- Size-bounded storage with least-recently-used eviction
+- Bodies streamed through to the caller, compressed into the cache as
+  they arrive
+
+Usage:
+    from utils.http_cache import HttpCache
+    from utils.http_pool import HttpPoolConfig, configure_http_pool
+
+    cache = HttpCache("http_cache.db", max_bytes=256 * 1024 * 1024)
+    await cache.initialize()
+    configure_http_pool(HttpPoolConfig(cache=cache))
+
+    # ... collectors run; get_http_client() clients now use the cache
+
+    await cache.close()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+import zlib
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, List, Optional
+
+import aiosqlite
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Default cache size (compressed bodies)
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+@dataclass
+class CachedResponse:
+    """A stored GET response."""
+    cache_key: str
+    status_code: int
+    headers: Dict[str, str]
+    body: bytes  # Raw (still content-encoded) response body
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float  # When the response was last fetched or revalidated
+
+    def is_fresh(self, ttl: float, now: Optional[float] = None) -> bool:
+        """True if younger than ttl seconds (no request needed)."""
+        return ttl > 0 and ((now or time.time()) - self.stored_at) < ttl
+
+    @property
+    def has_validators(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+
+class HttpCache:
+    """
+    SQLite-backed response cache with per-API TTLs and LRU eviction.
+
+    Bodies are zlib-compressed; max_bytes bounds their total size. Reads
+    don't write: access times are kept in memory and saved with the next
+    write, eviction or close.
+    """
+
+    # Seconds a response is served without revalidation; other APIs always
+    # revalidate (conditional request) when validators exist
+    API_TTLS: Dict[str, float] = {
+        "github": 600,               # Repo/search JSON, 10 minutes
+        "sec_edgar": 3600,           # Atom feed hourly; primary_doc.xml is immutable
+        "domain_whois": 86400,       # RDAP records change rarely
+        "job_postings": 6 * 3600,    # ATS boards
+    }
+
+    def __init__(
+        self,
+        db_path: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttls: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Args:
+            db_path: Path to SQLite database. Use ":memory:" for in-memory.
+            max_bytes: Evict least recently used entries above this size.
+            ttls: Per-API TTL overrides, merged over API_TTLS.
+        """
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.ttls = {**self.API_TTLS, **(ttls or {})}
+        self._db: Optional[aiosqlite.Connection] = None
+        self._total_bytes = 0
+        self._pending_access: Dict[str, float] = {}  # cache_key -> last read time
+
+        # Statistics
+        self.hits = 0  # Served fresh without a request
+        self.revalidated = 0  # 304 served from disk
+        self.misses = 0
+
+    async def initialize(self) -> None:
+        """Open the database and create the cache table."""
+        self._db = await aiosqlite.connect(self.db_path)
+        await self._db.execute("""
+            CREATE TABLE IF NOT EXISTS http_cache (
+                cache_key TEXT PRIMARY KEY,
+                api_name TEXT NOT NULL,
+                url TEXT NOT NULL,
+                status_code INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+        """)
+        await self._db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_http_cache_lru
+            ON http_cache(last_access)
+        """)
+        await self._db.commit()
+
+        cursor = await self._db.execute("SELECT COALESCE(SUM(size), 0) FROM http_cache")
+        self._total_bytes = (await cursor.fetchone())[0]
+        logger.info(f"HttpCache initialized at {self.db_path} ({self._total_bytes} bytes)")
+
+    def ttl_for(self, api_name: str) -> float:
+        """TTL in seconds for an API (0 = always revalidate)."""
+        return self.ttls.get(api_name, 0)
+
+    @staticmethod
+    def key_for(request: httpx.Request) -> str:
+        """Cache key: URL plus the request headers that change the response."""
+        parts = [
+            str(request.url),
+            request.headers.get("Accept", ""),
+            request.headers.get("Authorization", ""),
+        ]
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+    async def get(self, cache_key: str) -> Optional[CachedResponse]:
+        """Look up an entry and mark it recently used (saved lazily)."""
+        if not self._db:
+            raise RuntimeError("HttpCache not initialized")
+
+        cursor = await self._db.execute(
+            """SELECT status_code, headers, body, etag, last_modified, stored_at
+               FROM http_cache WHERE cache_key = ?""",
+            (cache_key,),
+        )
+        row = await cursor.fetchone()
+        if not row:
+            return None
+
+        self._pending_access[cache_key] = time.time()
+        return CachedResponse(
+            cache_key=cache_key,
+            status_code=row[0],
+            headers=json.loads(row[1]),
+            body=zlib.decompress(row[2]),
+            etag=row[3],
+            last_modified=row[4],
+            stored_at=row[5],
+        )
+
+    async def put(
+        self,
+        cache_key: str,
+        api_name: str,
+        url: str,
+        response: httpx.Response,
+        body: bytes,
+    ) -> None:
+        """Store a 200 response body with its validators, then evict if over size."""
+        await self.put_compressed(cache_key, api_name, url, response, zlib.compress(body))
+
+    async def put_compressed(
+        self,
+        cache_key: str,
+        api_name: str,
+        url: str,
+        response: httpx.Response,
+        compressed: bytes,
+    ) -> None:
+        """put() for a body already zlib-compressed (e.g. while it streamed in)."""
+        if not self._db:
+            raise RuntimeError("HttpCache not initialized")
+
+        now = time.time()
+        self._pending_access.pop(cache_key, None)
+        cursor = await self._db.execute(
+            "SELECT size FROM http_cache WHERE cache_key = ?", (cache_key,)
+        )
+        previous = await cursor.fetchone()
+
+        await self._db.execute(
+            """INSERT OR REPLACE INTO http_cache
+               (cache_key, api_name, url, status_code, headers, body, etag,
+                last_modified, stored_at, last_access, size)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            (
+                cache_key,
+                api_name,
+                url,
+                response.status_code,
+                json.dumps(dict(response.headers)),
+                compressed,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+                now,
+                now,
+                len(compressed),
+            ),
+        )
+        await self._save_access_times()
+        await self._db.commit()
+        self._total_bytes += len(compressed) - (previous[0] if previous else 0)
+
+        if self._total_bytes > self.max_bytes:
+            await self._evict()
+
+    async def refresh(self, cache_key: str) -> None:
+        """Mark an entry revalidated (after a 304)."""
+        now = time.time()
+        self._pending_access.pop(cache_key, None)
+        await self._db.execute(
+            "UPDATE http_cache SET stored_at = ?, last_access = ? WHERE cache_key = ?",
+            (now, now, cache_key),
+        )
+        await self._save_access_times()
+        await self._db.commit()
+
+    async def _save_access_times(self) -> None:
+        """Write pending access times (committed by the caller)."""
+        if not self._pending_access:
+            return
+        await self._db.executemany(
+            "UPDATE http_cache SET last_access = ? WHERE cache_key = ?",
+            [(accessed, cache_key) for cache_key, accessed in self._pending_access.items()],
+        )
+        self._pending_access.clear()
+
+    async def _evict(self) -> None:
+        """Delete least recently used entries until under max_bytes."""
+        await self._save_access_times()
+        cursor = await self._db.execute(
+            "SELECT cache_key, size FROM http_cache ORDER BY last_access"
+        )
+        doomed = []
+        async for cache_key, size in cursor:
+            if self._total_bytes <= self.max_bytes:
+                break
+            doomed.append((cache_key,))
+            self._total_bytes -= size
+        await cursor.close()
+
+        await self._db.executemany("DELETE FROM http_cache WHERE cache_key = ?", doomed)
+        await self._db.commit()
+        logger.debug(f"HttpCache evicted {len(doomed)} entries")
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of stored (compressed) bodies."""
+        return self._total_bytes
+
+    async def clear(self) -> None:
+        """Delete every entry."""
+        await self._db.execute("DELETE FROM http_cache")
+        await self._db.commit()
+        self._pending_access.clear()
+        self._total_bytes = 0
+
+    async def close(self) -> None:
+        """Save pending access times and close database connection."""
+        if self._db:
+            await self._save_access_times()
+            await self._db.commit()
+            await self._db.close()
+            self._db = None
+
+
+class _CacheTeeStream(httpx.AsyncByteStream):
+    """
+    Response body that reaches the caller chunk by chunk while a
+    compressed copy is built; it is stored once the body has been read
+    to the end, so a response abandoned part way is never cached.
+    """
+
+    def __init__(
+        self,
+        cache: HttpCache,
+        api_name: str,
+        cache_key: str,
+        request: httpx.Request,
+        response: httpx.Response,
+    ):
+        self.cache = cache
+        self.api_name = api_name
+        self.cache_key = cache_key
+        self.request = request
+        self.response = response
+        self._compressor = zlib.compressobj()
+        self._compressed: List[bytes] = []
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        # Raw (still encoded) chunks, so the stored headers stay valid
+        async for chunk in self.response.stream:
+            self._compressed.append(self._compressor.compress(chunk))
+            yield chunk
+        self._compressed.append(self._compressor.flush())
+
+        try:
+            await self.cache.put_compressed(
+                self.cache_key,
+                self.api_name,
+                str(self.request.url),
+                self.response,
+                b"".join(self._compressed),
+            )
+        except Exception as e:
+            logger.warning(f"HttpCache store failed for {self.request.url}: {e}")
+
+    async def aclose(self) -> None:
+        await self.response.aclose()
+
+
+class CachingTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport that answers GETs from an HttpCache.
+
+    Fresh entries are returned without a request. Stale entries with
+    validators become conditional requests; a 304 returns the stored body.
+    200 bodies stream through to the caller and are stored as they are
+    read. Other methods, non-200 responses, Cache-Control: no-store
+    responses and responses that could never be reused (no TTL for the
+    API and no validators) pass through uncached.
+    """
+
+    def __init__(self, cache: HttpCache, api_name: str, transport: httpx.AsyncBaseTransport):
+        self.cache = cache
+        self.api_name = api_name
+        self._transport = transport
+
+    def _from_cache(self, cached: CachedResponse, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            status_code=cached.status_code,
+            headers=cached.headers,
+            content=cached.body,
+            request=request,
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "GET":
+            return await self._transport.handle_async_request(request)
+
+        cache_key = HttpCache.key_for(request)
+        try:
+            cached = await self.cache.get(cache_key)
+        except Exception as e:
+            logger.warning(f"HttpCache lookup failed, fetching {request.url}: {e}")
+            return await self._transport.handle_async_request(request)
+
+        if cached and cached.is_fresh(self.cache.ttl_for(self.api_name)):
+            self.cache.hits += 1
+            return self._from_cache(cached, request)
+
+        if cached and cached.has_validators:
+            if cached.etag:
+                request.headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                request.headers["If-Modified-Since"] = cached.last_modified
+
+        response = await self._transport.handle_async_request(request)
+
+        if response.status_code == 304 and cached:
+            await response.aclose()
+            await self.cache.refresh(cache_key)
+            self.cache.revalidated += 1
+            return self._from_cache(cached, request)
+
+        self.cache.misses += 1
+        if response.status_code != 200 or "no-store" in response.headers.get("Cache-Control", ""):
+            return response
+        if self.cache.ttl_for(self.api_name) <= 0 and not (
+            response.headers.get("ETag") or response.headers.get("Last-Modified")
+        ):
+            return response
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_CacheTeeStream(self.cache, self.api_name, cache_key, request, response),
+            request=request,
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -0,0 +1,159 @@
+"""
+Shared HTTP Client Pool for Discovery Engine Collectors.
+
+Provides long-lived httpx.AsyncClient instances with:
+- One client per API (github, sec_edgar, job_postings, ...), so repeated
+  requests reuse warm keep-alive connections instead of a new TCP+TLS
+  handshake per call
+- Configurable pool limits, keep-alive expiry and timeouts
+- Optional HTTP/2 (needs the h2 package; falls back to HTTP/1.1)
+- Optional on-disk conditional GET cache (see utils/http_cache.py)
+- Global pool shared across collectors, closed by its owner (the pipeline)
+
+Clients are bound to the event loop they were created on; a client
+requested from a different loop is replaced rather than reused.
+
+Usage:
+    from utils.http_pool import get_http_client
+
+    client = get_http_client("github")
+    response = await client.get(url, headers=headers)
+
+    # At shutdown (DiscoveryPipeline.close() does this)
+    await close_http_clients()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+import httpx
+
+if TYPE_CHECKING:
+    from utils.http_cache import HttpCache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HttpPoolConfig:
+    """Connection pool settings applied to newly created clients."""
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0  # Seconds an idle connection is kept
+    timeout: float = 30.0  # Default request timeout in seconds
+    http2: bool = False
+    cache: Optional["HttpCache"] = None  # Initialized HttpCache for GETs (owned by the caller)
+
+
+class HttpClientPool:
+    """
+    Registry of long-lived HTTP clients, one per API name.
+
+    Creates clients on demand with the pool's limits and the API's timeout.
+    """
+
+    # APIs with slower endpoints than the pool default timeout
+    API_TIMEOUTS: Dict[str, float] = {
+        "arxiv": 60.0,
+        "uspto": 60.0,
+    }
+
+    def __init__(self, config: Optional[HttpPoolConfig] = None):
+        self.config = config or HttpPoolConfig()
+        self._clients: Dict[str, Tuple[httpx.AsyncClient, asyncio.AbstractEventLoop]] = {}
+
+    def configure(self, config: HttpPoolConfig) -> None:
+        """Set pool settings; clients created before keep their own."""
+        self.config = config
+
+    def _http2_available(self) -> bool:
+        if not self.config.http2:
+            return False
+        if importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requested but the h2 package is not installed; using HTTP/1.1")
+            self.config.http2 = False
+            return False
+        return True
+
+    def get(self, api_name: str) -> httpx.AsyncClient:
+        """
+        Get or create the client for an API.
+
+        Args:
+            api_name: Name of the API (e.g., "github", "sec_edgar")
+
+        Returns:
+            Shared httpx.AsyncClient; do not close it, the pool owns it
+        """
+        loop = asyncio.get_running_loop()
+        entry = self._clients.get(api_name)
+        if entry is not None:
+            client, client_loop = entry
+            if client_loop is loop and not client.is_closed:
+                return client
+
+        transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(
+                max_connections=self.config.max_connections,
+                max_keepalive_connections=self.config.max_keepalive_connections,
+                keepalive_expiry=self.config.keepalive_expiry,
+            ),
+            http2=self._http2_available(),
+        )
+        if self.config.cache is not None:
+            from utils.http_cache import CachingTransport
+            transport = CachingTransport(self.config.cache, api_name, transport)
+
+        client = httpx.AsyncClient(
+            timeout=self.API_TIMEOUTS.get(api_name, self.config.timeout),
+            transport=transport,
+        )
+        self._clients[api_name] = (client, loop)
+        logger.debug(f"Created pooled HTTP client for {api_name}")
+        return client
+
+    async def aclose(self) -> None:
+        """Close every client created on the running event loop and forget the rest."""
+        loop = asyncio.get_running_loop()
+        clients, self._clients = self._clients, {}
+        for api_name, (client, client_loop) in clients.items():
+            if client_loop is loop and not client.is_closed:
+                try:
+                    await client.aclose()
+                except Exception as e:
+                    logger.warning(f"Failed to close HTTP client for {api_name}: {e}")
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+# Global pool instance
+_global_pool = HttpClientPool()
+
+
+def get_http_client(api_name: str) -> httpx.AsyncClient:
+    """
+    Get a shared HTTP client from the global pool.
+
+    Args:
+        api_name: Name of the API
+
+    Returns:
+        Long-lived httpx.AsyncClient for the API
+    """
+    return _global_pool.get(api_name)
+
+
+def configure_http_pool(config: HttpPoolConfig) -> None:
+    """Apply settings to clients the global pool creates from now on."""
+    _global_pool.configure(config)
+
+
+async def close_http_clients() -> None:
+    """Close all clients in the global pool."""
+    await _global_pool.aclose()
@@ -5,6 +5,8 @@ Provides token-bucket style rate limiting with:
 - Per-API rate limits (GitHub, SEC EDGAR, Companies House, etc.)
 - Async-safe implementation using asyncio.Lock
 - Global pool for shared limiters across collectors
+- Optional SQLite-backed buckets shared by every process on the host, so
+  separate cron jobs and pipeline shards draw from one API budget
 
 Usage:
     from utils.rate_limiter import get_rate_limiter
@@ -16,6 +18,10 @@ Usage:
     await limiter.acquire()
     response = await client.get(url)
 
+    # Share budgets with other processes (in-memory buckets otherwise)
+    async with shared_rate_limits("rate_limits.db"):
+        ...
+
 API Limits (from CLAUDE.md):
     - GitHub: 5000/hour
     - SEC EDGAR: 10/second
@@ -29,7 +35,10 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
-from typing import Dict, Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+
+import aiosqlite
 
 logger = logging.getLogger(__name__)
 
@@ -41,14 +50,28 @@ class AsyncRateLimiter:
     Tokens are refilled over time based on the configured rate.
     Callers wait if no tokens are available.
 
+    With a SharedTokenBuckets backend, tokens live in the backend's
+    database instead, so every process using it shares one bucket per
+    key. If the backend fails, the in-memory bucket is used.
+
     Args:
         rate: Maximum requests per period (None = unlimited)
         period: Time period in seconds
+        backend: Optional cross-process bucket store
+        key: Bucket name in the backend (e.g., the API name)
     """
 
-    def __init__(self, rate: Optional[int] = None, period: int = 1):
+    def __init__(
+        self,
+        rate: Optional[int] = None,
+        period: int = 1,
+        backend: Optional["SharedTokenBuckets"] = None,
+        key: Optional[str] = None,
+    ):
         self.rate = rate
         self.period = period
+        self.backend = backend
+        self.key = key
         self._lock = asyncio.Lock()
         self._tokens: float = float(rate) if rate else float("inf")
         self._last_refill: Optional[float] = None
@@ -63,6 +86,17 @@ class AsyncRateLimiter:
         if self.rate is None:
             return
 
+        if self.backend is not None and self.key:
+            try:
+                wait_time = await self.backend.reserve(self.key, self.rate, self.period)
+            except Exception as e:
+                logger.warning(f"Shared rate limit for {self.key} unavailable, using local bucket: {e}")
+            else:
+                if wait_time > 0:
+                    logger.debug(f"Rate limit ({self.key}, shared): waiting {wait_time:.2f}s")
+                    await asyncio.sleep(wait_time)
+                return
+
         async with self._lock:
             now = time.monotonic()
 
@@ -88,6 +122,93 @@ class AsyncRateLimiter:
             self._tokens -= 1
 
 
+class SharedTokenBuckets:
+    """
+    Token buckets in a SQLite database, shared by every process that opens it.
+
+    Each acquire() is one short BEGIN IMMEDIATE transaction that refills the
+    bucket from the wall clock and takes a token. The balance may go
+    negative: a caller that finds no token still takes one, and then sleeps
+    until the bucket refills to that point. This happens outside the
+    transaction, so waiting processes queue up in order without holding
+    the database lock.
+    """
+
+    def __init__(self, db_path: str, busy_timeout: float = 10.0):
+        """
+        Args:
+            db_path: Path to the SQLite database, the same file for every process
+            busy_timeout: Seconds to wait for another process's transaction
+        """
+        self.db_path = db_path
+        self.busy_timeout = busy_timeout
+        self._db: Optional[aiosqlite.Connection] = None
+        self._lock = asyncio.Lock()  # One transaction at a time on our connection
+
+    async def initialize(self) -> None:
+        """Open the database and create the bucket table."""
+        self._db = await aiosqlite.connect(
+            self.db_path, timeout=self.busy_timeout, isolation_level=None
+        )
+        await self._db.execute("PRAGMA journal_mode=WAL")
+        await self._db.execute("""
+            CREATE TABLE IF NOT EXISTS token_buckets (
+                bucket TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                updated_at REAL NOT NULL  -- Unix time of the last refill
+            )
+        """)
+        logger.info(f"Shared rate limit buckets at {self.db_path}")
+
+    async def reserve(self, key: str, rate: int, period: float) -> float:
+        """
+        Take a token from a bucket holding at most rate tokens per period.
+
+        Returns:
+            Seconds the caller must wait before using the token (0 if available now)
+        """
+        if not self._db:
+            raise RuntimeError("SharedTokenBuckets not initialized")
+
+        async with self._lock:
+            await self._db.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = await self._db.execute(
+                    "SELECT tokens, updated_at FROM token_buckets WHERE bucket = ?", (key,)
+                )
+                row = await cursor.fetchone()
+
+                # Wall clock, not monotonic: the timestamp is compared across processes
+                now = time.time()
+                if row is None:
+                    tokens = float(rate)
+                else:
+                    elapsed = max(0.0, now - row[1])
+                    tokens = min(float(rate), row[0] + elapsed * (rate / period))
+                tokens -= 1
+
+                await self._db.execute(
+                    """INSERT INTO token_buckets (bucket, tokens, updated_at)
+                       VALUES (?, ?, ?)
+                       ON CONFLICT(bucket) DO UPDATE SET
+                           tokens = excluded.tokens,
+                           updated_at = excluded.updated_at""",
+                    (key, tokens, now),
+                )
+                await self._db.execute("COMMIT")
+            except BaseException:
+                await self._db.execute("ROLLBACK")
+                raise
+
+        return max(0.0, -tokens) * (period / rate)
+
+    async def close(self) -> None:
+        """Close database connection."""
+        if self._db:
+            await self._db.close()
+            self._db = None
+
+
 class RateLimiterPool:
     """
     Factory for per-API rate limiters.
@@ -110,9 +231,20 @@ class RateLimiterPool:
         "hacker_news": {"rate": 100, "period": 60},         # 100/min (conservative)
     }
 
-    def __init__(self):
+    def __init__(self, backend: Optional[SharedTokenBuckets] = None):
+        self.backend = backend
         self._limiters: Dict[str, AsyncRateLimiter] = {}
 
+    def configure(self, backend: Optional[SharedTokenBuckets]) -> None:
+        """
+        Switch every limiter, including ones already handed out, to a
+        shared backend (None = back to in-memory buckets).
+        """
+        self.backend = backend
+        for api_name, limiter in self._limiters.items():
+            limiter.backend = backend
+            limiter.key = api_name
+
     def get(self, api_name: str) -> AsyncRateLimiter:
         """
         Get or create rate limiter for an API.
@@ -128,6 +260,8 @@ class RateLimiterPool:
             self._limiters[api_name] = AsyncRateLimiter(
                 rate=limits["rate"],
                 period=limits["period"],
+                backend=self.backend,
+                key=api_name,
             )
             if limits["rate"]:
                 logger.info(
@@ -170,3 +304,30 @@ def reset_limiters() -> None:
     Primarily for testing purposes.
     """
     _global_pool.reset()
+
+
+def configure_rate_limiters(backend: Optional[SharedTokenBuckets]) -> None:
+    """Draw the global pool's limiters from a shared backend (None = in-memory)."""
+    _global_pool.configure(backend)
+
+
+@asynccontextmanager
+async def shared_rate_limits(db_path: Optional[str]) -> AsyncIterator[Optional[SharedTokenBuckets]]:
+    """
+    Share the global limiters' budgets through db_path for the duration.
+
+    Yields the open SharedTokenBuckets; with db_path None this does nothing
+    and limiters stay in-memory.
+    """
+    if not db_path:
+        yield None
+        return
+
+    backend = SharedTokenBuckets(db_path)
+    await backend.initialize()
+    configure_rate_limiters(backend)
+    try:
+        yield backend
+    finally:
+        configure_rate_limiters(None)
+        await backend.close()
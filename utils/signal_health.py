@@ -261,19 +261,19 @@ class SignalHealthMonitor:
 
         cutoff = datetime.now(timezone.utc) - timedelta(days=lookback_days)
 
-        cursor = await self.store._db.execute(
-            """
-            SELECT
-                id, signal_type, source_api, canonical_key,
-                confidence, detected_at, created_at
-            FROM signals
-            WHERE datetime(created_at) > datetime(?)
-            ORDER BY created_at DESC
-            """,
-            (cutoff.isoformat(),)
-        )
-
-        rows = await cursor.fetchall()
+        async with self.store.reader() as db:
+            cursor = await db.execute(
+                """
+                SELECT
+                    id, signal_type, source_api, canonical_key,
+                    confidence, detected_at, created_at
+                FROM signals
+                WHERE created_at_epoch > ?
+                ORDER BY created_at_epoch DESC
+                """,
+                (int(cutoff.timestamp()),)
+            )
+            rows = await cursor.fetchall()
 
         return [
             {
@@ -30,7 +30,7 @@ from datetime import datetime, timezone, timedelta
 from typing import Any, Dict, List, Optional, Set, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from storage.signal_store import SignalStore, StoredSignal
+    from storage.signal_store import CompanySignalStats, SignalBucket, SignalStore
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +45,7 @@ class VelocityConfig:
     # Time windows
     burst_window_hours: int = 48  # Window for "burst" detection
     convergence_window_days: int = 7  # Window for convergence detection
-    trend_window_days: int = 30  # Window for trend analysis
+    trend_window_days: int = 30  # Window for trend analysis (history loaded per company)
 
     # Thresholds
     burst_signal_threshold: int = 2  # Min signals for burst
@@ -248,33 +248,67 @@ class SignalVelocityTracker:
         Returns:
             VelocityMetrics with calculated values
         """
-        # Get all signals for this company
-        signals = await self.store.get_signals_for_company(canonical_key)
+        now = datetime.now(timezone.utc)
+        buckets, stats = await self._load_aggregates([canonical_key], now)
+        return self._compute_velocity(
+            canonical_key,
+            buckets.get(canonical_key, []),
+            stats.get(canonical_key),
+            now,
+        )
+
+    async def _load_aggregates(
+        self,
+        canonical_keys: List[str],
+        now: datetime,
+    ) -> tuple[Dict[str, List[SignalBucket]], Dict[str, CompanySignalStats]]:
+        """
+        Load precomputed per-company counters maintained by SignalStore on save.
 
-        if not signals:
-            return VelocityMetrics(canonical_key=canonical_key)
+        Every window below fits inside the trend window, so only that many
+        hourly buckets are read per company, however long its history.
+        """
+        buckets = await self.store.get_signal_buckets(
+            canonical_keys,
+            since=now - timedelta(days=self.config.trend_window_days),
+        )
+        stats = await self.store.get_company_signal_stats(canonical_keys)
+        return buckets, stats
 
-        now = datetime.now(timezone.utc)
+    def _compute_velocity(
+        self,
+        canonical_key: str,
+        buckets: List[SignalBucket],
+        stats: Optional[CompanySignalStats],
+        now: datetime,
+    ) -> VelocityMetrics:
+        """
+        Build VelocityMetrics from a company's hourly buckets and totals.
+
+        Window membership is decided by bucket start, so a signal near a
+        window edge can fall up to one bucket width early.
+        """
         metrics = VelocityMetrics(canonical_key=canonical_key)
 
-        # Calculate time-based counts
-        metrics.total_signals = len(signals)
+        if not buckets and not stats:
+            return metrics
 
-        for sig in signals:
-            age = now - sig.detected_at
+        # Calculate time-based counts
+        for bucket in buckets:
+            age = now - bucket.bucket_start
 
             if age <= timedelta(hours=24):
-                metrics.signals_24h += 1
+                metrics.signals_24h += bucket.count
             if age <= timedelta(hours=48):
-                metrics.signals_48h += 1
+                metrics.signals_48h += bucket.count
             if age <= timedelta(days=7):
-                metrics.signals_7d += 1
+                metrics.signals_7d += bucket.count
             if age <= timedelta(days=30):
-                metrics.signals_30d += 1
+                metrics.signals_30d += bucket.count
 
             # Track unique types and sources
-            metrics.unique_signal_types.add(sig.signal_type)
-            metrics.unique_sources.add(sig.source_api)
+            metrics.unique_signal_types.add(bucket.signal_type)
+            metrics.unique_sources.add(bucket.source_api)
 
         # Calculate velocities
         metrics.velocity_24h = metrics.signals_24h / 24.0 if metrics.signals_24h > 0 else 0
@@ -290,7 +324,7 @@ class SignalVelocityTracker:
             metrics.is_accelerating = metrics.signals_7d >= 2
 
         # Detect bursts
-        metrics.bursts = self._detect_bursts(signals, now)
+        metrics.bursts = self._detect_bursts(buckets, now)
         metrics.has_recent_burst = any(
             burst.is_significant and
             (now - burst.end_time) <= timedelta(hours=self.config.burst_window_hours)
@@ -298,67 +332,73 @@ class SignalVelocityTracker:
         )
 
         # Check convergence
-        recent_signals = [
-            s for s in signals
-            if (now - s.detected_at) <= timedelta(days=self.config.convergence_window_days)
+        recent_buckets = [
+            b for b in buckets
+            if (now - b.bucket_start) <= timedelta(days=self.config.convergence_window_days)
         ]
-        recent_types = set(s.signal_type for s in recent_signals)
-        recent_sources = set(s.source_api for s in recent_signals)
+        recent_types = set(b.signal_type for b in recent_buckets)
+        recent_sources = set(b.source_api for b in recent_buckets)
 
         metrics.has_type_convergence = len(recent_types) >= self.config.convergence_type_threshold
         metrics.has_source_convergence = len(recent_sources) >= 2
 
-        # Timing
-        sorted_signals = sorted(signals, key=lambda s: s.detected_at)
-        metrics.first_signal_at = sorted_signals[0].detected_at
-        metrics.last_signal_at = sorted_signals[-1].detected_at
+        # Totals and timing cover the full history, not just the trend window
+        if stats:
+            metrics.total_signals = stats.total_signals
+            metrics.first_signal_at = stats.first_signal_at
+            metrics.last_signal_at = stats.last_signal_at
+        else:
+            metrics.total_signals = sum(b.count for b in buckets)
+            metrics.first_signal_at = min(b.bucket_start for b in buckets)
+            metrics.last_signal_at = max(b.bucket_start for b in buckets)
 
         return metrics
 
     def _detect_bursts(
         self,
-        signals: List,  # List[StoredSignal]
+        buckets: List[SignalBucket],
         now: datetime,
     ) -> List[SignalBurst]:
         """
-        Detect signal bursts in the signal history.
+        Detect signal bursts in the bucketed signal history.
 
         A burst is 2+ signals within the burst window.
         """
-        if len(signals) < 2:
+        if sum(b.count for b in buckets) < 2:
             return []
 
         bursts = []
         window = timedelta(hours=self.config.burst_window_hours)
 
         # Sort by time
-        sorted_signals = sorted(signals, key=lambda s: s.detected_at)
+        sorted_buckets = sorted(buckets, key=lambda b: b.bucket_start)
 
         # Sliding window to find bursts
         i = 0
-        while i < len(sorted_signals):
-            # Start a potential burst at this signal
-            burst_signals = [sorted_signals[i]]
+        while i < len(sorted_buckets):
+            # Start a potential burst at this bucket
+            burst_buckets = [sorted_buckets[i]]
 
-            # Add all signals within the window
+            # Add all buckets within the window
             j = i + 1
-            while j < len(sorted_signals):
-                if sorted_signals[j].detected_at - sorted_signals[i].detected_at <= window:
-                    burst_signals.append(sorted_signals[j])
+            while j < len(sorted_buckets):
+                if sorted_buckets[j].bucket_start - sorted_buckets[i].bucket_start <= window:
+                    burst_buckets.append(sorted_buckets[j])
                     j += 1
                 else:
                     break
 
             # Check if this is a significant burst
-            if len(burst_signals) >= self.config.burst_signal_threshold:
+            signal_count = sum(b.count for b in burst_buckets)
+            if signal_count >= self.config.burst_signal_threshold:
                 burst = SignalBurst(
-                    canonical_key=burst_signals[0].canonical_key,
-                    signal_count=len(burst_signals),
-                    unique_types=set(s.signal_type for s in burst_signals),
-                    unique_sources=set(s.source_api for s in burst_signals),
+                    canonical_key=burst_buckets[0].canonical_key,
+                    signal_count=signal_count,
+                    unique_types=set(b.signal_type for b in burst_buckets),
+                    unique_sources=set(b.source_api for b in burst_buckets),
                     window_hours=self.config.burst_window_hours,
-                    start_time=burst_signals[0].detected_at,
-                    end_time=burst_signals[-1].detected_at,
+                    start_time=burst_buckets[0].bucket_start,
+                    end_time=burst_buckets[-1].bucket_start,
                 )
                 bursts.append(burst)
 
@@ -376,6 +416,8 @@ class SignalVelocityTracker:
         """
         Calculate velocity for multiple companies.
 
+        Counters for all companies are loaded in two batched queries.
+
         Args:
             canonical_keys: List of canonical keys
 
@@ -383,10 +425,19 @@ class SignalVelocityTracker:
             Dict mapping canonical_key to VelocityMetrics
         """
         results = {}
+        now = datetime.now(timezone.utc)
+
+        try:
+            buckets, stats = await self._load_aggregates(canonical_keys, now)
+        except Exception as e:
+            logger.error(f"Error loading velocity counters: {e}")
+            return {key: VelocityMetrics(canonical_key=key) for key in canonical_keys}
 
         for key in canonical_keys:
             try:
-                results[key] = await self.get_velocity(key)
+                results[key] = self._compute_velocity(
+                    key, buckets.get(key, []), stats.get(key), now
+                )
             except Exception as e:
                 logger.error(f"Error calculating velocity for {key}: {e}")
                 results[key] = VelocityMetrics(canonical_key=key)
@@ -0,0 +1,201 @@
+"""
+Tests for the on-disk conditional HTTP cache.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from utils.http_cache import CachingTransport, HttpCache
+
+
+def _origin(calls, etag='"v1"', body=b'{"stars": 1}'):
+    """Origin that honours If-None-Match and records request headers."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(dict(request.headers))
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(200, headers={"ETag": etag}, content=body)
+    return httpx.MockTransport(handler)
+
+
+class TestCachingTransport:
+    """Test TTL hits, revalidation and pass-through"""
+
+    @pytest.mark.asyncio
+    async def test_revalidates_with_etag_and_serves_304_from_disk(self, tmp_path):
+        """Without a TTL, repeats are conditional and 304s return the stored body"""
+        cache = HttpCache(str(tmp_path / "cache.db"))
+        await cache.initialize()
+        calls = []
+        client = httpx.AsyncClient(transport=CachingTransport(cache, "uspto", _origin(calls)))
+
+        first = await client.get("https://api.example.com/repo")
+        second = await client.get("https://api.example.com/repo")
+
+        assert first.json() == second.json() == {"stars": 1}
+        assert second.status_code == 200
+        assert "if-none-match" not in calls[0]
+        assert calls[1]["if-none-match"] == '"v1"'
+        assert (cache.misses, cache.revalidated) == (1, 1)
+
+        await client.aclose()
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_fresh_entries_skip_the_request(self, tmp_path):
+        """Within the API's TTL no request is made, even across restarts"""
+        path = str(tmp_path / "cache.db")
+        cache = HttpCache(path, ttls={"github": 3600})
+        await cache.initialize()
+        calls = []
+        client = httpx.AsyncClient(transport=CachingTransport(cache, "github", _origin(calls)))
+        await client.get("https://api.github.com/repos/a/b")
+        await client.aclose()
+        await cache.close()
+
+        cache = HttpCache(path, ttls={"github": 3600})
+        await cache.initialize()
+        client = httpx.AsyncClient(transport=CachingTransport(cache, "github", _origin(calls)))
+        response = await client.get("https://api.github.com/repos/a/b")
+
+        assert response.json() == {"stars": 1}
+        assert len(calls) == 1
+        assert cache.hits == 1
+
+        await client.aclose()
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_non_get_and_errors_are_not_cached(self):
+        """POSTs and non-200 responses always go to the origin"""
+        cache = HttpCache(":memory:", ttls={"uspto": 3600})
+        await cache.initialize()
+        calls = []
+
+        def handler(request):
+            calls.append(request.method)
+            status = 404 if request.url.path == "/missing" else 200
+            return httpx.Response(status, json={"ok": True})
+
+        client = httpx.AsyncClient(
+            transport=CachingTransport(cache, "uspto", httpx.MockTransport(handler))
+        )
+        for _ in range(2):
+            await client.post("https://api.example.com/query", json={})
+            await client.get("https://api.example.com/missing")
+
+        assert calls == ["POST", "GET", "POST", "GET"]
+        assert cache.size_bytes == 0
+
+        await client.aclose()
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_body_streams_through_and_is_stored_once_read(self):
+        """The caller gets chunks as they arrive; the full body is cached at the end"""
+        cache = HttpCache(":memory:", ttls={"sec_edgar": 3600})
+        await cache.initialize()
+        first_chunk_read = asyncio.Event()
+        calls = []
+
+        async def body():
+            yield b"<feed>"
+            await asyncio.wait_for(first_chunk_read.wait(), timeout=1)
+            yield b"</feed>"
+
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(200, content=body())
+
+        client = httpx.AsyncClient(
+            transport=CachingTransport(cache, "sec_edgar", httpx.MockTransport(handler))
+        )
+        async with client.stream("GET", "https://www.sec.gov/feed") as response:
+            chunks = response.aiter_raw()
+            assert await chunks.__anext__() == b"<feed>"
+            assert cache.size_bytes == 0  # Not stored until fully read
+            first_chunk_read.set()
+            assert [chunk async for chunk in chunks] == [b"</feed>"]
+
+        cached = await client.get("https://www.sec.gov/feed")
+
+        assert cached.content == b"<feed></feed>"
+        assert calls == ["/feed"]
+        assert cache.hits == 1
+
+        await client.aclose()
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_abandoned_and_unreusable_bodies_are_not_cached(self):
+        """Partly read bodies, and bodies with no TTL or validators, are never stored"""
+        cache = HttpCache(":memory:", ttls={"github": 3600})
+        await cache.initialize()
+
+        def handler(request):
+            return httpx.Response(200, content=b"x" * 4096)
+
+        for api_name in ("github", "uspto"):
+            client = httpx.AsyncClient(
+                transport=CachingTransport(cache, api_name, httpx.MockTransport(handler))
+            )
+            async with client.stream("GET", "https://api.example.com/big") as response:
+                async for _ in response.aiter_bytes(1024):
+                    break
+            assert (await client.get("https://api.example.com/other")).content == b"x" * 4096
+            await client.aclose()
+
+        cursor = await cache._db.execute("SELECT api_name, url FROM http_cache")
+        assert await cursor.fetchall() == [("github", "https://api.example.com/other")]
+        await cache.close()
+
+
+class TestHttpCacheEviction:
+    """Test size-bounded LRU eviction"""
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        """Entries not read recently are dropped first once over max_bytes"""
+        import os
+
+        cache = HttpCache(":memory:", max_bytes=2500)
+        await cache.initialize()
+        body = os.urandom(1000)  # Incompressible
+        response = httpx.Response(200, headers={"ETag": '"x"'})
+
+        await cache.put("a", "github", "https://x/a", response, body)
+        await cache.put("b", "github", "https://x/b", response, body)
+        assert await cache.get("a") is not None  # a is now more recent than b
+        await cache.put("c", "github", "https://x/c", response, body)
+
+        assert await cache.get("b") is None
+        assert (await cache.get("a")).body == body
+        assert await cache.get("c") is not None
+        assert cache.size_bytes <= 2500
+
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_reads_do_not_write(self, tmp_path):
+        """Hits update access times in memory; they are saved on close"""
+        path = str(tmp_path / "cache.db")
+        cache = HttpCache(path)
+        await cache.initialize()
+        response = httpx.Response(200, headers={"ETag": '"x"'})
+        await cache.put("a", "github", "https://x/a", response, b"body")
+        cursor = await cache._db.execute("SELECT last_access FROM http_cache")
+        stored_access = (await cursor.fetchone())[0]
+
+        changes = cache._db.total_changes
+        for _ in range(5):
+            assert await cache.get("a") is not None
+        assert cache._db.total_changes == changes
+        await cache.close()
+
+        cache = HttpCache(path)
+        await cache.initialize()
+        cursor = await cache._db.execute("SELECT last_access FROM http_cache")
+        assert (await cursor.fetchone())[0] > stored_access
+        await cache.close()
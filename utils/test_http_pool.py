@@ -0,0 +1,62 @@
+"""
+Tests for the shared HTTP client pool.
+"""
+
+import pytest
+import httpx
+
+from utils.http_pool import HttpClientPool, HttpPoolConfig
+
+
+class TestHttpClientPool:
+    """Test HttpClientPool reuse and lifecycle"""
+
+    @pytest.mark.asyncio
+    async def test_same_api_reuses_client(self):
+        """get() should return one long-lived client per API"""
+        pool = HttpClientPool()
+
+        github = pool.get("github")
+        assert pool.get("github") is github
+        assert pool.get("sec_edgar") is not github
+        assert len(pool) == 2
+
+        await pool.aclose()
+        assert github.is_closed
+        assert len(pool) == 0
+
+    @pytest.mark.asyncio
+    async def test_closed_client_is_replaced(self):
+        """A client closed elsewhere should not be handed out again"""
+        pool = HttpClientPool()
+        client = pool.get("github")
+        await client.aclose()
+
+        replacement = pool.get("github")
+        assert replacement is not client
+        assert not replacement.is_closed
+
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_config_sets_timeouts(self):
+        """Pool timeout applies except for APIs with their own"""
+        pool = HttpClientPool(HttpPoolConfig(timeout=5.0))
+
+        assert pool.get("github").timeout == httpx.Timeout(5.0)
+        assert pool.get("arxiv").timeout == httpx.Timeout(60.0)
+
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_http2_falls_back_without_h2(self, monkeypatch):
+        """HTTP/2 requires h2; without it the pool uses HTTP/1.1"""
+        import importlib.util
+
+        monkeypatch.setattr(importlib.util, "find_spec", lambda name: None)
+        pool = HttpClientPool(HttpPoolConfig(http2=True))
+
+        assert pool.get("github") is not None
+        assert pool.config.http2 is False
+
+        await pool.aclose()
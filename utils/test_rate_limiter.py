@@ -191,3 +191,93 @@ class TestConcurrentAccess:
 
         assert len(results) == 5
         assert sorted(results) == [0, 1, 2, 3, 4]
+
+
+class TestSharedTokenBuckets:
+    """Test the cross-process SQLite bucket backend"""
+
+    @pytest.mark.asyncio
+    async def test_connections_share_one_budget(self, tmp_path):
+        """Two connections to one file (two processes) draw from the same bucket"""
+        from utils.rate_limiter import SharedTokenBuckets
+
+        path = str(tmp_path / "rate_limits.db")
+        first, second = SharedTokenBuckets(path), SharedTokenBuckets(path)
+        await first.initialize()
+        await second.initialize()
+        try:
+            waits = [
+                await first.reserve("github", rate=3, period=1),
+                await second.reserve("github", rate=3, period=1),
+                await first.reserve("github", rate=3, period=1),
+                await second.reserve("github", rate=3, period=1),
+                await first.reserve("github", rate=3, period=1),
+            ]
+
+            assert waits[:3] == [0, 0, 0]
+            # Budget spent: later callers queue a third of a second apart
+            assert 0.2 < waits[3] <= 1 / 3
+            assert 0.5 < waits[4] <= 2 / 3
+            assert await second.reserve("sec_edgar", rate=10, period=1) == 0
+        finally:
+            await first.close()
+            await second.close()
+
+    @pytest.mark.asyncio
+    async def test_limiters_throttle_across_backends(self, tmp_path):
+        """Limiters in different 'processes' together stay within the rate"""
+        from utils.rate_limiter import AsyncRateLimiter, SharedTokenBuckets
+
+        path = str(tmp_path / "rate_limits.db")
+        backends = [SharedTokenBuckets(path), SharedTokenBuckets(path)]
+        for backend in backends:
+            await backend.initialize()
+        try:
+            limiters = [
+                AsyncRateLimiter(rate=4, period=1, backend=backend, key="github")
+                for backend in backends
+            ]
+
+            start = time.monotonic()
+            await asyncio.gather(*(limiters[i % 2].acquire() for i in range(6)))
+            elapsed = time.monotonic() - start
+
+            # 4 immediately, then 2 more at 4/second
+            assert elapsed >= 0.4
+        finally:
+            for backend in backends:
+                await backend.close()
+
+    @pytest.mark.asyncio
+    async def test_pool_configure_switches_existing_limiters(self, tmp_path):
+        """configure() applies to limiters already handed out, and None reverts"""
+        from utils.rate_limiter import RateLimiterPool, SharedTokenBuckets
+
+        backend = SharedTokenBuckets(str(tmp_path / "rate_limits.db"))
+        await backend.initialize()
+        try:
+            pool = RateLimiterPool()
+            github = pool.get("github")
+            assert github.backend is None
+
+            pool.configure(backend)
+            assert github.backend is backend
+            assert pool.get("sec_edgar").backend is backend
+            assert pool.get("sec_edgar").key == "sec_edgar"
+
+            pool.configure(None)
+            assert github.backend is None
+        finally:
+            await backend.close()
+
+    @pytest.mark.asyncio
+    async def test_backend_failure_falls_back_to_memory(self):
+        """An unusable backend doesn't block requests; the local bucket applies"""
+        from utils.rate_limiter import AsyncRateLimiter, SharedTokenBuckets
+
+        backend = SharedTokenBuckets(":memory:")  # Never initialized
+        limiter = AsyncRateLimiter(rate=100, period=1, backend=backend, key="github")
+
+        await limiter.acquire()
+
+        assert limiter._tokens == 99
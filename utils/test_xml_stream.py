@@ -0,0 +1,62 @@
+"""
+Tests for incremental XML parsing.
+"""
+
+from xml.etree import ElementTree as ET
+
+import pytest
+
+from utils.xml_stream import ATOM_ENTRY, XmlElementStream, aiter_elements, iter_elements
+
+FEED = (
+    b'<?xml version="1.0" encoding="UTF-8"?>'
+    b'<feed xmlns="http://www.w3.org/2005/Atom"><title>Feed</title>'
+    + b"".join(
+        b"<entry><id>%d</id><title>Entry %d</title></entry>" % (i, i) for i in range(20)
+    )
+    + b"</feed>"
+)
+
+ATOM_ID = "{http://www.w3.org/2005/Atom}id"
+
+
+class TestXmlElementStream:
+    """Test chunked parsing and element release"""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64, len(FEED)])
+    def test_entries_yielded_in_order_across_chunks(self, chunk_size):
+        """Entries come out complete and in order however the bytes are split"""
+        stream = XmlElementStream(ATOM_ENTRY)
+        ids = []
+        for start in range(0, len(FEED), chunk_size):
+            ids.extend(e.findtext(ATOM_ID) for e in stream.feed(FEED[start:start + chunk_size]))
+        ids.extend(e.findtext(ATOM_ID) for e in stream.close())
+
+        assert ids == [str(i) for i in range(20)]
+
+    def test_processed_entries_are_released(self):
+        """The document root keeps no entries once they have been consumed"""
+        stream = XmlElementStream(ATOM_ENTRY)
+        entries = list(stream.feed(FEED[:-len(b"</feed>")]))  # Root still open
+        root = stream._open[0]
+
+        assert len(entries) == 20
+        assert all(len(entry) == 0 for entry in entries)  # Cleared
+        assert [child.tag for child in root] == ["{http://www.w3.org/2005/Atom}title"]
+
+    def test_truncated_document_raises(self):
+        """A body cut off mid-document is a parse error, not a short feed"""
+        with pytest.raises(ET.ParseError):
+            list(iter_elements(FEED[:-40], ATOM_ENTRY))
+
+    @pytest.mark.asyncio
+    async def test_aiter_elements(self):
+        """Async chunks parse the same as an in-memory document"""
+        async def chunks():
+            for start in range(0, len(FEED), 100):
+                yield FEED[start:start + 100]
+
+        ids = [e.findtext(ATOM_ID) async for e in aiter_elements(chunks(), [ATOM_ENTRY])]
+
+        assert ids == [e.findtext(ATOM_ID) for e in iter_elements(FEED.decode(), ATOM_ENTRY)]
+        assert len(ids) == 20
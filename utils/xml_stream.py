@@ -0,0 +1,97 @@
+"""
+Incremental XML Parsing for Discovery Engine Collectors.
+
+Parses feeds (arXiv Atom, SEC EDGAR Atom, RSS) as their bytes arrive
+instead of buffering the whole response and building a full tree:
+- XMLPullParser fed chunk by chunk from a streamed response body
+- Yields each completed element with a wanted tag (e.g. Atom <entry>)
+- Clears and detaches yielded elements, so memory stays bounded by one
+  entry rather than the whole document
+
+Usage:
+    from utils.xml_stream import aiter_elements
+
+    async with client.stream("GET", url) as response:
+        response.raise_for_status()
+        async for entry in aiter_elements(response.aiter_bytes(), ATOM_ENTRY):
+            handle(entry)  # Read it now; it is cleared once the loop moves on
+
+Tags are matched as ElementTree reports them: "{namespace}local" for
+namespaced elements, the bare name otherwise.
+"""
+
+from __future__ import annotations
+
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, List, Union
+from xml.etree import ElementTree as ET
+
+# Bytes fed to the parser at a time when parsing an in-memory document
+CHUNK_SIZE = 64 * 1024
+
+ATOM_NS = "http://www.w3.org/2005/Atom"
+ATOM_ENTRY = f"{{{ATOM_NS}}}entry"
+
+
+class XmlElementStream:
+    """
+    Push parser yielding completed elements with the given tags.
+
+    Feed it chunks of the document; each feed() returns the elements
+    that chunk completed. An element is cleared and removed from its
+    parent as soon as the consumer asks for the next one, so take what
+    you need from it inside the loop.
+
+    Raises xml.etree.ElementTree.ParseError on malformed input.
+    """
+
+    def __init__(self, tags: Union[str, Iterable[str]]):
+        self.tags = {tags} if isinstance(tags, str) else set(tags)
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._open: List[ET.Element] = []  # Ancestors of the current element
+
+    def feed(self, data: Union[bytes, str]) -> Iterator[ET.Element]:
+        """Parse a chunk and yield the wanted elements it completed."""
+        self._parser.feed(data)
+        return self._drain()
+
+    def close(self) -> Iterator[ET.Element]:
+        """Finish the document (raises ParseError if it is truncated)."""
+        self._parser.close()
+        return self._drain()
+
+    def _drain(self) -> Iterator[ET.Element]:
+        for event, element in self._parser.read_events():
+            if event == "start":
+                self._open.append(element)
+                continue
+
+            self._open.pop()
+            if element.tag in self.tags:
+                yield element
+                element.clear()
+                if self._open:
+                    self._open[-1].remove(element)
+
+
+def iter_elements(
+    document: Union[bytes, str],
+    tags: Union[str, Iterable[str]],
+) -> Iterator[ET.Element]:
+    """Yield wanted elements from an in-memory document, parsing it in chunks."""
+    stream = XmlElementStream(tags)
+    for start in range(0, len(document), CHUNK_SIZE):
+        yield from stream.feed(document[start:start + CHUNK_SIZE])
+    yield from stream.close()
+
+
+async def aiter_elements(
+    chunks: AsyncIterable[bytes],
+    tags: Union[str, Iterable[str]],
+) -> AsyncIterator[ET.Element]:
+    """Yield wanted elements as the chunks of a streamed body arrive."""
+    stream = XmlElementStream(tags)
+    async for chunk in chunks:
+        for element in stream.feed(chunk):
+            yield element
+    for element in stream.close():
+        yield element
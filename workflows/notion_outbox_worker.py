@@ -67,12 +67,11 @@ class NotionOutboxWorker:
                 notion_page_id = result.get("page_id")
                 metadata = payload.get("metadata") or {}
 
-                for signal_id in payload.get("signal_ids", []):
-                    await self.store.mark_pushed(
-                        signal_id=signal_id,
-                        notion_page_id=notion_page_id,
-                        metadata=metadata,
-                    )
+                await self.store.mark_pushed_many(
+                    payload.get("signal_ids", []),
+                    notion_page_id=notion_page_id,
+                    metadata=metadata,
+                )
 
             except Exception as exc:
                 stats["failed"] += 1
@@ -589,15 +589,14 @@ class NotionPusher:
         if self.dry_run:
             return
 
-        for signal in signals:
-            try:
-                await self.store.mark_pushed(
-                    signal_id=signal.id,
-                    notion_page_id=notion_page_id,
-                    metadata=metadata
-                )
-            except Exception as e:
-                logger.error(f"Error marking signal {signal.id} as pushed: {e}")
+        try:
+            await self.store.mark_pushed_many(
+                [signal.id for signal in signals],
+                notion_page_id=notion_page_id,
+                metadata=metadata
+            )
+        except Exception as e:
+            logger.error(f"Error marking {len(signals)} signals as pushed: {e}")
 
     async def _mark_signals_rejected(
         self,
@@ -609,15 +608,14 @@ class NotionPusher:
         if self.dry_run:
             return
 
-        for signal in signals:
-            try:
-                await self.store.mark_rejected(
-                    signal_id=signal.id,
-                    reason=reason,
-                    metadata=metadata
-                )
-            except Exception as e:
-                logger.error(f"Error marking signal {signal.id} as rejected: {e}")
+        try:
+            await self.store.mark_rejected_many(
+                [signal.id for signal in signals],
+                reason=reason,
+                metadata=metadata
+            )
+        except Exception as e:
+            logger.error(f"Error marking {len(signals)} signals as rejected: {e}")
 
 
 # =============================================================================
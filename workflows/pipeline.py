@@ -41,7 +41,8 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
 # Storage
-from storage.signal_store import SignalStore, StoredSignal
+from storage.connection_manager import ConnectionManager
+from storage.signal_store import SignalStore, StoredSignal, SuppressionEntry
 from storage.source_asset_store import SourceAssetStore, SourceAsset
 from storage.founder_store import FounderStore
 from storage.entity_resolution import EntityResolutionStore, AssetToLead
@@ -51,6 +52,11 @@ from consumer.entity_resolver import EntityResolver, ResolverConfig
 # Velocity tracking (Harmonic enhancement)
 from utils.signal_velocity import SignalVelocityTracker, VelocityConfig
 
+# Shared HTTP clients for collectors
+from utils.http_cache import HttpCache
+from utils.http_pool import HttpPoolConfig, close_http_clients, configure_http_pool
+from utils.rate_limiter import SharedTokenBuckets, configure_rate_limiters
+
 # Verification
 from verification.verification_gate_v2 import (
     VerificationGate,
@@ -98,6 +104,16 @@ class PipelineMode(str, Enum):
     SYNC_ONLY = "sync"         # Sync suppression cache
 
 
+def _parse_ttls(value: str) -> Dict[str, float]:
+    """Parse "github=600,sec_edgar=3600" into per-API TTL seconds."""
+    ttls: Dict[str, float] = {}
+    for item in value.split(","):
+        name, _, seconds = item.partition("=")
+        if name.strip() and seconds.strip():
+            ttls[name.strip()] = float(seconds)
+    return ttls
+
+
 @dataclass
 class PipelineConfig:
     """Configuration for the discovery pipeline"""
@@ -105,6 +121,9 @@ class PipelineConfig:
     # Storage
     db_path: str = "signals.db"
     asset_store_path: str = "assets.db"  # SourceAssetStore path
+    db_wal_mode: bool = False  # WAL journaling + read-only connection pool
+    archive_db_path: Optional[str] = None  # Cold tier for archived signals/runs
+    retention_days: int = 0  # Archive pushed/rejected signals older than this (0 = off)
 
     # Notion
     notion_api_key: Optional[str] = None
@@ -118,6 +137,18 @@ class PipelineConfig:
     # Execution
     parallel_collectors: bool = True  # Run collectors in parallel
     batch_size: int = 50             # Process signals in batches
+    drain_pending: bool = False      # Process every pending signal, batch_size at a time
+
+    # HTTP connection pool (shared keep-alive clients per API)
+    http_max_connections: int = 20
+    http_max_keepalive: int = 10
+    http_keepalive_expiry: float = 30.0  # Seconds an idle connection is kept
+    http_timeout: float = 30.0
+    http2: bool = False              # Needs the h2 package
+    http_cache_path: Optional[str] = None  # On-disk conditional GET cache (None = off)
+    http_cache_max_mb: int = 256
+    http_cache_ttls: Dict[str, float] = field(default_factory=dict)  # Per-API TTL overrides
+    rate_limit_db_path: Optional[str] = None  # API budgets shared across processes (None = per process)
 
     # Verification
     strict_mode: bool = False        # Require 2+ sources for auto-push
@@ -140,6 +171,9 @@ class PipelineConfig:
         return cls(
             db_path=os.getenv("DISCOVERY_DB_PATH", "signals.db"),
             asset_store_path=os.getenv("ASSET_STORE_PATH", "assets.db"),
+            db_wal_mode=os.getenv("DISCOVERY_DB_WAL", "false").lower() == "true",
+            archive_db_path=os.getenv("ARCHIVE_DB_PATH") or None,
+            retention_days=int(os.getenv("RETENTION_DAYS", "0")),
             notion_api_key=os.getenv("NOTION_API_KEY"),
             notion_database_id=os.getenv("NOTION_DATABASE_ID"),
             watchlist_database_id=os.getenv("NOTION_WATCHLIST_DATABASE_ID"),
@@ -147,6 +181,16 @@ class PipelineConfig:
             companies_house_api_key=os.getenv("COMPANIES_HOUSE_API_KEY"),
             parallel_collectors=os.getenv("PARALLEL_COLLECTORS", "true").lower() == "true",
             batch_size=int(os.getenv("BATCH_SIZE", "50")),
+            drain_pending=os.getenv("DRAIN_PENDING", "false").lower() == "true",
+            http_max_connections=int(os.getenv("HTTP_MAX_CONNECTIONS", "20")),
+            http_max_keepalive=int(os.getenv("HTTP_MAX_KEEPALIVE", "10")),
+            http_keepalive_expiry=float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30")),
+            http_timeout=float(os.getenv("HTTP_TIMEOUT", "30")),
+            http2=os.getenv("HTTP2", "false").lower() == "true",
+            http_cache_path=os.getenv("HTTP_CACHE_PATH") or None,
+            http_cache_max_mb=int(os.getenv("HTTP_CACHE_MAX_MB", "256")),
+            http_cache_ttls=_parse_ttls(os.getenv("HTTP_CACHE_TTLS", "")),
+            rate_limit_db_path=os.getenv("RATE_LIMIT_DB_PATH") or None,
             strict_mode=os.getenv("STRICT_MODE", "false").lower() == "true",
             warmup_suppression_cache=os.getenv("WARMUP_SUPPRESSION_CACHE", "true").lower() == "true",
             use_gating=os.getenv("USE_GATING", "true").lower() == "true",
@@ -281,6 +325,8 @@ class DiscoveryPipeline:
         self._watchlist_loader: Optional[WatchlistLoader] = None
         self._gate: Optional[VerificationGate] = None
         self._asset_store: Optional[SourceAssetStore] = None
+        self._http_cache: Optional[HttpCache] = None
+        self._rate_limit_buckets: Optional[SharedTokenBuckets] = None
         self._signal_processor: Optional[SignalProcessor] = None
         self._entity_resolver: Optional[EntityResolver] = None
         self._entity_resolution_store: Optional[EntityResolutionStore] = None
@@ -291,6 +337,9 @@ class DiscoveryPipeline:
         self._founder_store: Optional[FounderStore] = None
         self._velocity_tracker: Optional[SignalVelocityTracker] = None
 
+        # Shared SQLite connection for SignalStore/EntityResolutionStore/FounderStore
+        self._connection: Optional[ConnectionManager] = None
+
         # State
         self._initialized = False
 
@@ -301,8 +350,19 @@ class DiscoveryPipeline:
 
         logger.info("Initializing discovery pipeline...")
 
+        # One write connection for every store on config.db_path, so
+        # cross-store writes can share a transaction
+        self._connection = ConnectionManager(
+            self.config.db_path,
+            wal_mode=self.config.db_wal_mode,
+        )
+        await self._connection.initialize()
+
         # Initialize signal store
-        self._store = SignalStore(db_path=self.config.db_path)
+        self._store = SignalStore(
+            connection=self._connection,
+            archive_path=self.config.archive_db_path,
+        )
         await self._store.initialize()
 
         # Initialize Notion connector (if credentials provided)
@@ -331,6 +391,30 @@ class DiscoveryPipeline:
         # Initialize verification gate
         self._gate = VerificationGate(strict_mode=self.config.strict_mode)
 
+        # Shared HTTP clients (and optional response cache) for collectors;
+        # closed in close()
+        if self.config.http_cache_path:
+            self._http_cache = HttpCache(
+                self.config.http_cache_path,
+                max_bytes=self.config.http_cache_max_mb * 1024 * 1024,
+                ttls=self.config.http_cache_ttls,
+            )
+            await self._http_cache.initialize()
+        configure_http_pool(HttpPoolConfig(
+            max_connections=self.config.http_max_connections,
+            max_keepalive_connections=self.config.http_max_keepalive,
+            keepalive_expiry=self.config.http_keepalive_expiry,
+            timeout=self.config.http_timeout,
+            http2=self.config.http2,
+            cache=self._http_cache,
+        ))
+
+        # Rate limit budgets shared with other pipeline/collector processes
+        if self.config.rate_limit_db_path:
+            self._rate_limit_buckets = SharedTokenBuckets(self.config.rate_limit_db_path)
+            await self._rate_limit_buckets.initialize()
+            configure_rate_limiters(self._rate_limit_buckets)
+
         # Initialize SourceAssetStore (if enabled)
         if self.config.use_asset_store:
             self._asset_store = SourceAssetStore(db_path=self.config.asset_store_path)
@@ -349,14 +433,16 @@ class DiscoveryPipeline:
             self._entity_resolver = EntityResolver(resolver_config)
 
             # Initialize EntityResolutionStore
-            self._entity_resolution_store = EntityResolutionStore(db_path=self.config.db_path)
+            self._entity_resolution_store = EntityResolutionStore(
+                connection=self._connection,
+            )
             await self._entity_resolution_store.initialize()
 
             logger.info("EntityResolver + EntityResolutionStore initialized")
 
         # Initialize FounderStore (if founder scoring enabled)
         if self.config.use_founder_scoring:
-            self._founder_store = FounderStore(db_path=self.config.db_path)
+            self._founder_store = FounderStore(connection=self._connection)
             await self._founder_store.initialize()
             logger.info("FounderStore initialized (founder intelligence enabled)")
 
@@ -413,11 +499,22 @@ class DiscoveryPipeline:
             self._notion_transport = None
         self._notion_outbox_worker = None
         self._notion = None
+        await close_http_clients()
+        if self._http_cache:
+            await self._http_cache.close()
+            self._http_cache = None
+        if self._rate_limit_buckets:
+            configure_rate_limiters(None)
+            await self._rate_limit_buckets.close()
+            self._rate_limit_buckets = None
         self._watchlist_loader = None
         if self._notifier:
             await self._notifier.close()
             self._notifier = None
         self._velocity_tracker = None
+        if self._connection:
+            await self._connection.close()
+            self._connection = None
         self._initialized = False
 
     async def _warmup_suppression_cache(self) -> None:
@@ -518,6 +615,14 @@ class DiscoveryPipeline:
                     stats.prospects_updated = outbox_stats["updated"]
                     stats.prospects_skipped = outbox_stats["skipped"]
 
+            # Stage 3: Move finished signals out of the hot tables
+            if not dry_run and self.config.retention_days > 0:
+                await self._apply_retention()
+
+            # Re-keyframe asset snapshot chains that have grown too long
+            if not dry_run and self._asset_store:
+                await self._compact_asset_snapshots()
+
             # Generate final health report
             if self._health_monitor:
                 try:
@@ -896,13 +1001,40 @@ class DiscoveryPipeline:
             "prospects_skipped": 0,
         }
 
-        # Get pending signals
-        pending = await self._store.get_pending_signals(limit=self.config.batch_size)
+        if self.config.drain_pending:
+            # Walk the whole backlog one keyset page at a time
+            pages = 0
+            async for pending in self._store.iter_pending_signals(
+                page_size=self.config.batch_size
+            ):
+                pages += 1
+                logger.info(f"Processing pending page {pages} ({len(pending)} signals)")
+                await self._process_pending_batch(pending, dry_run, stats)
+
+            if not pages:
+                logger.info("No pending signals to process")
+                return stats
+        else:
+            # Get pending signals
+            pending = await self._store.get_pending_signals(limit=self.config.batch_size)
+
+            if not pending:
+                logger.info("No pending signals to process")
+                return stats
 
-        if not pending:
-            logger.info("No pending signals to process")
-            return stats
+            await self._process_pending_batch(pending, dry_run, stats)
 
+        logger.info(f"Processing stage complete: {stats}")
+
+        return stats
+
+    async def _process_pending_batch(
+        self,
+        pending: List[StoredSignal],
+        dry_run: bool,
+        stats: Dict[str, int],
+    ) -> None:
+        """Group one batch of pending signals by company and process them, updating stats."""
         logger.info(f"Processing {len(pending)} pending signals")
 
         # Group by canonical key
@@ -917,10 +1049,18 @@ class DiscoveryPipeline:
             by_key = await self._regroup_signals_by_entity(by_key)
             logger.info(f"After entity regrouping: {len(by_key)} unique entities")
 
+        # One set-based suppression lookup for the whole batch, keyed by the
+        # signals' own canonical keys (entity regrouping may have re-keyed by_key)
+        suppression_map = await self._store.suppression_for(
+            list({sig.canonical_key for group in by_key.values() for sig in group})
+        )
+
         # Process each company
         for canonical_key, company_signals in by_key.items():
             try:
-                result = await self._process_company(company_signals, dry_run)
+                result = await self._process_company(
+                    company_signals, dry_run, suppression_map=suppression_map
+                )
 
                 # Update stats
                 stats["processed"] += len(company_signals)
@@ -945,12 +1085,9 @@ class DiscoveryPipeline:
                 logger.exception(f"Error processing company {canonical_key}")
 
                 # Mark signals as rejected
-                for sig in company_signals:
-                    await self._store.mark_rejected(sig.id, str(e))
-
-        logger.info(f"Processing stage complete: {stats}")
-
-        return stats
+                await self._store.mark_rejected_many(
+                    [sig.id for sig in company_signals], str(e)
+                )
 
     async def _drain_notion_outbox(self, limit: Optional[int] = None) -> Dict[str, int]:
         """Drain queued Notion writes from the outbox."""
@@ -986,6 +1123,7 @@ class DiscoveryPipeline:
         self,
         signals: List[StoredSignal],
         dry_run: bool,
+        suppression_map: Optional[Dict[str, SuppressionEntry]] = None,
     ) -> Dict[str, Any]:
         """
         Process all signals for a single company.
@@ -997,6 +1135,12 @@ class DiscoveryPipeline:
         4. Queue Notion write if appropriate
         5. Update signal status
 
+        Args:
+            signals: Signals for this company
+            dry_run: If True, don't queue Notion writes
+            suppression_map: Suppression entries prefetched by the caller via
+                SignalStore.suppression_for(); queried per company if None
+
         Returns dict with decision and Notion status.
         """
         if not signals:
@@ -1005,7 +1149,10 @@ class DiscoveryPipeline:
         canonical_key = signals[0].canonical_key
 
         # Check suppression cache
-        suppressed = await self._store.check_suppression(canonical_key)
+        if suppression_map is not None:
+            suppressed = suppression_map.get(canonical_key)
+        else:
+            suppressed = await self._store.check_suppression(canonical_key)
 
         if suppressed:
             logger.info(
@@ -1014,12 +1161,11 @@ class DiscoveryPipeline:
             )
 
             # Mark as rejected (already in CRM)
-            for sig in signals:
-                await self._store.mark_rejected(
-                    sig.id,
-                    f"Suppressed: already in Notion with status {suppressed.status}",
-                    metadata={"notion_page_id": suppressed.notion_page_id},
-                )
+            await self._store.mark_rejected_many(
+                [sig.id for sig in signals],
+                f"Suppressed: already in Notion with status {suppressed.status}",
+                metadata={"notion_page_id": suppressed.notion_page_id},
+            )
 
             return {
                 "decision": PushDecision.REJECT,
@@ -1193,18 +1339,17 @@ class DiscoveryPipeline:
                 notion_status = notion_result["status"]
 
                 # Mark signals as queued
-                for sig in signals:
-                    await self._store.mark_queued(
-                        sig.id,
-                        metadata={
-                            "decision": verification.decision.value,
-                            "confidence": verification.confidence_score,
-                            "status": verification.suggested_status,
-                            "verification_status": verification.verification_status.value,
-                            "outbox_id": notion_result["outbox_id"],
-                            "idempotency_key": notion_result["idempotency_key"],
-                        },
-                    )
+                await self._store.mark_queued_many(
+                    [sig.id for sig in signals],
+                    metadata={
+                        "decision": verification.decision.value,
+                        "confidence": verification.confidence_score,
+                        "status": verification.suggested_status,
+                        "verification_status": verification.verification_status.value,
+                        "outbox_id": notion_result["outbox_id"],
+                        "idempotency_key": notion_result["idempotency_key"],
+                    },
+                )
 
                 # Notify Slack for high-confidence signals
                 if (
@@ -1236,17 +1381,16 @@ class DiscoveryPipeline:
                 )
 
                 # Mark as pushed with dummy page ID
-                for sig in signals:
-                    await self._store.mark_pushed(
-                        sig.id,
-                        notion_page_id="dry-run-placeholder",
-                        metadata={
-                            "decision": verification.decision.value,
-                            "confidence": verification.confidence_score,
-                            "status": verification.suggested_status,
-                            "dry_run": True,
-                        },
-                    )
+                await self._store.mark_pushed_many(
+                    [sig.id for sig in signals],
+                    notion_page_id="dry-run-placeholder",
+                    metadata={
+                        "decision": verification.decision.value,
+                        "confidence": verification.confidence_score,
+                        "status": verification.suggested_status,
+                        "dry_run": True,
+                    },
+                )
 
                 notion_status = "dry_run"
 
@@ -1256,8 +1400,9 @@ class DiscoveryPipeline:
 
         elif verification.decision == PushDecision.REJECT:
             # Mark as rejected
-            for sig in signals:
-                await self._store.mark_rejected(sig.id, verification.reason)
+            await self._store.mark_rejected_many(
+                [sig.id for sig in signals], verification.reason
+            )
 
         return {
             "decision": verification.decision,
@@ -1531,6 +1676,31 @@ class DiscoveryPipeline:
         signal_types = [sig.signal_type for sig in signals]
         return f"Detected via {', '.join(set(signal_types))}"
 
+    async def _apply_retention(self) -> None:
+        """Archive old pushed/rejected signals and pipeline runs (non-fatal)."""
+        if not self._store.has_archive:
+            logger.warning("RETENTION_DAYS is set but ARCHIVE_DB_PATH is not; skipping retention")
+            return
+
+        try:
+            result = await self._store.apply_retention(self.config.retention_days)
+            logger.info(
+                f"Retention: archived {result['signals_archived']} signals, "
+                f"{result['pipeline_runs_archived']} pipeline runs, "
+                f"freed {result['pages_freed']} pages"
+            )
+        except Exception as e:
+            logger.warning(f"Retention failed (non-fatal): {e}")
+
+    async def _compact_asset_snapshots(self) -> None:
+        """Compact SourceAssetStore delta chains (non-fatal)."""
+        try:
+            compacted = await self._asset_store.compact_snapshots()
+            if compacted:
+                logger.info(f"Compacted asset snapshots for {compacted} entities")
+        except Exception as e:
+            logger.warning(f"Asset snapshot compaction failed (non-fatal): {e}")
+
     async def _check_signal_health(self) -> None:
         """
         Run health monitor and log any warnings.
@@ -53,3 +53,74 @@ class TestPipelineConfigFlags:
             assert config.use_asset_store is True
         finally:
             del os.environ["USE_ASSET_STORE"]
+
+    def test_drain_pending_default_false(self):
+        """drain_pending should default to False (one batch per run)."""
+        config = PipelineConfig()
+        assert config.drain_pending is False
+
+    def test_from_env_reads_drain_pending(self):
+        """from_env should read DRAIN_PENDING env var."""
+        os.environ["DRAIN_PENDING"] = "true"
+        try:
+            config = PipelineConfig.from_env()
+            assert config.drain_pending is True
+        finally:
+            del os.environ["DRAIN_PENDING"]
+
+    def test_retention_default_off(self):
+        """Retention should be disabled, with no archive, by default."""
+        config = PipelineConfig()
+        assert config.retention_days == 0
+        assert config.archive_db_path is None
+
+    def test_from_env_reads_retention(self):
+        """from_env should read RETENTION_DAYS and ARCHIVE_DB_PATH."""
+        os.environ["RETENTION_DAYS"] = "90"
+        os.environ["ARCHIVE_DB_PATH"] = "archive.db"
+        try:
+            config = PipelineConfig.from_env()
+            assert config.retention_days == 90
+            assert config.archive_db_path == "archive.db"
+        finally:
+            del os.environ["RETENTION_DAYS"]
+            del os.environ["ARCHIVE_DB_PATH"]
+
+    def test_from_env_reads_http_pool_settings(self):
+        """from_env should read HTTP pool limits, timeout and HTTP2."""
+        os.environ["HTTP_MAX_CONNECTIONS"] = "50"
+        os.environ["HTTP_TIMEOUT"] = "12.5"
+        os.environ["HTTP2"] = "true"
+        try:
+            config = PipelineConfig.from_env()
+            assert config.http_max_connections == 50
+            assert config.http_timeout == 12.5
+            assert config.http2 is True
+            assert config.http_max_keepalive == 10
+        finally:
+            del os.environ["HTTP_MAX_CONNECTIONS"]
+            del os.environ["HTTP_TIMEOUT"]
+            del os.environ["HTTP2"]
+
+    def test_from_env_reads_http_cache_settings(self):
+        """from_env should read HTTP_CACHE_PATH and per-API HTTP_CACHE_TTLS."""
+        os.environ["HTTP_CACHE_PATH"] = "http_cache.db"
+        os.environ["HTTP_CACHE_TTLS"] = "github=60, domain_whois=0"
+        try:
+            config = PipelineConfig.from_env()
+            assert config.http_cache_path == "http_cache.db"
+            assert config.http_cache_ttls == {"github": 60.0, "domain_whois": 0.0}
+            assert config.http_cache_max_mb == 256
+        finally:
+            del os.environ["HTTP_CACHE_PATH"]
+            del os.environ["HTTP_CACHE_TTLS"]
+
+    def test_from_env_reads_rate_limit_db_path(self):
+        """from_env should read RATE_LIMIT_DB_PATH; unset means in-memory limiters."""
+        assert PipelineConfig.from_env().rate_limit_db_path is None
+
+        os.environ["RATE_LIMIT_DB_PATH"] = "rate_limits.db"
+        try:
+            assert PipelineConfig.from_env().rate_limit_db_path == "rate_limits.db"
+        finally:
+            del os.environ["RATE_LIMIT_DB_PATH"]
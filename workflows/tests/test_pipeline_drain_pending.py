@@ -0,0 +1,65 @@
+"""Tests for draining the pending backlog in one pipeline run."""
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+from verification.verification_gate_v2 import PushDecision
+from workflows.pipeline import DiscoveryPipeline, PipelineConfig
+
+
+async def _make_pipeline(drain_pending: bool) -> DiscoveryPipeline:
+    config = PipelineConfig(
+        db_path=":memory:",
+        batch_size=2,
+        drain_pending=drain_pending,
+        warmup_suppression_cache=False,
+        use_gating=False,
+        use_founder_scoring=False,
+        use_velocity_tracking=False,
+    )
+    pipeline = DiscoveryPipeline(config)
+    await pipeline.initialize()
+
+    for i in range(5):
+        await pipeline._store.save_signal(
+            signal_type="github_spike",
+            source_api="github",
+            canonical_key=f"domain:co{i}.ai",
+            confidence=0.5,
+            raw_data={},
+            detected_at=datetime(2026, 1, 1, i, tzinfo=timezone.utc),
+        )
+
+    async def reject(signals, dry_run, suppression_map=None):
+        await pipeline._store.mark_rejected_many([sig.id for sig in signals], "test")
+        return {"decision": PushDecision.REJECT}
+
+    pipeline._process_company = AsyncMock(side_effect=reject)
+    return pipeline
+
+
+class TestDrainPending:
+    """Test PipelineConfig.drain_pending."""
+
+    @pytest.mark.asyncio
+    async def test_single_batch_by_default(self):
+        """Without drain_pending only batch_size signals are processed."""
+        pipeline = await _make_pipeline(drain_pending=False)
+        try:
+            stats = await pipeline._process_signals_stage(dry_run=True)
+            assert stats["processed"] == 2
+        finally:
+            await pipeline.close()
+
+    @pytest.mark.asyncio
+    async def test_drain_processes_whole_backlog(self):
+        """With drain_pending every pending signal is processed, page by page."""
+        pipeline = await _make_pipeline(drain_pending=True)
+        try:
+            stats = await pipeline._process_signals_stage(dry_run=True)
+
+            assert stats["processed"] == 5
+            assert stats["rejected"] == 5
+            assert await pipeline._store.get_processing_stats() == {"rejected": 5}
+        finally:
+            await pipeline.close()
@@ -1,5 +1,9 @@
 """Tests for EntityResolver integration in pipeline."""
 import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+from storage.signal_store import SuppressionEntry
 from workflows.pipeline import DiscoveryPipeline, PipelineConfig
 
 
@@ -55,3 +59,49 @@ class TestPipelineEntityResolver:
         assert pipeline._asset_store is not None
 
         await pipeline.close()
+
+
+class TestEntityRegroupingSuppression:
+    """Suppression must survive regrouping signals under a resolved lead key."""
+
+    @pytest.mark.asyncio
+    async def test_signal_key_suppressed_under_different_lead_key(self):
+        """A signal already in Notion is skipped even when its lead key differs."""
+        config = PipelineConfig(
+            db_path=":memory:",
+            use_entities=True,
+            warmup_suppression_cache=False,
+            use_gating=False,
+            use_founder_scoring=False,
+            use_velocity_tracking=False,
+        )
+        pipeline = DiscoveryPipeline(config)
+        await pipeline.initialize()
+        try:
+            store = pipeline._store
+            await store.save_signal(
+                signal_type="github_spike",
+                source_api="github",
+                canonical_key="domain:acme.ai",
+                confidence=0.9,
+                raw_data={},
+                detected_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            )
+            await store.update_suppression_cache([
+                SuppressionEntry(
+                    canonical_key="domain:acme.ai",
+                    notion_page_id="page-acme",
+                    status="Source",
+                ),
+            ])
+            pipeline._entity_resolution_store.get_lead_for_asset = AsyncMock(
+                return_value="lead:acme"
+            )
+
+            stats = await pipeline._process_signals_stage(dry_run=True)
+
+            assert stats["prospects_skipped"] == 1
+            assert stats["prospects_created"] == 0
+            assert await store.get_processing_stats() == {"rejected": 1}
+        finally:
+            await pipeline.close()
@@ -54,7 +54,7 @@ class TestProcessCompanyWithGating:
 
         # Mock the store methods
         pipeline._store.check_suppression = AsyncMock(return_value=None)
-        pipeline._store.mark_pushed = AsyncMock()
+        pipeline._store.mark_pushed_many = AsyncMock()
 
         # Create test signal
         signal = self._make_test_signal(has_previous=True)
@@ -82,7 +82,7 @@ class TestProcessCompanyWithGating:
 
         # Mock the store methods
         pipeline._store.check_suppression = AsyncMock(return_value=None)
-        pipeline._store.mark_pushed = AsyncMock()
+        pipeline._store.mark_pushed_many = AsyncMock()
 
         # Create test signal
         signal = self._make_test_signal()
@@ -109,9 +109,9 @@ class TestProcessCompanyWithGating:
         pipeline._store.check_suppression = AsyncMock(return_value=None)
 
         captured_metadata = {}
-        async def capture_mark_pushed(signal_id, notion_page_id, metadata=None):
+        async def capture_mark_pushed(signal_ids, notion_page_id, metadata=None):
             captured_metadata.update(metadata or {})
-        pipeline._store.mark_pushed = AsyncMock(side_effect=capture_mark_pushed)
+        pipeline._store.mark_pushed_many = AsyncMock(side_effect=capture_mark_pushed)
 
         # Create test signal with previous snapshot (so gating can run)
         signal = self._make_test_signal(has_previous=True)
@@ -138,7 +138,7 @@ class TestProcessCompanyWithGating:
 
         # Mock store methods
         pipeline._store.check_suppression = AsyncMock(return_value=None)
-        pipeline._store.mark_pushed = AsyncMock()
+        pipeline._store.mark_pushed_many = AsyncMock()
 
         signal = self._make_test_signal()
         result = await pipeline._process_company([signal], dry_run=True)
@@ -160,7 +160,7 @@ class TestProcessCompanyWithGating:
 
         # Mock store methods
         pipeline._store.check_suppression = AsyncMock(return_value=None)
-        pipeline._store.mark_pushed = AsyncMock()
+        pipeline._store.mark_pushed_many = AsyncMock()
 
         # Create signal with previous snapshot (so gating can run)
         signal = self._make_test_signal(has_previous=True)
@@ -216,7 +216,7 @@ class TestProcessCompanyWithGating:
 
         # Mock store methods
         pipeline._store.check_suppression = AsyncMock(return_value=None)
-        pipeline._store.mark_pushed = AsyncMock()
+        pipeline._store.mark_pushed_many = AsyncMock()
 
         # Create signal with medium confidence
         signal = self._make_test_signal(has_previous=True)
@@ -269,7 +269,7 @@ class TestProcessCompanyWithGating:
 
         # Mock store methods
         pipeline._store.check_suppression = AsyncMock(return_value=None)
-        pipeline._store.mark_pushed = AsyncMock()
+        pipeline._store.mark_pushed_many = AsyncMock()
 
         # Create signal with previous snapshot
         signal = self._make_test_signal(has_previous=True)